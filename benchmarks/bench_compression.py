@@ -0,0 +1,91 @@
+"""
+cold 답변 압축 벤치마크.
+
+압축 방식별로 절약된 메모리와 본문 접근 지연(원문/캐시 적중/캐시 미스)을
+비교합니다.
+
+실행:
+    python -m benchmarks.bench_compression [노드 수]
+"""
+
+import random
+import sys
+import time
+
+from core.compression import CompressedTextStore, build_zdict
+from core.store import Store
+
+SENTENCES = [
+    "이 문제는 먼저 감정을 인정하는 것에서 시작하는 것이 좋습니다.",
+    "Python은 간결하고 읽기 쉬운 문법을 가진 프로그래밍 언어입니다.",
+    "작은 목표를 세우고 매일 조금씩 실천해 보세요.",
+    "면접에서는 구체적인 경험과 결과를 중심으로 이야기하는 것이 효과적입니다.",
+    "It is often helpful to break the problem into smaller steps.",
+    "충분한 수면과 규칙적인 운동은 스트레스 관리에 도움이 됩니다.",
+]
+
+
+def make_answer(rng: random.Random) -> str:
+    """문장을 무작위로 조합해 답변 본문을 만듭니다."""
+    return " ".join(rng.choice(SENTENCES) for _ in range(rng.randint(8, 20)))
+
+
+def measure_access(cts: CompressedTextStore, refs, rounds: int = 3) -> float:
+    """참조 목록을 순회하며 본문 1건당 평균 접근 시간(마이크로초)을 잽니다."""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for ref in refs:
+            cts.get(ref)
+    return (time.perf_counter() - start) / (rounds * len(refs)) * 1e6
+
+
+def run(node_count: int):
+    """압축 방식별 벤치마크를 실행하고 결과를 출력합니다."""
+    rng = random.Random(42)
+    answers = [make_answer(rng) for _ in range(node_count)]
+    zdict = build_zdict(answers[:500])
+
+    configs = [
+        ("zlib", {"method": "zlib"}),
+        ("zlib+dict", {"method": "zlib", "zdict": zdict}),
+        ("lzma", {"method": "lzma"}),
+    ]
+
+    print(f"노드 수: {node_count}")
+    print(
+        f"{'방식':<10} {'원문(KB)':>10} {'보관(KB)':>10} {'절약률':>8} "
+        f"{'hot(us)':>9} {'캐시(us)':>9} {'미스(us)':>9}"
+    )
+
+    for label, options in configs:
+        # 구축 중에는 압축하지 않고, 측정 직전에 전부 cold로 만든다
+        cts = CompressedTextStore(
+            cold_after=node_count, hot_cache_size=64, **options
+        )
+        store = Store(content_store=cts)
+        refs = []
+        for i, answer in enumerate(answers):
+            node = store.add_node(f"질문 {i}?", answer)
+            refs.append(node.text_ref("ai_answer"))
+            store.switch_to_node("root")
+
+        sample = refs[:2000]
+        hot_latency = measure_access(cts, sample)
+
+        cts.cold_after = 0
+        cts.compress_cold()
+        stats = cts.stats()
+
+        miss_latency = measure_access(cts, sample, rounds=1)
+        cached_latency = measure_access(cts, sample[-32:])
+
+        saved_ratio = stats["saved_bytes"] / stats["raw_bytes"]
+        print(
+            f"{label:<10} {stats['raw_bytes'] / 1024:>10.1f} "
+            f"{stats['stored_bytes'] / 1024:>10.1f} {saved_ratio:>7.1%} "
+            f"{hot_latency:>9.2f} {cached_latency:>9.2f} {miss_latency:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -0,0 +1,83 @@
+"""
+다중 세션 부하 벤치마크 (plan.md §31 부하 모델).
+
+동시 사용자 1,000명, 평균 경로 길이 12를 가정하고, 하나의 공유 트리 위에
+세션을 열어 무작위 전환을 반복합니다. 세션당 메모리와 전환 처리량을
+측정하고, 사용자마다 Store를 복제하는 방식의 메모리와 비교합니다.
+
+실행:
+    python -m benchmarks.bench_sessions [사용자 수]
+"""
+
+import copy
+import random
+import sys
+import time
+import tracemalloc
+
+from core.session import SessionManager
+from core.store import Store
+
+PATH_LENGTH = 12
+SWITCHES_PER_USER = 100  # 분당 전환 100회
+
+
+def build_tree(manager: SessionManager, branches: int, rng: random.Random):
+    """깊이 PATH_LENGTH의 분기 branches개를 가진 공유 트리를 만듭니다."""
+    builder = manager.open_session("builder")
+    leaves = []
+    for b in range(branches):
+        # 앞쪽 절반은 공통 접두부를 공유하도록 기존 경로 중간에서 분기
+        if leaves:
+            base = builder.tree.get_path_to_root(rng.choice(leaves))
+            builder.switch_to_node(base[rng.randint(PATH_LENGTH // 2, PATH_LENGTH)])
+        else:
+            builder.switch_to_node("root")
+        while len(builder.active_path_ids) <= PATH_LENGTH:
+            builder.add_node(f"질문 {b}?", f"답변 {b} 입니다. " * 10)
+        leaves.append(builder.get_current_node_id())
+    manager.close_session("builder")
+    return leaves
+
+
+def run(users: int):
+    """세션 수 users로 벤치마크를 실행하고 결과를 출력합니다."""
+    rng = random.Random(42)
+    manager = SessionManager()
+    leaves = build_tree(manager, branches=200, rng=rng)
+    node_ids = list(manager.tree.nodes)
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    sessions = [manager.open_session(f"user-{i}") for i in range(users)]
+    for session in sessions:
+        session.switch_to_node(rng.choice(leaves))
+    session_bytes = tracemalloc.get_traced_memory()[0] - before
+
+    before = tracemalloc.get_traced_memory()[0]
+    # 사용자마다 Store를 복제하면 트리 노드와 경로를 통째로 복사해야 함
+    template = Store(tree=manager.tree)
+    replica = (template.tree.nodes, template.active_path_ids, template.checkpoints)
+    copies = [copy.deepcopy(replica) for _ in range(min(users, 20))]
+    copy_bytes = (tracemalloc.get_traced_memory()[0] - before) / len(copies)
+    tracemalloc.stop()
+    del copies
+
+    total_switches = users * SWITCHES_PER_USER
+    start = time.perf_counter()
+    for _ in range(SWITCHES_PER_USER):
+        for session in sessions:
+            session.switch_to_node(rng.choice(node_ids))
+    elapsed = time.perf_counter() - start
+
+    print(f"트리 노드 수: {manager.tree.get_node_count()}, 동시 세션: {users}")
+    print(f"세션당 메모리: {session_bytes / users / 1024:.2f}KB")
+    print(f"Store 복제당 메모리: {copy_bytes / 1024:.2f}KB")
+    print(
+        f"전환 {total_switches:,}회: {elapsed:.2f}s "
+        f"({total_switches / elapsed:,.0f} 전환/s)"
+    )
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
@@ -0,0 +1,39 @@
+"""
+깊은 대화에서의 노드 전환 비용 벤치마크.
+
+깊이 N의 대화 끝부분에서 가까운 형제 분기 사이를 오가며
+전환 1회당 평균 시간을 측정합니다 (LCA 기반 증분 전환).
+
+실행:
+    python -m benchmarks.bench_switch [깊이]
+"""
+
+import sys
+import time
+
+from core.store import Store
+
+
+def run(depth: int, rounds: int = 10_000):
+    """깊이 depth의 대화에서 형제 분기 전환 시간을 측정합니다."""
+    store = Store()
+    for i in range(depth):
+        store.add_node(f"질문 {i}?", f"답변 {i}")
+
+    # 끝에서 두 번째 노드 아래에 형제 분기 두 개
+    fork_id = store.active_path_ids[-2]
+    left = store.get_current_node_id()
+    store.switch_to_node(fork_id)
+    right = store.add_node("다른 질문?", "다른 답변").id
+
+    start = time.perf_counter()
+    for i in range(rounds):
+        store.switch_to_node(left if i % 2 == 0 else right)
+    elapsed = time.perf_counter() - start
+
+    print(f"깊이: {depth}")
+    print(f"전환 1회 평균: {elapsed / rounds * 1e6:.2f}us")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
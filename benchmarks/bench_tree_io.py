@@ -0,0 +1,50 @@
+"""
+JSONL 트리 내보내기/가져오기 처리량 벤치마크.
+
+실행:
+    python -m benchmarks.bench_tree_io [노드 수]
+"""
+
+import io
+import random
+import sys
+import time
+
+from core.store import Store
+from core.tree_io import export_tree_jsonl, import_tree_jsonl
+
+
+def build_store(node_count: int, seed: int = 42) -> Store:
+    """가끔 임의 노드로 전환하며 분기가 있는 트리를 만듭니다."""
+    rng = random.Random(seed)
+    store = Store()
+    node_ids = ["root"]
+    for i in range(node_count):
+        if rng.random() < 0.05:
+            store.switch_to_node(rng.choice(node_ids))
+        node = store.add_node(f"질문 {i}?", f"답변 {i} 입니다. " * 5)
+        node_ids.append(node.id)
+    return store
+
+
+def run(node_count: int):
+    """내보내기/가져오기 시간을 측정하고 초당 노드 수를 출력합니다."""
+    store = build_store(node_count)
+    buf = io.StringIO()
+
+    start = time.perf_counter()
+    export_tree_jsonl(store, buf)
+    export_time = time.perf_counter() - start
+
+    buf.seek(0)
+    start = time.perf_counter()
+    import_tree_jsonl(buf)
+    import_time = time.perf_counter() - start
+
+    print(f"노드 수: {node_count}")
+    print(f"내보내기: {export_time:.2f}s ({node_count / export_time:,.0f} 노드/s)")
+    print(f"가져오기: {import_time:.2f}s ({node_count / import_time:,.0f} 노드/s)")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
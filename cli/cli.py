@@ -28,14 +28,24 @@ from cli.visualizer import (
     visualize_tree,
 )
 from core.checkpoint import (
+    AUTO_CHECKPOINT_PREFIX,
+    CheckpointCompactor,
+    get_checkpoint_info,
     get_checkpoint_stats,
-    list_checkpoints_detailed,
+    is_auto_checkpoint,
     suggest_checkpoint_name,
     validate_checkpoint_name,
 )
 from core.conversation import ConversationManager
+from core.duplicates import DuplicateIndex
+from core.events import CheckpointSaved
+from core.journal import Operation
+from core.metadata_index import MetadataIndex
+from core.pagination import Page
 from core.path_utils import format_path, get_path_summary
+from core.search import SearchIndex
 from core.store import Store
+from core.vectors import VectorIndex
 
 # AI 클라이언트는 선택적으로 import (API 키 없어도 CLI는 작동)
 try:
@@ -46,6 +56,12 @@ except (ImportError, ValueError) as e:
     AI_AVAILABLE = False
     AI_ERROR = str(e)
 
+# 목록 명령(nodes, checkpoint list)이 한 번에 출력하는 항목 수
+PAGE_SIZE = 20
+# query 명령이 색인하는 메타데이터 키 (값이 같은지 / 숫자 범위)
+METADATA_HASH_KEYS = ("model", "topic")
+METADATA_RANGE_KEYS = ("latency_ms", "cost")
+
 
 class CLI:
     """대화형 CLI REPL 클래스."""
@@ -53,12 +69,29 @@ class CLI:
     def __init__(self):
         """CLI 초기화."""
         self.store = Store()
-        self.conversation = ConversationManager(self.store)
+        # similar 명령과 ask 맥락용 벡터 색인 (임베딩은 백그라운드에서 묶어 계산)
+        self.vector_index = VectorIndex(self.store)
+        self.vector_index.start()
+        # 분기가 생기면 ConversationManager가 @branch_* 체크포인트를 자동 저장하고,
+        # ask는 다른 분기의 관련 턴을 맥락에 함께 넣음
+        self.conversation = ConversationManager(
+            self.store, auto_checkpoint=True, vector_index=self.vector_index
+        )
+        self.store.events.subscribe(self._on_checkpoint_saved, CheckpointSaved)
         self.running = True
 
-        # 노드 번호 매핑 (n1, n2 등을 위한 인덱스)
-        self.node_index = {}  # {1: node_id, 2: node_id, ...}
-        self.node_reverse_index = {}  # {node_id: 1, node_id2: 2, ...}
+        # 오래된 자동(@branch_*) 체크포인트를 보존 정책에 맞춰 백그라운드에서 정리
+        self.compactor = CheckpointCompactor(self.store)
+        self.compactor.start()
+
+        # find 명령용 전문 검색 색인 (턴이 추가될 때마다 그 노드만 색인)
+        self.search_index = SearchIndex(self.store)
+        # 다른 분기에서 이미 한 질문 안내와 duplicates 명령용 중복 질문 색인
+        self.duplicate_index = DuplicateIndex(self.store)
+        # query 명령용 메타데이터 보조 색인 (depth는 항상 색인됨)
+        self.metadata_index = MetadataIndex(
+            self.store, hash_keys=METADATA_HASH_KEYS, range_keys=METADATA_RANGE_KEYS
+        )
 
         # Navigation history (이동 이력 추적)
         self.navigation_history = []  # [{timestamp, node_id, question}, ...]
@@ -144,6 +177,13 @@ class CLI:
             "/siblings": self.cmd_siblings,
             "/nodes": self.cmd_nodes,
             "/list": self.cmd_nodes,  # 별칭
+            "/find": self.cmd_find,
+            "/similar": self.cmd_similar,
+            "/query": self.cmd_query,
+            "/duplicates": self.cmd_duplicates,
+            "/dups": self.cmd_duplicates,  # 별칭
+            "/undo": self.cmd_undo,
+            "/redo": self.cmd_redo,
         }
 
         handler = command_map.get(command)
@@ -155,25 +195,21 @@ class CLI:
 
     # ==================== 노드 인덱싱 헬퍼 ====================
 
-    def _build_node_index(self):
-        """
-        모든 노드에 번호를 매깁니다 (n1, n2, ...).
-
-        DFS 순서로 노드를 순회하여 일관된 번호를 부여합니다.
+    def _node_number(self, node_id: Optional[str]):
         """
-        all_nodes = list(self.store.tree.nodes.values())
+        노드 번호(n1, n2, ...의 숫자)를 가져옵니다.
 
-        # root 제외하고 ID로 정렬하여 일관성 유지
-        non_root_nodes = [n for n in all_nodes if n.id != "root"]
-        non_root_nodes.sort(key=lambda n: n.id)
+        번호는 루트를 제외한 노드를 ID 순으로 정렬한 순번이며,
+        Tree의 정렬 인덱스에서 O(log N)으로 계산됩니다.
 
-        # 매핑 재구축
-        self.node_index = {}
-        self.node_reverse_index = {}
+        Args:
+            node_id: 노드 ID
 
-        for idx, node in enumerate(non_root_nodes, start=1):
-            self.node_index[idx] = node.id
-            self.node_reverse_index[node.id] = idx
+        Returns:
+            노드 번호 (찾지 못하면 "?")
+        """
+        num = self.store.tree.get_node_number(node_id) if node_id else None
+        return "?" if num is None else num
 
     def _resolve_node_reference(self, ref: str) -> Optional[str]:
         """
@@ -181,6 +217,7 @@ class CLI:
 
         지원 형식:
         - n1, n2, n123 등 (노드 번호)
+        - latest (가장 최근에 생긴 잎 노드)
         - cb5975d0 (부분 ID)
         - 전체 UUID
 
@@ -192,62 +229,33 @@ class CLI:
         """
         ref = ref.strip().lower()
 
+        if ref == "latest":
+            return self.store.tree.get_newest_leaf_id()
+
         # 노드 번호 형식 (n1, n2 등)
         if ref.startswith("n"):
             try:
                 num = int(ref[1:])
-                # 인덱스 갱신
-                self._build_node_index()
-                return self.node_index.get(num)
-            except (ValueError, KeyError):
+                return self.store.tree.get_node_by_number(num)
+            except ValueError:
                 return None
 
         # 정확한 ID 매칭
-        all_nodes = list(self.store.tree.nodes.values())
-        node_ids = [n.id for n in all_nodes]
-
-        if ref in node_ids:
+        if self.store.tree.node_exists(ref):
             return ref
 
-        # 부분 매칭
-        matching = [nid for nid in node_ids if nid.startswith(ref)]
+        # 부분 매칭 (2개만 찾으면 모호함을 알 수 있음)
+        matching = self.store.tree.find_ids_by_prefix(ref, limit=2)
         if len(matching) == 1:
             return matching[0]
 
         # 매칭 실패 또는 여러 개
         return None
 
-    def _auto_checkpoint_on_branch(self) -> bool:
-        """
-        분기 발생 시 자동 체크포인트 생성.
-
-        현재 노드가 이미 1개의 자식을 가지고 있다면,
-        새 노드 추가 시 2개가 되어 분기점이 됩니다.
-        이 경우 자동으로 체크포인트를 생성합니다.
-
-        Returns:
-            체크포인트가 생성되었으면 True, 아니면 False
-        """
-        current = self.store.get_current_node()
-        if not current:
-            return False
-
-        # 현재 노드의 자식 개수 확인
-        children = self.store.tree.get_children(current.id)
-
-        # 자식이 1개 이상이면 새 노드 추가 시 분기점이 됨
-        if len(children) >= 1:
-            # 자동 체크포인트 이름 생성
-            auto_name = f"@branch_{current.id[:8]}"
-
-            # 중복 방지: 이미 존재하지 않으면 저장
-            existing_checkpoints = self.store.list_checkpoints()
-            if auto_name not in existing_checkpoints:
-                self.store.save_checkpoint(auto_name)
-                print(f"🔀 분기 발생: 자동 체크포인트 '{auto_name}' 생성됨")
-                return True
-
-        return False
+    def _on_checkpoint_saved(self, event: CheckpointSaved):
+        """자동 체크포인트가 저장되면 알림 (Store 이벤트 콜백)."""
+        if is_auto_checkpoint(event.name):
+            print(f"🔀 분기 발생: 자동 체크포인트 '{event.name}' 생성됨")
 
     def _format_elapsed_time(self, elapsed) -> str:
         """
@@ -283,8 +291,8 @@ class CLI:
                     "timestamp": datetime.now(),
                     "node_id": current.id,
                     "question": (
-                        current.user_question[:60]
-                        if current.user_question
+                        current.question_preview
+                        if current.question_preview
                         else "(대화 없음)"
                     ),
                 }
@@ -305,9 +313,11 @@ class CLI:
         print("  turn <질문> | <답변>    - 수동으로 대화 턴 추가")
         print("  history                 - 현재 경로의 대화 히스토리 보기")
         print("  switch <참조>           - 다른 노드로 전환 (분기)")
-        print("                            <참조>: n1, n2 또는 노드ID")
+        print("                            <참조>: n1, n2, latest 또는 노드ID")
         print("  back                    - 이전 위치로 복귀")
         print("  visits                  - 최근 방문 이력 보기")
+        print("  undo                    - 마지막 작업 되돌리기 (턴 추가/전환/체크포인트)")
+        print("  redo                    - 되돌린 작업 다시 실행")
 
         print("\n[체크포인트]")
         print("  checkpoint save <이름>  - 현재 위치에 체크포인트 저장")
@@ -315,7 +325,10 @@ class CLI:
         print("  checkpoint load <이름>  - 체크포인트로 이동")
         print("  checkpoint list         - 저장된 체크포인트 목록")
         print("  checkpoint delete <이름> - 체크포인트 삭제")
+        print("  checkpoint rename <이름> <새이름> - 체크포인트 이름 변경")
+        print("  checkpoint compact      - 보존 정책에 따라 오래된 자동 체크포인트 정리")
         print("  💡 분기 발생 시 자동으로 @branch_* 체크포인트 생성됨")
+        print("     (최근 것은 모두, 그 이전은 날짜별 하나만 자동 보관)")
 
         print("\n[트리 탐색]")
         print("  tree [옵션]             - 대화 트리 시각화")
@@ -324,6 +337,12 @@ class CLI:
         print("  nodes, list             - 모든 노드 목록 (번호 포함)")
         print("  node [참조]             - 노드 상세 정보 (기본: 현재 노드)")
         print("  siblings [참조]         - 형제 노드 보기 (기본: 현재 노드)")
+        print("  find <검색어> [옵션]    - 질문/답변 내용으로 노드 검색")
+        print('                            "구절" 일치, 옵션: in=<참조>, depth=N 또는 A-B, cp')
+        print("  similar [참조]          - 의미가 비슷한 노드 찾기 (기본: 현재 노드)")
+        print("  duplicates, dups        - 여러 분기에서 반복된 질문 묶음 보기")
+        print("  query <조건>            - 메타데이터/깊이 조건으로 노드 찾기")
+        print("                            예: depth>3 and model=gpt-4o-mini")
         print("  stats                   - 트리 및 체크포인트 통계")
 
         print("\n[기타]")
@@ -334,6 +353,8 @@ class CLI:
     def cmd_exit(self, args: str):
         """프로그램 종료."""
         self.running = False
+        self.compactor.stop()
+        self.vector_index.stop()
 
     def cmd_ask(self, args: str):
         """
@@ -355,33 +376,20 @@ class CLI:
 
         question = args.strip()
 
-        # 🔍 분기 감지 및 자동 체크포인트 생성
-        self._auto_checkpoint_on_branch()
-
         # AI에게 질문 (현재 대화 맥락 포함)
         print(f"\n💭 AI에게 질문 중...")
 
         try:
-            # 현재 대화 맥락 가져오기
-            context = self.conversation.get_full_context()
-
-            if context and context != "[대화 없음]":
-                # 맥락이 있으면 포함해서 질문
-                answer = self.ai_client.ask_with_context(
-                    question,
-                    f"이전 대화 맥락:\n{context}",
-                    system_prompt="당신은 친절한 AI 상담사입니다. 이전 대화 맥락을 고려하여 답변하세요.",
-                )
-            else:
-                # 맥락이 없으면 단순 질문
-                answer = self.ai_client.ask(question)
-
-            # 노드 생성
-            node = self.conversation.turn(question, answer)
+            # 현재 대화 맥락과 함께 질문하고 노드 생성
+            # 사용한 모델을 남겨 query model=... 로 찾을 수 있게 함
+            metadata = {"model": self.ai_client.model}
+            node = self.conversation.ask(question, self.ai_client, metadata)
+            answer = node.ai_answer
 
             print(f"\n✅ AI 답변:")
             print(f"{answer}")
             print(f"\n✅ 노드 생성됨: {node.id[:8]}...")
+            self._report_duplicates(node.id)
 
         except Exception as e:
             print(f"\n❌ AI 응답 생성 실패: {str(e)}")
@@ -412,14 +420,41 @@ class CLI:
             print("❌ 질문과 답변 모두 입력해야 합니다.")
             return
 
-        # 🔍 분기 감지 및 자동 체크포인트 생성
-        self._auto_checkpoint_on_branch()
-
         # 노드 생성
         node = self.conversation.turn(question, answer)
         print(f"✅ 대화 턴이 추가되었습니다. (노드 ID: {node.id})")
         print(f"   질문: {question[:50]}{'...' if len(question) > 50 else ''}")
         print(f"   답변: {answer[:50]}{'...' if len(answer) > 50 else ''}")
+        self._report_duplicates(node.id)
+
+    def _report_duplicates(self, node_id: str, limit: int = 3):
+        """
+        같은 질문을 다른 분기에서 이미 했다면 그 노드를 알려줍니다.
+
+        중복 색인의 버킷 조회만 하므로 트리 크기와 무관하게 빠릅니다.
+
+        Args:
+            node_id: 방금 추가된 노드 ID
+            limit: 최대 안내 수
+        """
+        try:
+            hits = self.duplicate_index.find_duplicates(node_id, limit=limit + 10)
+        except ValueError:
+            return
+        # 현재 경로의 조상에서 같은 질문을 한 경우는 분기 중복이 아님
+        active_ids = set(self.store.get_active_path_ids())
+        hits = [hit for hit in hits if hit.node_id not in active_ids][:limit]
+        if not hits:
+            return
+
+        tree = self.store.tree
+        print("\n💡 같은 질문을 다른 분기에서 이미 했습니다:")
+        for hit in hits:
+            node = tree.get_node(hit.node_id)
+            print(
+                f"   • n{self._node_number(hit.node_id)}"
+                f" (유사도 {hit.similarity:.2f}) - {node.question_preview}"
+            )
 
     def cmd_checkpoint(self, args: str):
         """
@@ -430,6 +465,8 @@ class CLI:
           /checkpoint load <이름>
           /checkpoint list
           /checkpoint delete <이름>
+          /checkpoint rename <이름> <새이름>
+          /checkpoint compact
         """
         if not args:
             print("❌ 사용법:")
@@ -437,6 +474,8 @@ class CLI:
             print("   /checkpoint load <이름>")
             print("   /checkpoint list")
             print("   /checkpoint delete <이름>")
+            print("   /checkpoint rename <이름> <새이름>")
+            print("   /checkpoint compact")
             return
 
         parts = args.split(maxsplit=1)
@@ -451,9 +490,13 @@ class CLI:
             self._checkpoint_list()
         elif action == "delete" or action == "del":
             self._checkpoint_delete(name)
+        elif action == "rename":
+            self._checkpoint_rename(name)
+        elif action == "compact":
+            self._checkpoint_compact()
         else:
             print(f"❌ 알 수 없는 체크포인트 명령: {action}")
-            print("   save, load, list, delete 중 하나를 사용하세요.")
+            print("   save, load, list, delete, rename, compact 중 하나를 사용하세요.")
 
     def _checkpoint_save(self, name: str):
         """체크포인트 저장."""
@@ -501,14 +544,12 @@ class CLI:
             print(f"❌ 체크포인트 '{name}'을 찾을 수 없습니다.")
 
     def _checkpoint_list(self):
-        """체크포인트 목록 출력 (3섹션: 명시적/분기/방문이력)."""
-        checkpoints = list_checkpoints_detailed(self.store)
+        """체크포인트 목록 출력 (3섹션: 명시적/분기/방문이력, 섹션별 페이지 단위)."""
+        store = self.store
+        branch_count = store.count_checkpoints(AUTO_CHECKPOINT_PREFIX)
+        manual_count = store.count_checkpoints() - branch_count
 
-        # 체크포인트를 타입별로 분류
-        manual_cps = [cp for cp in checkpoints if not cp["name"].startswith("@branch_")]
-        branch_cps = [cp for cp in checkpoints if cp["name"].startswith("@branch_")]
-
-        has_any = manual_cps or branch_cps or self.navigation_history
+        has_any = manual_count or branch_count or self.navigation_history
 
         if not has_any:
             print("\n📋 체크포인트 & 이력이 없습니다.")
@@ -518,27 +559,24 @@ class CLI:
         print("=" * 80)
 
         # 섹션 1: 명시적 체크포인트 (사용자가 직접 생성)
-        if manual_cps:
-            print(f"\n[명시적 체크포인트] ({len(manual_cps)}개)")
-            for cp in manual_cps:
-                print(f"  • {cp['name']}")
-                print(f"    질문: {cp['user_question'][:60]}")
-                print(f"    깊이: {cp['depth']} | 자식: {cp['children_count']}개")
-                print()
+        if manual_count:
+            print(f"\n[명시적 체크포인트] ({manual_count}개)")
+            self._paginate(
+                lambda cursor: store.list_checkpoints_page(
+                    cursor, PAGE_SIZE, exclude_prefix=AUTO_CHECKPOINT_PREFIX
+                ),
+                self._print_manual_checkpoint,
+            )
 
         # 섹션 2: 분기 노드 (자동 체크포인트)
-        if branch_cps:
-            print(f"\n[분기 노드] ({len(branch_cps)}개) 🔀")
-            for cp in branch_cps:
-                # 노드 번호 찾기
-                self._build_node_index()
-                node_id = self.store.list_checkpoints().get(cp["name"])
-                num = self.node_reverse_index.get(node_id, "?") if node_id else "?"
-
-                print(f"  • {cp['name']} → n{num}")
-                print(f"    질문: {cp['user_question'][:60]}")
-                print(f"    자식: {cp['children_count']}개 (분기점)")
-                print()
+        if branch_count:
+            print(f"\n[분기 노드] ({branch_count}개) 🔀")
+            self._paginate(
+                lambda cursor: store.list_checkpoints_page(
+                    cursor, PAGE_SIZE, prefix=AUTO_CHECKPOINT_PREFIX
+                ),
+                self._print_branch_checkpoint,
+            )
 
         # 섹션 3: 최근 방문 이력
         if self.navigation_history:
@@ -548,9 +586,7 @@ class CLI:
                 elapsed = datetime.now() - entry["timestamp"]
                 time_str = self._format_elapsed_time(elapsed)
 
-                # 노드 번호 찾기
-                self._build_node_index()
-                num = self.node_reverse_index.get(entry["node_id"], "?")
+                num = self._node_number(entry["node_id"])
 
                 print(f"  • n{num} - {entry['question']} ({time_str})")
 
@@ -561,6 +597,31 @@ class CLI:
 
         print("=" * 80)
 
+    def _print_manual_checkpoint(self, item):
+        """명시적 체크포인트 한 항목 출력."""
+        cp = get_checkpoint_info(self.store, item[0])
+        if not cp:
+            return
+        print(f"  • {cp['name']}")
+        print(f"    질문: {cp['user_question'][:60]}")
+        print(
+            f"    깊이: {cp['depth']} | 자식: {cp['children_count']}개"
+            f" | 이력: {cp['path_hash'][:12]}"
+        )
+        print()
+
+    def _print_branch_checkpoint(self, item):
+        """분기 노드(자동 체크포인트) 한 항목 출력."""
+        cp = get_checkpoint_info(self.store, item[0])
+        if not cp:
+            return
+        num = self._node_number(cp["node_id"])
+
+        print(f"  • {cp['name']} → n{num}")
+        print(f"    질문: {cp['user_question'][:60]}")
+        print(f"    자식: {cp['children_count']}개 (분기점)")
+        print()
+
     def _checkpoint_delete(self, name: str):
         """체크포인트 삭제."""
         if not name:
@@ -572,6 +633,34 @@ class CLI:
         else:
             print(f"❌ 체크포인트 '{name}'을 찾을 수 없습니다.")
 
+    def _checkpoint_compact(self):
+        """보존 정책에 따라 정리 대기 중인 자동 체크포인트를 바로 삭제."""
+        removed = self.compactor.compact()
+        if removed:
+            print(f"🧹 오래된 자동 체크포인트 {removed}개를 정리했습니다.")
+        else:
+            print("✅ 정리할 자동 체크포인트가 없습니다.")
+
+    def _checkpoint_rename(self, args: str):
+        """체크포인트 이름 변경."""
+        names = args.split()
+        if len(names) != 2:
+            print("❌ 사용법: checkpoint rename <이름> <새이름>")
+            return
+
+        old_name, new_name = names
+        valid, error = validate_checkpoint_name(new_name)
+        if not valid:
+            print(f"❌ {error}")
+            return
+
+        if self.store.rename_checkpoint(old_name, new_name):
+            print(f"✅ 체크포인트 '{old_name}'의 이름을 '{new_name}'(으)로 바꿨습니다.")
+        elif old_name not in self.store.list_checkpoints():
+            print(f"❌ 체크포인트 '{old_name}'을 찾을 수 없습니다.")
+        else:
+            print(f"❌ 체크포인트 '{new_name}'이 이미 존재합니다.")
+
     def cmd_tree(self, args: str):
         """트리 시각화."""
         # 옵션 파싱
@@ -619,6 +708,7 @@ class CLI:
             print("   <참조>: n1, n2 또는 노드ID")
             print("   예시: switch n1")
             print("   예시: switch cb5975d0")
+            print("   예시: switch latest   (가장 최근 잎 노드)")
             return
 
         ref = args.strip()
@@ -631,18 +721,18 @@ class CLI:
 
         if node_id is None:
             # 부분 매칭으로 여러 개 찾았을 수 있으므로 다시 확인
-            all_nodes = list(self.store.tree.nodes.values())
-            matching_nodes = [n for n in all_nodes if n.id.startswith(ref.lower())]
+            matching_ids = self.store.tree.find_ids_by_prefix(ref.strip().lower())
+            matching_nodes = [self.store.tree.nodes[nid] for nid in matching_ids]
 
             if len(matching_nodes) > 1:
                 print(f"❌ '{ref}'로 시작하는 노드가 {len(matching_nodes)}개 있습니다:")
-                # 인덱스 갱신
-                self._build_node_index()
                 for node in matching_nodes[:5]:  # 최대 5개만 표시
                     preview = (
-                        node.user_question[:40] if node.user_question else "(루트)"
+                        node.question_preview[:40]
+                        if node.question_preview
+                        else "(루트)"
                     )
-                    num = self.node_reverse_index.get(node.id, "?")
+                    num = self._node_number(node.id)
                     print(f"   • n{num} - {node.id[:12]}... - {preview}")
                 if len(matching_nodes) > 5:
                     print(f"   ... 외 {len(matching_nodes) - 5}개")
@@ -654,9 +744,7 @@ class CLI:
 
         # 전환 시도
         if self.store.switch_to_node(node_id):
-            # 노드 번호 표시를 위해 인덱스 갱신
-            self._build_node_index()
-            num = self.node_reverse_index.get(node_id, "?")
+            num = self._node_number(node_id)
             print(f"✅ 노드 n{num} ({node_id[:8]}...)로 전환했습니다.")
             self._show_current_position()
         else:
@@ -715,15 +803,57 @@ class CLI:
             elapsed = datetime.now() - entry["timestamp"]
             time_str = self._format_elapsed_time(elapsed)
 
-            # 노드 번호 찾기
-            self._build_node_index()
-            num = self.node_reverse_index.get(entry["node_id"], "?")
+            num = self._node_number(entry["node_id"])
 
             print(f"  {i}. n{num} - {entry['question']} ({time_str})")
 
         print("=" * 80)
         print("💡 사용: back (최근 위치로 복귀)")
 
+    def _describe_operation(self, op: Operation) -> str:
+        """실행 취소 기록의 작업을 한 줄 설명으로 만듭니다."""
+        if op.kind == "add":
+            return f"대화 턴 추가 ({op.key[:8]}...)"
+        if op.kind == "switch":
+            return f"노드 전환 (n{self._node_number(op.after)})"
+        if op.kind == "rename":
+            return f"체크포인트 이름 변경 ('{op.before}' → '{op.after}')"
+        if op.before is None:
+            return f"체크포인트 저장 ('{op.key}')"
+        return f"체크포인트 삭제 ('{op.key}')"
+
+    def cmd_undo(self, args: str):
+        """마지막 작업 되돌리기."""
+        try:
+            op = self.store.undo()
+        except ValueError as e:
+            print(f"❌ 되돌릴 수 없습니다: {e}")
+            print("   이 작업 기록은 버렸습니다. 다시 undo하면 그 이전 작업을 되돌립니다.")
+            return
+
+        if op is None:
+            print("❌ 되돌릴 작업이 없습니다.")
+            return
+
+        print(f"↩️  되돌림: {self._describe_operation(op)}")
+        self._show_current_position()
+
+    def cmd_redo(self, args: str):
+        """되돌린 작업 다시 실행."""
+        try:
+            op = self.store.redo()
+        except ValueError as e:
+            print(f"❌ 다시 실행할 수 없습니다: {e}")
+            print("   이 작업 기록은 버렸습니다.")
+            return
+
+        if op is None:
+            print("❌ 다시 실행할 작업이 없습니다.")
+            return
+
+        print(f"↪️  다시 실행: {self._describe_operation(op)}")
+        self._show_current_position()
+
     def cmd_stats(self, args: str):
         """통계 정보 출력."""
         output = visualize_stats(self.store)
@@ -775,57 +905,247 @@ class CLI:
 
     def cmd_nodes(self, args: str):
         """모든 노드 목록을 번호와 함께 출력."""
-        # 인덱스 갱신
-        self._build_node_index()
+        tree = self.store.tree
+        node_count = tree.get_node_count() - 1  # 루트 제외
 
-        if not self.node_index:
+        if node_count == 0:
             print("\n📋 아직 노드가 없습니다.")
             print("   ask 또는 turn 명령으로 첫 대화를 시작하세요!")
             return
 
-        print(f"\n📋 노드 목록 ({len(self.node_index)}개):")
+        print(f"\n📋 노드 목록 ({node_count}개):")
         print("=" * 80)
 
         # 현재 노드 확인
         current_node = self.store.get_current_node()
         current_id = current_node.id if current_node else None
 
-        # 번호 순으로 출력
-        for num in sorted(self.node_index.keys()):
-            node_id = self.node_index[num]
-            node = self.store.tree.get_node(node_id)
+        def print_node(node):
+            # 현재 위치 표시
+            marker = "👉 " if node.id == current_id else "   "
+            num = tree.get_node_number(node.id)
 
-            if node:
-                # 현재 위치 표시
-                marker = "👉 " if node_id == current_id else "   "
+            # 질문 미리보기
+            preview = node.question_preview if node.question_preview else "(대화 없음)"
 
-                # 질문 미리보기
-                preview = (
-                    node.user_question[:60] if node.user_question else "(대화 없음)"
-                )
+            # 자식 노드 수
+            child_count = tree.get_child_count(node.id)
+            children_info = f"자식 {child_count}개" if child_count else "말단"
 
-                # 자식 노드 수
-                children = self.store.tree.get_children(node_id)
-                children_info = f"자식 {len(children)}개" if children else "말단"
+            print(f"{marker}n{num:3d} - {node.id[:8]}... - {preview}")
+            print(f"       {children_info}")
+            print()
 
-                print(f"{marker}n{num:3d} - {node_id[:8]}... - {preview}")
-                print(f"       {children_info}")
-                print()
+        # 번호 순으로 한 페이지씩 출력
+        self._paginate(
+            lambda cursor: tree.list_nodes(after=cursor, limit=PAGE_SIZE), print_node
+        )
 
         print("=" * 80)
         print("💡 사용: switch n1, node n2, siblings n3 등")
 
+    def cmd_find(self, args: str):
+        """
+        질문/답변 내용으로 노드 검색 (BM25 순위).
+
+        형식: /find <검색어> [in=<참조>] [depth=N | depth=A-B] [cp]
+        """
+        if not args:
+            print("❌ 사용법: find <검색어> [in=<참조>] [depth=N|A-B] [cp]")
+            print('   예시: find 파이썬 "list comprehension" in=n3 depth=1-4 cp')
+            return
+
+        terms = []
+        filters = {}
+        for part in args.split():
+            if part.startswith("in="):
+                ref = part[3:]
+                node_id = self._resolve_node_reference(ref)
+                if node_id is None:
+                    print(f"❌ '{ref}'에 해당하는 노드를 찾을 수 없습니다.")
+                    return
+                filters["subtree"] = node_id
+            elif part.startswith("depth="):
+                low, _, high = part[6:].partition("-")
+                try:
+                    filters["min_depth"] = int(low) if high else None
+                    filters["max_depth"] = int(high or low)
+                except ValueError:
+                    print("❌ depth 옵션 형식이 잘못되었습니다 (예: depth=3, depth=2-5)")
+                    return
+            elif part == "cp":
+                filters["has_checkpoint"] = True
+            else:
+                terms.append(part)
+
+        query = " ".join(terms)
+        hits = self.search_index.search(query, limit=PAGE_SIZE, **filters)
+        if not hits:
+            print(f"\n🔍 '{query}'에 해당하는 노드가 없습니다.")
+            return
+
+        tree = self.store.tree
+        current_id = self.store.get_current_node_id()
+        print(f"\n🔍 검색 결과: {query} ({len(hits)}건)")
+        print("=" * 80)
+        for rank, hit in enumerate(hits, start=1):
+            node = tree.get_node(hit.node_id)
+            marker = "👉 " if hit.node_id == current_id else "   "
+            names = self.store.get_checkpoint_names(hit.node_id)
+            checkpoint_info = f" 📌{', '.join(names)}" if names else ""
+            print(
+                f"{marker}{rank:2d}. n{self._node_number(hit.node_id)}"
+                f" - {hit.node_id[:8]}... (점수 {hit.score:.2f},"
+                f" 깊이 {tree.get_depth(hit.node_id)}){checkpoint_info}"
+            )
+            print(f"       질문: {node.question_preview}")
+        print("=" * 80)
+        print("💡 사용: switch n1, node n2 등")
+
+    def cmd_query(self, args: str):
+        """
+        메타데이터와 깊이 조건으로 노드 검색 (보조 색인).
+
+        형식: /query <키><연산자><값> [and ...]
+        """
+        if not args:
+            print("❌ 사용법: query <키><연산자><값> [and ...]")
+            print("   예시: query depth>10 and model=gpt-4o-mini and latency_ms>2000")
+            print("   연산자: =, !=, >, >=, <, <=")
+            return
+
+        try:
+            plan = self.metadata_index.plan(args)
+            node_ids = self.metadata_index.query(plan.conditions)
+        except ValueError as e:
+            print(f"❌ {e}")
+            return
+
+        if plan.index is None:
+            plan_info = f"전체 탐색 {plan.estimate}개"
+        else:
+            plan_info = f"색인 {plan.index}, 후보 {plan.estimate}개"
+        if not node_ids:
+            print(f"\n🔎 조건에 맞는 노드가 없습니다. ({plan_info})")
+            return
+
+        tree = self.store.tree
+        current_id = self.store.get_current_node_id()
+        print(f"\n🔎 질의 결과: {args.strip()} ({len(node_ids)}건, {plan_info})")
+        print("=" * 80)
+        for node_id in node_ids[:PAGE_SIZE]:
+            node = tree.get_node(node_id)
+            marker = "👉 " if node_id == current_id else "   "
+            tags = "".join(f" {k}={v}" for k, v in node.metadata.items())
+            print(
+                f"{marker}n{self._node_number(node_id)} - {node_id[:8]}..."
+                f" (깊이 {tree.get_depth(node_id)}){tags}"
+            )
+            print(f"       질문: {node.question_preview}")
+        if len(node_ids) > PAGE_SIZE:
+            print(f"  ... 외 {len(node_ids) - PAGE_SIZE}개")
+        print("=" * 80)
+
+    def cmd_similar(self, args: str):
+        """의미가 비슷한 노드 출력 (벡터 색인)."""
+        if not args:
+            node_id = self.store.get_current_node_id()
+        else:
+            ref = args.strip()
+            node_id = self._resolve_node_reference(ref)
+            if node_id is None:
+                print(f"❌ '{ref}'에 해당하는 노드를 찾을 수 없습니다.")
+                print("   nodes 명령으로 사용 가능한 노드를 확인하세요.")
+                return
+        if node_id == self.store.tree.root_id:
+            print("❌ 루트 노드는 비교할 내용이 없습니다.")
+            return
+
+        # 아직 임베딩되지 않은 턴까지 반영
+        self.vector_index.flush()
+        hits = self.vector_index.similar_to(node_id, k=10)
+        if not hits:
+            print("\nℹ️  비교할 다른 노드가 없습니다.")
+            return
+
+        tree = self.store.tree
+        active_ids = set(self.store.get_active_path_ids())
+        print(f"\n🧭 n{self._node_number(node_id)}와 비슷한 노드 ({len(hits)}개)")
+        print("=" * 80)
+        for rank, hit in enumerate(hits, start=1):
+            node = tree.get_node(hit.node_id)
+            branch_info = "" if hit.node_id in active_ids else " 🔀다른 분기"
+            print(
+                f"   {rank:2d}. n{self._node_number(hit.node_id)}"
+                f" - {hit.node_id[:8]}... (유사도 {hit.score:.2f}){branch_info}"
+            )
+            print(f"       질문: {node.question_preview}")
+        print("=" * 80)
+
+    def cmd_duplicates(self, args: str):
+        """여러 분기에서 반복된 질문 묶음 출력 (중복 질문 색인)."""
+        clusters = self.duplicate_index.clusters()
+        if not clusters:
+            print("\nℹ️  여러 번 나온 질문이 없습니다.")
+            return
+
+        tree = self.store.tree
+        shown = clusters[:10]
+        print(f"\n🔁 반복된 질문 묶음 ({len(clusters)}개 중 상위 {len(shown)}개)")
+        print("=" * 80)
+        for rank, members in enumerate(shown, start=1):
+            numbers = sorted(self._node_number(node_id) for node_id in members)
+            refs = ", ".join(f"n{num}" for num in numbers[:10])
+            if len(numbers) > 10:
+                refs += f" ... 외 {len(numbers) - 10}개"
+            preview = tree.get_node(members[0]).question_preview
+            print(f"   {rank:2d}. {len(members)}회 - {preview}")
+            print(f"       노드: {refs}")
+        print("=" * 80)
+
+    def _paginate(self, fetch, render):
+        """
+        커서 기반 목록을 한 페이지씩 출력합니다.
+
+        다음 페이지는 이전 페이지의 커서로 요청하므로 페이지마다 O(페이지 크기)만
+        읽습니다. 터미널에서는 페이지마다 계속 볼지 묻고, 입력이 파이프면 모두
+        출력합니다.
+
+        Args:
+            fetch: 커서(처음에는 None)를 받아 Page를 반환하는 함수
+            render: 항목 하나를 출력하는 함수
+        """
+        cursor = None
+        while True:
+            page: Page = fetch(cursor)
+            for item in page.items:
+                render(item)
+            if page.next_cursor is None:
+                return
+            if not self._confirm_next_page():
+                print("  ... (이하 생략)")
+                return
+            cursor = page.next_cursor
+
+    def _confirm_next_page(self) -> bool:
+        """다음 페이지를 볼지 묻습니다 (터미널이 아니면 항상 True)."""
+        if not sys.stdin.isatty():
+            return True
+        try:
+            answer = input("-- 다음 페이지: Enter / 그만 보기: q -- ")
+        except EOFError:
+            return False
+        return answer.strip().lower() != "q"
+
     def _show_current_position(self):
         """현재 위치 정보 출력."""
         current_node = self.store.get_current_node()
         if current_node and current_node.id != "root":
-            # 노드 번호 가져오기
-            self._build_node_index()
-            num = self.node_reverse_index.get(current_node.id, "?")
+            num = self._node_number(current_node.id)
 
             print(f"\n현재 위치:")
             print(f"  노드: n{num} ({current_node.id[:8]}...)")
-            print(f"  질문: {current_node.user_question[:60]}")
+            print(f"  질문: {current_node.question_preview}")
 
 
 def main():
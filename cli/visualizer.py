@@ -4,10 +4,15 @@
 대화 트리를 다양한 형식으로 시각화하여 출력합니다.
 """
 
-from typing import Dict, List, Optional, Set
+from typing import List, Optional, Set
 
+from core.checkpoint_index import CheckpointIndex
 from core.models import Node, Tree
 from core.store import Store
+from core.text_store import TextStore
+
+# 노드 상세 화면에 표시할 최대 자식 수
+CHILDREN_PAGE_SIZE = 20
 
 
 def visualize_tree(
@@ -38,8 +43,7 @@ def visualize_tree(
     """
     tree = store.tree
     active_ids = set(store.active_path_ids) if highlight_path else set()
-    checkpoints = store.list_checkpoints() if show_checkpoints else {}
-    checkpoint_map = {node_id: name for name, node_id in checkpoints.items()}
+    checkpoint_index = store.checkpoint_index if show_checkpoints else None
 
     lines = []
     lines.append("🌳 대화 트리")
@@ -54,7 +58,7 @@ def visualize_tree(
         prefix="",
         is_last=True,
         active_ids=active_ids,
-        checkpoint_map=checkpoint_map,
+        checkpoint_index=checkpoint_index,
         current_depth=0,
         max_depth=max_depth,
     )
@@ -69,7 +73,7 @@ def _render_node(
     prefix: str,
     is_last: bool,
     active_ids: Set[str],
-    checkpoint_map: Dict[str, str],
+    checkpoint_index: Optional[CheckpointIndex],
     current_depth: int,
     max_depth: Optional[int],
 ):
@@ -83,7 +87,7 @@ def _render_node(
         prefix: 현재 줄의 접두사 (들여쓰기)
         is_last: 마지막 자식 노드인지 여부
         active_ids: 활성 경로 노드 ID 집합
-        checkpoint_map: 노드 ID → 체크포인트 이름 매핑
+        checkpoint_index: 노드 → 체크포인트 이름 역색인 (None이면 표시 안 함)
         current_depth: 현재 깊이
         max_depth: 최대 깊이
     """
@@ -99,15 +103,16 @@ def _render_node(
     connector = "└── " if is_last else "├── "
     active_marker = "👉 " if node_id in active_ids else ""
     checkpoint_marker = ""
-    if node_id in checkpoint_map:
-        checkpoint_marker = f" 📌{checkpoint_map[node_id]}"
+    if checkpoint_index is not None and checkpoint_index.count(node_id):
+        names = ", ".join(checkpoint_index.names_of(node_id))
+        checkpoint_marker = f" 📌{names}"
 
     if node_id == "root":
         line = f"🌱 ROOT{checkpoint_marker}"
     else:
         node_id_short = node_id[:8]
-        question_preview = node.user_question[:40]
-        if len(node.user_question) > 40:
+        question_preview = node.question_preview[:40]
+        if len(node.question_preview) > 40:
             question_preview += "..."
         line = f"{prefix}{connector}{active_marker}[{current_depth}] {node_id_short}... - {question_preview}{checkpoint_marker}"
 
@@ -137,7 +142,7 @@ def _render_node(
             prefix=next_prefix,
             is_last=is_last_child,
             active_ids=active_ids,
-            checkpoint_map=checkpoint_map,
+            checkpoint_index=checkpoint_index,
             current_depth=current_depth + 1,
             max_depth=max_depth,
         )
@@ -226,20 +231,22 @@ def visualize_node_detail(store: Store, node_id: str) -> str:
     depth = len(path) - 1
     lines.append(f"깊이: {depth}")
 
-    # 자식 노드 정보
-    children = store.tree.get_children(node_id)
-    lines.append(f"자식 노드 수: {len(children)}")
-    if children:
+    # 자식 노드 정보 (첫 페이지만 표시)
+    child_count = store.tree.get_child_count(node_id)
+    lines.append(f"자식 노드 수: {child_count}")
+    if child_count:
+        page = store.tree.list_children(node_id, limit=CHILDREN_PAGE_SIZE)
         lines.append("자식 노드 ID:")
-        for child in children:
-            child_preview = child.user_question[:30]
+        for child in page.items:
+            child_preview = child.question_preview[:30]
             lines.append(f"  • {child.id[:8]}... - {child_preview}")
+        if page.next_cursor is not None:
+            lines.append(f"  ... 외 {child_count - len(page.items)}개")
 
     lines.append("")
 
     # 체크포인트 확인
-    checkpoints = store.list_checkpoints()
-    checkpoint_names = [name for name, cp_id in checkpoints.items() if cp_id == node_id]
+    checkpoint_names = store.get_checkpoint_names(node_id)
     if checkpoint_names:
         lines.append(f"체크포인트: {', '.join(checkpoint_names)}")
         lines.append("")
@@ -304,7 +311,7 @@ def visualize_siblings(store: Store, node_id: str) -> str:
 
     for sibling in siblings:
         current_marker = " (👉 현재)" if sibling.id == node_id else ""
-        question_preview = sibling.user_question[:40]
+        question_preview = sibling.question_preview[:40]
         lines.append(f"• {sibling.id[:8]}... - {question_preview}{current_marker}")
 
     return "\n".join(lines)
@@ -331,14 +338,14 @@ def visualize_stats(store: Store) -> str:
     """
     from core.checkpoint import get_checkpoint_stats
     from core.conversation import ConversationManager
-    from core.path_utils import find_branch_points
 
     conv = ConversationManager(store)
     tree_stats = conv.get_stats()
     cp_stats = get_checkpoint_stats(store)
+    branching = store.tree.stats.as_dict()["branching_histogram"]
 
     # Calculate branch points
-    branch_points = find_branch_points(store.tree, store.active_path_ids)
+    branch_points = store.tree.get_branch_points_on_path(store.get_active_path_ids())
     current_path_length = len(store.active_path_ids)
 
     lines = []
@@ -350,7 +357,15 @@ def visualize_stats(store: Store) -> str:
     lines.append(f"  전체 노드 수: {tree_stats['total_nodes']}")
     lines.append(f"  현재 경로 길이: {current_path_length}")
     lines.append(f"  현재 깊이: {tree_stats['current_depth']}")
-    lines.append(f"  분기 포인트: {len(branch_points)}개")
+    lines.append(f"  현재 경로의 분기 포인트: {len(branch_points)}개")
+    lines.append(f"  잎 노드 수: {tree_stats['leaf_count']}")
+    lines.append(f"  전체 분기 포인트: {tree_stats['branch_points']}개")
+    lines.append(f"  최대 깊이: {tree_stats['max_depth']}")
+    lines.append(f"  평균 깊이: {tree_stats['mean_depth']:.1f}")
+    lines.append(
+        "  자식 수 분포: "
+        + ", ".join(f"{fanout}개→{count}" for fanout, count in branching.items())
+    )
     lines.append("")
 
     lines.append("[체크포인트]")
@@ -361,4 +376,16 @@ def visualize_stats(store: Store) -> str:
         lines.append(f"  최소 깊이: {cp_stats['min_depth']}")
         lines.append(f"  분기 체크포인트: {cp_stats['branch_points']}개")
 
+    # 내용 주소 기반 저장소를 사용하는 경우 중복 제거 현황 표시
+    if isinstance(store.content_store, TextStore):
+        dedup = store.content_store.report()
+        lines.append("")
+        lines.append("[본문 중복 제거]")
+        lines.append(f"  고유 본문: {dedup['unique_texts']}개")
+        lines.append(f"  전체 참조: {dedup['references']}개")
+        lines.append(
+            f"  저장 크기: {dedup['stored_bytes']:,}B / 논리 크기: {dedup['logical_bytes']:,}B"
+        )
+        lines.append(f"  중복 제거 비율: {dedup['dedup_ratio']:.2f}x")
+
     return "\n".join(lines)
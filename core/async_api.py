@@ -0,0 +1,208 @@
+"""
+Store와 ConversationManager의 asyncio 인터페이스.
+
+이 모듈은 asyncio 기반 서비스에서 사용할 AsyncStore와
+AsyncConversationManager를 제공합니다. 블로킹 작업(AI 호출, 디스크 본문
+저장소 접근)은 실행기(executor) 스레드에서 수행되어 이벤트 루프를 막지 않고,
+대화(Store)마다 하나의 asyncio.Lock으로 변경 작업을 직렬화합니다.
+서로 다른 대화는 잠금을 공유하지 않으므로 한 이벤트 루프에서 수천 개의
+세션이 동시에 진행될 수 있습니다.
+"""
+
+import asyncio
+import functools
+from concurrent.futures import Executor
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+from core.conversation import ConversationManager
+from core.models import Node
+from core.store import PathDelta, Store
+
+T = TypeVar("T")
+
+
+class AsyncStore:
+    """
+    Store의 asyncio 래퍼.
+
+    변경 메서드는 Store별 asyncio.Lock 안에서 실행기로 넘겨 실행하고,
+    읽기 메서드는 잠금 없이 실행기에서 실행합니다.
+
+    Example:
+        >>> store = AsyncStore(Store())
+        >>> node = await store.add_node("Q?", "A.")
+        >>> delta = await store.switch("root")
+    """
+
+    def __init__(
+        self, store: Optional[Store] = None, executor: Optional[Executor] = None
+    ):
+        """
+        AsyncStore를 초기화합니다.
+
+        Args:
+            store: 감쌀 Store (None이면 새로 생성)
+            executor: 블로킹 작업을 실행할 실행기 (None이면 이벤트 루프 기본값)
+        """
+        self.store = store if store is not None else Store()
+        self.executor = executor
+        self.lock = asyncio.Lock()
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        블로킹 함수를 실행기에서 실행합니다 (잠금 없음).
+
+        Args:
+            func: 실행할 함수
+            *args: 위치 인자
+            **kwargs: 키워드 인자
+
+        Returns:
+            함수의 반환값
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, functools.partial(func, *args, **kwargs)
+        )
+
+    async def run_locked(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        블로킹 함수를 이 Store의 asyncio 잠금 안에서 실행기로 실행합니다.
+
+        Args:
+            func: 실행할 함수
+            *args: 위치 인자
+            **kwargs: 키워드 인자
+
+        Returns:
+            함수의 반환값
+        """
+        async with self.lock:
+            return await self.run(func, *args, **kwargs)
+
+    async def add_node(
+        self,
+        user_question: str,
+        ai_answer: str,
+        metadata: Optional[Dict] = None,
+        expected_version: Optional[int] = None,
+    ) -> Node:
+        """Store.add_node()의 비동기 버전."""
+        return await self.run_locked(
+            self.store.add_node,
+            user_question,
+            ai_answer,
+            metadata,
+            expected_version=expected_version,
+        )
+
+    async def switch(
+        self, target_node_id: str, expected_version: Optional[int] = None
+    ) -> Optional[PathDelta]:
+        """Store.switch_to_node()의 비동기 버전."""
+        return await self.run_locked(
+            self.store.switch_to_node,
+            target_node_id,
+            expected_version=expected_version,
+        )
+
+    async def save_checkpoint(
+        self, name: str, expected_version: Optional[int] = None
+    ) -> bool:
+        """Store.save_checkpoint()의 비동기 버전."""
+        return await self.run_locked(
+            self.store.save_checkpoint, name, expected_version=expected_version
+        )
+
+    async def load_checkpoint(
+        self, name: str, expected_version: Optional[int] = None
+    ) -> bool:
+        """Store.load_checkpoint()의 비동기 버전."""
+        return await self.run_locked(
+            self.store.load_checkpoint, name, expected_version=expected_version
+        )
+
+    async def delete_checkpoint(
+        self, name: str, expected_version: Optional[int] = None
+    ) -> bool:
+        """Store.delete_checkpoint()의 비동기 버전."""
+        return await self.run_locked(
+            self.store.delete_checkpoint, name, expected_version=expected_version
+        )
+
+    async def get_active_path(self) -> List[Node]:
+        """Store.get_active_path()의 비동기 버전 (지연 로딩 본문 접근 포함)."""
+        return await self.run(self.store.get_active_path)
+
+    def get_current_node_id(self) -> str:
+        """현재 노드 ID (메모리 조회이므로 동기)."""
+        return self.store.get_current_node_id()
+
+    def get_version(self) -> int:
+        """현재 상태 버전 (메모리 조회이므로 동기)."""
+        return self.store.get_version()
+
+
+class AsyncConversationManager:
+    """
+    ConversationManager의 asyncio 래퍼.
+
+    ask()는 맥락 조회, AI 호출, 노드 추가를 대화 잠금 하나로 묶어 실행하므로
+    같은 대화의 질문들은 순서대로 처리되고, 다른 대화의 질문들은 동시에
+    처리됩니다.
+
+    Example:
+        >>> conv = AsyncConversationManager(ai_client=AIClient())
+        >>> node = await conv.ask("Python이 뭐야?")
+        >>> await conv.store.switch("root")
+    """
+
+    def __init__(
+        self,
+        manager: Optional[ConversationManager] = None,
+        ai_client: Any = None,
+        executor: Optional[Executor] = None,
+    ):
+        """
+        AsyncConversationManager를 초기화합니다.
+
+        Args:
+            manager: 감쌀 ConversationManager (None이면 새로 생성)
+            ai_client: ask()에 사용할 AI 클라이언트
+            executor: 블로킹 작업을 실행할 실행기 (None이면 이벤트 루프 기본값)
+        """
+        self.manager = manager if manager is not None else ConversationManager()
+        self.ai_client = ai_client
+        self.store = AsyncStore(self.manager.store, executor=executor)
+
+    async def ask(self, question: str, metadata: Optional[Dict] = None) -> Node:
+        """
+        AI에게 질문하고 답변으로 대화 턴을 추가합니다 (ConversationManager.ask).
+
+        Args:
+            question: 사용자의 질문
+            metadata: 선택적 메타데이터
+
+        Returns:
+            생성된 Node 객체
+
+        Raises:
+            ValueError: AI 클라이언트가 설정되지 않은 경우
+        """
+        if self.ai_client is None:
+            raise ValueError("AI client is not configured")
+        return await self.store.run_locked(
+            self.manager.ask, question, self.ai_client, metadata
+        )
+
+    async def turn(
+        self, user_question: str, ai_answer: str, metadata: Optional[Dict] = None
+    ) -> Node:
+        """ConversationManager.turn()의 비동기 버전."""
+        return await self.store.run_locked(
+            self.manager.turn, user_question, ai_answer, metadata
+        )
+
+    async def get_full_context(self) -> str:
+        """ConversationManager.get_full_context()의 비동기 버전."""
+        return await self.store.run(self.manager.get_full_context)
@@ -1,15 +1,29 @@
 """
 체크포인트(이름표) 관리 유틸리티.
 
-이 모듈은 체크포인트 생성, 검증, 분석 등의 유틸리티 기능을 제공합니다.
+이 모듈은 체크포인트 생성, 검증, 분석 등의 유틸리티 기능과, 자동 체크포인트의
+보존 정책(RetentionPolicy)과 점진적 정리기(CheckpointCompactor)를 제공합니다.
 """
 
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional
-
-from core.models import Node
+from typing import Dict, Hashable, List, Optional
+
+from core.events import (
+    CheckpointDeleted,
+    CheckpointRenamed,
+    CheckpointSaved,
+    Reset,
+    StoreEvent,
+)
+from core.models import Node, Tree
 from core.store import Store
 
+# 분기 시 자동으로 만들어지는 체크포인트의 이름 접두사 (수동 이름에는 쓸 수 없음)
+AUTO_CHECKPOINT_PREFIX = "@branch_"
+
 
 def validate_checkpoint_name(name: str) -> tuple[bool, Optional[str]]:
     """
@@ -110,15 +124,30 @@ def get_checkpoint_info(store: Store, checkpoint_name: str) -> Optional[dict]:
         "children_count": len(children),
         "timestamp": node.timestamp,
         "has_branches": len(children) >= 2,
+        "path_hash": store.tree.get_path_hash(node_id),
     }
 
 
-def list_checkpoints_detailed(store: Store) -> List[dict]:
+def list_checkpoints_detailed(
+    store: Store,
+    after: Optional[str] = None,
+    limit: Optional[int] = None,
+    prefix: str = "",
+    exclude_prefix: str = "",
+) -> List[dict]:
     """
-    모든 체크포인트의 상세 정보를 반환합니다.
+    체크포인트의 상세 정보를 이름순으로 반환합니다.
+
+    after/limit을 주면 Store.list_checkpoints_page로 한 페이지만 조회하므로
+    상세 정보도 그 페이지 분량만 만듭니다. 다음 페이지 커서는 마지막 항목의
+    'name'입니다.
 
     Args:
         store: Store 객체
+        after: 이 이름 뒤부터 (None이면 처음부터)
+        limit: 최대 개수 (None이면 전체)
+        prefix: 이 접두사로 시작하는 체크포인트만
+        exclude_prefix: 이 접두사로 시작하는 체크포인트는 제외
 
     Returns:
         체크포인트 정보 딕셔너리 리스트 (이름순 정렬)
@@ -128,9 +157,10 @@ def list_checkpoints_detailed(store: Store) -> List[dict]:
         >>> for cp in checkpoints:
         ...     print(f"{cp['name']}: {cp['user_question']}")
     """
+    page = store.list_checkpoints_page(after, limit, prefix, exclude_prefix)
     result = []
 
-    for name in sorted(store.list_checkpoints().keys()):
+    for name, _node_id in page.items:
         info = get_checkpoint_info(store, name)
         if info:
             result.append(info)
@@ -147,19 +177,40 @@ def find_checkpoint_by_node(store: Store, node_id: str) -> Optional[str]:
         node_id: 노드 ID
 
     Returns:
-        체크포인트 이름, 없으면 None
+        체크포인트 이름 (여러 개면 가장 먼저 저장된 것), 없으면 None
 
     Example:
         >>> name = find_checkpoint_by_node(store, 'node-abc')
         >>> name  # 'checkpoint-1'
     """
-    checkpoints = store.list_checkpoints()
+    names = store.get_checkpoint_names(node_id)
+    return names[0] if names else None
 
-    for name, cp_node_id in checkpoints.items():
-        if cp_node_id == node_id:
-            return name
 
-    return None
+def has_same_history(store: Store, name_a: str, name_b: str) -> bool:
+    """
+    두 체크포인트가 같은 대화 이력(루트부터의 질문/답변)을 가리키는지 확인합니다.
+
+    경로 해시 비교 한 번으로 끝나므로 경로 길이와 무관하게 O(1)입니다.
+    서로 다른 노드라도 내용이 같은 이력이면 True입니다.
+
+    Args:
+        store: Store 객체
+        name_a: 첫 번째 체크포인트 이름
+        name_b: 두 번째 체크포인트 이름
+
+    Returns:
+        이력이 같으면 True, 다르거나 체크포인트가 없으면 False
+
+    Example:
+        >>> has_same_history(store, "before-retry", "after-retry")
+        False
+    """
+    snapshot_a = store.get_checkpoint_snapshot(name_a)
+    snapshot_b = store.get_checkpoint_snapshot(name_b)
+    if snapshot_a is None or snapshot_b is None:
+        return False
+    return snapshot_a.hash == snapshot_b.hash
 
 
 def export_checkpoints(store: Store) -> List[dict]:
@@ -190,6 +241,7 @@ def export_checkpoints(store: Store) -> List[dict]:
                     "ai_answer": node.ai_answer,
                     "metadata": node.metadata,
                     "timestamp": node.timestamp.isoformat(),
+                    "path_hash": store.tree.get_path_hash(node_id),
                 }
             )
 
@@ -200,6 +252,9 @@ def import_checkpoints(store: Store, data: List[dict]) -> tuple[int, List[str]]:
     """
     체크포인트를 가져옵니다.
 
+    항목에 path_hash가 있으면 대상 노드의 경로 해시와 비교해, 같은 ID의
+    노드라도 대화 이력이 다르면 가져오지 않습니다 (무결성 검증, O(1)).
+
     Args:
         store: Store 객체
         data: 내보내기 데이터 리스트
@@ -223,15 +278,17 @@ def import_checkpoints(store: Store, data: List[dict]) -> tuple[int, List[str]]:
             failures.append(name or "unknown")
             continue
 
-        # 노드가 존재하는지 확인
+        # 노드가 존재하고 이력이 내보낼 때와 같은지 확인
         if not store.tree.node_exists(node_id):
             failures.append(name)
             continue
+        expected_hash = item.get("path_hash")
+        if expected_hash and expected_hash != store.tree.get_path_hash(node_id):
+            failures.append(name)
+            continue
 
-        # 체크포인트 저장 시도
-        if store.save_checkpoint(name):
-            # 수동으로 node_id 설정 (이미 다른 노드에 있을 수 있으므로)
-            store.checkpoints[name] = node_id
+        # 체크포인트 저장 시도 (현재 위치가 아닌 지정된 노드에)
+        if store.save_checkpoint(name, node_id=node_id):
             success_count += 1
         else:
             failures.append(name)
@@ -254,37 +311,8 @@ def get_checkpoint_stats(store: Store) -> dict:
         >>> stats['total_count']  # 5
         >>> stats['avg_depth']  # 2.4
     """
-    checkpoints = store.list_checkpoints()
-    total = len(checkpoints)
-
-    if total == 0:
-        return {
-            "total_count": 0,
-            "avg_depth": 0,
-            "max_depth": 0,
-            "min_depth": 0,
-            "branch_points": 0,
-        }
-
-    depths = []
-    branch_count = 0
-
-    for node_id in checkpoints.values():
-        path = store.tree.get_path_to_root(node_id)
-        depth = len(path) - 1
-        depths.append(depth)
-
-        children = store.tree.get_children(node_id)
-        if len(children) >= 2:
-            branch_count += 1
-
-    return {
-        "total_count": total,
-        "avg_depth": sum(depths) / total if total > 0 else 0,
-        "max_depth": max(depths) if depths else 0,
-        "min_depth": min(depths) if depths else 0,
-        "branch_points": branch_count,
-    }
+    # Store가 체크포인트 변경마다 갱신하는 집계를 읽으므로 O(1)
+    return store.get_checkpoint_stats()
 
 
 def cleanup_orphaned_checkpoints(store: Store) -> int:
@@ -346,8 +374,300 @@ def rename_checkpoint(
         return False, f"체크포인트 '{new_name}'이 이미 존재합니다"
 
     # 이름 변경
-    node_id = checkpoints[old_name]
-    store.delete_checkpoint(old_name)
-    store.checkpoints[new_name] = node_id
+    store.rename_checkpoint(old_name, new_name)
 
     return True, None
+
+
+def is_auto_checkpoint(name: str) -> bool:
+    """
+    자동으로 만들어진 체크포인트인지 확인합니다.
+
+    Args:
+        name: 체크포인트 이름
+
+    Returns:
+        AUTO_CHECKPOINT_PREFIX로 시작하면 True (수동 체크포인트는 False)
+    """
+    return name.startswith(AUTO_CHECKPOINT_PREFIX)
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """
+    자동 체크포인트 보존 정책 (plan.md §7의 하이브리드 전략).
+
+    최근 keep_recent개의 자동 체크포인트는 모두 보관하고, 그보다 오래된 것은
+    그룹(날짜 또는 서브트리)마다 가장 최근 것 하나만 대표로 남깁니다.
+    수동 체크포인트는 항상 보관(고정)됩니다.
+
+    Attributes:
+        keep_recent: 전부 보관할 최근 자동 체크포인트 수
+        group_by: 오래된 체크포인트를 묶는 기준
+            - "day": 노드 생성 날짜
+            - "subtree": 깊이 subtree_depth의 조상 노드
+        subtree_depth: group_by="subtree"일 때 서브트리를 나누는 깊이 (1 이상)
+
+    Example:
+        >>> policy = RetentionPolicy(keep_recent=20, group_by="subtree")
+    """
+
+    keep_recent: int = 50
+    group_by: str = "day"
+    subtree_depth: int = 1
+
+    def __post_init__(self):
+        """정책 값 검증."""
+        if self.keep_recent < 0:
+            raise ValueError("keep_recent cannot be negative")
+        if self.group_by not in ("day", "subtree"):
+            raise ValueError(f"Unknown group_by '{self.group_by}'")
+        if self.subtree_depth < 1:
+            raise ValueError("subtree_depth must be at least 1")
+
+    def group_key(
+        self, tree: Tree, node_id: str, path_ids: Optional[List[str]] = None
+    ) -> Hashable:
+        """
+        체크포인트가 가리키는 노드의 그룹 키를 계산합니다.
+
+        "subtree" 그룹은 깊이 색인으로 조상 위치를 정합니다. 노드가 path_ids
+        위에 있으면 O(1)이고, 아니면 부모를 (깊이 - subtree_depth)번 따라
+        올라갑니다.
+
+        Args:
+            tree: Tree 객체
+            node_id: 체크포인트가 가리키는 노드 ID
+            path_ids: 루트 → 노드 순서의 경로 힌트 (Store.active_path_ids 등)
+
+        Returns:
+            날짜(date) 또는 서브트리 조상 노드 ID (노드가 없으면 None)
+        """
+        if self.group_by == "day":
+            node = tree.get_node(node_id)
+            return node.timestamp.date() if node else None
+
+        depth = tree.get_depth(node_id)
+        if depth < 0:
+            return None
+        # 서브트리 깊이보다 얕은 노드는 자기 자신이 그룹
+        if depth <= self.subtree_depth:
+            return node_id
+        if path_ids is not None and depth < len(path_ids):
+            if path_ids[depth] == node_id:
+                return path_ids[self.subtree_depth]
+
+        current_id = node_id
+        for _ in range(depth - self.subtree_depth):
+            current_id = tree.nodes[current_id].parent_id
+        return current_id
+
+
+class _RetentionState:
+    """
+    보존 정책을 자동 체크포인트가 하나 추가될 때마다 O(1)로 적용하는 상태.
+
+    최근 창(recent)을 벗어난 체크포인트는 그룹별 대표(kept)와 비교되며,
+    같은 그룹의 더 오래된 대표는 삭제 대상으로 반환됩니다.
+    """
+
+    def __init__(self, policy: RetentionPolicy):
+        self.policy = policy
+        self.recent: "OrderedDict[str, Hashable]" = OrderedDict()  # 이름 → 그룹 키
+        self.old: Dict[str, Hashable] = {}  # 창을 벗어난 대표 → 그룹 키
+        self.kept: Dict[Hashable, str] = {}  # 그룹 키 → 대표 이름
+
+    def push(self, name: str, key: Hashable) -> Optional[str]:
+        """가장 최근 체크포인트로 추가하고, 더 이상 필요 없는 이름을 반환합니다."""
+        self.recent[name] = key
+        if len(self.recent) <= self.policy.keep_recent:
+            return None
+
+        demoted, demoted_key = self.recent.popitem(last=False)
+        superseded = self.kept.get(demoted_key)
+        self.kept[demoted_key] = demoted
+        self.old[demoted] = demoted_key
+        if superseded is not None:
+            del self.old[superseded]
+        return superseded
+
+    def discard(self, name: str):
+        """삭제되었거나 이름이 바뀐 체크포인트를 추적에서 뺍니다."""
+        if name in self.recent:
+            del self.recent[name]
+            return
+        if name not in self.old:
+            return
+        key = self.old.pop(name)
+        if self.kept.get(key) == name:
+            del self.kept[key]
+
+
+def plan_retention(store: Store, policy: RetentionPolicy) -> List[str]:
+    """
+    보존 정책에 따라 삭제할 자동 체크포인트를 계산합니다 (삭제는 하지 않음).
+
+    체크포인트는 저장된 순서를 최신성으로 사용합니다. O(C)입니다.
+
+    Args:
+        store: Store 객체
+        policy: 보존 정책
+
+    Returns:
+        삭제할 체크포인트 이름 리스트 (오래된 순)
+
+    Example:
+        >>> names = plan_retention(store, RetentionPolicy(keep_recent=10))
+        >>> store.prune_checkpoints(names)
+    """
+    state = _RetentionState(policy)
+    superseded = []
+    for name, node_id in store.list_checkpoints().items():
+        if not is_auto_checkpoint(name):
+            continue
+        evicted = state.push(name, policy.group_key(store.tree, node_id))
+        if evicted is not None:
+            superseded.append(evicted)
+    return superseded
+
+
+class CheckpointCompactor:
+    """
+    자동 체크포인트를 보존 정책에 맞춰 점진적으로 정리합니다.
+
+    Store 이벤트를 구독해 자동 체크포인트가 저장될 때마다 O(1)로 삭제
+    대상을 골라 두고(pending), compact()가 호출되거나 백그라운드 스레드가
+    깨어날 때 batch_size개씩 Store.prune_checkpoints()로 삭제합니다.
+    정리는 실행 취소 기록에 남지 않습니다.
+
+    생성 중에는 다른 스레드가 체크포인트를 바꾸지 않아야 합니다.
+
+    Example:
+        >>> compactor = CheckpointCompactor(store, RetentionPolicy(keep_recent=50))
+        >>> compactor.start()  # 백그라운드 정리
+        >>> compactor.stop()
+    """
+
+    def __init__(
+        self,
+        store: Store,
+        policy: Optional[RetentionPolicy] = None,
+        batch_size: int = 100,
+    ):
+        """
+        정리기를 만들고 store의 체크포인트 이벤트를 구독합니다.
+
+        Args:
+            store: 대상 Store
+            policy: 보존 정책 (None이면 기본 정책)
+            batch_size: 백그라운드에서 한 번에 삭제할 최대 개수
+        """
+        self.store = store
+        self.policy = policy if policy is not None else RetentionPolicy()
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self._pending: Dict[str, None] = {}  # 삭제 대상 (오래된 순)
+        self._wakeup = threading.Event()
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+
+        self._rebuild(store.list_checkpoints())
+        store.events.subscribe(
+            self._on_event, CheckpointSaved, CheckpointDeleted, CheckpointRenamed, Reset
+        )
+
+    @property
+    def pending_count(self) -> int:
+        """삭제를 기다리는 체크포인트 수."""
+        return len(self._pending)
+
+    def compact(self, limit: Optional[int] = None) -> int:
+        """
+        삭제 대상 체크포인트를 삭제합니다.
+
+        Args:
+            limit: 최대 삭제 개수 (None이면 전부)
+
+        Returns:
+            삭제된 체크포인트 개수
+        """
+        with self._lock:
+            names = list(self._pending)[:limit]
+            for name in names:
+                del self._pending[name]
+        # 삭제 이벤트가 _lock을 다시 잡으므로 잠금 밖에서 호출
+        return self.store.prune_checkpoints(names) if names else 0
+
+    def start(self, interval: float = 1.0):
+        """
+        백그라운드 정리 스레드를 시작합니다 (이미 실행 중이면 무시).
+
+        Args:
+            interval: 삭제 대상이 없을 때 다시 확인하는 간격 (초)
+        """
+        if self._thread is not None:
+            return
+        self._stopping = False
+        self._thread = threading.Thread(
+            target=self._run, args=(interval,), name="checkpoint-compactor", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        """
+        백그라운드 정리 스레드를 멈춥니다.
+
+        Args:
+            timeout: 스레드 종료를 기다릴 최대 시간 (초, None이면 무한)
+        """
+        if self._thread is None:
+            return
+        self._stopping = True
+        self._wakeup.set()
+        self._thread.join(timeout)
+        self._thread = None
+
+    def _run(self, interval: float):
+        while not self._stopping:
+            self._wakeup.wait(interval)
+            self._wakeup.clear()
+            # 한 번에 batch_size개씩 잘라서 다른 작업이 잠금을 오래 기다리지 않게 함
+            while self._pending and not self._stopping:
+                self.compact(self.batch_size)
+
+    def _rebuild(self, checkpoints: Dict[str, str]):
+        with self._lock:
+            self._state = _RetentionState(self.policy)
+            self._pending.clear()
+            for name, node_id in checkpoints.items():
+                self._track(name, node_id)
+
+    def _track(self, name: str, node_id: str):
+        if not is_auto_checkpoint(name):
+            return  # 수동 체크포인트는 고정
+        # 이벤트는 쓰기 잠금 안에서 전달되므로 활성 경로를 힌트로 쓸 수 있음
+        key = self.policy.group_key(
+            self.store.tree, node_id, self.store.active_path_ids
+        )
+        superseded = self._state.push(name, key)
+        if superseded is not None:
+            self._pending[superseded] = None
+            self._wakeup.set()
+
+    def _untrack(self, name: str):
+        self._state.discard(name)
+        self._pending.pop(name, None)
+
+    def _on_event(self, event: StoreEvent):
+        if isinstance(event, Reset):
+            # 이벤트는 쓰기 잠금 안에서 전달되므로 store.checkpoints를 직접 읽음
+            self._rebuild(self.store.checkpoints)
+            return
+        with self._lock:
+            if isinstance(event, CheckpointSaved):
+                self._track(event.name, event.node_id)
+            elif isinstance(event, CheckpointDeleted):
+                self._untrack(event.name)
+            elif isinstance(event, CheckpointRenamed):
+                self._untrack(event.old_name)
+                self._track(event.new_name, event.node_id)
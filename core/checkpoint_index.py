@@ -0,0 +1,235 @@
+"""
+노드 → 체크포인트 이름 역색인과 체크포인트 경로 스냅샷.
+
+이 모듈은 Store의 체크포인트({이름: 노드 ID})를 거꾸로 찾는 색인을
+제공합니다. 체크포인트 저장·삭제·이름 변경 이벤트마다 O(1)로 갱신되므로
+"이 노드에 붙은 체크포인트" 조회가 체크포인트 수와 무관하게 끝나며,
+한 노드에 여러 이름이 붙은 경우도 모두 돌려줍니다.
+
+각 체크포인트는 저장 시점의 활성 경로 스냅샷(PathSnapshot)도 가집니다.
+스냅샷은 노드의 경로 해시(Tree.get_path_hash)로 식별되므로 같은 대화 이력은
+O(1)로 중복 제거되고, 두 체크포인트의 이력 비교는 해시 비교 한 번입니다.
+
+이름순 정렬 색인도 함께 유지하므로 체크포인트 목록은 전체를 정렬하지 않고
+커서 위치부터 필요한 만큼만 읽을 수 있습니다 (iter_names).
+"""
+
+from dataclasses import dataclass
+from itertools import chain, dropwhile, takewhile
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
+
+from core.cow import SortedIds
+
+from core.events import (
+    CheckpointDeleted,
+    CheckpointRenamed,
+    CheckpointSaved,
+    Reset,
+    StoreEvent,
+)
+
+if TYPE_CHECKING:
+    from core.store import Store
+
+
+@dataclass(frozen=True)
+class PathSnapshot:
+    """
+    체크포인트가 저장한 활성 경로의 불변 스냅샷.
+
+    같은 해시의 스냅샷은 하나만 만들어 공유합니다. 해시는 내용만 반영하므로,
+    내용이 같은 이력이 여러 곳에 있으면 path_ids는 처음 저장된 쪽의 경로입니다.
+
+    Attributes:
+        hash: 경로 끝 노드의 경로 해시 (루트부터의 대화 이력 머클 해시)
+        path_ids: 루트 → 노드 순서의 노드 ID
+    """
+
+    hash: str
+    path_ids: Tuple[str, ...]
+
+    @property
+    def node_id(self) -> str:
+        """경로 끝 노드 ID."""
+        return self.path_ids[-1]
+
+    @property
+    def depth(self) -> int:
+        """경로 끝 노드의 깊이 (루트는 0)."""
+        return len(self.path_ids) - 1
+
+
+class CheckpointIndex:
+    """
+    노드 ID → 체크포인트 이름들과 체크포인트별 경로 스냅샷.
+
+    Store 이벤트 구독으로 갱신됩니다. 노드별 이름은 저장된 순서를 유지하며
+    (이름을 바꾸면 맨 뒤로 이동), 스냅샷은 해시별로 하나만 보관하고 참조가
+    없어지면 버립니다. Reset 이벤트를 받으면 O(C)로 다시 만듭니다.
+
+    Example:
+        >>> store.save_checkpoint("a")
+        >>> store.save_checkpoint("b")
+        >>> store.checkpoint_index.names_of(store.get_current_node_id())
+        ['a', 'b']
+    """
+
+    def __init__(self, store: "Store"):
+        """
+        색인을 만들고 store의 체크포인트 이벤트를 구독합니다.
+
+        Args:
+            store: 대상 Store
+        """
+        self.store = store
+        self._names: Dict[str, Dict[str, None]] = {}  # 노드 ID → {이름: None}
+        self._snapshots: Dict[str, PathSnapshot] = {}  # 이름 → 스냅샷
+        self._pool: Dict[str, PathSnapshot] = {}  # 해시 → 스냅샷 (중복 제거)
+        self._refs: Dict[str, int] = {}  # 해시 → 참조하는 체크포인트 수
+        self._sorted_names = SortedIds()  # 이름순 정렬 색인
+        self.rebuild()
+        store.events.subscribe(
+            self._on_event, CheckpointSaved, CheckpointDeleted, CheckpointRenamed, Reset
+        )
+
+    def rebuild(self):
+        """현재 체크포인트로 색인을 다시 만듭니다 (O(C + 서로 다른 이력 × 깊이))."""
+        self._names.clear()
+        self._snapshots.clear()
+        self._pool.clear()
+        self._refs.clear()
+        self._sorted_names = SortedIds()
+        for name, node_id in self.store.checkpoints.items():
+            self._add(name, node_id)
+
+    def names_of(self, node_id: str) -> List[str]:
+        """
+        노드를 가리키는 체크포인트 이름들을 반환합니다 (O(해당 이름 수)).
+
+        Args:
+            node_id: 노드 ID
+
+        Returns:
+            체크포인트 이름 리스트 (저장 순서, 없으면 빈 리스트)
+        """
+        return list(self._names.get(node_id, ()))
+
+    def count(self, node_id: str) -> int:
+        """노드를 가리키는 체크포인트 수 (O(1))."""
+        return len(self._names.get(node_id, ()))
+
+    def snapshot_of(self, name: str) -> Optional[PathSnapshot]:
+        """
+        체크포인트의 경로 스냅샷을 O(1)로 반환합니다.
+
+        Args:
+            name: 체크포인트 이름
+
+        Returns:
+            PathSnapshot, 없는 체크포인트(또는 트리에 없는 노드)면 None
+        """
+        return self._snapshots.get(name)
+
+    def iter_names(
+        self, after: str = "", prefix: str = "", exclude_prefix: str = ""
+    ) -> Iterator[str]:
+        """
+        체크포인트 이름을 이름순으로 순회합니다 (시작 O(log C), 이후 항목당 O(1)).
+
+        같은 접두사의 이름은 정렬 순서에서 연속이므로, 접두사 조건은 그 구간만
+        읽고 제외 조건은 구간을 통째로 건너뜁니다.
+
+        Args:
+            after: 이 이름보다 뒤의 이름만 (빈 문자열이면 처음부터)
+            prefix: 이 접두사로 시작하는 이름만
+            exclude_prefix: 이 접두사로 시작하는 이름은 제외 (빈 문자열이면 제외 없음)
+
+        Returns:
+            이름 이터레이터
+        """
+        if not exclude_prefix:
+            return self._scan(after, prefix, after)
+        # 제외 구간 앞부분과, 구간 끝 다음부터의 뒷부분을 이어 붙임
+        head = takewhile(
+            lambda name: name < exclude_prefix, self._scan(after, prefix, after)
+        )
+        tail = self._scan(_prefix_end(exclude_prefix), prefix, after)
+        return chain(head, tail)
+
+    def count_names(self, prefix: str = "") -> int:
+        """접두사로 시작하는 체크포인트 수 (O(log C))."""
+        if not prefix:
+            return len(self._sorted_names)
+        sorted_names = self._sorted_names
+        return sorted_names.rank(_prefix_end(prefix)) - sorted_names.rank(prefix)
+
+    @property
+    def snapshot_count(self) -> int:
+        """중복 제거 후 보관 중인 스냅샷 수."""
+        return len(self._pool)
+
+    def __len__(self) -> int:
+        """체크포인트가 하나 이상 붙은 노드 수."""
+        return len(self._names)
+
+    def _scan(self, start: str, prefix: str, after: str) -> Iterator[str]:
+        names = self._sorted_names.iter_from(max(start, prefix, after))
+        if after:
+            names = dropwhile(lambda name: name == after, names)
+        return takewhile(lambda name: name.startswith(prefix), names)
+
+    def _add(self, name: str, node_id: str):
+        self._names.setdefault(node_id, {})[name] = None
+        self._sorted_names.add(name)
+
+        tree = self.store.tree
+        path_hash = tree.get_path_hash(node_id)
+        if path_hash is None:
+            return  # 트리에 없는 노드 (고아 체크포인트)는 스냅샷 없음
+        snapshot = self._pool.get(path_hash)
+        if snapshot is None:
+            # 처음 보는 이력만 경로를 복사 (O(깊이)), 이후에는 O(1)로 공유
+            path_ids = tuple(reversed(tree.get_path_to_root(node_id)))
+            snapshot = self._pool[path_hash] = PathSnapshot(path_hash, path_ids)
+        self._snapshots[name] = snapshot
+        self._refs[path_hash] = self._refs.get(path_hash, 0) + 1
+
+    def _remove(self, name: str, node_id: str):
+        names = self._names[node_id]
+        del names[name]
+        if not names:
+            del self._names[node_id]
+        self._sorted_names.remove(name)
+
+        snapshot = self._snapshots.pop(name, None)
+        if snapshot is None:
+            return
+        path_hash = snapshot.hash
+        remaining = self._refs[path_hash] - 1
+        if remaining:
+            self._refs[path_hash] = remaining
+        else:
+            del self._refs[path_hash]
+            del self._pool[path_hash]
+
+    def _on_event(self, event: StoreEvent):
+        if isinstance(event, CheckpointSaved):
+            self._add(event.name, event.node_id)
+        elif isinstance(event, CheckpointDeleted):
+            self._remove(event.name, event.node_id)
+        elif isinstance(event, CheckpointRenamed):
+            names = self._names[event.node_id]
+            del names[event.old_name]
+            names[event.new_name] = None
+            self._sorted_names.remove(event.old_name)
+            self._sorted_names.add(event.new_name)
+            snapshot = self._snapshots.pop(event.old_name, None)
+            if snapshot is not None:
+                self._snapshots[event.new_name] = snapshot
+        elif isinstance(event, Reset):
+            self.rebuild()
+
+
+def _prefix_end(prefix: str) -> str:
+    # prefix로 시작하는 모든 문자열보다 큰 가장 작은 문자열 (정렬 구간의 끝)
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
@@ -0,0 +1,343 @@
+"""
+오래 방문하지 않은(cold) 답변 본문의 투명 압축.
+
+이 모듈은 Tree/Store의 content_store로 사용할 수 있는 CompressedTextStore를
+제공합니다. 새 본문은 원문 그대로(hot) 보관하고, 최근 N번의 노드 전환 동안
+방문하지 않은 본문은 zlib 또는 lzma로 압축합니다. 압축된 본문은 접근 시
+지연 해제되며, 해제 결과는 작은 hot 캐시에 보관됩니다.
+"""
+
+import lzma
+import threading
+import weakref
+import zlib
+from collections import Counter, OrderedDict
+from typing import Dict, Iterable, List, Optional, Union
+
+COMPRESSION_METHODS = ("zlib", "lzma")
+
+# zlib 사전(preset dictionary)의 최대 유효 크기 (윈도우 크기)
+ZDICT_MAX_SIZE = 32 * 1024
+
+
+def build_zdict(texts: Iterable[str], size: int = ZDICT_MAX_SIZE) -> bytes:
+    """
+    트리의 본문들로부터 zlib 공유 사전을 만듭니다.
+
+    자주 등장하는 단어를 (빈도 × 길이) 점수 순으로 모아 사전을 구성하며,
+    zlib은 사전 끝부분을 더 가깝게 참조하므로 점수가 높은 단어를 뒤에 둡니다.
+
+    Args:
+        texts: 학습에 사용할 텍스트들
+        size: 사전 최대 바이트 수 (최대 32KB)
+
+    Returns:
+        zlib zdict로 사용할 바이트열
+    """
+    counts: Counter = Counter()
+    for text in texts:
+        counts.update(text.split())
+
+    scored = sorted(
+        (word for word, count in counts.items() if count > 1),
+        key=lambda word: counts[word] * len(word),
+        reverse=True,
+    )
+
+    chosen: List[bytes] = []
+    total = 0
+    limit = min(size, ZDICT_MAX_SIZE)
+    for word in scored:
+        encoded = word.encode("utf-8") + b" "
+        if total + len(encoded) > limit:
+            break
+        chosen.append(encoded)
+        total += len(encoded)
+
+    return b"".join(reversed(chosen))
+
+
+class PathRefs(set):
+    """Store 하나의 활성 경로에 있는 본문 핸들 집합 (track_path() 참고)."""
+
+
+class CompressedTextStore:
+    """
+    방문 이력 기반으로 오래된 본문을 압축하는 메모리 텍스트 저장소.
+
+    put()은 정수 핸들을 참조로 반환합니다. Store는 노드 전환마다
+    record_switch()로 새로 활성 경로에 들어온 본문 핸들을 알려주며,
+    cold_after번의 전환 동안 방문되지 않은 본문은 압축됩니다. 방문된 본문은
+    다시 원문으로 복원됩니다. 어느 Store의 활성 경로(track_path())에든 있는
+    본문은 방문 시점과 무관하게 hot으로 유지됩니다.
+
+    본문은 여러 Store/세션이 동시에 읽고 전환하므로, 본문과 hot 캐시, 방문
+    이력의 변경은 자체 잠금으로 보호합니다.
+    """
+
+    content_addressed = False
+
+    def __init__(
+        self,
+        method: str = "zlib",
+        level: int = 6,
+        zdict: Optional[bytes] = None,
+        cold_after: int = 20,
+        hot_cache_size: int = 64,
+        min_size: int = 128,
+    ):
+        """
+        압축 저장소를 초기화합니다.
+
+        Args:
+            method: 압축 방식 ("zlib" 또는 "lzma")
+            level: 압축 레벨 (zlib 0-9, lzma 0-9 preset)
+            zdict: zlib 공유 사전 (build_zdict()로 생성, zlib에서만 사용)
+            cold_after: 이 횟수의 전환 동안 방문하지 않은 본문을 압축
+            hot_cache_size: 해제된 본문을 보관할 hot 캐시 크기
+            min_size: 이보다 짧은(바이트) 본문은 압축하지 않음
+
+        Raises:
+            ValueError: 지원하지 않는 압축 방식이거나 lzma에 zdict를 지정한 경우
+        """
+        if method not in COMPRESSION_METHODS:
+            raise ValueError(f"Unsupported compression method: {method}")
+        if zdict is not None and method != "zlib":
+            raise ValueError("zdict is only supported with zlib")
+
+        self.method = method
+        self.level = level
+        self.zdict = zdict
+        self.cold_after = cold_after
+        self.hot_cache_size = hot_cache_size
+        self.min_size = min_size
+        self._lock = threading.Lock()
+
+        self._data: Dict[int, Union[str, bytes]] = {}
+        self._raw_sizes: Dict[int, int] = {}
+        self._next_handle = 0
+
+        # 원문 상태 핸들 → 마지막 방문 시점 (방문 순서 유지)
+        self._hot: "OrderedDict[int, int]" = OrderedDict()
+        self._tick = 0
+        # Store별 활성 경로 핸들 집합 (Store가 사라지면 자동으로 빠짐)
+        self._paths: "weakref.WeakValueDictionary[int, PathRefs]" = (
+            weakref.WeakValueDictionary()
+        )
+        self._next_path = 0
+
+        self._cache: "OrderedDict[int, str]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    # ==================== 압축/해제 ====================
+
+    def _compress(self, text: str) -> bytes:
+        """텍스트를 설정된 방식으로 압축합니다."""
+        data = text.encode("utf-8")
+        if self.method == "lzma":
+            return lzma.compress(data, preset=self.level)
+        if self.zdict:
+            compressor = zlib.compressobj(self.level, zdict=self.zdict)
+            return compressor.compress(data) + compressor.flush()
+        return zlib.compress(data, self.level)
+
+    def _decompress(self, blob: bytes) -> str:
+        """압축된 바이트를 텍스트로 복원합니다."""
+        if self.method == "lzma":
+            return lzma.decompress(blob).decode("utf-8")
+        if self.zdict:
+            decompressor = zlib.decompressobj(zdict=self.zdict)
+            return (decompressor.decompress(blob) + decompressor.flush()).decode(
+                "utf-8"
+            )
+        return zlib.decompress(blob).decode("utf-8")
+
+    # ==================== content_store 인터페이스 ====================
+
+    def put(self, text: str) -> int:
+        """
+        본문을 원문(hot) 상태로 저장합니다.
+
+        Args:
+            text: 저장할 텍스트
+
+        Returns:
+            본문 핸들 (참조)
+        """
+        raw_size = len(text.encode("utf-8"))
+        with self._lock:
+            handle = self._next_handle
+            self._next_handle += 1
+            self._data[handle] = text
+            self._raw_sizes[handle] = raw_size
+            self._hot[handle] = self._tick
+        return handle
+
+    def get(self, handle: int) -> str:
+        """
+        핸들로 본문을 조회합니다 (압축된 경우 hot 캐시 경유 지연 해제).
+
+        Args:
+            handle: put()이 반환한 참조
+
+        Returns:
+            원문 텍스트
+        """
+        with self._lock:
+            return self._get(handle)
+
+    def _get(self, handle: int) -> str:
+        """잠금 안에서 본문을 조회합니다 (get 참고)."""
+        stored = self._data[handle]
+        if isinstance(stored, str):
+            return stored
+
+        cached = self._cache.get(handle)
+        if cached is not None:
+            self._cache.move_to_end(handle)
+            self._hits += 1
+            return cached
+
+        self._misses += 1
+        text = self._decompress(stored)
+        if self.hot_cache_size > 0:
+            self._cache[handle] = text
+            if len(self._cache) > self.hot_cache_size:
+                self._cache.popitem(last=False)
+        return text
+
+    def release(self, handle: int) -> bool:
+        """
+        본문을 제거합니다.
+
+        Args:
+            handle: 제거할 참조
+
+        Returns:
+            제거되었으면 True
+        """
+        with self._lock:
+            if handle not in self._data:
+                return False
+            del self._data[handle]
+            del self._raw_sizes[handle]
+            self._hot.pop(handle, None)
+            self._cache.pop(handle, None)
+            return True
+
+    # ==================== 압축 정책 ====================
+
+    def track_path(self) -> PathRefs:
+        """
+        활성 경로의 본문 핸들을 담을 집합을 만들어 추적합니다.
+
+        Store는 활성 경로가 바뀔 때마다 이 집합을 갱신합니다. 집합에 있는
+        본문은 압축 대상에서 빠지며, 집합을 가진 Store가 사라지면 추적도
+        끝납니다.
+
+        Returns:
+            비어 있는 PathRefs 집합
+        """
+        refs = PathRefs()
+        with self._lock:
+            self._paths[self._next_path] = refs
+            self._next_path += 1
+        return refs
+
+    def record_switch(self, handles: Iterable[int]) -> int:
+        """
+        노드 전환 1회를 기록하고 오래된 본문을 압축합니다.
+
+        방문한 본문은 압축되어 있었다면 원문으로 복원됩니다.
+
+        Args:
+            handles: 이번 전환에서 새로 활성 경로에 들어온 본문 핸들들
+
+        Returns:
+            이번에 새로 압축된 본문 개수
+        """
+        with self._lock:
+            self._tick += 1
+
+            for handle in handles:
+                stored = self._data.get(handle)
+                if stored is None:
+                    continue
+                if not isinstance(stored, str):
+                    self._data[handle] = self._get(handle)
+                    self._cache.pop(handle, None)
+                self._hot[handle] = self._tick
+                self._hot.move_to_end(handle)
+
+            return self._compress_older_than(self._tick - self.cold_after)
+
+    def compress_cold(self) -> int:
+        """
+        현재 방문 이력 기준으로 cold 본문을 즉시 압축합니다.
+
+        Returns:
+            새로 압축된 본문 개수
+        """
+        with self._lock:
+            return self._compress_older_than(self._tick - self.cold_after)
+
+    def _compress_older_than(self, threshold: int) -> int:
+        """
+        마지막 방문이 threshold 이하인 원문 본문을 압축합니다 (잠금 안에서 호출).
+
+        활성 경로에 있는 본문은 압축하지 않고 현재 시점으로 다시 기록하므로,
+        경로에 머무는 동안 cold_after번의 전환마다 한 번씩만 확인됩니다.
+        """
+        compressed = 0
+        on_path = []
+        while self._hot:
+            handle, last_visit = next(iter(self._hot.items()))
+            if last_visit > threshold:
+                break
+            self._hot.popitem(last=False)
+            if any(handle in refs for refs in self._paths.values()):
+                on_path.append(handle)
+                continue
+
+            text = self._data[handle]
+            if self._raw_sizes[handle] < self.min_size:
+                continue
+            blob = self._compress(text)
+            if len(blob) < self._raw_sizes[handle]:
+                self._data[handle] = blob
+                compressed += 1
+
+        for handle in on_path:
+            self._hot[handle] = self._tick
+        return compressed
+
+    def stats(self) -> dict:
+        """
+        압축 현황을 반환합니다.
+
+        Returns:
+            본문 수, 압축된 본문 수, 원문/보관 바이트, 절약 바이트, 캐시 통계
+        """
+        with self._lock:
+            raw_bytes = sum(self._raw_sizes.values())
+            stored_bytes = 0
+            compressed = 0
+            for handle, stored in self._data.items():
+                if isinstance(stored, str):
+                    stored_bytes += self._raw_sizes[handle]
+                else:
+                    stored_bytes += len(stored)
+                    compressed += 1
+            texts = len(self._data)
+            hits, misses = self._hits, self._misses
+
+        return {
+            "texts": texts,
+            "compressed": compressed,
+            "raw_bytes": raw_bytes,
+            "stored_bytes": stored_bytes,
+            "saved_bytes": raw_bytes - stored_bytes,
+            "cache_hits": hits,
+            "cache_misses": misses,
+        }
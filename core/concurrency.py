@@ -0,0 +1,139 @@
+"""
+Store 동시성 제어 도구.
+
+이 모듈은 Store가 사용하는 읽기-쓰기 잠금(RWLock)과, 낙관적 버전 검사
+(compare-and-swap)에 실패했을 때 발생하는 VersionConflictError와, 현재 노드만
+비교할 때 쓰는 PathConflictError를 제공합니다.
+plan.md의 409(동시 전환 충돌) 의미를 그대로 따릅니다.
+"""
+
+import threading
+from typing import Callable
+
+
+class VersionConflictError(ValueError):
+    """
+    기대한 버전과 Store의 현재 버전이 다를 때 발생하는 예외 (HTTP 409).
+
+    Attributes:
+        expected: 호출자가 기대한 버전
+        actual: Store의 현재 버전
+    """
+
+    status = 409
+
+    def __init__(self, expected: int, actual: int):
+        super().__init__(
+            f"Version conflict: expected {expected}, current version is {actual}"
+        )
+        self.expected = expected
+        self.actual = actual
+
+
+class PathConflictError(VersionConflictError):
+    """
+    기대한 현재 노드와 Store의 현재 노드가 다를 때 발생하는 예외 (HTTP 409).
+
+    버전 대신 현재 위치만 비교하므로, 체크포인트 정리처럼 활성 경로와 무관한
+    변경은 충돌로 보지 않습니다. 거부된 턴의 질문과 답변을 함께 담아 두므로
+    호출자는 AI를 다시 부르지 않고 재시도하거나 사용자에게 보여줄 수 있습니다.
+
+    Attributes:
+        expected: 호출자가 기대한 현재 노드 ID
+        actual: Store의 현재 노드 ID
+        user_question: 추가하려던 질문
+        ai_answer: 추가하려던 답변
+    """
+
+    def __init__(
+        self, expected: str, actual: str, user_question: str, ai_answer: str
+    ):
+        ValueError.__init__(
+            self,
+            f"Path conflict: expected current node {expected}, "
+            f"current node is {actual}",
+        )
+        self.expected = expected
+        self.actual = actual
+        self.user_question = user_question
+        self.ai_answer = ai_answer
+
+
+class RWLock:
+    """
+    쓰기 우선 읽기-쓰기 잠금.
+
+    여러 읽기는 동시에 진행되고, 쓰기는 단독으로 진행됩니다. 대기 중인
+    쓰기가 있으면 새 읽기는 기다리므로 쓰기가 굶지 않습니다.
+    재진입은 지원하지 않습니다.
+
+    Example:
+        >>> lock = RWLock()
+        >>> with lock.read():
+        ...     pass
+        >>> with lock.write():
+        ...     pass
+    """
+
+    def __init__(self):
+        """잠금을 초기화합니다."""
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._waiting_writers = 0
+        # 호출마다 제너레이터를 만들지 않도록 컨텍스트 객체를 재사용
+        self._read_guard = _Guard(self.acquire_read, self.release_read)
+        self._write_guard = _Guard(self.acquire_write, self.release_write)
+
+    def acquire_read(self):
+        """읽기 잠금을 잡습니다 (다른 읽기와 동시 진행 가능)."""
+        with self._cond:
+            while self._writer or self._waiting_writers:
+                self._cond.wait()
+            self._readers += 1
+
+    def release_read(self):
+        """읽기 잠금을 놓습니다."""
+        with self._cond:
+            self._readers -= 1
+            if self._readers == 0:
+                self._cond.notify_all()
+
+    def acquire_write(self):
+        """쓰기 잠금을 잡습니다 (단독 진행)."""
+        with self._cond:
+            self._waiting_writers += 1
+            while self._writer or self._readers:
+                self._cond.wait()
+            self._waiting_writers -= 1
+            self._writer = True
+
+    def release_write(self):
+        """쓰기 잠금을 놓습니다."""
+        with self._cond:
+            self._writer = False
+            self._cond.notify_all()
+
+    def read(self) -> "_Guard":
+        """with 문에서 사용할 읽기 잠금 컨텍스트를 반환합니다."""
+        return self._read_guard
+
+    def write(self) -> "_Guard":
+        """with 문에서 사용할 쓰기 잠금 컨텍스트를 반환합니다."""
+        return self._write_guard
+
+
+class _Guard:
+    """잠금 획득/해제 함수를 with 문으로 감싸는 컨텍스트."""
+
+    __slots__ = ("_acquire", "_release")
+
+    def __init__(self, acquire: Callable[[], None], release: Callable[[], None]):
+        self._acquire = acquire
+        self._release = release
+
+    def __enter__(self):
+        self._acquire()
+
+    def __exit__(self, exc_type, exc, tb):
+        self._release()
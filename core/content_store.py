@@ -0,0 +1,146 @@
+"""
+노드 본문을 디스크에 보관하는 콘텐츠 저장소.
+
+이 모듈은 질문/답변 본문을 추가 전용(append-only) 파일에 기록하고
+오프셋과 길이를 담은 정수 참조로 다시 읽어오는 ContentStore를 제공합니다.
+자주 읽는 본문은 LRU 캐시에 보관합니다.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, Tuple
+
+# 참조 = (오프셋 << _LENGTH_BITS) | 길이. 노드마다 참조를 두 개씩 들고 있으므로
+# 튜플 대신 정수 하나로 표현해 노드당 상주 메모리를 줄임
+ContentRef = int
+_LENGTH_BITS = 32
+_LENGTH_MASK = (1 << _LENGTH_BITS) - 1
+
+
+def split_ref(ref: ContentRef) -> Tuple[int, int]:
+    """
+    참조를 (오프셋, 바이트 길이)로 나눕니다.
+
+    Args:
+        ref: ContentStore.put()이 반환한 참조
+
+    Returns:
+        (오프셋, 길이) 튜플
+    """
+    return ref >> _LENGTH_BITS, ref & _LENGTH_MASK
+
+
+class ContentStore:
+    """
+    추가 전용 파일 기반 텍스트 저장소.
+
+    put()으로 기록한 텍스트는 오프셋과 길이를 담은 정수 참조로 식별되며,
+    파일은 덮어쓰지 않으므로 한 번 발급된 참조는 항상 유효합니다.
+    LazyNode 본문은 Store 읽기 잠금 안에서(또는 잠금 없이) 여러 스레드가 동시에
+    읽으므로, 공유 파일 핸들의 seek/read와 LRU 갱신은 자체 잠금으로 보호합니다.
+    """
+
+    # 같은 텍스트라도 기록할 때마다 다른 참조가 발급됨
+    content_addressed = False
+
+    def __init__(self, path: str, cache_size: int = 256):
+        """
+        콘텐츠 저장소를 엽니다 (파일이 없으면 생성).
+
+        Args:
+            path: 저장소 파일 경로
+            cache_size: LRU 캐시에 보관할 최대 본문 개수
+        """
+        self.path = path
+        self.cache_size = cache_size
+        self._lock = threading.Lock()
+        self._file = open(path, "a+b")
+        self._file.seek(0, 2)
+        self._end = self._file.tell()
+        self._dirty = False
+        self._cache: "OrderedDict[ContentRef, str]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def put(self, text: str) -> ContentRef:
+        """
+        텍스트를 파일 끝에 기록합니다.
+
+        Args:
+            text: 저장할 텍스트
+
+        Returns:
+            오프셋과 길이를 담은 참조 (split_ref()로 나눌 수 있음)
+
+        Raises:
+            ValueError: 본문이 4GB 이상인 경우
+        """
+        data = text.encode("utf-8")
+        if len(data) > _LENGTH_MASK:
+            raise ValueError("Text is too large for a content store ref")
+        with self._lock:
+            ref = (self._end << _LENGTH_BITS) | len(data)
+            self._file.write(data)
+            self._end += len(data)
+            self._dirty = True
+        return ref
+
+    def get(self, ref: ContentRef) -> str:
+        """
+        참조로 텍스트를 읽습니다 (LRU 캐시 경유).
+
+        Args:
+            ref: put()이 반환한 참조
+
+        Returns:
+            저장된 텍스트
+        """
+        with self._lock:
+            cached = self._cache.get(ref)
+            if cached is not None:
+                self._cache.move_to_end(ref)
+                self._hits += 1
+                return cached
+
+            self._misses += 1
+            if self._dirty:
+                self._file.flush()
+                self._dirty = False
+
+            offset, length = split_ref(ref)
+            self._file.seek(offset)
+            text = self._file.read(length).decode("utf-8")
+
+            if self.cache_size > 0:
+                self._cache[ref] = text
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+            return text
+
+    def cache_info(self) -> Dict[str, int]:
+        """
+        캐시 통계를 반환합니다.
+
+        Returns:
+            hits, misses, size, bytes(파일 크기) 딕셔너리
+        """
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "size": len(self._cache),
+            "bytes": self._end,
+        }
+
+    def close(self):
+        """파일을 닫습니다."""
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+            self._cache.clear()
+
+    def __enter__(self) -> "ContentStore":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
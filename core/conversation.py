@@ -5,11 +5,22 @@
 핵심 원칙: 1턴 = 1노드
 """
 
-from typing import Dict, Optional
+from collections import deque
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Optional
 
+from core.checkpoint import AUTO_CHECKPOINT_PREFIX
+from core.events import NodeAdded, Reset
 from core.models import Node
 from core.store import Store
 
+if TYPE_CHECKING:
+    from core.vectors import VectorIndex
+
+# ask()가 이전 대화 맥락과 함께 질문할 때 사용하는 시스템 프롬프트
+CONTEXT_SYSTEM_PROMPT = (
+    "당신은 친절한 AI 상담사입니다. 이전 대화 맥락을 고려하여 답변하세요."
+)
+
 
 class ConversationManager:
     """
@@ -17,16 +28,135 @@ class ConversationManager:
 
     매 대화 턴(사용자 질문 + AI 응답)마다 자동으로 새 노드를 생성합니다.
     Store의 상위 레이어로서 대화 중심의 인터페이스를 제공합니다.
+
+    auto_checkpoint를 켜면 노드에 두 번째 자식이 생겨 분기점이 되는 순간
+    그 노드에 @branch_* 체크포인트를 만듭니다. 분기 판정은 NodeAdded 이벤트와
+    자식 수 인덱스로 O(1)에 이루어집니다. merge처럼 노드를 통째로 들여와
+    Reset만 알리는 변경이나, 트리를 공유하는 다른 세션이 만든 분기점(이
+    Store의 이벤트로는 오지 않음)은 트리의 분기점 생성 횟수가 이 관리자가 본
+    것보다 늘었을 때만 이미 본 분기점 집합과 비교해 찾습니다 (O(분기점 수)).
+
+    vector_index를 주면 ask()가 현재 경로 밖(다른 분기)에서 질문과 의미가
+    가까운 턴을 찾아 맥락에 함께 넣습니다.
     """
 
-    def __init__(self, store: Optional[Store] = None):
+    def __init__(
+        self,
+        store: Optional[Store] = None,
+        auto_checkpoint: bool = False,
+        vector_index: Optional["VectorIndex"] = None,
+        related_turns: int = 3,
+        related_min_score: float = 0.2,
+    ):
         """
         ConversationManager 초기화.
 
         Args:
             store: 사용할 Store 인스턴스 (None이면 새로 생성)
+            auto_checkpoint: True면 분기가 생길 때 자동 체크포인트를 만듭니다
+            vector_index: 다른 분기의 관련 턴을 찾을 벡터 색인 (None이면 사용 안 함)
+            related_turns: ask()가 맥락에 넣을 다른 분기 턴의 최대 개수
+            related_min_score: 맥락에 넣을 다른 분기 턴의 최소 유사도 (이보다
+                낮으면 관련 없는 턴으로 보고 버림)
         """
         self.store = store if store is not None else Store()
+        self.auto_checkpoint = auto_checkpoint
+        self.vector_index = vector_index
+        self.related_turns = related_turns
+        self.related_min_score = related_min_score
+        # 분기점이 된 노드 (이벤트는 Store 쓰기 잠금 안에서 오므로 모았다가 저장)
+        self._new_branch_points: Deque[str] = deque()
+        # 이미 처리한 분기점과 그때의 트리 분기점 생성 횟수 (다른 작업자나
+        # Reset으로 생긴 분기점만 골라내기 위함)
+        self._known_branch_points = set(self.store.tree.get_branch_point_ids())
+        self._seen_branch_points_created = self.store.tree.branch_points_created
+        if auto_checkpoint:
+            self.store.events.subscribe(self._on_node_added, NodeAdded)
+            self.store.events.subscribe(self._on_reset, Reset)
+
+    def _on_node_added(self, event: NodeAdded):
+        """
+        노드 추가로 부모가 새 분기점이 되었으면 저장 대기열에 넣습니다.
+
+        자식이 정확히 2개가 된 순간에만 기록하므로 O(1)입니다. 이벤트는 Store
+        쓰기 잠금 안에서 오므로 체크포인트 저장은 save_branch_checkpoints()로
+        미룹니다.
+
+        Args:
+            event: Store가 발행한 NodeAdded 이벤트
+        """
+        if self.store.tree.get_child_count(event.parent_id) == 2:
+            self._known_branch_points.add(event.parent_id)
+            self._new_branch_points.append(event.parent_id)
+            # 이 분기점은 직접 처리했으므로 다시 훑지 않도록 본 횟수에 포함
+            self._seen_branch_points_created += 1
+
+    def _on_reset(self, event: Reset):
+        """
+        트리가 통째로 바뀌면 처음 보는 분기점을 저장 대기열에 넣습니다.
+
+        merge나 replace_state로 들어온 노드는 NodeAdded 없이 Reset만 알리므로
+        현재 분기점 전체를 이미 본 분기점과 비교합니다 (O(분기점 수)).
+        이미 본 분기점은 자동 체크포인트가 정리되었더라도 다시 만들지 않습니다.
+
+        Args:
+            event: Store가 발행한 Reset 이벤트
+        """
+        self._collect_branch_points(replaced=True)
+
+    def _collect_branch_points(self, replaced: bool = False):
+        """
+        이 관리자가 아직 못 본 분기점을 저장 대기열에 넣습니다.
+
+        트리의 분기점 생성 횟수가 본 횟수와 같으면 O(1)로 끝나고, 다르면
+        현재 분기점 전체를 이미 본 분기점과 비교합니다 (O(분기점 수)).
+
+        Args:
+            replaced: True면 횟수와 상관없이 비교하고, 이미 본 분기점 집합을
+                현재 분기점으로 교체 (트리가 통째로 바뀐 경우)
+        """
+        tree = self.store.tree
+        created = tree.branch_points_created
+        if not replaced and created == self._seen_branch_points_created:
+            return
+        branch_points = tree.get_branch_point_ids()
+        known = self._known_branch_points
+        self._new_branch_points.extend(
+            node_id for node_id in branch_points if node_id not in known
+        )
+        if replaced:
+            self._known_branch_points = set(branch_points)
+        else:
+            known.update(branch_points)
+        self._seen_branch_points_created = created
+
+    def save_branch_checkpoints(self) -> List[str]:
+        """
+        새로 생긴 분기점에 자동 체크포인트를 저장합니다.
+
+        turn()/ask()가 노드를 추가한 뒤 자동으로 호출하며, Store.add_node()를
+        직접 호출한 경우에도 이 메서드로 반영할 수 있습니다. 트리를 공유하는
+        다른 세션이 만든 분기점도 이때 함께 저장합니다.
+        auto_checkpoint가 꺼져 있으면 아무것도 하지 않습니다.
+
+        Returns:
+            새로 저장된 체크포인트 이름 리스트
+        """
+        if not self.auto_checkpoint:
+            return []
+        with self.store._lock.read():
+            self._collect_branch_points()
+        saved = []
+        pending = self._new_branch_points
+        while pending:
+            node_id = pending.popleft()
+            # 그 사이 실행 취소로 분기가 사라졌으면 건너뜀
+            if self.store.tree.get_child_count(node_id) < 2:
+                continue
+            name = f"{AUTO_CHECKPOINT_PREFIX}{node_id[:8]}"
+            if self.store.save_checkpoint(name, node_id=node_id):
+                saved.append(name)
+        return saved
 
     def turn(
         self, user_question: str, ai_answer: str, metadata: Optional[Dict] = None
@@ -50,7 +180,70 @@ class ConversationManager:
             >>> node1 = cm.turn("Python이 뭐야?", "Python은 프로그래밍 언어입니다.")
             >>> node2 = cm.turn("특징은?", "간결하고 읽기 쉽습니다.")
         """
-        return self.store.add_node(user_question, ai_answer, metadata)
+        node = self.store.add_node(user_question, ai_answer, metadata)
+        self.save_branch_checkpoints()
+        return node
+
+    def ask(
+        self, question: str, ai_client: Any, metadata: Optional[Dict] = None
+    ) -> Node:
+        """
+        현재 대화 맥락과 함께 AI에게 질문하고, 답변으로 대화 턴을 추가합니다.
+
+        AI 호출은 블로킹이므로 오래 걸릴 수 있습니다. 질문 시점의 현재 노드를
+        기억했다가 노드를 추가할 때 비교하므로, AI 호출 중 다른 작업자가 위치를
+        옮겼다면 엉뚱한 위치에 답변이 붙지 않고 거부됩니다. 체크포인트 정리처럼
+        활성 경로와 무관한 변경은 충돌이 아니며, 거부될 때도 받은 답변은
+        예외에 담겨 돌아옵니다.
+
+        Args:
+            question: 사용자의 질문
+            ai_client: ask(question)와 ask_with_context(question, context,
+                system_prompt=...)를 제공하는 AI 클라이언트
+            metadata: 선택적 메타데이터
+
+        Returns:
+            생성된 Node 객체
+
+        Raises:
+            PathConflictError: AI 호출 중 현재 노드가 바뀐 경우
+                (ai_answer 속성에 받은 답변이 들어 있음)
+
+        Example:
+            >>> cm = ConversationManager()
+            >>> node = cm.ask("Python이 뭐야?", AIClient())
+        """
+        node_id = self.store.get_current_node_id()
+        context = self.get_full_context()
+        related = self.get_related_turns(question)
+
+        sections = []
+        if context and context != "[대화 없음]":
+            sections.append(f"이전 대화 맥락:\n{context}")
+        if related:
+            lines = ["다른 분기의 관련 대화:"]
+            for node in related:
+                lines.append(f"- 사용자: {node.user_question}")
+                lines.append(f"  AI: {node.ai_answer}")
+            sections.append("\n".join(lines))
+
+        if sections:
+            # 맥락이 있으면 포함해서 질문 (다른 분기의 관련 턴은 뒤에 덧붙임)
+            full_context = "\n\n".join(sections)
+            answer = ai_client.ask_with_context(
+                question,
+                full_context,
+                system_prompt=CONTEXT_SYSTEM_PROMPT,
+            )
+        else:
+            # 맥락이 없으면 단순 질문
+            answer = ai_client.ask(question)
+
+        node = self.store.add_node(
+            question, answer, metadata, expected_node_id=node_id
+        )
+        self.save_branch_checkpoints()
+        return node
 
     def get_conversation_history(self) -> list[tuple[str, str]]:
         """
@@ -73,6 +266,47 @@ class ConversationManager:
 
         return [(node.user_question, node.ai_answer) for node in conversation_nodes]
 
+    def get_related_turns(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        min_score: Optional[float] = None,
+    ) -> List[Node]:
+        """
+        현재 경로 밖의 분기에서 질의와 의미가 가까운 턴을 찾습니다.
+
+        vector_index가 없으면 빈 리스트입니다. 아직 임베딩되지 않은 노드가
+        있으면 먼저 처리하므로 방금 추가한 턴도 찾을 수 있습니다. 유사도가
+        min_score보다 낮은 턴은 관련 없는 것으로 보고 뺍니다.
+
+        Args:
+            query: 질의 (보통 새 질문)
+            limit: 최대 개수 (None이면 related_turns)
+            min_score: 최소 유사도 (None이면 related_min_score)
+
+        Returns:
+            관련도 순 Node 리스트 (현재 활성 경로의 노드 제외)
+
+        Example:
+            >>> cm = ConversationManager(store, vector_index=VectorIndex(store))
+            >>> cm.get_related_turns("리스트 정렬")
+        """
+        if self.vector_index is None:
+            return []
+        limit = self.related_turns if limit is None else limit
+        if limit < 1:
+            return []
+        self.vector_index.flush()
+        active = set(self.store.get_active_path_ids())
+        hits = self.vector_index.search(query, k=limit, exclude=active)
+        min_score = self.related_min_score if min_score is None else min_score
+        tree = self.store.tree
+        return [
+            tree.nodes[hit.node_id]
+            for hit in hits
+            if hit.score >= min_score and hit.node_id in tree.nodes
+        ]
+
     def get_full_context(self) -> str:
         """
         현재까지의 전체 대화 맥락을 문자열로 반환합니다.
@@ -136,7 +370,7 @@ class ConversationManager:
             >>> cm.branch_from_node(node1.id)  # node1로 돌아가서 새 분기
             True
         """
-        return self.store.switch_to_node(node_id)
+        return self.store.switch_to_node(node_id) is not None
 
     def get_current_node(self) -> Optional[Node]:
         """
@@ -165,15 +399,10 @@ class ConversationManager:
             >>> branch_points = cm.get_branch_points()
             >>> len(branch_points)  # 1 (root)
         """
-        path = self.store.get_active_path()
-        branch_points = []
-
-        for node in path:
-            children = self.store.tree.get_children(node.id)
-            if len(children) >= 2:
-                branch_points.append(node)
-
-        return branch_points
+        tree = self.store.tree
+        path_ids = self.store.get_active_path_ids()
+        branch_ids = tree.get_branch_points_on_path(path_ids)
+        return [tree.nodes[node_id] for node_id in branch_ids]
 
     def get_stats(self) -> Dict:
         """
@@ -198,6 +427,10 @@ class ConversationManager:
             "current_depth": tree_stats["path_depth"] - 1,  # 루트 제외
             "total_nodes": tree_stats["total_nodes"],
             "checkpoints": tree_stats["checkpoints"],
+            "leaf_count": tree_stats["leaf_count"],
+            "branch_points": tree_stats["branch_points"],
+            "max_depth": tree_stats["max_depth"],
+            "mean_depth": tree_stats["mean_depth"],
         }
 
     def reset(self):
@@ -0,0 +1,374 @@
+"""
+copy-on-write 자료구조.
+
+이 모듈은 Tree/Store 분기(fork)에 사용하는 계층형 자료구조를 제공합니다.
+분기 시점의 내용은 더 이상 변경되지 않는 바닥 계층(base)으로 고정되고,
+분기된 각 쪽은 자신의 변경분만 위 계층에 기록합니다. 따라서 분기 자체는
+데이터 크기와 무관하게 O(1)이고, 이후 메모리는 변경분에만 비례합니다.
+
+분기를 거듭하면 계층이 하나씩 쌓여 조회가 느려지므로, 계층이 MAX_LAYERS에
+이르면 다음 분기 때 한 번 평탄화합니다 (O(N), MAX_LAYERS번 분기마다 한 번).
+"""
+
+import copy
+import heapq
+from bisect import bisect_left, insort
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Set,
+    Tuple,
+)
+
+# 분기 시 평탄화하기 전까지 허용하는 변경 계층 수 (조회는 최대 이만큼 거슬러 감)
+MAX_LAYERS = 4
+
+
+class CowDict(MutableMapping):
+    """
+    고정된 바닥 매핑 위에 변경분만 기록하는 딕셔너리.
+
+    조회는 자체 계층 → 바닥 순으로 이루어지고, 삭제는 바닥 키를 가리는
+    표식(tombstone)으로 기록됩니다. 바닥 매핑은 이후 변경되지 않아야 합니다.
+
+    setdefault()는 바닥 계층의 값을 얕은 복사해 자체 계층으로 옮긴 뒤
+    반환하므로, 반환값(리스트 등)을 제자리에서 수정해도 바닥이 바뀌지 않습니다.
+
+    Example:
+        >>> base = {"a": 1}
+        >>> view = CowDict(base)
+        >>> view["b"] = 2
+        >>> del view["a"]
+        >>> dict(view), base
+        ({'b': 2}, {'a': 1})
+    """
+
+    __slots__ = ("base", "own", "deleted", "_len")
+
+    def __init__(self, base: Mapping):
+        """
+        바닥 매핑 위에 빈 변경 계층을 만듭니다.
+
+        Args:
+            base: 고정된 바닥 매핑
+        """
+        self.base = base
+        self.own: Dict[Hashable, Any] = {}
+        self.deleted: Set[Hashable] = set()
+        self._len = len(base)
+
+    def __getitem__(self, key):
+        own = self.own
+        if key in own:
+            return own[key]
+        if key in self.deleted:
+            raise KeyError(key)
+        return self.base[key]
+
+    def __contains__(self, key) -> bool:
+        return key in self.own or (key not in self.deleted and key in self.base)
+
+    def get(self, key, default=None):
+        own = self.own
+        if key in own:
+            return own[key]
+        if key in self.deleted:
+            return default
+        return self.base.get(key, default)
+
+    def __setitem__(self, key, value):
+        if key not in self:
+            self._len += 1
+        self.own[key] = value
+        self.deleted.discard(key)
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        self.own.pop(key, None)
+        if key in self.base:
+            self.deleted.add(key)
+        self._len -= 1
+
+    def __iter__(self) -> Iterator:
+        own, deleted = self.own, self.deleted
+        for key in self.base:
+            if key not in own and key not in deleted:
+                yield key
+        yield from own
+
+    def __reversed__(self) -> Iterator:
+        own, deleted = self.own, self.deleted
+        yield from reversed(own)
+        for key in reversed(self.base):
+            if key not in own and key not in deleted:
+                yield key
+
+    def __len__(self) -> int:
+        return self._len
+
+    def setdefault(self, key, default=None):
+        """
+        자체 계층의 값을 반환합니다 (바닥 값이면 얕은 복사 후 옮김).
+
+        Args:
+            key: 키
+            default: 키가 없을 때 저장할 값
+
+        Returns:
+            제자리 수정이 안전한 값
+        """
+        own = self.own
+        if key in own:
+            return own[key]
+        if key in self:
+            value = copy.copy(self.base[key])
+        else:
+            value = default
+            self._len += 1
+        own[key] = value
+        self.deleted.discard(key)
+        return value
+
+    def is_pristine(self) -> bool:
+        """바닥 이후 변경이 없으면 True."""
+        return not self.own and not self.deleted
+
+    def changes_since(self, base: Mapping) -> Tuple[Dict[Hashable, Any], Set[Hashable]]:
+        """
+        주어진 바닥 계층 이후의 변경분을 모읍니다.
+
+        이 딕셔너리에서 바닥 방향으로 계층을 따라가며 base를 만날 때까지의
+        변경을 합칩니다 (분기 후 다시 분기된 경우에도 동작).
+
+        Args:
+            base: 기준 바닥 매핑 (이 객체의 계층 사슬에 있어야 함)
+
+        Returns:
+            (변경/추가된 {키: 값}, 삭제된 키 집합)
+
+        Raises:
+            ValueError: base가 계층 사슬에 없는 경우
+        """
+        layers: List[CowDict] = []
+        layer: Mapping = self
+        while layer is not base:
+            if not isinstance(layer, CowDict):
+                raise ValueError("Mapping is not derived from the given base")
+            layers.append(layer)
+            layer = layer.base
+
+        updated: Dict[Hashable, Any] = {}
+        deleted: Set[Hashable] = set()
+        for layer in reversed(layers):  # 오래된 계층부터 적용
+            for key in layer.deleted:
+                updated.pop(key, None)
+                deleted.add(key)
+            for key, value in layer.own.items():
+                updated[key] = value
+                deleted.discard(key)
+        return updated, deleted
+
+
+def layered(mapping: MutableMapping) -> Tuple[Mapping, MutableMapping, MutableMapping]:
+    """
+    매핑을 고정하고, 그 위에 독립적인 변경 계층 두 개를 만듭니다.
+
+    이미 변경 없는 CowDict라면 그 바닥을 그대로 공유하여 계층이 깊어지지
+    않게 하고, 계층이 MAX_LAYERS에 이르렀으면 일반 딕셔너리로 평탄화한 것을
+    바닥으로 삼아 양쪽 조회가 O(MAX_LAYERS) 안에 끝나게 합니다.
+
+    Args:
+        mapping: 분기할 매핑 (이후 직접 수정하면 안 됨)
+
+    Returns:
+        (고정된 바닥, 원래 쪽 새 계층, 분기 쪽 새 계층)
+    """
+    if isinstance(mapping, CowDict) and mapping.is_pristine():
+        base = mapping.base
+        return base, mapping, CowDict(base)
+    if _layer_count(mapping) >= MAX_LAYERS:
+        mapping = dict(mapping)
+    return mapping, CowDict(mapping), CowDict(mapping)
+
+
+def changes_between(
+    mapping: Mapping, base: Mapping
+) -> Tuple[Dict[Hashable, Any], Set[Hashable]]:
+    """
+    base 이후 mapping의 변경분을 모읍니다.
+
+    mapping이 base 위에 쌓인 CowDict면 변경 계층만 모으고(CowDict.changes_since),
+    그사이 평탄화되어 base가 계층 사슬에 없으면 두 매핑을 직접 비교합니다 (O(N)).
+
+    Args:
+        mapping: 현재 매핑
+        base: 기준 매핑
+
+    Returns:
+        (변경/추가된 {키: 값}, 삭제된 키 집합)
+    """
+    if isinstance(mapping, CowDict):
+        try:
+            return mapping.changes_since(base)
+        except ValueError:
+            pass
+    missing = object()
+    updated = {}
+    for key, value in mapping.items():
+        old = base.get(key, missing)
+        if old is not value and old != value:
+            updated[key] = value
+    deleted = {key for key in base if key not in mapping}
+    return updated, deleted
+
+
+def _layer_count(mapping: Mapping) -> int:
+    """mapping에서 일반 매핑 바닥까지의 CowDict 계층 수."""
+    count = 0
+    while isinstance(mapping, CowDict):
+        count += 1
+        mapping = mapping.base
+    return count
+
+
+class SortedIds:
+    """
+    정렬된 문자열 ID 목록 (선택적으로 고정된 바닥 목록 위에 계층화).
+
+    바닥이 있으면 자체 목록에는 분기 이후 추가된 ID만 두고, 순위(rank)와
+    선택(select)은 두 목록을 합친 것처럼 계산합니다.
+
+    extend()로 들어온 ID는 대기 목록에 모아 두었다가 다음 조회 때 한 번에
+    정렬해 합칩니다. 연속된 일괄 추가는 조회 전까지 O(k)이고, 합치는 비용은
+    O(P log P + N)입니다 (P는 대기 중인 ID 수).
+    """
+
+    __slots__ = ("base", "_ids", "_pending")
+
+    def __init__(self, ids: Iterable[str] = (), base: Optional["SortedIds"] = None):
+        """
+        목록을 초기화합니다.
+
+        Args:
+            ids: 초기 ID들
+            base: 고정된 바닥 목록 (None이면 단일 계층)
+        """
+        self.base = base
+        self._ids: List[str] = sorted(ids)
+        self._pending: List[str] = []
+
+    @property
+    def ids(self) -> List[str]:
+        """자체 계층의 정렬된 ID 목록 (대기 중인 ID를 먼저 합침)."""
+        if self._pending:
+            # 정렬된 두 구간은 Timsort가 선형 병합으로 합침
+            self._pending.sort()
+            self._ids.extend(self._pending)
+            self._ids.sort()
+            self._pending = []
+        return self._ids
+
+    @ids.setter
+    def ids(self, ids: List[str]):
+        self._ids = ids
+        self._pending = []
+
+    def __len__(self) -> int:
+        own = len(self._ids) + len(self._pending)
+        return own + (len(self.base) if self.base is not None else 0)
+
+    def add(self, node_id: str):
+        """ID 하나를 정렬 위치에 추가합니다 (O(log N + 이동))."""
+        insort(self.ids, node_id)
+
+    def extend(self, node_ids: Iterable[str]):
+        """여러 ID를 대기 목록에 추가합니다 (다음 조회 때 한 번에 합침)."""
+        self._pending.extend(node_ids)
+
+    def remove(self, node_id: str) -> bool:
+        """
+        자체 계층에서 ID를 제거합니다.
+
+        Returns:
+            제거했으면 True, 자체 계층에 없으면 False
+        """
+        idx = bisect_left(self.ids, node_id)
+        if idx < len(self.ids) and self.ids[idx] == node_id:
+            del self.ids[idx]
+            return True
+        return False
+
+    def rank(self, node_id: str) -> int:
+        """node_id보다 작은 ID의 개수를 반환합니다."""
+        count = bisect_left(self.ids, node_id)
+        if self.base is not None:
+            count += self.base.rank(node_id)
+        return count
+
+    def select(self, index: int) -> Optional[str]:
+        """
+        정렬 순서로 index번째(0부터) ID를 반환합니다.
+
+        Returns:
+            ID, 범위를 벗어나면 None
+        """
+        if index < 0 or index >= len(self):
+            return None
+        if self.base is None:
+            return self.ids[index]
+
+        # 자체 목록의 i번째 ID 앞에는 자체 i개 + 바닥 rank개가 있음
+        lo, hi = 0, len(self.ids)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if mid + self.base.rank(self.ids[mid]) < index:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(self.ids) and lo + self.base.rank(self.ids[lo]) == index:
+            return self.ids[lo]
+        # 답은 바닥 목록에 있고, 그 앞에 자체 목록 ID가 lo개 있음
+        return self.base.select(index - lo)
+
+    def iter_from(self, start: str = "") -> Iterator[str]:
+        """start 이상인 ID를 정렬 순서로 순회합니다 (시작 위치 찾기 O(log N))."""
+        # islice는 앞부분을 하나씩 건너뛰므로 인덱스로 바로 시작
+        ids = self.ids
+        own = map(ids.__getitem__, range(bisect_left(ids, start), len(ids)))
+        if self.base is None:
+            return own
+        return heapq.merge(self.base.iter_from(start), own)
+
+    def fork(self) -> Tuple["SortedIds", "SortedIds"]:
+        """
+        현재 내용을 고정하고, 그 위에 독립적인 계층 두 개를 만듭니다.
+
+        계층이 MAX_LAYERS에 이르렀으면 한 목록으로 합쳐 바닥으로 삼습니다.
+
+        Returns:
+            (원래 쪽 새 계층, 분기 쪽 새 계층)
+        """
+        if not self.ids and self.base is not None:
+            base = self.base
+        elif self._layer_count() >= MAX_LAYERS:
+            base = SortedIds()
+            base.ids = list(self.iter_from())
+        else:
+            base = SortedIds(base=self.base)
+            base.ids = self.ids
+        return SortedIds(base=base), SortedIds(base=base)
+
+    def _layer_count(self) -> int:
+        count, layer = 0, self.base
+        while layer is not None:
+            count += 1
+            layer = layer.base
+        return count
@@ -0,0 +1,359 @@
+"""
+질문 중복 탐지용 MinHash-LSH 색인.
+
+넓은 트리에서는 같은 질문이 여러 분기에서 반복되곤 합니다. 이 모듈은 노드의
+user_question을 문자 n-gram(shingle) 집합으로 바꾸고 MinHash 서명을 만들어,
+서명을 밴드로 나눈 LSH 버킷에 넣습니다.
+
+- 서명은 노드가 추가될 때 한 번 계산되며(O(shingle 수 × num_perm)), 조회는
+  그 노드가 속한 밴드 버킷의 후보만 서명으로 비교하므로 트리 크기와 무관합니다.
+- 두 서명에서 값이 같은 자리의 비율은 두 shingle 집합의 자카드 유사도 추정치입니다.
+- 트리 전체의 중복 묶음(clusters)은 버킷마다 대표 하나와 나머지를 비교해
+  합치므로(union-find) 모든 쌍을 비교하는 O(N²) 없이 O(N × bands)입니다.
+"""
+
+import hashlib
+import re
+import threading
+from array import array
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Set, Tuple
+
+from core.events import NodeAdded, NodeRemoved, Reset, StoreEvent
+
+if TYPE_CHECKING:
+    from core.models import Tree
+    from core.store import Store
+
+# MinHash 순열 해시의 법 (메르센 소수 2^61 - 1)
+_PRIME = (1 << 61) - 1
+# 정규화 시 남길 문자 외의 구두점/기호
+_NOISE_RE = re.compile(r"[^\w\s]+")
+_SPACE_RE = re.compile(r"\s+")
+
+
+def question_shingles(text: str, size: int = 3) -> Set[str]:
+    """
+    질문을 정규화한 뒤 문자 n-gram 집합으로 만듭니다.
+
+    대소문자, 구두점, 연속 공백 차이는 무시하므로 "Python이 뭐야?"와
+    "python이  뭐야"는 같은 집합이 됩니다. 한글과 영문 모두 같은 방식입니다.
+
+    Args:
+        text: 질문
+        size: n-gram 길이
+
+    Returns:
+        shingle 집합 (정규화 후 size보다 짧으면 문자열 전체 하나, 비면 빈 집합)
+
+    Example:
+        >>> sorted(question_shingles("뭐야?"))
+        ['뭐야']
+    """
+    normalized = _SPACE_RE.sub(" ", _NOISE_RE.sub(" ", text.lower())).strip()
+    if len(normalized) <= size:
+        return {normalized} if normalized else set()
+    return {normalized[i : i + size] for i in range(len(normalized) - size + 1)}
+
+
+class DuplicateHit(NamedTuple):
+    """
+    중복 후보 한 건.
+
+    Attributes:
+        node_id: 노드 ID
+        similarity: 추정 자카드 유사도 (0 ~ 1)
+    """
+
+    node_id: str
+    similarity: float
+
+
+class DuplicateIndex:
+    """
+    user_question MinHash 서명과 LSH 버킷.
+
+    num_perm개 해시로 서명을 만들고 bands개 밴드(밴드당 num_perm / bands개
+    값)로 나눠 버킷에 넣습니다. 한 밴드라도 완전히 같으면 후보가 되며, 기본값
+    (64개, 16밴드)에서는 유사도 0.7인 쌍이 약 99% 확률로 후보가 됩니다.
+    Store 이벤트로 갱신되고, 검색은 색인 자체 잠금으로 보호됩니다.
+
+    Example:
+        >>> index = DuplicateIndex(store)
+        >>> node = store.add_node("파이썬이 뭐야?", "...")
+        >>> index.find_duplicates(node.id)
+        [DuplicateHit(node_id='...', similarity=1.0)]
+    """
+
+    def __init__(
+        self,
+        store: "Store",
+        num_perm: int = 64,
+        bands: int = 16,
+        threshold: float = 0.7,
+        shingle_size: int = 3,
+    ):
+        """
+        색인을 만들고 store의 노드 이벤트를 구독합니다.
+
+        Args:
+            store: 대상 Store
+            num_perm: MinHash 서명 길이
+            bands: LSH 밴드 수 (num_perm의 약수)
+            threshold: 중복으로 볼 최소 추정 유사도
+            shingle_size: shingle 문자 수
+
+        Raises:
+            ValueError: bands가 num_perm의 약수가 아닌 경우
+        """
+        if bands < 1 or num_perm % bands:
+            raise ValueError(f"bands({bands})는 num_perm({num_perm})의 약수여야 합니다.")
+        self.store = store
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        # 순열 계수는 고정 시드로 만들어 프로세스가 달라도 같은 서명이 나오게 함
+        self._perms: List[Tuple[int, int]] = []
+        for i in range(num_perm):
+            digest = hashlib.blake2b(f"minhash-{i}".encode(), digest_size=16).digest()
+            a = int.from_bytes(digest[:8], "little") % (_PRIME - 1) + 1
+            b = int.from_bytes(digest[8:], "little") % _PRIME
+            self._perms.append((a, b))
+        self._lock = threading.Lock()
+        # 정규화 후 같은 질문은 서명도 같으므로, 서명 하나에 노드들을 묶어 두고
+        # 버킷에는 서로 다른 서명만 넣음 (같은 질문이 수천 번 반복돼도 후보 1개)
+        self._signatures: Dict[str, bytes] = {}  # 노드 ID → 서명 키
+        self._members: Dict[bytes, Dict[str, None]] = {}  # 서명 키 → 노드 (추가 순)
+        self._values: Dict[bytes, array] = {}  # 서명 키 → 서명
+        self._buckets: List[Dict[Tuple[int, ...], Dict[bytes, None]]] = [
+            {} for _ in range(bands)
+        ]
+        self._tree: Optional["Tree"] = None
+        self.rebuild()
+        store.events.subscribe(self._on_event, NodeAdded, NodeRemoved, Reset)
+
+    def rebuild(self):
+        """현재 트리의 모든 질문을 다시 색인합니다."""
+        with self._lock:
+            self._clear()
+            self._tree = self.store.tree
+            self._sync()
+
+    def signature(self, text: str) -> array:
+        """
+        질문의 MinHash 서명을 계산합니다.
+
+        Args:
+            text: 질문
+
+        Returns:
+            num_perm개 정수 배열 (shingle이 없으면 모두 최댓값)
+        """
+        hashes = [
+            int.from_bytes(
+                hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(),
+                "little",
+            )
+            for shingle in question_shingles(text, self.shingle_size)
+        ]
+        if not hashes:
+            return array("Q", [_PRIME] * self.num_perm)
+        return array(
+            "Q", [min((a * h + b) % _PRIME for h in hashes) for a, b in self._perms]
+        )
+
+    def find_duplicates(
+        self, node_id: str, threshold: Optional[float] = None, limit: int = 10
+    ) -> List[DuplicateHit]:
+        """
+        같은(비슷한) 질문을 가진 다른 노드를 찾습니다.
+
+        노드의 서명은 추가될 때 계산되어 있으므로 밴드 버킷 조회와 후보 서명
+        비교만 합니다 (트리 크기와 무관).
+
+        Args:
+            node_id: 기준 노드 ID
+            threshold: 최소 추정 유사도 (None이면 색인 기본값)
+            limit: 최대 결과 수
+
+        Returns:
+            DuplicateHit 리스트 (유사도 내림차순, 자기 자신 제외)
+
+        Raises:
+            ValueError: 색인에 없는 노드인 경우
+        """
+        with self._lock:
+            key = self._signatures.get(node_id)
+            if key is None:
+                raise ValueError(f"Node '{node_id}' is not indexed")
+            return self._candidates(self._values[key], threshold, limit, node_id)
+
+    def find_similar_questions(
+        self, text: str, threshold: Optional[float] = None, limit: int = 10
+    ) -> List[DuplicateHit]:
+        """
+        아직 트리에 없는 질문과 비슷한 질문을 가진 노드를 찾습니다.
+
+        Args:
+            text: 질문
+            threshold: 최소 추정 유사도 (None이면 색인 기본값)
+            limit: 최대 결과 수
+
+        Returns:
+            DuplicateHit 리스트 (유사도 내림차순)
+        """
+        signature = self.signature(text)
+        with self._lock:
+            return self._candidates(signature, threshold, limit)
+
+    def clusters(
+        self, threshold: Optional[float] = None, min_size: int = 2
+    ) -> List[List[str]]:
+        """
+        트리 전체의 중복 질문 묶음을 찾습니다 (O(N × bands)).
+
+        버킷마다 첫 노드를 대표로 두고 나머지를 대표와만 비교해 합치므로
+        모든 쌍을 비교하지 않습니다. 유사도는 추이적이지 않으므로 묶음 안의
+        두 노드가 직접 비교하면 threshold보다 낮을 수 있습니다.
+
+        Args:
+            threshold: 합칠 최소 추정 유사도 (None이면 색인 기본값)
+            min_size: 반환할 묶음의 최소 크기
+
+        Returns:
+            노드 ID 리스트의 리스트 (큰 묶음 먼저)
+        """
+        threshold = self.threshold if threshold is None else threshold
+        with self._lock:
+            values = self._values
+            parent: Dict[bytes, bytes] = {}
+
+            def find(key: bytes) -> bytes:
+                root = key
+                while parent.get(root, root) != root:
+                    root = parent[root]
+                while key != root:  # 경로 압축
+                    parent[key], key = root, parent[key]
+                return root
+
+            # 같은 서명의 노드는 이미 한 묶음이므로 서로 다른 서명끼리만 합침
+            for buckets in self._buckets:
+                for keys in buckets.values():
+                    if len(keys) < 2:
+                        continue
+                    anchor, *others = keys
+                    for other in others:
+                        if _similarity(values[anchor], values[other]) >= threshold:
+                            root_a, root_b = find(anchor), find(other)
+                            if root_a != root_b:
+                                parent[root_b] = root_a
+
+            groups: Dict[bytes, List[str]] = {}
+            for key, members in self._members.items():
+                groups.setdefault(find(key), []).extend(members)
+        result = [group for group in groups.values() if len(group) >= min_size]
+        result.sort(key=len, reverse=True)
+        return result
+
+    def __len__(self) -> int:
+        """색인된 노드 수."""
+        return len(self._signatures)
+
+    # ==================== 내부 ====================
+
+    def _candidates(
+        self,
+        signature: array,
+        threshold: Optional[float],
+        limit: int,
+        exclude: Optional[str] = None,
+    ) -> List[DuplicateHit]:
+        threshold = self.threshold if threshold is None else threshold
+        # 후보는 서로 다른 서명 단위로 한 번씩만 비교
+        scored = {}
+        for band, band_key in enumerate(self._band_keys(signature)):
+            for key in self._buckets[band].get(band_key, ()):
+                if key not in scored:
+                    scored[key] = _similarity(signature, self._values[key])
+        hits = []
+        for key, similarity in sorted(scored.items(), key=lambda item: -item[1]):
+            if similarity < threshold:
+                break
+            for node_id in self._members[key]:
+                if node_id == exclude:
+                    continue
+                hits.append(DuplicateHit(node_id, similarity))
+                if len(hits) == limit:
+                    return hits
+        return hits
+
+    def _band_keys(self, signature: array) -> List[Tuple[int, ...]]:
+        rows = self.rows
+        return [
+            tuple(signature[start : start + rows])
+            for start in range(0, self.num_perm, rows)
+        ]
+
+    def _clear(self):
+        self._signatures.clear()
+        self._members.clear()
+        self._values.clear()
+        for buckets in self._buckets:
+            buckets.clear()
+
+    def _sync(self):
+        # 트리와 맞춤: 빠진 노드는 색인하고 없어진 노드는 제거
+        tree = self.store.tree
+        if tree is not self._tree:
+            self._clear()
+            self._tree = tree
+        for node_id in tree.nodes:
+            if node_id not in self._signatures:
+                self._add(node_id)
+        for node_id in [n for n in self._signatures if not tree.node_exists(n)]:
+            self._remove(node_id)
+
+    def _add(self, node_id: str):
+        if node_id == self._tree.root_id:
+            return
+        signature = self.signature(self._tree.nodes[node_id].user_question)
+        key = signature.tobytes()
+        self._signatures[node_id] = key
+        members = self._members.get(key)
+        if members is None:
+            members = self._members[key] = {}
+            self._values[key] = signature
+            for band, band_key in enumerate(self._band_keys(signature)):
+                self._buckets[band].setdefault(band_key, {})[key] = None
+        members[node_id] = None
+
+    def _remove(self, node_id: str):
+        key = self._signatures.pop(node_id, None)
+        if key is None:
+            return
+        members = self._members[key]
+        del members[node_id]
+        if members:
+            return
+        del self._members[key]
+        signature = self._values.pop(key)
+        for band, band_key in enumerate(self._band_keys(signature)):
+            keys = self._buckets[band][band_key]
+            del keys[key]
+            if not keys:
+                del self._buckets[band][band_key]
+
+    def _on_event(self, event: StoreEvent):
+        with self._lock:
+            if isinstance(event, NodeAdded) and self.store.tree is self._tree:
+                self._add(event.node_id)
+            elif isinstance(event, NodeRemoved):
+                self._remove(event.node_id)
+            else:
+                self._sync()
+
+
+def _similarity(a: array, b: array) -> float:
+    """두 서명에서 값이 같은 자리의 비율 (자카드 유사도 추정치)."""
+    return sum(x == y for x, y in zip(a, b)) / len(a)
@@ -0,0 +1,272 @@
+"""
+Store 변경 이벤트와 이벤트 버스.
+
+이 모듈은 Store가 상태를 바꿀 때마다 발행하는 이벤트 타입과, 이를
+구독자에게 전달하는 EventBus를 제공합니다. 파생 뷰(인덱스, 통계, 캐시)는
+이벤트의 변경분만 반영하면 되므로 트리 전체를 다시 훑을 필요가 없습니다.
+
+이벤트는 Store의 쓰기 잠금 안에서 버전 순서대로 동기 전달됩니다.
+따라서 콜백 구독자는 Store의 잠금 메서드(get_*, add_node 등)를 호출하면
+안 되며, 이벤트 내용과 store.tree만 사용해야 합니다. 무거운 처리는
+subscribe_queue()로 받은 큐를 다른 스레드에서 소비하세요. 큐에 넣는 일은
+절대 대기하지 않으므로 소비자가 Store를 읽어도 교착 상태가 생기지 않습니다.
+
+구독자의 예외는 발행한 변경 메서드로 전파되지 않습니다. 이미 반영된 변경을
+실패로 보이게 하면 호출자가 재시도하면서 같은 노드를 두 번 만들기 때문입니다.
+예외는 로그로 남기고 EventBus.errors에 모아 둡니다.
+"""
+
+import logging
+import queue
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Deque, List, Tuple, Type
+
+if TYPE_CHECKING:
+    from core.store import PathDelta
+
+
+logger = logging.getLogger(__name__)
+
+# EventBus.errors에 보관할 최근 구독자 예외 수
+ERROR_HISTORY = 100
+
+
+@dataclass(frozen=True)
+class StoreEvent:
+    """
+    모든 Store 이벤트의 기반 클래스.
+
+    Attributes:
+        version: 이벤트를 만든 변경 이후의 Store 버전
+    """
+
+    version: int
+
+
+@dataclass(frozen=True)
+class NodeAdded(StoreEvent):
+    """
+    노드가 추가되고 활성 경로가 그 노드까지 늘어남.
+
+    Attributes:
+        node_id: 추가된 노드 ID
+        parent_id: 부모 노드 ID (추가 직전의 현재 노드)
+    """
+
+    node_id: str
+    parent_id: str
+
+
+@dataclass(frozen=True)
+class NodeRemoved(StoreEvent):
+    """
+    노드 추가가 실행 취소되어 잎 노드가 트리에서 제거됨.
+
+    Attributes:
+        node_id: 제거된 노드 ID
+        parent_id: 부모 노드 ID
+    """
+
+    node_id: str
+    parent_id: str
+
+
+@dataclass(frozen=True)
+class PathSwitched(StoreEvent):
+    """
+    활성 경로가 전환됨.
+
+    Attributes:
+        delta: 경로 변경분 (PathDelta)
+    """
+
+    delta: "PathDelta"
+
+
+@dataclass(frozen=True)
+class CheckpointSaved(StoreEvent):
+    """
+    체크포인트가 저장됨.
+
+    Attributes:
+        name: 체크포인트 이름
+        node_id: 체크포인트가 가리키는 노드 ID
+    """
+
+    name: str
+    node_id: str
+
+
+@dataclass(frozen=True)
+class CheckpointDeleted(StoreEvent):
+    """
+    체크포인트가 삭제됨.
+
+    Attributes:
+        name: 체크포인트 이름
+        node_id: 삭제 전 가리키던 노드 ID
+    """
+
+    name: str
+    node_id: str
+
+
+@dataclass(frozen=True)
+class CheckpointRenamed(StoreEvent):
+    """
+    체크포인트 이름이 바뀜.
+
+    Attributes:
+        old_name: 이전 이름
+        new_name: 새 이름
+        node_id: 체크포인트가 가리키는 노드 ID
+    """
+
+    old_name: str
+    new_name: str
+    node_id: str
+
+
+@dataclass(frozen=True)
+class Reset(StoreEvent):
+    """
+    트리나 체크포인트가 통째로 바뀜 (reset, replace_state, merge 등).
+
+    구독자는 파생 상태를 처음부터 다시 만들어야 합니다.
+    """
+
+
+EventCallback = Callable[[StoreEvent], None]
+_Subscriber = Tuple[EventCallback, Tuple[Type[StoreEvent], ...]]
+
+
+class EventQueue(queue.Queue):
+    """
+    EventBus.subscribe_queue()가 돌려주는 이벤트 큐.
+
+    Attributes:
+        dropped: 큐가 가득 차서 버린 이벤트 수
+        unsubscribe: 구독을 해제하는 함수
+    """
+
+    def __init__(self, maxsize: int = 0):
+        """
+        Args:
+            maxsize: 큐 최대 크기 (0이면 무제한)
+        """
+        super().__init__(maxsize=maxsize)
+        self.dropped = 0
+        self.unsubscribe: Callable[[], None] = lambda: None
+
+    def offer(self, event: "StoreEvent"):
+        """기다리지 않고 이벤트를 넣습니다 (가득 찼으면 버리고 dropped 증가)."""
+        try:
+            self.put_nowait(event)
+        except queue.Full:
+            self.dropped += 1
+
+
+class EventBus:
+    """
+    Store 이벤트를 구독자에게 전달하는 버스.
+
+    구독자는 등록 순서대로 호출되며, 이벤트 타입을 지정하면 해당 타입
+    (및 하위 타입)의 이벤트만 받습니다. 구독자가 없으면 발행 비용은 O(1)입니다.
+
+    Attributes:
+        errors: 최근 구독자 예외 (이벤트, 예외) 목록 (최대 ERROR_HISTORY개)
+        error_count: 지금까지 구독자가 던진 예외 수
+
+    Example:
+        >>> bus = EventBus()
+        >>> unsubscribe = bus.subscribe(print, NodeAdded)
+        >>> bus.publish(NodeAdded(version=1, node_id="a", parent_id="root"))
+        NodeAdded(version=1, node_id='a', parent_id='root')
+        >>> unsubscribe()
+    """
+
+    def __init__(self):
+        """빈 버스를 초기화합니다."""
+        self._subscribers: List[_Subscriber] = []
+        self.errors: Deque[Tuple[StoreEvent, Exception]] = deque(
+            maxlen=ERROR_HISTORY
+        )
+        self.error_count = 0
+
+    def subscribe(
+        self, callback: EventCallback, *event_types: Type[StoreEvent]
+    ) -> Callable[[], None]:
+        """
+        콜백 구독자를 등록합니다.
+
+        Args:
+            callback: 이벤트를 받을 함수 (Store 쓰기 잠금 안에서 호출됨)
+            *event_types: 받을 이벤트 타입 (생략하면 모든 이벤트)
+
+        Returns:
+            구독을 해제하는 함수
+        """
+        entry = (callback, event_types)
+        # 발행 중 구독/해제가 일어나도 안전하도록 목록을 새로 만들어 교체
+        self._subscribers = self._subscribers + [entry]
+
+        def unsubscribe():
+            self._subscribers = [s for s in self._subscribers if s is not entry]
+
+        return unsubscribe
+
+    def subscribe_queue(
+        self, *event_types: Type[StoreEvent], maxsize: int = 0
+    ) -> "EventQueue":
+        """
+        이벤트를 쌓아 두는 큐 구독자를 등록합니다 (다른 스레드에서 소비).
+
+        발행은 Store 쓰기 잠금 안에서 일어나므로 큐에 넣을 때 기다리지 않습니다.
+        maxsize를 주면 큐가 가득 찼을 때 새 이벤트를 버리고 dropped를 늘리므로,
+        소비자는 dropped가 늘었으면 파생 상태를 다시 만들어야 합니다.
+
+        Args:
+            *event_types: 받을 이벤트 타입 (생략하면 모든 이벤트)
+            maxsize: 큐 최대 크기 (0이면 무제한)
+
+        Returns:
+            이벤트가 쌓이는 EventQueue (unsubscribe()로 구독 해제)
+
+        Example:
+            >>> events = bus.subscribe_queue(NodeAdded, maxsize=1000)
+            >>> event = events.get()
+            >>> events.unsubscribe()
+        """
+        events = EventQueue(maxsize=maxsize)
+        events.unsubscribe = self.subscribe(events.offer, *event_types)
+        return events
+
+    def publish(self, event: StoreEvent):
+        """
+        이벤트를 구독자들에게 전달합니다.
+
+        한 구독자가 예외를 던져도 나머지 구독자에게는 모두 전달하므로, 한 파생
+        뷰의 오류가 다른 파생 뷰를 어긋나게 만들지 않습니다. 예외는 호출자에게
+        던지지 않고 로그로 남긴 뒤 errors에 모읍니다. 발행 시점에는 상태 변경이
+        이미 반영되었으므로, 예외를 던지면 호출자가 성공한 변경을 재시도하게
+        됩니다.
+
+        Args:
+            event: 발행할 이벤트
+        """
+        for callback, event_types in self._subscribers:
+            if not event_types or isinstance(event, event_types):
+                try:
+                    callback(event)
+                except Exception as e:
+                    self.error_count += 1
+                    self.errors.append((event, e))
+                    logger.exception(
+                        "Event subscriber %r failed on %r", callback, event
+                    )
+
+    def __len__(self) -> int:
+        """등록된 구독자 수."""
+        return len(self._subscribers)
+
@@ -0,0 +1,100 @@
+"""
+Store 작업의 실행 취소(undo)/다시 실행(redo) 기록.
+
+이 모듈은 Store가 상태를 바꿀 때마다 남기는 역방향 변경분(Operation)과,
+이를 크기 제한이 있는 스택 두 개로 관리하는 Journal을 제공합니다.
+각 기록은 노드 ID나 체크포인트 이름 몇 개만 담으므로 트리 크기와 무관하게
+작업당 O(1) 메모리를 사용합니다.
+"""
+
+from collections import deque
+from typing import TYPE_CHECKING, Deque, List, NamedTuple, Optional
+
+if TYPE_CHECKING:
+    from core.models import Node
+
+# 기본 기록 개수
+JOURNAL_SIZE = 100
+
+
+class Operation(NamedTuple):
+    """
+    되돌릴 수 있는 Store 작업 하나.
+
+    실행 취소는 before 상태를, 다시 실행은 after 상태를 적용합니다.
+
+    Attributes:
+        kind: 작업 종류
+            - "add": 노드 추가 (key: 노드 ID, before: 이전 현재 노드 ID)
+            - "switch": 노드 전환 (before/after: 전환 전/후 현재 노드 ID)
+            - "checkpoint": 체크포인트 저장/삭제 (key: 이름,
+              before/after: 변경 전/후 노드 ID, 없으면 None)
+            - "rename": 체크포인트 이름 변경 (before/after: 이전/새 이름)
+        key: 작업 대상 (노드 ID 또는 체크포인트 이름, 해당 없으면 None)
+        before: 작업 전 값
+        after: 작업 후 값
+        node: 추가된 노드 ("add"에서만, 다시 실행 시 재사용)
+    """
+
+    kind: str
+    key: Optional[str]
+    before: Optional[str]
+    after: Optional[str]
+    node: Optional["Node"] = None
+
+
+class Journal:
+    """
+    크기 제한이 있는 실행 취소/다시 실행 스택.
+
+    새 작업이 기록되면 다시 실행 스택은 비워지고, 실행 취소 스택이
+    max_size를 넘으면 가장 오래된 기록부터 버립니다.
+
+    Example:
+        >>> journal = Journal(max_size=2)
+        >>> journal.record(Operation("switch", None, "a", "b"))
+        >>> journal.can_undo, journal.can_redo
+        (True, False)
+    """
+
+    def __init__(self, max_size: int = JOURNAL_SIZE):
+        """
+        기록을 초기화합니다.
+
+        Args:
+            max_size: 실행 취소 가능한 최대 작업 수 (0이면 기록하지 않음)
+        """
+        self.max_size = max_size
+        self.undo_ops: Deque[Operation] = deque(maxlen=max(max_size, 0))
+        self.redo_ops: List[Operation] = []
+
+    def record(self, op: Operation):
+        """
+        새 작업을 기록합니다 (다시 실행 스택은 비워짐).
+
+        Args:
+            op: 기록할 작업
+        """
+        if self.max_size <= 0:
+            return
+        self.undo_ops.append(op)
+        self.redo_ops.clear()
+
+    def clear(self):
+        """모든 기록을 지웁니다 (되돌릴 수 없는 전체 변경 후 호출)."""
+        self.undo_ops.clear()
+        self.redo_ops.clear()
+
+    @property
+    def can_undo(self) -> bool:
+        """실행 취소할 작업이 있으면 True."""
+        return bool(self.undo_ops)
+
+    @property
+    def can_redo(self) -> bool:
+        """다시 실행할 작업이 있으면 True."""
+        return bool(self.redo_ops)
+
+    def __len__(self) -> int:
+        """실행 취소 가능한 작업 수."""
+        return len(self.undo_ops)
@@ -0,0 +1,495 @@
+"""
+노드 메타데이터 보조 색인과 질의 플래너.
+
+Node.metadata는 자유 형식 딕셔너리라 주제, 모델, 지연 시간, 비용 같은 태그를
+그대로 담을 수 있지만, 조건으로 찾으려면 모든 노드를 훑어야 합니다. 이 모듈은
+지정한 키에 보조 색인을 두고 간단한 질의 문법을 제공합니다.
+
+- 해시 색인: 값 → 노드 집합. "=" 조건의 후보를 O(1)로 찾습니다.
+- 범위 색인: (숫자 값, 노드 ID) 정렬 리스트. 비교 조건의 후보 수를 이분 탐색으로
+  O(log N)에 세고 그 구간만 읽습니다. 깊이(depth)는 항상 범위 색인으로 둡니다.
+
+질의는 "키 연산자 값"을 and로 이은 것입니다 (연산자: =, !=, >, >=, <, <=)::
+
+    depth>10 and model=gpt-4o-mini and latency_ms>2000
+
+플래너는 색인을 쓸 수 있는 조건마다 후보 수를 정확히 세어 가장 적은 색인
+하나를 고르고, 그 후보에만 나머지 조건을 확인합니다. 쓸 수 있는 색인이 없으면
+전체 노드를 훑습니다. 노드의 메타데이터와 깊이는 만들어진 뒤 바뀌지 않으므로
+색인은 Store의 노드 추가·제거 이벤트만 따라가면 됩니다.
+"""
+
+import math
+import re
+import threading
+from bisect import bisect_left, bisect_right, insort
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from core.events import NodeAdded, NodeRemoved, Reset, StoreEvent
+
+if TYPE_CHECKING:
+    from core.models import Tree
+    from core.store import Store
+
+# 메타데이터 대신 트리에서 값을 읽는 예약 키
+DEPTH_KEY = "depth"
+# 지원하는 연산자 (긴 것부터 맞춰야 ">="가 ">"로 잘리지 않음)
+OPERATORS = ("!=", ">=", "<=", "==", "=", ">", "<")
+RANGE_OPERATORS = (">", ">=", "<", "<=")
+
+_AND_RE = re.compile(r"\s+and\s+", re.IGNORECASE)
+_OPERATOR_RE = "|".join(re.escape(op) for op in OPERATORS)
+_CONDITION_RE = re.compile(r"^\s*([\w.-]+)\s*(" + _OPERATOR_RE + r")\s*(.+?)\s*$")
+# 정렬 리스트에서 같은 값의 모든 노드 ID보다 뒤에 오는 값
+_ID_MAX = "\U0010ffff"
+_MISSING = object()
+
+
+class Condition(NamedTuple):
+    """
+    질의 조건 하나.
+
+    Attributes:
+        key: 메타데이터 키 (또는 depth)
+        op: 연산자 (=, !=, >, >=, <, <=)
+        value: 비교 값 (숫자 또는 문자열)
+    """
+
+    key: str
+    op: str
+    value: Any
+
+    def matches(self, actual: Any) -> bool:
+        """
+        실제 값이 조건을 만족하는지 확인합니다.
+
+        대소 비교는 양쪽이 모두 숫자일 때만 참이며, 키가 없는 노드는 어떤
+        조건도 만족하지 않습니다.
+
+        Args:
+            actual: 노드의 값 (키가 없으면 내부 표식)
+
+        Returns:
+            만족 여부
+        """
+        if actual is _MISSING:
+            return False
+        if self.op == "=":
+            return actual == self.value
+        if self.op == "!=":
+            return actual != self.value
+        if not _is_number(actual):
+            return False
+        if self.op == ">":
+            return actual > self.value
+        if self.op == ">=":
+            return actual >= self.value
+        if self.op == "<":
+            return actual < self.value
+        return actual <= self.value
+
+
+class QueryPlan(NamedTuple):
+    """
+    질의 실행 계획.
+
+    Attributes:
+        index: 후보를 꺼낼 색인의 키 (None이면 전체 훑기)
+        estimate: 확인할 후보 수
+        conditions: 파싱된 조건
+    """
+
+    index: Optional[str]
+    estimate: int
+    conditions: List[Condition]
+
+
+def parse_query(text: str) -> List[Condition]:
+    """
+    "키 연산자 값 and ..." 형식의 질의를 조건 리스트로 바꿉니다.
+
+    값은 정수/실수로 읽을 수 있으면 숫자, 아니면 문자열입니다. 따옴표로 묶으면
+    숫자처럼 보여도 문자열입니다 ("==" 는 "="와 같습니다).
+
+    Args:
+        text: 질의 문자열
+
+    Returns:
+        Condition 리스트
+
+    Raises:
+        ValueError: 형식이 잘못됐거나 대소 비교 값이 숫자가 아닌 경우
+
+    Example:
+        >>> parse_query("depth>10 and model=gpt-4o-mini")
+        [Condition(key='depth', op='>', value=10),
+         Condition(key='model', op='=', value='gpt-4o-mini')]
+    """
+    if not text.strip():
+        raise ValueError("질의가 비어 있습니다.")
+    conditions = []
+    for clause in _AND_RE.split(text.strip()):
+        match = _CONDITION_RE.match(clause)
+        if not match:
+            raise ValueError(f"조건 형식이 잘못되었습니다: '{clause}'")
+        key, op, raw = match.groups()
+        op = "=" if op == "==" else op
+        value = _parse_value(raw)
+        if op in RANGE_OPERATORS and not _is_number(value):
+            raise ValueError(f"'{op}' 비교 값은 숫자여야 합니다: '{raw}'")
+        conditions.append(Condition(key, op, value))
+    return conditions
+
+
+class _RangeIndex:
+    """(숫자 값, 노드 ID) 정렬 리스트."""
+
+    def __init__(self):
+        self.entries: List[Tuple[Union[int, float], str]] = []
+        self.values: Dict[str, Union[int, float]] = {}  # 노드 ID → 값 (제거용)
+
+    def add(self, node_id: str, value: Any):
+        if _is_number(value):
+            insort(self.entries, (value, node_id))
+            self.values[node_id] = value
+
+    def remove(self, node_id: str):
+        value = self.values.pop(node_id, _MISSING)
+        if value is not _MISSING:
+            del self.entries[bisect_left(self.entries, (value, node_id))]
+
+    def span(self, conditions: Iterable[Condition]) -> Tuple[int, int]:
+        """조건을 모두 만족하는 값 구간의 entries 위치 [start, end)."""
+        entries = self.entries
+        start, end = 0, len(entries)
+        for cond in conditions:
+            value = cond.value
+            if cond.op in ("=", ">="):
+                start = max(start, bisect_left(entries, (value, "")))
+            elif cond.op == ">":
+                start = max(start, bisect_right(entries, (value, _ID_MAX)))
+            if cond.op in ("=", "<="):
+                end = min(end, bisect_right(entries, (value, _ID_MAX)))
+            elif cond.op == "<":
+                end = min(end, bisect_left(entries, (value, "")))
+        return start, max(start, end)
+
+
+class MetadataIndex:
+    """
+    메타데이터 키별 해시/범위 색인과 질의 실행기.
+
+    해시 색인은 값이 같은 노드를, 범위 색인은 숫자 값 순서로 노드를 찾습니다.
+    색인하지 않은 키도 질의할 수 있지만 그 조건은 후보를 좁히지 못합니다.
+    Store 이벤트로 갱신되고, 질의는 색인 자체 잠금으로 보호됩니다.
+
+    Example:
+        >>> index = MetadataIndex(store, hash_keys=["model"],
+        ...                       range_keys=["latency_ms"])
+        >>> index.query("depth>10 and model=gpt-4o-mini and latency_ms>2000")
+        ['3f2a...', ...]
+    """
+
+    def __init__(
+        self,
+        store: "Store",
+        hash_keys: Iterable[str] = (),
+        range_keys: Iterable[str] = (),
+    ):
+        """
+        색인을 만들고 store의 노드 이벤트를 구독합니다.
+
+        Args:
+            store: 대상 Store
+            hash_keys: 해시 색인을 둘 메타데이터 키
+            range_keys: 범위 색인을 둘 메타데이터 키 (숫자 값만 색인)
+
+        Raises:
+            ValueError: 예약 키(depth)를 지정한 경우
+        """
+        self.store = store
+        self._lock = threading.Lock()
+        self._hash: Dict[str, Dict[Any, Dict[str, None]]] = {}  # 키 → 값 → 노드
+        self._hash_values: Dict[str, Dict[str, Any]] = {}  # 키 → 노드 → 값
+        self._range: Dict[str, _RangeIndex] = {DEPTH_KEY: _RangeIndex()}
+        self._tree: Optional["Tree"] = None  # 색인한 트리 (교체 감지용)
+        for key in hash_keys:
+            self._check_key(key)
+            self._hash[key] = {}
+            self._hash_values[key] = {}
+        for key in range_keys:
+            self._check_key(key)
+            self._range[key] = _RangeIndex()
+        self.rebuild()
+        store.events.subscribe(self._on_event, NodeAdded, NodeRemoved, Reset)
+
+    # ==================== 색인 관리 ====================
+
+    def add_hash_index(self, key: str):
+        """
+        키에 해시 색인을 추가하고 기존 노드를 색인합니다 (O(N)).
+
+        Args:
+            key: 메타데이터 키
+
+        Raises:
+            ValueError: 예약 키(depth)인 경우
+        """
+        self._check_key(key)
+        with self._lock:
+            if key in self._hash:
+                return
+            self._hash[key] = {}
+            self._hash_values[key] = {}
+            for node_id, node in self._tree.nodes.items():
+                if node_id != self._tree.root_id:
+                    self._add_hash(key, node_id, node.metadata.get(key, _MISSING))
+
+    def add_range_index(self, key: str):
+        """
+        키에 범위 색인을 추가하고 기존 노드를 색인합니다 (O(N log N)).
+
+        Args:
+            key: 메타데이터 키
+
+        Raises:
+            ValueError: 예약 키(depth)인 경우
+        """
+        self._check_key(key)
+        with self._lock:
+            if key in self._range:
+                return
+            index = self._range[key] = _RangeIndex()
+            for node_id, node in self._tree.nodes.items():
+                if node_id != self._tree.root_id:
+                    index.add(node_id, node.metadata.get(key, _MISSING))
+
+    @property
+    def indexed_keys(self) -> Dict[str, str]:
+        """색인된 키와 종류 ("hash" 또는 "range")."""
+        keys = {key: "hash" for key in self._hash}
+        keys.update((key, "range") for key in self._range)
+        return keys
+
+    def rebuild(self):
+        """현재 트리 전체를 다시 색인합니다."""
+        with self._lock:
+            self._clear()
+            self._tree = self.store.tree
+            for node_id in self._tree.nodes:
+                self._add(node_id)
+
+    # ==================== 질의 ====================
+
+    def plan(self, query: Union[str, List[Condition]]) -> QueryPlan:
+        """
+        질의에 쓸 색인을 고릅니다.
+
+        색인이 있는 키의 조건마다 후보 수를 세고(해시 O(1), 범위 O(log N))
+        가장 적은 색인을 고릅니다. 같은 키의 여러 비교 조건은 한 구간으로
+        합쳐 셉니다.
+
+        Args:
+            query: 질의 문자열 또는 parse_query() 결과
+
+        Returns:
+            QueryPlan
+
+        Raises:
+            ValueError: 질의 형식이 잘못된 경우
+        """
+        conditions = parse_query(query) if isinstance(query, str) else list(query)
+        with self._lock:
+            index, estimate, _ = self._plan(conditions)
+        return QueryPlan(index, estimate, conditions)
+
+    def query(
+        self, query: Union[str, List[Condition]], limit: Optional[int] = None
+    ) -> List[str]:
+        """
+        조건을 모두 만족하는 노드를 찾습니다 (루트 제외).
+
+        Args:
+            query: 질의 문자열 또는 parse_query() 결과
+            limit: 최대 결과 수 (None이면 모두)
+
+        Returns:
+            노드 ID 리스트 (ID 순)
+
+        Raises:
+            ValueError: 질의 형식이 잘못된 경우
+        """
+        conditions = parse_query(query) if isinstance(query, str) else list(query)
+        with self._lock:
+            _, _, candidates = self._plan(conditions)
+            tree = self._tree
+            nodes = tree.nodes
+            result = []
+            for node_id in candidates:
+                metadata = nodes[node_id].metadata
+                for cond in conditions:
+                    if cond.key == DEPTH_KEY:
+                        actual = tree.get_depth(node_id)
+                    else:
+                        actual = metadata.get(cond.key, _MISSING)
+                    if not cond.matches(actual):
+                        break
+                else:
+                    result.append(node_id)
+        result.sort()
+        return result if limit is None else result[:limit]
+
+    def __len__(self) -> int:
+        """색인된 노드 수."""
+        return len(self._range[DEPTH_KEY].values)
+
+    # ==================== 내부 구현 ====================
+
+    def _plan(
+        self, conditions: List[Condition]
+    ) -> Tuple[Optional[str], int, Iterable[str]]:
+        # (색인 키, 후보 수, 후보 이터러블) - 후보 수가 가장 적은 것
+        tree = self._tree
+        best: Tuple[Optional[str], int, Iterable[str]] = (
+            None,
+            len(self),
+            self._scan(tree),
+        )
+        by_key: Dict[str, List[Condition]] = {}
+        for cond in conditions:
+            by_key.setdefault(cond.key, []).append(cond)
+
+        for key, conds in by_key.items():
+            if key in self._hash:
+                for cond in conds:
+                    if cond.op != "=" or not _is_hashable(cond.value):
+                        continue
+                    nodes = self._hash[key].get(cond.value, {})
+                    if len(nodes) < best[1]:
+                        best = (key, len(nodes), nodes)
+            # 범위 색인에는 숫자 값만 있으므로 문자열 "=" 조건은 쓰지 않음
+            range_conds = [
+                c
+                for c in conds
+                if c.op in RANGE_OPERATORS or (c.op == "=" and _is_number(c.value))
+            ]
+            if key in self._range and range_conds:
+                index = self._range[key]
+                start, end = index.span(range_conds)
+                if end - start < best[1]:
+                    best = (key, end - start, _slice_ids(index.entries, start, end))
+        return best
+
+    def _scan(self, tree: "Tree") -> Iterator[str]:
+        root_id = tree.root_id
+        return (node_id for node_id in tree.nodes if node_id != root_id)
+
+    def _check_key(self, key: str):
+        if key == DEPTH_KEY:
+            raise ValueError(f"'{DEPTH_KEY}'는 항상 색인되는 예약 키입니다.")
+
+    def _clear(self):
+        for key in self._hash:
+            self._hash[key] = {}
+            self._hash_values[key] = {}
+        for key in self._range:
+            self._range[key] = _RangeIndex()
+
+    def _sync(self):
+        # 트리와 맞춤: 빠진 노드는 색인하고 없어진 노드는 제거
+        tree = self.store.tree
+        if tree is not self._tree:
+            self._clear()
+            self._tree = tree
+        indexed = self._range[DEPTH_KEY].values
+        for node_id in tree.nodes:
+            if node_id not in indexed:
+                self._add(node_id)
+        for node_id in [n for n in indexed if not tree.node_exists(n)]:
+            self._remove(node_id)
+
+    def _add(self, node_id: str):
+        tree = self._tree
+        if node_id == tree.root_id:
+            return
+        metadata = tree.nodes[node_id].metadata
+        for key in self._hash:
+            self._add_hash(key, node_id, metadata.get(key, _MISSING))
+        for key, index in self._range.items():
+            if key == DEPTH_KEY:
+                index.add(node_id, tree.get_depth(node_id))
+            else:
+                index.add(node_id, metadata.get(key, _MISSING))
+
+    def _add_hash(self, key: str, node_id: str, value: Any):
+        if value is _MISSING or not _is_hashable(value):
+            return
+        self._hash[key].setdefault(value, {})[node_id] = None
+        self._hash_values[key][node_id] = value
+
+    def _remove(self, node_id: str):
+        for key, values in self._hash_values.items():
+            value = values.pop(node_id, _MISSING)
+            if value is _MISSING:
+                continue
+            nodes = self._hash[key][value]
+            del nodes[node_id]
+            if not nodes:
+                del self._hash[key][value]
+        for index in self._range.values():
+            index.remove(node_id)
+
+    def _on_event(self, event: StoreEvent):
+        with self._lock:
+            if isinstance(event, NodeAdded) and self.store.tree is self._tree:
+                self._add(event.node_id)
+            elif isinstance(event, NodeRemoved):
+                self._remove(event.node_id)
+            else:
+                self._sync()
+
+
+def _parse_value(raw: str) -> Any:
+    """질의 값 문자열을 숫자 또는 문자열로 바꿉니다."""
+    if len(raw) >= 2 and raw[0] == raw[-1] and raw[0] in "\"'":
+        return raw[1:-1]
+    try:
+        return int(raw)
+    except ValueError:
+        pass
+    try:
+        value = float(raw)
+    except ValueError:
+        return raw
+    return value if math.isfinite(value) else raw
+
+
+def _is_number(value: Any) -> bool:
+    """bool과 NaN을 제외한 int/float인지 확인합니다."""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return False
+    return not (isinstance(value, float) and math.isnan(value))
+
+
+def _is_hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+def _slice_ids(entries: List[Tuple[Any, str]], start: int, end: int) -> Iterator[str]:
+    """정렬 리스트의 [start, end) 구간 노드 ID (복사 없이)."""
+    return (entries[i][1] for i in range(start, end))
@@ -4,10 +4,57 @@
 이 모듈은 대화 노드와 트리를 표현하는 기본 데이터 구조를 포함합니다.
 """
 
+import hashlib
+import threading
 import uuid
+import weakref
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Union
+
+from core.cow import SortedIds, layered
+from core.pagination import DEFAULT_PAGE_SIZE, Page, paginate
+from core.persistent import PMap, TreeVersion
+from core.stats import TreeStats
+
+if TYPE_CHECKING:
+    from core.compression import CompressedTextStore
+    from core.content_store import ContentStore
+    from core.text_store import TextStore
+
+    ContentStoreLike = Union[ContentStore, TextStore, CompressedTextStore]
+
+# 탐색 화면(트리, 노드 목록 등)에서 사용하는 질문 미리보기 길이
+PREVIEW_LENGTH = 60
+
+# 루트의 경로 해시 (루트는 모든 트리에 공통인 시스템 노드이므로 내용과 무관)
+ROOT_PATH_HASH = hashlib.blake2b(digest_size=16).hexdigest()
+
+
+def path_hash(parent_hash: str, user_question: str, ai_answer: str) -> str:
+    """
+    부모의 경로 해시와 이 노드의 질문/답변으로 경로 해시(머클 해시)를 계산합니다.
+
+    경로 해시는 루트부터 이 노드까지의 대화 내용 전체를 대표하므로, 두 노드의
+    해시가 같으면 (ID와 무관하게) 같은 대화 이력을 가진 것입니다.
+
+    Args:
+        parent_hash: 부모 노드의 경로 해시 (16진수 문자열)
+        user_question: 사용자 질문
+        ai_answer: AI 응답
+
+    Returns:
+        32자리 16진수 해시 문자열
+    """
+    digest = hashlib.blake2b(bytes.fromhex(parent_hash), digest_size=16)
+    for text in (user_question, ai_answer):
+        data = text.encode("utf-8")
+        # 길이를 앞에 붙여 ("ab", "c")와 ("a", "bc")가 구분되도록 함
+        digest.update(len(data).to_bytes(8, "little"))
+        digest.update(data)
+    return digest.hexdigest()
 
 
 @dataclass
@@ -43,6 +90,162 @@ class Node:
         if not self.ai_answer:
             raise ValueError("ai_answer cannot be empty")
 
+    @property
+    def question_preview(self) -> str:
+        """탐색 화면용 질문 미리보기 (최대 PREVIEW_LENGTH자)."""
+        return self.user_question[:PREVIEW_LENGTH]
+
+    def has_same_answer(self, other: "Node") -> bool:
+        """
+        다른 노드와 답변 내용이 같은지 확인합니다.
+
+        Args:
+            other: 비교할 노드
+
+        Returns:
+            답변이 같으면 True
+        """
+        return self.ai_answer == other.ai_answer
+
+
+class _StoredText:
+    """ContentStore에 보관된 본문을 참조로 읽고 쓰는 디스크립터."""
+
+    def __set_name__(self, owner, name):
+        self.ref_attr = f"_{name}_ref"
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return instance._content_store.get(getattr(instance, self.ref_attr))
+
+    def __set__(self, instance, value: str):
+        store = instance._content_store
+        old_ref = getattr(instance, self.ref_attr, None)
+        setattr(instance, self.ref_attr, store.put(value))
+        # 참조를 해제할 수 있는 저장소(TextStore 등)라면 이전 본문 참조 해제
+        if old_ref is not None and hasattr(store, "release"):
+            store.release(old_ref)
+
+
+class LazyNode(Node):
+    """
+    본문을 ContentStore에 두고 골격만 메모리에 유지하는 노드.
+
+    id, parent_id, metadata, timestamp와 본문 참조 두 개만 슬롯에 보관하며,
+    user_question/ai_answer(와 질문 미리보기)는 접근 시 ContentStore(LRU 캐시
+    경유)에서 읽습니다. 저장소는 노드마다 들고 있지 않고, 저장소별로 한 번
+    만들어지는 하위 클래스의 클래스 속성으로 공유합니다.
+    Tree가 콘텐츠 저장소 모드일 때 from_node()로 생성합니다.
+    """
+
+    __slots__ = (
+        "id",
+        "parent_id",
+        "metadata",
+        "timestamp",
+        "_user_question_ref",
+        "_ai_answer_ref",
+    )
+
+    # 저장소별 하위 클래스에만 지정됨 (_lazy_class_for 참고)
+    _content_store: "ContentStoreLike"
+
+    user_question = _StoredText()
+    ai_answer = _StoredText()
+
+    @classmethod
+    def from_node(cls, node: Node, content_store: "ContentStoreLike") -> "LazyNode":
+        """
+        일반 노드의 본문을 저장소로 옮기고 LazyNode로 변환합니다.
+
+        Args:
+            node: 변환할 노드 (이미 검증된 노드)
+            content_store: 본문을 기록할 저장소
+
+        Returns:
+            새 LazyNode 객체
+        """
+        lazy = object.__new__(_lazy_class_for(content_store))
+        lazy.id = node.id
+        lazy.parent_id = node.parent_id
+        lazy.metadata = node.metadata
+        lazy.timestamp = node.timestamp
+        lazy._user_question_ref = content_store.put(node.user_question)
+        lazy._ai_answer_ref = content_store.put(node.ai_answer)
+        return lazy
+
+    def has_same_answer(self, other: Node) -> bool:
+        """
+        다른 노드와 답변 내용이 같은지 확인합니다.
+
+        두 노드가 같은 내용 주소 기반 저장소(TextStore)를 공유하면
+        본문을 읽지 않고 참조(해시)만 비교합니다.
+
+        Args:
+            other: 비교할 노드
+
+        Returns:
+            답변이 같으면 True
+        """
+        store = self._content_store
+        if (
+            isinstance(other, LazyNode)
+            and other._content_store is store
+            and getattr(store, "content_addressed", False)
+        ):
+            return self._ai_answer_ref == other._ai_answer_ref
+        return super().has_same_answer(other)
+
+    def text_ref(self, field_name: str):
+        """
+        본문 필드의 저장소 참조를 반환합니다 (본문은 읽지 않음).
+
+        Args:
+            field_name: "user_question" 또는 "ai_answer"
+
+        Returns:
+            content_store.put()이 반환했던 참조
+        """
+        return getattr(self, f"_{field_name}_ref")
+
+    def to_node(self) -> Node:
+        """
+        본문을 모두 읽어 일반 Node로 변환합니다.
+
+        Returns:
+            같은 내용을 가진 Node 객체
+        """
+        return Node(
+            id=self.id,
+            parent_id=self.parent_id,
+            user_question=self.user_question,
+            ai_answer=self.ai_answer,
+            metadata=self.metadata,
+            timestamp=self.timestamp,
+        )
+
+
+# 저장소 → 그 저장소에 묶인 LazyNode 하위 클래스 (저장소가 사라지면 함께 정리)
+_lazy_classes: "weakref.WeakKeyDictionary[Any, type]" = weakref.WeakKeyDictionary()
+_lazy_classes_lock = threading.Lock()
+
+
+def _lazy_class_for(content_store: "ContentStoreLike") -> type:
+    """저장소를 클래스 속성으로 가진 LazyNode 하위 클래스를 반환합니다."""
+    lazy_class = _lazy_classes.get(content_store)
+    if lazy_class is None:
+        with _lazy_classes_lock:
+            lazy_class = _lazy_classes.get(content_store)
+            if lazy_class is None:
+                lazy_class = type(
+                    LazyNode.__name__,
+                    (LazyNode,),
+                    {"__slots__": (), "_content_store": content_store},
+                )
+                _lazy_classes[content_store] = lazy_class
+    return lazy_class
+
 
 class Tree:
     """
@@ -55,24 +258,57 @@ class Tree:
     애플리케이션 상태는 담당하지 않습니다.
     """
 
-    def __init__(self, root_id: str = "root"):
+    def __init__(
+        self,
+        root_id: str = "root",
+        content_store: Optional["ContentStoreLike"] = None,
+    ):
         """
         루트 노드를 가진 새로운 대화 트리를 초기화합니다.
 
         Args:
             root_id: 루트 노드에 사용할 ID (기본값: 'root')
+            content_store: 지정하면 추가되는 노드의 본문을 저장소로 옮기고
+                골격(LazyNode)만 메모리에 유지합니다 (ContentStore: 디스크,
+                TextStore: 내용 주소 기반 중복 제거, CompressedTextStore:
+                cold 본문 압축)
         """
         self.root_id = root_id
+        self.content_store = content_store
         self.nodes: Dict[str, Node] = {}
 
+        # 노드 추가 직렬화 (여러 Store/세션이 트리를 공유할 수 있음)
+        self._lock = threading.Lock()
+
+        # 보조 인덱스 (노드 추가 시 함께 갱신)
+        self._children: Dict[str, List[str]] = {}  # 부모 ID → 자식 ID (추가 순)
+        self._depth: Dict[str, int] = {}  # 노드 ID → 깊이
+        self._sorted_ids = SortedIds()  # ID 정렬 목록 (접두사 검색, 번호 매기기)
+        self.stats = TreeStats()  # 구조 통계 (노드/잎/분기점 수, 깊이 분포)
+        # 잎(자식 없음)과 분기점(자식 2개 이상) 집합, 잎은 잎이 된 순서 유지
+        self._leaves: Dict[str, None] = {}
+        self._branch_points: Dict[str, None] = {}
+        # 분기점이 생긴 횟수 (단조 증가, 트리를 공유하는 다른 작업자의 분기 감지용)
+        self.branch_points_created = 0
+        self._hashes: Dict[str, str] = {}  # 노드 ID → 경로 해시 (삽입 시 1회 계산)
+
         # 루트 노드 생성
-        self.nodes[root_id] = Node(
+        root = Node(
             id=root_id,
             parent_id=None,
             user_question="[시스템]",
             ai_answer="대화를 시작합니다",
             metadata={"type": "root"},
         )
+        self.nodes[root_id] = root
+        self._depth[root_id] = 0
+        self._sorted_ids.add(root_id)
+        self.stats.node_attached(0, None)
+        self._leaves[root_id] = None
+        self._hashes[root_id] = ROOT_PATH_HASH
+
+        # 영속 버전 (enable_versions() 이후에만 유지)
+        self._version: Optional[TreeVersion] = None
 
     def add_node(self, node: Node) -> bool:
         """
@@ -87,15 +323,202 @@ class Tree:
         Raises:
             ValueError: parent_id가 트리에 존재하지 않는 경우 (루트 제외)
         """
-        if node.id in self.nodes:
-            return False
+        with self._lock:
+            if node.id in self.nodes:
+                return False
+
+            # 부모 노드 존재 여부 검증 (루트 제외)
+            if node.parent_id is not None and node.parent_id not in self.nodes:
+                raise ValueError(f"Parent node '{node.parent_id}' does not exist")
+
+            # 본문을 저장소로 옮기기 전에 해시 계산 (LazyNode면 본문을 한 번 읽음)
+            self._hashes[node.id] = self._hash_of(node)
+            if self.content_store is not None and not isinstance(node, LazyNode):
+                node = LazyNode.from_node(node, self.content_store)
+
+            self.nodes[node.id] = node
+            self._index_node(node)
+            if self._version is not None:
+                self._version = self._version.with_node(node)
+            self._sorted_ids.add(node.id)
+            return True
+
+    def add_nodes(self, nodes: Iterable[Node]) -> int:
+        """
+        여러 노드를 한 번에 추가합니다 (순서 무관, 전부 아니면 전무).
+
+        배치 안에서 부모가 자식보다 뒤에 와도 되며, 부모 관계를 위상 정렬로
+        해석합니다. 배치 전체를 먼저 한 번 검증한 뒤, 모든 인덱스(자식, 깊이,
+        ID 정렬)를 한 번의 패스로 갱신합니다. 검증에 실패하면 트리는 변경되지
+        않습니다.
+
+        Args:
+            nodes: 추가할 노드들
+
+        Returns:
+            추가된 노드 개수
+
+        Raises:
+            ValueError: ID가 중복되거나, 부모가 트리와 배치 어디에도 없거나,
+                순환 참조가 있는 경우
+
+        Example:
+            >>> tree.add_nodes([child_node, parent_node])  # 순서 무관
+            2
+        """
+        with self._lock:
+            batch: Dict[str, Node] = {}
+            for node in nodes:
+                if node.id in self.nodes or node.id in batch:
+                    raise ValueError(f"Duplicate node id '{node.id}'")
+                batch[node.id] = node
+
+            # 위상 정렬 (부모 우선 순서). 부모가 이미 배치된 노드는 바로 배치하고,
+            # 부모가 뒤에 나오는 노드만 부모 ID 아래에 대기시킴
+            tree_depth = self._depth
+            new_depth: Dict[str, int] = {}
+            order: List[str] = []
+            waiting: Dict[str, List[str]] = {}
+            for node_id, node in batch.items():
+                parent_id = node.parent_id
+                if parent_id in tree_depth:
+                    parent_depth = tree_depth[parent_id]
+                elif parent_id in new_depth:
+                    parent_depth = new_depth[parent_id]
+                elif parent_id in batch:
+                    waiting.setdefault(parent_id, []).append(node_id)
+                    continue
+                elif parent_id is None:
+                    raise ValueError(f"Node '{node_id}' has no parent")
+                else:
+                    raise ValueError(f"Parent node '{parent_id}' does not exist")
+
+                new_depth[node_id] = parent_depth + 1
+                order.append(node_id)
+                if waiting:
+                    # 이 노드를 기다리던 자손들을 연쇄적으로 배치
+                    stack = [node_id]
+                    while stack:
+                        placed = stack.pop()
+                        for child_id in waiting.pop(placed, ()):
+                            new_depth[child_id] = new_depth[placed] + 1
+                            order.append(child_id)
+                            stack.append(child_id)
+
+            if waiting:
+                raise ValueError("Cycle detected among batch nodes")
+
+            # 검증 완료 - 한 번의 패스로 삽입 및 인덱스 갱신
+            content_store = self.content_store
+            tree_nodes, children = self.nodes, self._children
+            hashes = self._hashes
+            # 통계는 노드마다 갱신하지 않고 부모별 자식 수 변화만 모아 한 번에 반영
+            old_fanouts: Dict[str, int] = {}
+            for node_id in order:
+                node = batch[node_id]
+                # 부모 우선 순서이므로 부모 해시는 이미 있음
+                hashes[node_id] = self._hash_of(node)
+                if content_store is not None and not isinstance(node, LazyNode):
+                    node = LazyNode.from_node(node, content_store)
+                tree_nodes[node_id] = node
+                siblings = children.setdefault(node.parent_id, [])
+                old_fanouts.setdefault(node.parent_id, len(siblings))
+                self._attach_child(node.parent_id, len(siblings), node_id)
+                siblings.append(node_id)
+            tree_depth.update(new_depth)
+
+            fanouts: Dict[int, int] = {0: len(order)}
+            for parent_id, old in old_fanouts.items():
+                new = len(children[parent_id])
+                fanouts[old] = fanouts.get(old, 0) - 1
+                fanouts[new] = fanouts.get(new, 0) + 1
+            self.stats.nodes_attached(Counter(new_depth.values()), fanouts)
+
+            self._sorted_ids.extend(order)
+            if self._version is not None:
+                version = self._version
+                for node_id in order:
+                    version = version.with_node(tree_nodes[node_id])
+                self._version = version
+            return len(order)
+
+    def remove_leaf(self, node_id: str) -> Node:
+        """
+        자식이 없는 노드를 트리에서 제거합니다 (실행 취소용).
 
-        # 부모 노드 존재 여부 검증 (루트 제외)
-        if node.parent_id is not None and node.parent_id not in self.nodes:
-            raise ValueError(f"Parent node '{node.parent_id}' does not exist")
+        트리는 원칙적으로 추가만 가능하며, 이 메서드는 방금 추가한 노드를
+        되돌릴 때만 사용합니다. 본문은 저장소에 남겨 두므로 반환된 노드를
+        add_node()로 다시 추가할 수 있습니다.
 
-        self.nodes[node.id] = node
-        return True
+        Args:
+            node_id: 제거할 노드 ID
+
+        Returns:
+            제거된 노드
+
+        Raises:
+            ValueError: 노드가 없거나, 루트이거나, 자식이 있거나,
+                분기(fork) 이전부터 있던 노드인 경우
+        """
+        with self._lock:
+            node = self.nodes.get(node_id)
+            if node is None:
+                raise ValueError(f"Node '{node_id}' does not exist")
+            if node.parent_id is None:
+                raise ValueError("Cannot remove the root node")
+            if self._children.get(node_id):
+                raise ValueError(f"Node '{node_id}' has children")
+            if not self._sorted_ids.remove(node_id):
+                raise ValueError(f"Node '{node_id}' was added before fork")
+
+            del self.nodes[node_id]
+            del self._hashes[node_id]
+            depth = self._depth.pop(node_id)
+            self._children.pop(node_id, None)
+            siblings = self._children.setdefault(node.parent_id, [])
+            self.stats.node_detached(depth, len(siblings))
+            del self._leaves[node_id]
+            if len(siblings) == 1:
+                self._leaves[node.parent_id] = None
+            elif len(siblings) == 2:
+                del self._branch_points[node.parent_id]
+            siblings.remove(node_id)
+            if not siblings:
+                del self._children[node.parent_id]
+            if self._version is not None:
+                self._version = self._version.without_node(node)
+            return node
+
+    def _index_node(self, node: Node):
+        """이미 nodes에 들어간 노드를 자식/깊이 인덱스와 통계에 반영합니다."""
+        if node.parent_id is None:
+            self._depth[node.id] = 0
+            self.stats.node_attached(0, None)
+            self._leaves[node.id] = None
+            return
+        siblings = self._children.setdefault(node.parent_id, [])
+        depth = self._depth[node.parent_id] + 1
+        self.stats.node_attached(depth, len(siblings))
+        self._attach_child(node.parent_id, len(siblings), node.id)
+        siblings.append(node.id)
+        self._depth[node.id] = depth
+
+    def _hash_of(self, node: Node) -> str:
+        """부모의 경로 해시로 노드의 경로 해시를 계산합니다 (O(본문 길이))."""
+        if node.parent_id is None:
+            return ROOT_PATH_HASH
+        return path_hash(
+            self._hashes[node.parent_id], node.user_question, node.ai_answer
+        )
+
+    def _attach_child(self, parent_id: str, sibling_count: int, node_id: str):
+        """자식이 붙을 때 잎/분기점 집합을 O(1)로 갱신합니다."""
+        self._leaves[node_id] = None
+        if sibling_count == 0:
+            del self._leaves[parent_id]
+        elif sibling_count == 1:
+            self._branch_points[parent_id] = None
+            self.branch_points_created += 1
 
     def get_node(self, node_id: str) -> Optional[Node]:
         """
@@ -119,10 +542,152 @@ class Tree:
         Returns:
             자식 노드 리스트 (없으면 빈 리스트)
         """
-        if node_id not in self.nodes:
-            return []
+        return [self.nodes[child_id] for child_id in self._children.get(node_id, ())]
+
+    def get_child_ids(self, node_id: str) -> List[str]:
+        """
+        노드의 직접 자식 ID를 추가된 순서로 가져옵니다 (노드 조회 없음).
+
+        Args:
+            node_id: 부모 노드의 ID
 
-        return [node for node in self.nodes.values() if node.parent_id == node_id]
+        Returns:
+            자식 노드 ID 리스트 (없으면 빈 리스트)
+        """
+        return list(self._children.get(node_id, ()))
+
+    def list_children(
+        self,
+        node_id: str,
+        after: Optional[str] = None,
+        limit: Optional[int] = DEFAULT_PAGE_SIZE,
+    ) -> Page:
+        """
+        노드의 직접 자식을 추가된 순서로 한 페이지씩 가져옵니다.
+
+        커서는 자식 ID이며, 커서 위치를 찾는 데 O(자식 수)의 C 수준 탐색
+        한 번, 이후 O(limit)입니다.
+
+        Args:
+            node_id: 부모 노드의 ID
+            after: 이전 페이지의 next_cursor (None이면 처음부터)
+            limit: 페이지 크기 (None이면 끝까지)
+
+        Returns:
+            자식 Node를 담은 Page
+
+        Raises:
+            ValueError: after가 이 노드의 자식이 아니거나 limit이 1보다 작은 경우
+        """
+        child_ids = self._children.get(node_id, ())
+        start = 0
+        if after is not None:
+            try:
+                start = child_ids.index(after) + 1
+            except ValueError:
+                raise ValueError(
+                    f"'{after}'는 노드 '{node_id}'의 자식이 아닙니다."
+                ) from None
+        nodes = map(self.nodes.__getitem__, islice(child_ids, start, None))
+        return paginate(nodes, limit, lambda node: node.id)
+
+    def get_child_count(self, node_id: str) -> int:
+        """
+        노드의 직접 자식 수를 O(1)로 가져옵니다.
+
+        Args:
+            node_id: 부모 노드의 ID
+
+        Returns:
+            자식 수 (없는 노드면 0)
+        """
+        return len(self._children.get(node_id, ()))
+
+    def is_leaf(self, node_id: str) -> bool:
+        """노드가 자식 없는 잎이면 True (O(1))."""
+        return node_id in self._leaves
+
+    def is_branch_point(self, node_id: str) -> bool:
+        """노드의 자식이 2개 이상이면 True (O(1))."""
+        return node_id in self._branch_points
+
+    def get_leaf_ids(self) -> List[str]:
+        """
+        모든 잎 노드 ID를 잎이 된 순서로 반환합니다 (O(잎 수)).
+
+        Returns:
+            잎 노드 ID 리스트
+        """
+        return list(self._leaves)
+
+    def get_newest_leaf_id(self) -> str:
+        """
+        가장 최근에 잎이 된 노드(보통 마지막으로 추가된 노드)의 ID를 O(1)로 반환합니다.
+
+        Returns:
+            노드 ID (노드가 루트뿐이면 루트)
+        """
+        return next(reversed(self._leaves))
+
+    def get_branch_point_ids(self) -> List[str]:
+        """
+        자식이 2개 이상인 모든 노드 ID를 반환합니다 (O(분기점 수)).
+
+        Returns:
+            분기점 노드 ID 리스트
+        """
+        return list(self._branch_points)
+
+    def get_branch_points_on_path(self, path_ids: List[str]) -> List[str]:
+        """
+        루트에서 시작하는 경로 위의 분기점을 경로 순서로 반환합니다.
+
+        경로의 i번째 노드는 깊이 i이므로, 분기점이 경로보다 적으면 분기점
+        쪽을 훑어 깊이로 경로 포함 여부를 O(1)에 판정합니다.
+        비용은 O(min(경로 길이, 분기점 수))입니다.
+
+        Args:
+            path_ids: 루트 → 노드 순서의 경로 (Store.active_path_ids 등)
+
+        Returns:
+            경로 위의 분기점 ID 리스트 (루트 쪽부터)
+        """
+        branch_points = self._branch_points
+        if len(path_ids) <= len(branch_points):
+            return [node_id for node_id in path_ids if node_id in branch_points]
+
+        depth_of = self._depth
+        on_path = []
+        for node_id in branch_points:
+            depth = depth_of[node_id]
+            if depth < len(path_ids) and path_ids[depth] == node_id:
+                on_path.append(node_id)
+        on_path.sort(key=depth_of.__getitem__)
+        return on_path
+
+    def get_path_hash(self, node_id: str) -> Optional[str]:
+        """
+        노드의 경로 해시(루트부터의 대화 이력 머클 해시)를 O(1)로 가져옵니다.
+
+        Args:
+            node_id: 노드 ID
+
+        Returns:
+            32자리 16진수 해시, 노드가 없으면 None
+        """
+        return self._hashes.get(node_id)
+
+    def get_depth(self, node_id: str) -> int:
+        """
+        노드의 깊이를 O(1)로 가져옵니다.
+
+        Args:
+            node_id: 노드 ID
+
+        Returns:
+            깊이 (루트는 0), 노드가 없으면 -1
+        """
+        return self._depth.get(node_id, -1)
 
     def get_path_to_root(self, node_id: str) -> List[str]:
         """
@@ -171,6 +736,173 @@ class Tree:
         """
         return len(self.nodes)
 
+    def find_ids_by_prefix(self, prefix: str, limit: Optional[int] = None) -> List[str]:
+        """
+        ID가 접두사로 시작하는 노드를 정렬 순서로 찾습니다 (O(log N + k)).
+
+        Args:
+            prefix: ID 접두사
+            limit: 최대 반환 개수 (None이면 전체)
+
+        Returns:
+            일치하는 노드 ID 리스트
+        """
+        result = []
+        for node_id in islice(self._sorted_ids.iter_from(prefix), limit):
+            if not node_id.startswith(prefix):
+                break
+            result.append(node_id)
+        return result
+
+    def list_nodes(
+        self, after: Optional[str] = None, limit: Optional[int] = DEFAULT_PAGE_SIZE
+    ) -> Page:
+        """
+        루트를 제외한 노드를 번호 순(ID 정렬 순)으로 한 페이지씩 가져옵니다.
+
+        정렬된 ID 색인에서 커서 위치를 O(log N)에 찾고 limit개만 읽으므로,
+        몇 번째 페이지든 O(log N + limit)입니다.
+
+        Args:
+            after: 이전 페이지의 next_cursor (None이면 처음부터)
+            limit: 페이지 크기 (None이면 끝까지)
+
+        Returns:
+            Node를 담은 Page (첫 노드의 번호는 get_node_number로 구함)
+
+        Raises:
+            ValueError: limit이 1보다 작은 경우
+
+        Example:
+            >>> page = tree.list_nodes(limit=20)
+            >>> next_page = tree.list_nodes(after=page.next_cursor, limit=20)
+        """
+        ids = self._sorted_ids.iter_from(after or "")
+        nodes = (
+            self.nodes[node_id]
+            for node_id in ids
+            if node_id != after and node_id != self.root_id
+        )
+        return paginate(nodes, limit, lambda node: node.id)
+
+    def get_node_number(self, node_id: str) -> Optional[int]:
+        """
+        노드 번호(n1, n2, ...의 숫자)를 반환합니다.
+
+        번호는 루트를 제외한 노드를 ID 순으로 정렬했을 때의 순번(1부터)입니다.
+
+        Args:
+            node_id: 노드 ID
+
+        Returns:
+            노드 번호, 루트이거나 없는 노드면 None
+        """
+        if node_id == self.root_id or node_id not in self.nodes:
+            return None
+        idx = self._sorted_ids.rank(node_id)
+        root_idx = self._sorted_ids.rank(self.root_id)
+        return idx if root_idx < idx else idx + 1
+
+    def get_node_by_number(self, number: int) -> Optional[str]:
+        """
+        노드 번호로 노드 ID를 찾습니다 (get_node_number의 역방향).
+
+        Args:
+            number: 노드 번호 (1부터)
+
+        Returns:
+            노드 ID, 범위를 벗어나면 None
+        """
+        if number < 1:
+            return None
+        idx = number - 1
+        if idx >= self._sorted_ids.rank(self.root_id):
+            idx += 1
+        return self._sorted_ids.select(idx)
+
+    def iter_numbered_ids(self) -> Iterable[str]:
+        """
+        루트를 제외한 노드 ID를 번호 순(ID 정렬 순)으로 순회합니다.
+
+        Returns:
+            노드 ID 이터레이터
+        """
+        return (
+            node_id
+            for node_id in self._sorted_ids.iter_from()
+            if node_id != self.root_id
+        )
+
+    def enable_versions(self):
+        """
+        영속 버전 유지를 켭니다 (snapshot() 사용 가능).
+
+        현재 내용으로 첫 버전을 만들고(O(N log N)), 이후에는 노드를 추가할
+        때마다 구조를 공유하는 새 버전을 O(log N)으로 만듭니다.
+        이미 켜져 있으면 아무것도 하지 않습니다.
+        """
+        with self._lock:
+            if self._version is not None:
+                return
+            children = PMap(
+                {parent_id: tuple(ids) for parent_id, ids in self._children.items()}
+            )
+            self._version = TreeVersion(self.root_id, PMap(self.nodes), children)
+
+    def snapshot(self) -> TreeVersion:
+        """
+        현재 트리의 읽기 전용 스냅샷을 O(1)로 반환합니다.
+
+        이후 노드가 추가되어도 반환된 스냅샷은 바뀌지 않습니다.
+
+        Returns:
+            TreeVersion 객체
+
+        Raises:
+            ValueError: enable_versions()로 버전 유지를 켜지 않은 경우
+        """
+        version = self._version
+        if version is None:
+            raise ValueError("Versions are not enabled for this tree")
+        return version
+
+    def fork(self) -> "Tree":
+        """
+        이 트리의 copy-on-write 분기를 만듭니다 (노드 수와 무관하게 O(1)).
+
+        현재 내용은 고정된 바닥 계층이 되어 양쪽이 공유하고, 이후 이 트리와
+        분기된 트리는 각자 추가한 노드만 자신의 계층에 기록합니다.
+        서로의 이후 추가는 보이지 않습니다. 분기를 거듭해 계층이
+        cow.MAX_LAYERS에 이르면 그 분기에서 한 번 평탄화하므로(O(N)) 조회는
+        분기 횟수와 무관하게 O(1)로 유지됩니다.
+
+        Returns:
+            분기된 새 Tree
+
+        Example:
+            >>> what_if = tree.fork()
+            >>> what_if.add_node(node)  # 원래 tree에는 보이지 않음
+        """
+        with self._lock:
+            other = Tree.__new__(Tree)
+            other.root_id = self.root_id
+            other.content_store = self.content_store
+            other._lock = threading.Lock()
+
+            _, self.nodes, other.nodes = layered(self.nodes)
+            _, self._depth, other._depth = layered(self._depth)
+            _, self._children, other._children = layered(self._children)
+            _, self._leaves, other._leaves = layered(self._leaves)
+            _, self._branch_points, other._branch_points = layered(
+                self._branch_points
+            )
+            _, self._hashes, other._hashes = layered(self._hashes)
+            self._sorted_ids, other._sorted_ids = self._sorted_ids.fork()
+            other._version = self._version  # 불변 객체이므로 그대로 공유
+            other.branch_points_created = self.branch_points_created
+            other.stats = self.stats.copy()
+            return other
+
 
 def create_node(
     parent_id: str,
@@ -0,0 +1,63 @@
+"""
+커서 기반 페이지 조회.
+
+노드·자식·체크포인트 목록을 한 번에 모두 만들지 않고 정렬된 색인에서 필요한
+만큼만 꺼내도록, 공통 페이지 형식(Page)과 페이지를 자르는 함수를 제공합니다.
+커서는 이전 페이지의 마지막 항목 키(노드 ID, 체크포인트 이름)이므로 다음
+페이지는 색인에서 커서 위치를 찾은 뒤(O(log N)) k개만 읽으면 됩니다.
+"""
+
+from itertools import islice
+from typing import Any, Callable, Iterable, List, NamedTuple, Optional
+
+# 목록 API의 기본 페이지 크기
+DEFAULT_PAGE_SIZE = 50
+
+
+class Page(NamedTuple):
+    """
+    목록 조회 결과의 한 페이지.
+
+    Attributes:
+        items: 이 페이지의 항목
+        next_cursor: 다음 페이지를 요청할 때 after로 넘길 커서 (마지막이면 None)
+
+    Example:
+        >>> page = tree.list_nodes(limit=20)
+        >>> while page.next_cursor:
+        ...     page = tree.list_nodes(after=page.next_cursor, limit=20)
+    """
+
+    items: List[Any]
+    next_cursor: Optional[str]
+
+
+def paginate(
+    items: Iterable[Any], limit: Optional[int], cursor_of: Callable[[Any], str]
+) -> Page:
+    """
+    정렬된 이터러블에서 최대 limit개를 꺼내 페이지를 만듭니다.
+
+    다음 페이지가 있는지 알기 위해 하나만 더 읽으므로 O(limit)입니다.
+
+    Args:
+        items: 커서 다음 항목부터 정렬 순서로 나오는 이터러블
+        limit: 페이지 크기 (None이면 끝까지)
+        cursor_of: 항목에서 커서 키를 꺼내는 함수
+
+    Returns:
+        Page 객체
+
+    Raises:
+        ValueError: limit이 1보다 작은 경우
+    """
+    if limit is None:
+        return Page(list(items), None)
+    if limit < 1:
+        raise ValueError(f"페이지 크기는 1 이상이어야 합니다: {limit}")
+
+    page = list(islice(items, limit + 1))
+    if len(page) <= limit:
+        return Page(page, None)
+    page.pop()
+    return Page(page, cursor_of(page[-1]))
@@ -61,14 +61,8 @@ def find_branch_points(tree: Tree, path_ids: List[str]) -> List[str]:
         >>> 'root' in branch_points  # root has 2+ children
         True
     """
-    branch_points = []
-
-    for node_id in path_ids:
-        children = tree.get_children(node_id)
-        if len(children) >= 2:
-            branch_points.append(node_id)
-
-    return branch_points
+    # Tree가 유지하는 분기점 집합으로 노드마다 O(1) 판정
+    return [node_id for node_id in path_ids if tree.is_branch_point(node_id)]
 
 
 def get_path_summary(store: Store) -> dict:
@@ -275,14 +269,8 @@ def get_leaf_nodes(tree: Tree) -> List[Node]:
         >>> all(len(tree.get_children(leaf.id)) == 0 for leaf in leaves)
         True
     """
-    leaves = []
-
-    for node_id, node in tree.nodes.items():
-        children = tree.get_children(node_id)
-        if len(children) == 0:
-            leaves.append(node)
-
-    return leaves
+    # Tree가 유지하는 잎 집합을 읽으므로 O(잎 수)
+    return [tree.nodes[node_id] for node_id in tree.get_leaf_ids()]
 
 
 def get_path_depth(tree: Tree, node_id: str) -> int:
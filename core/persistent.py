@@ -0,0 +1,378 @@
+"""
+영속(persistent) 자료구조와 트리 버전.
+
+이 모듈은 변경할 때마다 새 버전을 만들되 바뀌지 않은 구조는 이전 버전과
+공유하는 해시 배열 매핑 트라이(HAMT) PMap과, PMap 위에 만든 읽기 전용
+트리 스냅샷 TreeVersion을 제공합니다. 버전 하나를 만드는 비용과 추가
+메모리는 O(log N)이며, 이전 버전은 그대로 남아 시간 여행에 쓸 수 있습니다.
+"""
+
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Hashable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+if TYPE_CHECKING:
+    from core.models import Node
+
+_BITS = 5
+_MASK = (1 << _BITS) - 1
+_HASH_BITS = 64
+_HASH_MASK = (1 << _HASH_BITS) - 1
+
+# 하위 노드를 가리키는 엔트리의 키 자리 표식
+_SUB = object()
+
+
+def _hash(key: Hashable) -> int:
+    return hash(key) & _HASH_MASK
+
+
+def _popcount(bits: int) -> int:
+    # int.bit_count()는 Python 3.10부터 제공
+    return bin(bits).count("1")
+
+
+class _Collision:
+    """전체 해시가 같은 키들을 선형으로 보관하는 노드."""
+
+    __slots__ = ("keys", "vals")
+
+    def __init__(self, keys: tuple, vals: tuple):
+        self.keys = keys
+        self.vals = vals
+
+    def find(self, shift, h, key, default):
+        for idx, k in enumerate(self.keys):
+            if k == key:
+                return self.vals[idx]
+        return default
+
+    def assoc(self, shift, h, key, value):
+        for idx, k in enumerate(self.keys):
+            if k == key:
+                if self.vals[idx] is value:
+                    return self, False
+                vals = self.vals[:idx] + (value,) + self.vals[idx + 1 :]
+                return _Collision(self.keys, vals), False
+        return _Collision(self.keys + (key,), self.vals + (value,)), True
+
+    def without(self, shift, h, key):
+        for idx, k in enumerate(self.keys):
+            if k == key:
+                if len(self.keys) == 1:
+                    return None, True
+                keys = self.keys[:idx] + self.keys[idx + 1 :]
+                vals = self.vals[:idx] + self.vals[idx + 1 :]
+                return _Collision(keys, vals), True
+        return self, False
+
+    def items(self):
+        return zip(self.keys, self.vals)
+
+
+class _Bitmap:
+    """32갈래 비트맵 인덱스 노드."""
+
+    __slots__ = ("bitmap", "keys", "vals")
+
+    def __init__(self, bitmap: int, keys: tuple, vals: tuple):
+        self.bitmap = bitmap
+        self.keys = keys
+        self.vals = vals
+
+    def find(self, shift, h, key, default):
+        bit = 1 << ((h >> shift) & _MASK)
+        if not self.bitmap & bit:
+            return default
+        idx = _popcount(self.bitmap & (bit - 1))
+        k = self.keys[idx]
+        if k is _SUB:
+            return self.vals[idx].find(shift + _BITS, h, key, default)
+        return self.vals[idx] if k == key else default
+
+    def assoc(self, shift, h, key, value):
+        bit = 1 << ((h >> shift) & _MASK)
+        idx = _popcount(self.bitmap & (bit - 1))
+        keys, vals = self.keys, self.vals
+
+        if not self.bitmap & bit:
+            return (
+                _Bitmap(
+                    self.bitmap | bit,
+                    keys[:idx] + (key,) + keys[idx:],
+                    vals[:idx] + (value,) + vals[idx:],
+                ),
+                True,
+            )
+
+        k = keys[idx]
+        if k is _SUB:
+            child, added = vals[idx].assoc(shift + _BITS, h, key, value)
+            if child is vals[idx]:
+                return self, False
+            new_key, new_val = _SUB, child
+        elif k == key:
+            if vals[idx] is value:
+                return self, False
+            new_key, new_val, added = key, value, False
+        else:
+            new_key, added = _SUB, True
+            new_val = _make_sub(shift + _BITS, _hash(k), k, vals[idx], h, key, value)
+
+        return (
+            _Bitmap(
+                self.bitmap,
+                keys[:idx] + (new_key,) + keys[idx + 1 :],
+                vals[:idx] + (new_val,) + vals[idx + 1 :],
+            ),
+            added,
+        )
+
+    def without(self, shift, h, key):
+        bit = 1 << ((h >> shift) & _MASK)
+        if not self.bitmap & bit:
+            return self, False
+        idx = _popcount(self.bitmap & (bit - 1))
+        k = self.keys[idx]
+
+        if k is _SUB:
+            child, removed = self.vals[idx].without(shift + _BITS, h, key)
+            if not removed:
+                return self, False
+            if child is not None:
+                return (
+                    _Bitmap(
+                        self.bitmap,
+                        self.keys,
+                        self.vals[:idx] + (child,) + self.vals[idx + 1 :],
+                    ),
+                    True,
+                )
+        elif k != key:
+            return self, False
+
+        if self.bitmap == bit:
+            return None, True
+        return (
+            _Bitmap(
+                self.bitmap & ~bit,
+                self.keys[:idx] + self.keys[idx + 1 :],
+                self.vals[:idx] + self.vals[idx + 1 :],
+            ),
+            True,
+        )
+
+    def items(self):
+        for k, v in zip(self.keys, self.vals):
+            if k is _SUB:
+                yield from v.items()
+            else:
+                yield k, v
+
+
+def _make_sub(shift, h1, k1, v1, h2, k2, v2):
+    """두 엔트리를 담는 하위 노드를 만듭니다."""
+    if shift >= _HASH_BITS:
+        return _Collision((k1, k2), (v1, v2))
+    b1 = (h1 >> shift) & _MASK
+    b2 = (h2 >> shift) & _MASK
+    if b1 == b2:
+        child = _make_sub(shift + _BITS, h1, k1, v1, h2, k2, v2)
+        return _Bitmap(1 << b1, (_SUB,), (child,))
+    if b1 < b2:
+        return _Bitmap((1 << b1) | (1 << b2), (k1, k2), (v1, v2))
+    return _Bitmap((1 << b1) | (1 << b2), (k2, k1), (v2, v1))
+
+
+_EMPTY_NODE = _Bitmap(0, (), ())
+
+
+class PMap(Mapping):
+    """
+    변경 불가능한 해시 매핑 (HAMT).
+
+    set()/delete()는 자신을 바꾸지 않고 새 PMap을 반환하며, 바뀌지 않은
+    내부 노드는 이전 PMap과 공유합니다. 조회와 변경 모두 O(log32 N)입니다.
+
+    Example:
+        >>> v1 = PMap().set("a", 1)
+        >>> v2 = v1.set("b", 2)
+        >>> "b" in v1, len(v2)
+        (False, 2)
+    """
+
+    __slots__ = ("_root", "_len")
+
+    def __init__(self, items: Optional[Mapping] = None):
+        """
+        매핑을 초기화합니다.
+
+        Args:
+            items: 초기 내용 (None이면 빈 매핑)
+        """
+        self._root = _EMPTY_NODE
+        self._len = 0
+        if items:
+            root, count = _EMPTY_NODE, 0
+            for key, value in items.items():
+                root, added = root.assoc(0, _hash(key), key, value)
+                count += added
+            self._root, self._len = root, count
+
+    @classmethod
+    def _make(cls, root, length: int) -> "PMap":
+        pmap = cls.__new__(cls)
+        pmap._root = root if root is not None else _EMPTY_NODE
+        pmap._len = length
+        return pmap
+
+    def __getitem__(self, key):
+        value = self._root.find(0, _hash(key), key, _SUB)
+        if value is _SUB:
+            raise KeyError(key)
+        return value
+
+    def get(self, key, default=None):
+        value = self._root.find(0, _hash(key), key, _SUB)
+        return default if value is _SUB else value
+
+    def __contains__(self, key) -> bool:
+        return self._root.find(0, _hash(key), key, _SUB) is not _SUB
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator:
+        return (key for key, _ in self._root.items())
+
+    def items(self):
+        return list(self._root.items())
+
+    def set(self, key: Hashable, value: Any) -> "PMap":
+        """
+        key에 value를 연결한 새 PMap을 반환합니다.
+
+        Args:
+            key: 키
+            value: 값
+
+        Returns:
+            새 PMap (내용이 같으면 자기 자신)
+        """
+        root, added = self._root.assoc(0, _hash(key), key, value)
+        if root is self._root:
+            return self
+        return PMap._make(root, self._len + added)
+
+    def delete(self, key: Hashable) -> "PMap":
+        """
+        key를 제거한 새 PMap을 반환합니다 (없으면 자기 자신).
+
+        Args:
+            key: 제거할 키
+
+        Returns:
+            새 PMap
+        """
+        root, removed = self._root.without(0, _hash(key), key)
+        if not removed:
+            return self
+        return PMap._make(root, self._len - 1)
+
+
+class TreeVersion:
+    """
+    특정 시점 트리의 읽기 전용 스냅샷.
+
+    Tree.snapshot()으로 만들며, Tree의 조회 API(get_node, get_children,
+    get_path_to_root 등)를 같은 이름으로 제공합니다.
+    """
+
+    __slots__ = ("root_id", "nodes", "children")
+
+    def __init__(self, root_id: str, nodes: PMap, children: PMap):
+        """
+        스냅샷을 초기화합니다.
+
+        Args:
+            root_id: 루트 노드 ID
+            nodes: {노드 ID: Node} 영속 매핑
+            children: {부모 ID: 자식 ID 튜플} 영속 매핑
+        """
+        self.root_id = root_id
+        self.nodes = nodes
+        self.children = children
+
+    def get_node(self, node_id: str) -> Optional["Node"]:
+        """노드를 조회합니다 (없으면 None)."""
+        return self.nodes.get(node_id)
+
+    def node_exists(self, node_id: str) -> bool:
+        """노드가 이 버전에 있으면 True."""
+        return node_id in self.nodes
+
+    def get_node_count(self) -> int:
+        """루트를 포함한 노드 개수."""
+        return len(self.nodes)
+
+    def get_child_ids(self, node_id: str) -> List[str]:
+        """직접 자식 ID를 추가된 순서로 반환합니다."""
+        return list(self.children.get(node_id, ()))
+
+    def get_children(self, node_id: str) -> List["Node"]:
+        """직접 자식 노드를 추가된 순서로 반환합니다."""
+        return [self.nodes[child_id] for child_id in self.children.get(node_id, ())]
+
+    def get_path_to_root(self, node_id: str) -> List[str]:
+        """node_id에서 루트까지의 ID 리스트 (없는 노드면 빈 리스트)."""
+        path = []
+        node = self.nodes.get(node_id)
+        while node is not None:
+            path.append(node.id)
+            node = self.nodes.get(node.parent_id) if node.parent_id else None
+        return path
+
+    def with_node(self, node: "Node") -> "TreeVersion":
+        """
+        노드 하나를 추가한 새 버전을 반환합니다 (O(log N + 형제 수)).
+
+        Args:
+            node: 추가할 노드
+
+        Returns:
+            새 TreeVersion
+        """
+        children = self.children
+        if node.parent_id is not None:
+            siblings: Tuple[str, ...] = children.get(node.parent_id, ())
+            children = children.set(node.parent_id, siblings + (node.id,))
+        return TreeVersion(self.root_id, self.nodes.set(node.id, node), children)
+
+    def without_node(self, node: "Node") -> "TreeVersion":
+        """
+        자식이 없는 노드 하나를 제거한 새 버전을 반환합니다 (with_node의 역).
+
+        Args:
+            node: 제거할 노드
+
+        Returns:
+            새 TreeVersion
+        """
+        children = self.children.delete(node.id)
+        siblings = tuple(
+            child_id
+            for child_id in children.get(node.parent_id, ())
+            if child_id != node.id
+        )
+        if siblings:
+            children = children.set(node.parent_id, siblings)
+        else:
+            children = children.delete(node.parent_id)
+        return TreeVersion(self.root_id, self.nodes.delete(node.id), children)
@@ -0,0 +1,466 @@
+"""
+질문/답변 본문 전문 검색 색인 (역색인 + BM25).
+
+이 모듈은 노드의 질문과 답변을 토큰으로 나눠 위치 정보를 담은 역색인
+(토큰 → {문서: 위치 목록})을 만들고, BM25 점수로 순위를 매겨 검색합니다.
+Store 이벤트를 구독해 노드가 추가·제거될 때마다 그 노드만 색인하므로,
+색인을 켠 뒤에는 트리를 다시 훑지 않습니다.
+
+토큰화:
+    - 영문/숫자 등: 소문자로 바꾼 단어 단위
+    - 한글: 연속된 음절을 2음절씩 겹쳐 자른 바이그램 ("파이썬은" →
+      "파이", "이썬", "썬은"). 형태소 분석 없이도 조사가 붙은 어절을
+      어간으로 찾을 수 있습니다. 한 음절 어절은 그대로 토큰이 됩니다.
+
+검색:
+    - 따옴표로 묶은 구절("list comprehension")은 위치가 연속한 문서만 남깁니다.
+    - 점수는 질의 토큰별 BM25 합이며, 희귀한 토큰부터 처리하다가 남은 토큰의
+      최대 기여로는 상위 k위에 들 수 없게 되면 새 후보를 더 만들지 않습니다
+      (MaxScore 가지치기). 흔한 토큰은 이미 모인 후보에 대해서만 조회합니다.
+
+색인은 Store의 선택 기능입니다. 필요한 곳에서 SearchIndex(store)로 켜면
+그때부터 store의 변경을 따라갑니다.
+"""
+
+import heapq
+import json
+import math
+import re
+import threading
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    TextIO,
+    Tuple,
+)
+
+from core.events import NodeAdded, NodeRemoved, Reset, StoreEvent
+
+if TYPE_CHECKING:
+    from core.models import Tree
+    from core.store import Store
+
+FORMAT_NAME = "search-index"
+FORMAT_VERSION = 1
+
+# 한글 음절 연속 구간, 그 외 문자 단어 (밑줄 포함)
+_TOKEN_RE = re.compile(r"[가-힣]+|[^\W가-힣]+")
+# 따옴표로 묶은 구절
+_PHRASE_RE = re.compile(r'"([^"]*)"')
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    본문을 검색 토큰으로 나눕니다.
+
+    Args:
+        text: 본문
+
+    Returns:
+        토큰 리스트 (순서가 곧 위치)
+
+    Example:
+        >>> tokenize("Python 리스트는")
+        ['python', '리스', '스트', '트는']
+    """
+    tokens: List[str] = []
+    for word in _TOKEN_RE.findall(text.lower()):
+        if "가" <= word[0] <= "힣" and len(word) > 1:
+            tokens.extend(word[i : i + 2] for i in range(len(word) - 1))
+        else:
+            tokens.append(word)
+    return tokens
+
+
+class SearchHit(NamedTuple):
+    """
+    검색 결과 한 건.
+
+    Attributes:
+        node_id: 노드 ID
+        score: BM25 점수 (클수록 관련도 높음)
+    """
+
+    node_id: str
+    score: float
+
+
+class SearchIndex:
+    """
+    노드 질문/답변의 위치 역색인과 BM25 검색.
+
+    문서는 노드 하나(질문 + 답변)이며, 내부적으로 정수 문서 번호로 관리합니다.
+    색인 갱신은 Store 쓰기 잠금 안(이벤트 전달)에서, 검색은 색인 자체 잠금으로
+    보호되므로 다른 스레드에서 검색해도 안전합니다.
+
+    Example:
+        >>> index = SearchIndex(store)
+        >>> store.add_node("파이썬 리스트는?", "순서가 있는 컬렉션입니다.")
+        >>> index.search("리스트")
+        [SearchHit(node_id='...', score=0.28...)]
+    """
+
+    def __init__(
+        self,
+        store: "Store",
+        fp: Optional[Iterable[str]] = None,
+        k1: float = 1.2,
+        b: float = 0.75,
+    ):
+        """
+        색인을 만들고 store의 노드 이벤트를 구독합니다.
+
+        Args:
+            store: 대상 Store
+            fp: dump()로 저장한 색인 (지정하면 트리를 다시 토큰화하지 않고
+                읽은 뒤, 저장 이후 달라진 노드만 반영합니다)
+            k1: BM25 단어 빈도 포화 계수
+            b: BM25 문서 길이 정규화 계수
+        """
+        self.store = store
+        self.k1 = k1
+        self.b = b
+        self._lock = threading.Lock()
+        self._postings: Dict[str, Dict[int, List[int]]] = {}  # 토큰 → {문서: 위치}
+        self._doc_ids: List[Optional[str]] = []  # 문서 번호 → 노드 ID (제거되면 None)
+        self._doc_nums: Dict[str, int] = {}  # 노드 ID → 문서 번호
+        self._doc_lens: List[int] = []  # 문서 번호 → 토큰 수
+        self._doc_terms: List[Tuple[str, ...]] = []  # 문서 번호 → 고유 토큰 (제거용)
+        self._total_len = 0
+        self._tree: Optional["Tree"] = None  # 색인한 트리 (교체 감지용)
+        if fp is None:
+            self.rebuild()
+        else:
+            self._load(fp)
+        store.events.subscribe(self._on_event, NodeAdded, NodeRemoved, Reset)
+
+    # ==================== 색인 갱신 ====================
+
+    def rebuild(self):
+        """현재 트리 전체를 다시 색인합니다 (O(전체 본문 길이))."""
+        with self._lock:
+            self._clear()
+            self._tree = self.store.tree
+            for node in self._tree.nodes.values():
+                self._add(node.id)
+
+    def _clear(self):
+        self._postings.clear()
+        self._doc_ids.clear()
+        self._doc_nums.clear()
+        self._doc_lens.clear()
+        self._doc_terms.clear()
+        self._total_len = 0
+
+    def _sync(self):
+        # 같은 트리에 노드만 늘어난 경우(병합, 버전 복원)는 빠진 노드만 색인
+        tree = self.store.tree
+        if tree is not self._tree:
+            self._clear()
+            self._tree = tree
+        doc_nums = self._doc_nums
+        for node_id in tree.nodes:
+            if node_id not in doc_nums:
+                self._add(node_id)
+        for node_id in [n for n in doc_nums if not tree.node_exists(n)]:
+            self._remove(node_id)
+
+    def _add(self, node_id: str):
+        node = self._tree.nodes[node_id]
+        question = tokenize(node.user_question)
+        answer = tokenize(node.ai_answer)
+        doc = len(self._doc_ids)
+        positions: Dict[str, List[int]] = {}
+        # 질문과 답변 사이에 위치를 한 칸 띄워 구절이 경계를 넘지 않게 함
+        for offset, tokens in ((0, question), (len(question) + 1, answer)):
+            for pos, token in enumerate(tokens, offset):
+                positions.setdefault(token, []).append(pos)
+
+        postings = self._postings
+        for token, token_positions in positions.items():
+            postings.setdefault(token, {})[doc] = token_positions
+        length = len(question) + len(answer)
+        self._doc_ids.append(node_id)
+        self._doc_nums[node_id] = doc
+        self._doc_lens.append(length)
+        self._doc_terms.append(tuple(positions))
+        self._total_len += length
+
+    def _remove(self, node_id: str):
+        doc = self._doc_nums.pop(node_id, None)
+        if doc is None:
+            return
+        postings = self._postings
+        for token in self._doc_terms[doc]:
+            docs = postings[token]
+            del docs[doc]
+            if not docs:
+                del postings[token]
+        self._total_len -= self._doc_lens[doc]
+        self._doc_ids[doc] = None
+        self._doc_lens[doc] = 0
+        self._doc_terms[doc] = ()
+
+    def _on_event(self, event: StoreEvent):
+        with self._lock:
+            if isinstance(event, NodeAdded):
+                if self.store.tree is self._tree:
+                    self._add(event.node_id)
+                else:
+                    self._sync()
+            elif isinstance(event, NodeRemoved):
+                self._remove(event.node_id)
+            elif isinstance(event, Reset):
+                self._sync()
+
+    # ==================== 검색 ====================
+
+    def search(
+        self,
+        query: str,
+        limit: int = 10,
+        subtree: Optional[str] = None,
+        min_depth: Optional[int] = None,
+        max_depth: Optional[int] = None,
+        has_checkpoint: Optional[bool] = None,
+    ) -> List[SearchHit]:
+        """
+        질의와 관련도가 높은 노드를 BM25 점수 순으로 찾습니다.
+
+        Args:
+            query: 검색어 (따옴표로 묶은 부분은 구절 일치가 필요)
+            limit: 최대 결과 수
+            subtree: 지정하면 이 노드와 그 자손만
+            min_depth: 최소 깊이 (루트 = 0)
+            max_depth: 최대 깊이
+            has_checkpoint: True면 체크포인트가 붙은 노드만, False면 없는 노드만
+
+        Returns:
+            SearchHit 리스트 (점수 내림차순)
+
+        Raises:
+            ValueError: limit이 1보다 작거나 subtree 노드가 없는 경우
+
+        Example:
+            >>> index.search('"list comprehension" 파이썬', subtree=node_id)
+        """
+        if limit < 1:
+            raise ValueError(f"limit은 1 이상이어야 합니다: {limit}")
+        tree = self.store.tree
+        subtree_depth = None
+        if subtree is not None:
+            if not tree.node_exists(subtree):
+                raise ValueError(f"Node '{subtree}' not found")
+            subtree_depth = tree.get_depth(subtree)
+
+        phrases = [tokenize(p) for p in _PHRASE_RE.findall(query)]
+        phrases = [p for p in phrases if p]
+        terms = tokenize(_PHRASE_RE.sub(" ", query))
+        for phrase in phrases:
+            terms.extend(phrase)
+        if not terms:
+            return []
+
+        checkpoint_index = self.store.checkpoint_index
+
+        def accept(node_id: str) -> bool:
+            if node_id == tree.root_id:
+                return False
+            if min_depth is not None or max_depth is not None:
+                depth = tree.get_depth(node_id)
+                if min_depth is not None and depth < min_depth:
+                    return False
+                if max_depth is not None and depth > max_depth:
+                    return False
+            if has_checkpoint is not None:
+                if (checkpoint_index.count(node_id) > 0) != has_checkpoint:
+                    return False
+            if subtree is not None:
+                return _is_descendant(tree, node_id, subtree, subtree_depth)
+            return True
+
+        with self._lock:
+            return self._search(terms, phrases, limit, accept)
+
+    def _search(self, terms, phrases, limit, accept) -> List[SearchHit]:
+        postings = self._postings
+        doc_count = len(self._doc_nums)
+        if not doc_count:
+            return []
+        k1, b = self.k1, self.b
+        avg_len = self._total_len / doc_count or 1.0
+        doc_lens = self._doc_lens
+        doc_ids = self._doc_ids
+
+        # (토큰, 질의 내 빈도, idf) - 희귀한(idf가 큰) 토큰부터
+        weighted = []
+        for term in set(terms):
+            docs = postings.get(term)
+            if not docs:
+                continue
+            df = len(docs)
+            idf = math.log(1 + (doc_count - df + 0.5) / (df + 0.5))
+            weighted.append((term, terms.count(term), idf))
+        if not weighted:
+            return []
+        weighted.sort(key=lambda item: -item[2] * item[1])
+        # 남은 토큰들이 문서 하나에 더할 수 있는 점수 상한 (tf 포화로 idf×(k1+1))
+        bounds = [idf * qtf * (k1 + 1) for _, qtf, idf in weighted]
+        remaining = [sum(bounds[i:]) for i in range(len(bounds))]
+
+        scores: Dict[int, float] = {}
+        rejected = set()
+        for i, (term, qtf, idf) in enumerate(weighted):
+            docs = postings[term]
+            # 새 후보가 상위 limit위에 들 수 없으면 기존 후보만 갱신
+            grow = len(scores) < limit or (
+                remaining[i] > heapq.nlargest(limit, scores.values())[-1]
+            )
+            if grow:
+                candidates = docs.items()
+            else:
+                candidates = (
+                    (doc, docs[doc]) for doc in scores.keys() & docs.keys()
+                )
+            for doc, positions in candidates:
+                if doc not in scores:
+                    # 필터와 구절 조건은 후보가 될 때 한 번만 확인
+                    if doc in rejected or not (
+                        accept(doc_ids[doc])
+                        and all(self._has_phrase(doc, p) for p in phrases)
+                    ):
+                        rejected.add(doc)
+                        continue
+                    scores[doc] = 0.0
+                tf = len(positions)
+                norm = k1 * (1 - b + b * doc_lens[doc] / avg_len)
+                scores[doc] += qtf * idf * tf * (k1 + 1) / (tf + norm)
+
+        best = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+        return [SearchHit(doc_ids[doc], score) for doc, score in best]
+
+    def _has_phrase(self, doc: int, phrase: List[str]) -> bool:
+        postings = self._postings
+        lists = []
+        for token in phrase:
+            positions = postings.get(token, {}).get(doc)
+            if positions is None:
+                return False
+            lists.append(positions)
+        # 첫 토큰 위치에서 시작해 i번째 토큰이 +i 위치에 있는지 확인
+        following = [set(positions) for positions in lists[1:]]
+        return any(
+            all(start + i in positions for i, positions in enumerate(following, 1))
+            for start in lists[0]
+        )
+
+    def __len__(self) -> int:
+        """색인된 노드 수."""
+        return len(self._doc_nums)
+
+    @property
+    def term_count(self) -> int:
+        """서로 다른 토큰 수."""
+        return len(self._postings)
+
+    # ==================== 저장/불러오기 ====================
+
+    def dump(self, fp: TextIO) -> int:
+        """
+        색인을 JSONL로 저장합니다 (트리 내보내기 파일 옆에 두는 용도).
+
+        제거된 문서 번호는 저장하면서 채워지므로 저장본은 항상 빈틈이 없습니다.
+
+        Args:
+            fp: 텍스트 모드로 열린 출력 스트림
+
+        Returns:
+            저장된 문서 수
+
+        Example:
+            >>> with open("tree.search.jsonl", "w", encoding="utf-8") as f:
+            ...     index.dump(f)
+        """
+        with self._lock:
+            renumber: Dict[int, int] = {}
+            docs = []
+            for doc, node_id in enumerate(self._doc_ids):
+                if node_id is not None:
+                    renumber[doc] = len(docs)
+                    docs.append((node_id, self._doc_lens[doc]))
+
+            header = {
+                "type": "header",
+                "format": FORMAT_NAME,
+                "version": FORMAT_VERSION,
+                "doc_count": len(docs),
+            }
+            fp.write(json.dumps(header) + "\n")
+            for node_id, length in docs:
+                record = {"type": "doc", "id": node_id, "length": length}
+                fp.write(json.dumps(record, ensure_ascii=False) + "\n")
+            for term, term_docs in self._postings.items():
+                record = {
+                    "type": "term",
+                    "term": term,
+                    "postings": [
+                        [renumber[doc], positions]
+                        for doc, positions in term_docs.items()
+                    ],
+                }
+                fp.write(json.dumps(record, ensure_ascii=False) + "\n")
+            return len(docs)
+
+    def _load(self, fp: Iterable[str]):
+        lines = iter(fp)
+        try:
+            header = json.loads(next(lines))
+        except StopIteration:
+            raise ValueError("Empty search index")
+        if header.get("type") != "header" or header.get("format") != FORMAT_NAME:
+            raise ValueError("Not a search index")
+        if header.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported index version: {header.get('version')}")
+
+        terms: Dict[int, List[str]] = {}
+        with self._lock:
+            self._clear()
+            self._tree = self.store.tree
+            for line in lines:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                kind = record.get("type")
+                if kind == "doc":
+                    self._doc_nums[record["id"]] = len(self._doc_ids)
+                    self._doc_ids.append(record["id"])
+                    self._doc_lens.append(record["length"])
+                    self._total_len += record["length"]
+                elif kind == "term":
+                    term = record["term"]
+                    docs = self._postings[term] = {}
+                    for doc, positions in record["postings"]:
+                        docs[doc] = positions
+                        terms.setdefault(doc, []).append(term)
+                else:
+                    raise ValueError(f"Unknown record type: {kind}")
+            self._doc_terms.extend(
+                tuple(terms.get(doc, ())) for doc in range(len(self._doc_ids))
+            )
+            # 저장 이후 바뀐 트리와 맞춤 (새 노드 색인, 없어진 노드 제거)
+            self._sync()
+
+
+def _is_descendant(tree: "Tree", node_id: str, ancestor_id: str, depth: int) -> bool:
+    """node_id가 ancestor_id(깊이 depth) 자신이거나 그 자손인지 확인합니다."""
+    steps = tree.get_depth(node_id) - depth
+    if steps < 0:
+        return False
+    nodes = tree.nodes
+    for _ in range(steps):
+        node_id = nodes[node_id].parent_id
+    return node_id == ancestor_id
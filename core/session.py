@@ -0,0 +1,189 @@
+"""
+하나의 공유 트리 위에서 동작하는 다중 세션.
+
+이 모듈은 여러 사용자(또는 탭)가 같은 대화 트리를 동시에 탐색할 수 있도록
+Session과 SessionManager를 제공합니다. 트리는 추가만 가능한(append-only)
+공유 객체이고, 각 Session은 자신의 활성 경로, 이동 이력, 체크포인트
+이름공간만 가집니다. 따라서 세션당 메모리는 트리 크기가 아니라 경로 길이에
+비례합니다.
+"""
+
+import uuid
+from typing import Dict, List, Optional, Union
+
+from core.compression import CompressedTextStore
+from core.content_store import ContentStore
+from core.events import Reset
+from core.models import Tree
+from core.store import PathDelta, Store
+from core.text_store import TextStore
+
+# 세션별 이동 이력 최대 길이 (CLI navigation history와 동일)
+HISTORY_SIZE = 20
+
+
+class Session(Store):
+    """
+    공유 트리를 참조하는 경량 Store.
+
+    Store의 모든 API(add_node, switch_to_node, 체크포인트 등)를 그대로
+    제공하며, 노드 추가는 공유 트리에 반영되어 다른 세션에서도 보입니다.
+    활성 경로와 체크포인트는 세션마다 독립적입니다.
+
+    Example:
+        >>> manager = SessionManager()
+        >>> alice = manager.open_session("alice")
+        >>> bob = manager.open_session("bob")
+        >>> node = alice.add_node("Q?", "A.")
+        >>> bob.switch_to_node(node.id)  # 공유 트리이므로 전환 가능
+    """
+
+    def __init__(
+        self,
+        tree: Tree,
+        session_id: Optional[str] = None,
+        history_size: int = HISTORY_SIZE,
+    ):
+        """
+        세션을 초기화합니다.
+
+        Args:
+            tree: 공유 트리
+            session_id: 세션 ID (None이면 자동 생성)
+            history_size: 이동 이력 최대 길이
+        """
+        super().__init__(tree=tree)
+        self.session_id = session_id or str(uuid.uuid4())
+        self.history_size = history_size
+        self.history: List[str] = []
+
+    def reset(self, expected_version: Optional[int] = None):
+        """
+        세션 상태(활성 경로, 이동 이력, 체크포인트)만 초기화합니다.
+
+        공유 트리는 다른 세션도 사용하므로 변경하지 않습니다.
+
+        Args:
+            expected_version: 기대하는 현재 버전 (None이면 검사하지 않음)
+        """
+        with self._lock.write():
+            self._check_version(expected_version)
+            self.active_path_ids = [self.tree.root_id]
+            self._reset_path_refs()
+            self.checkpoints.clear()
+            self.history.clear()
+            self.journal.clear()
+            self._commit(replaced=True)
+            self.events.publish(Reset(self.version))
+
+    def _switch_to_node(self, target_node_id: str) -> Optional[PathDelta]:
+        """활성 경로를 전환하고 전환 전 위치를 이동 이력에 남깁니다."""
+        previous_id = self.active_path_ids[-1]
+        delta = super()._switch_to_node(target_node_id)
+        if delta is not None and previous_id != target_node_id:
+            self.history.append(previous_id)
+            if len(self.history) > self.history_size:
+                del self.history[0]
+        return delta
+
+    def go_back(self, expected_version: Optional[int] = None) -> Optional[PathDelta]:
+        """
+        이동 이력의 마지막 위치로 되돌아갑니다.
+
+        Args:
+            expected_version: 기대하는 현재 버전 (None이면 검사하지 않음)
+
+        Returns:
+            전환 성공 시 PathDelta, 이력이 없으면 None
+
+        Raises:
+            VersionConflictError: 현재 버전이 기대 버전과 다른 경우
+        """
+        with self._lock.write():
+            self._check_version(expected_version)
+            if not self.history:
+                return None
+
+            previous_id = self.active_path_ids[-1]
+            target_id = self.history.pop()
+            delta = Store._switch_to_node(self, target_id)
+            self._record_switch(previous_id, delta)
+            return delta
+
+    def _unlink_node(self, node_id: str) -> bool:
+        """공유 트리의 노드는 다른 세션도 볼 수 있으므로 제거하지 않습니다."""
+        return False
+
+
+class SessionManager:
+    """
+    공유 트리와 그 위의 세션들을 관리하는 클래스.
+
+    Example:
+        >>> manager = SessionManager()
+        >>> session = manager.open_session()
+        >>> manager.get_session(session.session_id) is session
+        True
+    """
+
+    def __init__(
+        self,
+        tree: Optional[Tree] = None,
+        content_store: Optional[
+            Union[ContentStore, TextStore, CompressedTextStore]
+        ] = None,
+    ):
+        """
+        세션 관리자를 초기화합니다.
+
+        Args:
+            tree: 공유할 트리 (None이면 새로 생성)
+            content_store: 새 트리를 만들 때 사용할 본문 저장소
+        """
+        self.tree = tree or Tree(root_id="root", content_store=content_store)
+        self.sessions: Dict[str, Session] = {}
+
+    def open_session(self, session_id: Optional[str] = None) -> Session:
+        """
+        새 세션을 엽니다 (이미 열린 ID면 기존 세션 반환).
+
+        Args:
+            session_id: 세션 ID (None이면 자동 생성)
+
+        Returns:
+            Session 객체
+        """
+        if session_id is not None and session_id in self.sessions:
+            return self.sessions[session_id]
+
+        session = Session(self.tree, session_id=session_id)
+        self.sessions[session.session_id] = session
+        return session
+
+    def get_session(self, session_id: str) -> Optional[Session]:
+        """
+        세션 ID로 세션을 조회합니다.
+
+        Args:
+            session_id: 세션 ID
+
+        Returns:
+            Session 객체, 없으면 None
+        """
+        return self.sessions.get(session_id)
+
+    def close_session(self, session_id: str) -> bool:
+        """
+        세션을 닫습니다 (세션이 추가한 노드는 트리에 남음).
+
+        Args:
+            session_id: 닫을 세션 ID
+
+        Returns:
+            닫았으면 True, 없으면 False
+        """
+        return self.sessions.pop(session_id, None) is not None
+
+    def __len__(self) -> int:
+        """열린 세션 수."""
+        return len(self.sessions)
@@ -0,0 +1,425 @@
+"""
+읽기 전용 바이너리 트리 스냅샷.
+
+이 모듈은 트리를 고정 폭 레코드 테이블, 문자열 힙, 정렬된 ID 인덱스로 구성된
+바이너리 파일로 저장하고, mmap으로 열어 노드를 필요할 때만 디코딩하는
+Tree 호환 읽기 전용 뷰를 제공합니다.
+
+파일 레이아웃:
+    [헤더][문자열 힙][노드 레코드 테이블][정렬된 ID 인덱스]
+
+- 헤더: 매직, 버전, 노드 수, 각 섹션 오프셋
+- 레코드: 부모 인덱스, 깊이, 첫 자식, 다음 형제, 힙 오프셋, 문자열 길이 5개
+- 힙: 노드별 (id, 질문, 답변, 메타데이터 JSON, 타임스탬프) UTF-8 바이트
+- ID 인덱스: ID 순으로 정렬된 레코드 인덱스 (이진 탐색용)
+"""
+
+import json
+import mmap
+import struct
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+from core.models import Node, Tree
+
+MAGIC = b"CTSNAP01"
+VERSION = 1
+
+_HEADER = struct.Struct("<8sHHIQQQ")
+_RECORD = struct.Struct("<iIiiQIIIII")
+_INDEX_ENTRY = struct.Struct("<I")
+
+_NO_NODE = -1
+
+
+def write_snapshot(tree: Tree, path: str) -> int:
+    """
+    트리를 바이너리 스냅샷 파일로 저장합니다.
+
+    노드는 루트부터 너비 우선(부모가 자식보다 먼저) 순서로 기록되며,
+    루트에서 도달할 수 없는 노드는 제외됩니다.
+
+    Args:
+        tree: 저장할 Tree 객체
+        path: 출력 파일 경로
+
+    Returns:
+        기록된 노드 개수
+
+    Example:
+        >>> write_snapshot(store.tree, "tree.snap")
+        42
+    """
+    # 자식 목록을 한 번의 순회로 구성 (원래 삽입 순서 유지)
+    children: Dict[str, List[str]] = {}
+    for node in tree.nodes.values():
+        if node.parent_id is not None:
+            children.setdefault(node.parent_id, []).append(node.id)
+
+    order = [tree.root_id]
+    for node_id in order:
+        order.extend(children.get(node_id, ()))
+
+    index_of = {node_id: idx for idx, node_id in enumerate(order)}
+    depths = [0] * len(order)
+    records = bytearray(_RECORD.size * len(order))
+
+    with open(path, "wb") as f:
+        f.write(b"\0" * _HEADER.size)
+        heap_offset = f.tell()
+        heap_pos = 0
+
+        for idx, node_id in enumerate(order):
+            node = tree.nodes[node_id]
+            parts = [
+                node.id.encode("utf-8"),
+                node.user_question.encode("utf-8"),
+                node.ai_answer.encode("utf-8"),
+                (
+                    json.dumps(node.metadata, ensure_ascii=False, default=str).encode(
+                        "utf-8"
+                    )
+                    if node.metadata
+                    else b""
+                ),
+                node.timestamp.isoformat().encode("utf-8"),
+            ]
+            for part in parts:
+                f.write(part)
+
+            parent_idx = index_of.get(node.parent_id, _NO_NODE)
+            if parent_idx != _NO_NODE:
+                depths[idx] = depths[parent_idx] + 1
+
+            # 너비 우선 순서에서 형제는 연속으로 배치되므로 바로 다음 레코드만 확인
+            next_sibling = _NO_NODE
+            if (
+                node.parent_id is not None
+                and idx + 1 < len(order)
+                and tree.nodes[order[idx + 1]].parent_id == node.parent_id
+            ):
+                next_sibling = idx + 1
+
+            own_children = children.get(node_id)
+            first_child = index_of[own_children[0]] if own_children else _NO_NODE
+
+            _RECORD.pack_into(
+                records,
+                idx * _RECORD.size,
+                parent_idx,
+                depths[idx],
+                first_child,
+                next_sibling,
+                heap_pos,
+                *(len(part) for part in parts),
+            )
+            heap_pos += sum(len(part) for part in parts)
+
+        records_offset = f.tell()
+        f.write(records)
+
+        index_offset = f.tell()
+        for idx in sorted(range(len(order)), key=order.__getitem__):
+            f.write(_INDEX_ENTRY.pack(idx))
+
+        f.seek(0)
+        f.write(
+            _HEADER.pack(
+                MAGIC,
+                VERSION,
+                0,
+                len(order),
+                heap_offset,
+                records_offset,
+                index_offset,
+            )
+        )
+
+    return len(order)
+
+
+def open_snapshot(path: str) -> "SnapshotTree":
+    """
+    스냅샷 파일을 mmap으로 열어 읽기 전용 트리 뷰를 반환합니다.
+
+    헤더만 읽으므로 파일 크기와 무관하게 O(1)에 열립니다.
+
+    Args:
+        path: 스냅샷 파일 경로
+
+    Returns:
+        SnapshotTree 객체
+
+    Raises:
+        ValueError: 스냅샷 형식이 아니거나 버전이 다른 경우
+    """
+    return SnapshotTree(path)
+
+
+class SnapshotTree:
+    """
+    mmap 기반 읽기 전용 Tree 호환 뷰.
+
+    Tree의 조회 API(get_node, get_children, get_path_to_root, node_exists,
+    get_node_count, get_leaf_ids, is_branch_point, nodes)를 제공하며, 노드는 조회 시점에 디코딩됩니다.
+    여러 프로세스가 같은 파일을 열면 페이지 캐시를 공유합니다.
+    """
+
+    def __init__(self, path: str):
+        """
+        스냅샷 파일을 엽니다.
+
+        Args:
+            path: 스냅샷 파일 경로
+
+        Raises:
+            ValueError: 스냅샷 형식이 아니거나 버전이 다른 경우
+        """
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._mm) < _HEADER.size:
+            self._mm.close()
+            raise ValueError(f"'{path}' is not a tree snapshot")
+
+        (
+            magic,
+            version,
+            _reserved,
+            self._count,
+            self._heap_offset,
+            self._records_offset,
+            self._index_offset,
+        ) = _HEADER.unpack_from(self._mm, 0)
+
+        if magic != MAGIC:
+            self._mm.close()
+            raise ValueError(f"'{path}' is not a tree snapshot")
+        if version != VERSION:
+            self._mm.close()
+            raise ValueError(f"Unsupported snapshot version: {version}")
+
+        self.root_id = self._read_id(0)
+        self.nodes = _SnapshotNodes(self)
+
+    # ==================== 저수준 디코딩 ====================
+
+    def _record(self, idx: int) -> tuple:
+        """레코드 인덱스로 고정 폭 레코드를 읽습니다."""
+        return _RECORD.unpack_from(self._mm, self._records_offset + idx * _RECORD.size)
+
+    def _read_id(self, idx: int) -> str:
+        """레코드 인덱스의 노드 ID만 디코딩합니다."""
+        record = self._record(idx)
+        start = self._heap_offset + record[4]
+        return self._mm[start : start + record[5]].decode("utf-8")
+
+    def _decode_node(self, idx: int) -> Node:
+        """레코드 인덱스의 노드 전체를 디코딩합니다."""
+        parent_idx, _depth, _first, _next, offset, *lengths = self._record(idx)
+
+        fields = []
+        pos = self._heap_offset + offset
+        for length in lengths:
+            fields.append(self._mm[pos : pos + length].decode("utf-8"))
+            pos += length
+
+        node_id, question, answer, metadata, timestamp = fields
+        return Node(
+            id=node_id,
+            parent_id=self._read_id(parent_idx) if parent_idx != _NO_NODE else None,
+            user_question=question,
+            ai_answer=answer,
+            metadata=json.loads(metadata) if metadata else {},
+            timestamp=datetime.fromisoformat(timestamp),
+        )
+
+    def _find_index(self, node_id: str) -> Optional[int]:
+        """정렬된 ID 인덱스에서 이진 탐색으로 레코드 인덱스를 찾습니다."""
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            (idx,) = _INDEX_ENTRY.unpack_from(
+                self._mm, self._index_offset + mid * _INDEX_ENTRY.size
+            )
+            mid_id = self._read_id(idx)
+            if mid_id == node_id:
+                return idx
+            if mid_id < node_id:
+                lo = mid + 1
+            else:
+                hi = mid
+        return None
+
+    # ==================== Tree 호환 API ====================
+
+    def get_node(self, node_id: str) -> Optional[Node]:
+        """
+        ID로 노드를 조회합니다.
+
+        Args:
+            node_id: 조회할 노드의 ID
+
+        Returns:
+            노드를 찾으면 해당 노드, 없으면 None
+        """
+        idx = self._find_index(node_id)
+        if idx is None:
+            return None
+        return self._decode_node(idx)
+
+    def get_children(self, node_id: str) -> List[Node]:
+        """
+        노드의 모든 직접 자식 노드를 가져옵니다.
+
+        Args:
+            node_id: 부모 노드의 ID
+
+        Returns:
+            자식 노드 리스트 (없으면 빈 리스트)
+        """
+        idx = self._find_index(node_id)
+        if idx is None:
+            return []
+
+        children = []
+        child_idx = self._record(idx)[2]
+        while child_idx != _NO_NODE:
+            children.append(self._decode_node(child_idx))
+            child_idx = self._record(child_idx)[3]
+        return children
+
+    def get_path_to_root(self, node_id: str) -> List[str]:
+        """
+        노드에서 루트까지의 경로를 가져옵니다.
+
+        Args:
+            node_id: 시작 노드의 ID
+
+        Returns:
+            node_id에서 루트까지의 노드 ID 리스트 (포함)
+            node_id가 존재하지 않으면 빈 리스트
+        """
+        idx = self._find_index(node_id)
+        path = []
+        while idx is not None and idx != _NO_NODE:
+            path.append(self._read_id(idx))
+            idx = self._record(idx)[0]
+        return path
+
+    def get_depth(self, node_id: str) -> int:
+        """
+        노드의 깊이를 반환합니다 (레코드에 저장된 값, O(log N)).
+
+        Args:
+            node_id: 노드 ID
+
+        Returns:
+            깊이 (루트는 0), 노드가 없으면 -1
+        """
+        idx = self._find_index(node_id)
+        if idx is None:
+            return -1
+        return self._record(idx)[1]
+
+    def node_exists(self, node_id: str) -> bool:
+        """
+        노드가 스냅샷에 존재하는지 확인합니다.
+
+        Args:
+            node_id: 확인할 노드의 ID
+
+        Returns:
+            노드가 존재하면 True, 없으면 False
+        """
+        return self._find_index(node_id) is not None
+
+    def get_node_count(self) -> int:
+        """
+        스냅샷의 전체 노드 개수를 가져옵니다.
+
+        Returns:
+            루트를 포함한 노드 개수
+        """
+        return self._count
+
+    def is_branch_point(self, node_id: str) -> bool:
+        """
+        노드의 자식이 2개 이상인지 확인합니다 (첫 자식의 다음 형제 확인).
+
+        Args:
+            node_id: 노드 ID
+
+        Returns:
+            자식이 2개 이상이면 True
+        """
+        idx = self._find_index(node_id)
+        if idx is None:
+            return False
+        first_child = self._record(idx)[2]
+        return first_child != _NO_NODE and self._record(first_child)[3] != _NO_NODE
+
+    def get_leaf_ids(self) -> List[str]:
+        """
+        모든 잎 노드 ID를 기록 순서로 반환합니다.
+
+        레코드의 첫 자식 필드만 확인하고 잎의 ID만 디코딩합니다.
+
+        Returns:
+            잎 노드 ID 리스트
+        """
+        return [
+            self._read_id(idx)
+            for idx in range(self._count)
+            if self._record(idx)[2] == _NO_NODE
+        ]
+
+    def add_node(self, node: Node) -> bool:
+        """스냅샷은 읽기 전용이므로 항상 TypeError를 발생시킵니다."""
+        raise TypeError("SnapshotTree is read-only")
+
+    # ==================== 리소스 관리 ====================
+
+    def close(self):
+        """mmap을 닫습니다."""
+        if not self._mm.closed:
+            self._mm.close()
+
+    def __enter__(self) -> "SnapshotTree":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class _SnapshotNodes(Mapping):
+    """SnapshotTree.nodes - Tree.nodes와 같은 형태의 지연 디코딩 매핑."""
+
+    def __init__(self, snapshot: SnapshotTree):
+        self._snapshot = snapshot
+
+    def __getitem__(self, node_id: str) -> Node:
+        node = self._snapshot.get_node(node_id)
+        if node is None:
+            raise KeyError(node_id)
+        return node
+
+    def __contains__(self, node_id: object) -> bool:
+        return isinstance(node_id, str) and self._snapshot.node_exists(node_id)
+
+    def __iter__(self) -> Iterator[str]:
+        for idx in range(self._snapshot._count):
+            yield self._snapshot._read_id(idx)
+
+    def __len__(self) -> int:
+        return self._snapshot._count
+
+    def values(self):
+        """레코드 순서(부모 우선)로 노드를 디코딩하며 순회합니다."""
+        return (self._snapshot._decode_node(i) for i in range(len(self)))
+
+    def items(self):
+        """(ID, 노드) 쌍을 레코드 순서로 순회합니다."""
+        return ((node.id, node) for node in self.values())
@@ -0,0 +1,354 @@
+"""
+점진적으로 유지되는 트리/체크포인트 통계.
+
+이 모듈은 노드 추가·제거와 체크포인트 변경이 일어날 때마다 O(1)로 갱신되는
+통계 집계기를 제공합니다. 통계 조회는 트리를 다시 훑지 않으므로 노드 수와
+무관하게 즉시 끝납니다.
+
+- TreeStats: Tree가 직접 갱신 (노드 수, 잎/분기점 수, 깊이, 분기 계수 분포)
+- CheckpointStats: Store 이벤트 구독으로 갱신 (체크포인트별 깊이, 분기 체크포인트)
+"""
+
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+from core.events import (
+    CheckpointDeleted,
+    CheckpointRenamed,
+    CheckpointSaved,
+    NodeAdded,
+    NodeRemoved,
+    Reset,
+    StoreEvent,
+)
+
+if TYPE_CHECKING:
+    from core.store import Store
+
+
+class Histogram:
+    """
+    정수 값의 개수 분포 (추가/제거 O(1), 최소/최대는 분할 상환 O(1)).
+
+    Example:
+        >>> hist = Histogram()
+        >>> hist.add(3)
+        >>> hist.add(5)
+        >>> hist.remove(5)
+        >>> hist.max, hist.mean
+        (3, 3.0)
+    """
+
+    __slots__ = ("counts", "count", "total", "_min", "_max")
+
+    def __init__(self):
+        """빈 분포를 초기화합니다."""
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0
+        self._min: Optional[int] = None
+        self._max: Optional[int] = None
+
+    def add(self, value: int):
+        """값 하나를 추가합니다."""
+        self.counts[value] = self.counts.get(value, 0) + 1
+        self.count += 1
+        self.total += value
+        if self._min is None or value < self._min:
+            self._min = value
+        if self._max is None or value > self._max:
+            self._max = value
+
+    def remove(self, value: int):
+        """
+        값 하나를 제거합니다.
+
+        Raises:
+            ValueError: 분포에 없는 값인 경우
+        """
+        self._drop(value, 1)
+
+    def _drop(self, value: int, n: int):
+        """값 n개를 제거합니다 (remove 참고)."""
+        remaining = self.counts.get(value, 0) - n
+        if remaining < 0:
+            raise ValueError(f"Value {value} is not in histogram")
+        self.count -= n
+        self.total -= value * n
+        if remaining:
+            self.counts[value] = remaining
+            return
+
+        del self.counts[value]
+        if not self.counts:
+            self._min = self._max = None
+            return
+        # 경계값이 사라졌으면 남은 값이 나올 때까지 이동 (빈 값 수만큼 걸림).
+        # 값을 1씩 옮기는 move()는 새 값을 먼저 넣으므로 한 칸만 이동함
+        if value == self._max:
+            while self._max not in self.counts:
+                self._max -= 1
+        if value == self._min:
+            while self._min not in self.counts:
+                self._min += 1
+
+    def move(self, old: int, new: int):
+        """
+        값 하나를 old에서 new로 바꿉니다.
+
+        new를 먼저 넣어 두므로, old가 유일한 경계값이어도 경계는 new까지만
+        이동합니다 (자식 수를 1씩 바꾸는 TreeStats 갱신이 O(1)).
+        """
+        self.add(new)
+        self.remove(old)
+
+    def update(self, delta: Dict[int, int]):
+        """
+        값별 개수 변화를 한 번에 반영합니다 (양수는 추가, 음수는 제거).
+
+        move()처럼 추가를 먼저 반영하므로 경계값 이동은 한 번씩만 일어납니다.
+
+        Raises:
+            ValueError: 제거할 값이 분포에 모자란 경우
+        """
+        counts = self.counts
+        for value, n in delta.items():
+            if n > 0:
+                counts[value] = counts.get(value, 0) + n
+                self.count += n
+                self.total += value * n
+                if self._min is None or value < self._min:
+                    self._min = value
+                if self._max is None or value > self._max:
+                    self._max = value
+        for value, n in delta.items():
+            if n < 0:
+                self._drop(value, -n)
+
+    def count_of(self, value: int) -> int:
+        """value의 개수."""
+        return self.counts.get(value, 0)
+
+    @property
+    def min(self) -> int:
+        """최솟값 (비어 있으면 0)."""
+        return self._min if self._min is not None else 0
+
+    @property
+    def max(self) -> int:
+        """최댓값 (비어 있으면 0)."""
+        return self._max if self._max is not None else 0
+
+    @property
+    def mean(self) -> float:
+        """평균 (비어 있으면 0)."""
+        return self.total / self.count if self.count else 0
+
+    def as_dict(self) -> Dict[int, int]:
+        """{값: 개수} 딕셔너리 (값 순서)."""
+        return dict(sorted(self.counts.items()))
+
+    def copy(self) -> "Histogram":
+        """독립적인 복사본 (서로 다른 값 개수에 비례)."""
+        other = Histogram()
+        other.counts = dict(self.counts)
+        other.count, other.total = self.count, self.total
+        other._min, other._max = self._min, self._max
+        return other
+
+
+class TreeStats:
+    """
+    트리 구조 통계.
+
+    Tree가 노드를 붙이거나 뗄 때마다 호출하며, 노드 깊이와 자식 수 분포만
+    유지합니다. 잎 수와 분기점 수는 자식 수 분포에서 바로 얻습니다.
+    """
+
+    __slots__ = ("depths", "fanouts")
+
+    def __init__(self):
+        """빈 통계를 초기화합니다."""
+        self.depths = Histogram()  # 노드 깊이 분포
+        self.fanouts = Histogram()  # 노드별 자식 수 분포
+
+    def node_attached(self, depth: int, parent_fanout: Optional[int]):
+        """
+        노드 하나가 붙었음을 반영합니다.
+
+        Args:
+            depth: 새 노드의 깊이
+            parent_fanout: 붙기 전 부모의 자식 수 (루트면 None)
+        """
+        self.depths.add(depth)
+        self.fanouts.add(0)
+        if parent_fanout is not None:
+            self.fanouts.move(parent_fanout, parent_fanout + 1)
+
+    def nodes_attached(self, depths: Dict[int, int], fanouts: Dict[int, int]):
+        """
+        여러 노드가 한 번에 붙었음을 반영합니다 (Tree.add_nodes용).
+
+        Args:
+            depths: 새 노드들의 {깊이: 개수}
+            fanouts: 자식 수 분포의 {자식 수: 개수 변화} (새 노드의 0 포함)
+        """
+        self.depths.update(depths)
+        self.fanouts.update(fanouts)
+
+    def node_detached(self, depth: int, parent_fanout: int):
+        """
+        잎 노드 하나가 떨어졌음을 반영합니다.
+
+        Args:
+            depth: 제거된 노드의 깊이
+            parent_fanout: 떨어지기 전 부모의 자식 수
+        """
+        self.depths.remove(depth)
+        self.fanouts.remove(0)
+        self.fanouts.move(parent_fanout, parent_fanout - 1)
+
+    @property
+    def node_count(self) -> int:
+        """루트를 포함한 노드 수."""
+        return self.depths.count
+
+    @property
+    def leaf_count(self) -> int:
+        """자식이 없는 노드 수."""
+        return self.fanouts.count_of(0)
+
+    @property
+    def branch_point_count(self) -> int:
+        """자식이 2개 이상인 노드 수."""
+        return self.node_count - self.leaf_count - self.fanouts.count_of(1)
+
+    def as_dict(self) -> Dict:
+        """
+        통계를 딕셔너리로 반환합니다.
+
+        Returns:
+            node_count, leaf_count, branch_points, max_depth, mean_depth,
+            mean_branching(잎이 아닌 노드의 평균 자식 수), branching_histogram
+        """
+        internal = self.node_count - self.leaf_count
+        return {
+            "node_count": self.node_count,
+            "leaf_count": self.leaf_count,
+            "branch_points": self.branch_point_count,
+            "max_depth": self.depths.max,
+            "mean_depth": self.depths.mean,
+            "mean_branching": (self.node_count - 1) / internal if internal else 0,
+            "branching_histogram": self.fanouts.as_dict(),
+        }
+
+    def copy(self) -> "TreeStats":
+        """독립적인 복사본 (트리 분기용)."""
+        other = TreeStats()
+        other.depths = self.depths.copy()
+        other.fanouts = self.fanouts.copy()
+        return other
+
+
+class CheckpointStats:
+    """
+    체크포인트 통계 (Store 이벤트 구독으로 갱신).
+
+    체크포인트별 깊이와, 가리키는 노드가 분기점(자식 2개 이상)인
+    체크포인트 수를 유지합니다. Reset 이벤트를 받으면 O(C)로 다시 만듭니다.
+    노드별 체크포인트 이름은 store.checkpoint_index에서 얻습니다.
+    공유 트리(Session)에서는 다른 세션이 추가한 자식이 분기 체크포인트 수에
+    반영되지 않습니다. 체크포인트마다 분기로 셌는지 기억해 두고 그 표시로만
+    빼므로, 그런 경우에도 수가 음수가 되지는 않습니다.
+    """
+
+    def __init__(self, store: "Store"):
+        """
+        통계를 만들고 store의 이벤트를 구독합니다.
+
+        Args:
+            store: 대상 Store
+        """
+        self.store = store
+        # 이름 → (노드 ID, 깊이, 분기 체크포인트로 셌는지)
+        self._entries: Dict[str, Tuple[str, int, bool]] = {}
+        self.depths = Histogram()
+        self.branch_count = 0
+        self.rebuild()
+        store.events.subscribe(self._on_event)
+
+    def rebuild(self):
+        """현재 체크포인트로 통계를 다시 만듭니다 (O(C))."""
+        self._entries.clear()
+        self.depths = Histogram()
+        self.branch_count = 0
+        for name, node_id in self.store.checkpoints.items():
+            self._add(name, node_id)
+
+    def depth_of(self, name: str) -> Optional[int]:
+        """
+        체크포인트가 가리키는 노드의 깊이를 O(1)로 반환합니다.
+
+        Args:
+            name: 체크포인트 이름
+
+        Returns:
+            깊이, 없는 체크포인트면 None
+        """
+        entry = self._entries.get(name)
+        return entry[1] if entry is not None else None
+
+    def _add(self, name: str, node_id: str):
+        if name in self._entries:
+            self._remove(name)
+        tree = self.store.tree
+        depth = tree.get_depth(node_id)
+        is_branch = tree.get_child_count(node_id) >= 2
+        self._entries[name] = (node_id, depth, is_branch)
+        self.depths.add(depth)
+        self.branch_count += is_branch
+
+    def _remove(self, name: str):
+        _, depth, is_branch = self._entries.pop(name)
+        self.depths.remove(depth)
+        self.branch_count -= is_branch
+
+    def _mark_branch(self, node_id: str, is_branch: bool):
+        # node_id의 체크포인트 중 표시가 다른 것만 바꾸고 수를 맞춤
+        entries = self._entries
+        for name in self.store.checkpoint_index.names_of(node_id):
+            entry = entries.get(name)
+            if entry is not None and entry[2] != is_branch:
+                entries[name] = (entry[0], entry[1], is_branch)
+                self.branch_count += 1 if is_branch else -1
+
+    def _on_event(self, event: StoreEvent):
+        if isinstance(event, CheckpointSaved):
+            self._add(event.name, event.node_id)
+        elif isinstance(event, CheckpointDeleted):
+            self._remove(event.name)
+        elif isinstance(event, CheckpointRenamed):
+            self._entries[event.new_name] = self._entries.pop(event.old_name)
+        elif isinstance(event, NodeAdded):
+            # 부모의 자식 수가 1 → 2가 되면 부모의 체크포인트가 분기 체크포인트가 됨
+            if self.store.tree.get_child_count(event.parent_id) >= 2:
+                self._mark_branch(event.parent_id, True)
+        elif isinstance(event, NodeRemoved):
+            if self.store.tree.get_child_count(event.parent_id) < 2:
+                self._mark_branch(event.parent_id, False)
+        elif isinstance(event, Reset):
+            self.rebuild()
+
+    def as_dict(self) -> Dict:
+        """
+        통계를 딕셔너리로 반환합니다 (get_checkpoint_stats와 같은 키).
+
+        Returns:
+            total_count, avg_depth, max_depth, min_depth, branch_points
+        """
+        return {
+            "total_count": self.depths.count,
+            "avg_depth": self.depths.mean,
+            "max_depth": self.depths.max,
+            "min_depth": self.depths.min,
+            "branch_points": self.branch_count,
+        }
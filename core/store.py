@@ -4,9 +4,77 @@
 이 모듈은 대화 트리와 현재 활성 경로, 체크포인트를 관리합니다.
 """
 
-from typing import Dict, List, Optional
+import weakref
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional, Union
 
-from core.models import Node, Tree, create_node
+from core.checkpoint_index import CheckpointIndex, PathSnapshot
+from core.compression import CompressedTextStore, PathRefs
+from core.concurrency import PathConflictError, RWLock, VersionConflictError
+from core.content_store import ContentStore
+from core.cow import CowDict, changes_between, layered
+from core.events import (
+    CheckpointDeleted,
+    CheckpointRenamed,
+    CheckpointSaved,
+    EventBus,
+    NodeAdded,
+    NodeRemoved,
+    PathSwitched,
+    Reset,
+)
+from core.journal import JOURNAL_SIZE, Journal, Operation
+from core.models import LazyNode, Node, Tree, create_node
+from core.pagination import DEFAULT_PAGE_SIZE, Page, paginate
+from core.persistent import PMap, TreeVersion
+from core.stats import CheckpointStats
+from core.text_store import TextStore
+
+
+@dataclass
+class PathDelta:
+    """
+    활성 경로 전환 결과 (증분 변경분).
+
+    Attributes:
+        lca: 이전 현재 노드와 대상 노드의 최소 공통 조상 ID
+            (서로 다른 루트에 속해 공통 조상이 없으면 None)
+        removed_ids: 활성 경로에서 제거된 노드 ID (경로 순서, LCA 아래부터)
+        added_ids: 활성 경로에 추가된 노드 ID (경로 순서, LCA 아래부터)
+    """
+
+    lca: Optional[str]
+    removed_ids: List[str]
+    added_ids: List[str]
+
+    @property
+    def distance(self) -> int:
+        """이전 현재 노드와 대상 노드 사이의 간선 수."""
+        return len(self.removed_ids) + len(self.added_ids)
+
+
+@dataclass(frozen=True)
+class StoreVersion:
+    """
+    Store의 특정 버전 스냅샷 (불변).
+
+    Attributes:
+        version: Store 버전 번호
+        tree: 그 시점의 트리 (이후 버전과 구조 공유)
+        current_node_id: 그 시점의 현재 노드 ID
+        checkpoints: 그 시점의 체크포인트 {이름: 노드ID}
+    """
+
+    version: int
+    tree: TreeVersion
+    current_node_id: str
+    checkpoints: PMap
+
+    @property
+    def active_path_ids(self) -> List[str]:
+        """그 시점의 활성 경로 (루트 → 현재 노드)."""
+        return list(reversed(self.tree.get_path_to_root(self.current_node_id)))
 
 
 class Store:
@@ -16,30 +84,195 @@ class Store:
     Store는 다음을 관리합니다:
     - Tree 객체 (모든 노드 저장)
     - active_path_ids (현재 활성 경로)
-    - checkpoints (이름표 시스템)
+    - checkpoints (이름표 시스템, checkpoint_index로 노드 → 이름 역조회)
 
     설계 원칙:
     - Tree 객체 분리로 SRP 준수
     - active_path_ids로 O(1) 현재 노드 조회
     - reset()으로 테스트 격리 지원
+
+    동시성:
+    - 읽기-쓰기 잠금으로 보호되어 여러 스레드에서 안전하게 사용 가능
+      (읽기끼리는 서로 막지 않음)
+    - 상태가 바뀔 때마다 version이 1씩 증가하며, 변경 메서드에
+      expected_version을 넘기면 버전이 다를 때 VersionConflictError(409)로
+      거부됩니다 (compare-and-swap)
+
+    변경 알림:
+    - 상태가 바뀔 때마다 events(EventBus)로 NodeAdded, PathSwitched,
+      Checkpoint*, Reset 이벤트를 발행합니다 (core.events 참고)
     """
 
-    def __init__(self):
-        """Store 초기화 - 새로운 트리와 루트 경로 생성."""
-        self.tree: Tree = Tree(root_id="root")
-        self.active_path_ids: List[str] = ["root"]
+    def __init__(
+        self,
+        content_store: Optional[
+            Union[ContentStore, TextStore, CompressedTextStore]
+        ] = None,
+        tree: Optional[Tree] = None,
+        max_versions: int = 0,
+        journal_size: int = JOURNAL_SIZE,
+    ):
+        """
+        Store 초기화 - 새로운 트리와 루트 경로 생성.
+
+        Args:
+            content_store: 지정하면 노드 본문을 저장소에 두는 지연 로딩 모드로
+                동작합니다 (메모리에는 트리 골격과 미리보기만 유지).
+                TextStore를 지정하면 동일한 본문이 한 번만 저장되고,
+                CompressedTextStore를 지정하면 오래 방문하지 않은 본문이 압축됩니다
+            tree: 지정하면 새 트리 대신 이 트리를 사용합니다 (여러 Store가 한
+                트리를 공유하는 세션 모드, content_store는 트리의 것을 따름)
+            max_versions: 0보다 크면 최근 이 개수만큼의 버전 스냅샷을 보관합니다
+                (시간 여행, get_snapshot()/restore_version() 참고)
+            journal_size: 실행 취소(undo) 가능한 최대 작업 수 (0이면 기록 안 함)
+        """
+        if tree is not None:
+            content_store = tree.content_store
+        else:
+            tree = Tree(root_id="root", content_store=content_store)
+        self.content_store = content_store
+        self.tree: Tree = tree
+        self.active_path_ids: List[str] = [tree.root_id]
         self.checkpoints: Dict[str, str] = {}
+        self.version = 0
+        # 압축 저장소가 hot으로 유지할 활성 경로의 본문 참조 (_record_visit 참고)
+        track_path = getattr(content_store, "track_path", None)
+        self._path_refs: Optional[PathRefs] = track_path() if track_path else None
+        self._lock = RWLock()
+        self.journal = Journal(journal_size)
+        self.events = EventBus()
+        self.checkpoint_index = CheckpointIndex(self)
+        self.checkpoint_stats = CheckpointStats(self)
+
+        # fork()로 만들어진 경우의 원본 Store와 분기 시점의 바닥 계층
+        self.forked_from: Optional["Store"] = None
+        self._fork_point: Optional[tuple] = None
+        # 이미 병합한 분기 (같은 분기를 두 번 병합하지 않도록)
+        self._merged_forks: "weakref.WeakSet[Store]" = weakref.WeakSet()
+
+        # 버전 스냅샷 고리 (max_versions개까지, 오래된 것부터 버림)
+        self.max_versions = max_versions
+        self._versions: Optional[Deque[StoreVersion]] = None
+        self._checkpoint_map = PMap()
+        if max_versions > 0:
+            self._versions = deque(maxlen=max_versions)
+            self._commit(replaced=True, bump=False)
+
+    def _commit(
+        self, *checkpoint_names: str, replaced: bool = False, bump: bool = True
+    ):
+        """
+        상태 변경을 확정합니다 (쓰기 잠금 안에서 호출).
+
+        버전을 올리고, 버전 기록이 켜져 있으면 새 스냅샷을 고리에 넣습니다.
+        트리는 구조를 공유하므로 스냅샷 비용은 O(log N)입니다.
+
+        Args:
+            *checkpoint_names: 이번 변경에서 바뀐 체크포인트 이름들
+            replaced: 트리나 체크포인트 전체가 바뀐 경우 True
+            bump: False면 버전 번호를 올리지 않음 (초기 스냅샷용)
+        """
+        if bump:
+            self.version += 1
+        if self._versions is None:
+            return
+
+        if replaced:
+            self.tree.enable_versions()
+            self._checkpoint_map = PMap(self.checkpoints)
+        else:
+            for name in checkpoint_names:
+                if name in self.checkpoints:
+                    self._checkpoint_map = self._checkpoint_map.set(
+                        name, self.checkpoints[name]
+                    )
+                else:
+                    self._checkpoint_map = self._checkpoint_map.delete(name)
+
+        self._versions.append(
+            StoreVersion(
+                version=self.version,
+                tree=self.tree.snapshot(),
+                current_node_id=self.active_path_ids[-1],
+                checkpoints=self._checkpoint_map,
+            )
+        )
 
-    def reset(self):
+    def _check_version(self, expected_version: Optional[int]):
+        """
+        기대 버전을 검사합니다 (쓰기 잠금 안에서 호출).
+
+        Args:
+            expected_version: 기대하는 현재 버전 (None이면 검사하지 않음)
+
+        Raises:
+            VersionConflictError: 현재 버전이 기대 버전과 다른 경우
+        """
+        if expected_version is not None and expected_version != self.version:
+            raise VersionConflictError(expected_version, self.version)
+
+    def get_version(self) -> int:
+        """
+        현재 상태 버전을 반환합니다.
+
+        Returns:
+            상태가 바뀔 때마다 1씩 증가하는 버전 번호
+        """
+        with self._lock.read():
+            return self.version
+
+    def reset(self, expected_version: Optional[int] = None):
         """
         Store를 초기 상태로 리셋합니다.
 
         테스트 격리를 위해 사용됩니다.
         모든 상태를 초기화하고 새로운 트리를 생성합니다.
+
+        Args:
+            expected_version: 기대하는 현재 버전 (None이면 검사하지 않음)
+
+        Raises:
+            VersionConflictError: 현재 버전이 기대 버전과 다른 경우
         """
-        self.tree = Tree(root_id="root")
-        self.active_path_ids = ["root"]
-        self.checkpoints.clear()
+        with self._lock.write():
+            self._check_version(expected_version)
+            self.tree = Tree(root_id="root", content_store=self.content_store)
+            self.active_path_ids = ["root"]
+            self._reset_path_refs()
+            self.checkpoints.clear()
+            self.journal.clear()
+            self._commit(replaced=True)
+            self.events.publish(Reset(self.version))
+
+    def replace_state(
+        self,
+        tree: Tree,
+        checkpoints: Dict[str, str],
+        current_node_id: str,
+        expected_version: Optional[int] = None,
+    ):
+        """
+        트리, 체크포인트, 현재 위치를 한 번에 교체합니다 (가져오기 등에서 사용).
+
+        Args:
+            tree: 새 트리
+            checkpoints: 새 체크포인트 {이름: 노드ID}
+            current_node_id: 새 현재 노드 ID (tree에 있어야 함)
+            expected_version: 기대하는 현재 버전 (None이면 검사하지 않음)
+
+        Raises:
+            VersionConflictError: 현재 버전이 기대 버전과 다른 경우
+        """
+        with self._lock.write():
+            self._check_version(expected_version)
+            self.tree = tree
+            self.checkpoints = checkpoints
+            path_to_root = tree.get_path_to_root(current_node_id)
+            self.active_path_ids = list(reversed(path_to_root))
+            self._reset_path_refs()
+            self.journal.clear()
+            self._commit(replaced=True)
+            self.events.publish(Reset(self.version))
 
     def get_current_node_id(self) -> str:
         """
@@ -48,7 +281,8 @@ class Store:
         Returns:
             active_path_ids의 마지막 요소 (현재 노드 ID)
         """
-        return self.active_path_ids[-1]
+        with self._lock.read():
+            return self.active_path_ids[-1]
 
     def get_current_node(self) -> Optional[Node]:
         """
@@ -60,7 +294,12 @@ class Store:
         return self.tree.get_node(self.get_current_node_id())
 
     def add_node(
-        self, user_question: str, ai_answer: str, metadata: Optional[Dict] = None
+        self,
+        user_question: str,
+        ai_answer: str,
+        metadata: Optional[Dict] = None,
+        expected_version: Optional[int] = None,
+        expected_node_id: Optional[str] = None,
     ) -> Node:
         """
         현재 노드의 자식으로 새 노드를 추가하고 활성 경로를 업데이트합니다.
@@ -69,32 +308,52 @@ class Store:
             user_question: 사용자 질문
             ai_answer: AI 응답
             metadata: 선택적 메타데이터
+            expected_version: 기대하는 현재 버전 (None이면 검사하지 않음)
+            expected_node_id: 기대하는 현재 노드 ID (None이면 검사하지 않음).
+                버전과 달리 활성 경로와 무관한 변경은 충돌로 보지 않습니다.
 
         Returns:
             생성된 Node 객체
 
         Raises:
             ValueError: 부모 노드가 존재하지 않는 경우
+            VersionConflictError: 현재 버전이 기대 버전과 다른 경우
+            PathConflictError: 현재 노드가 기대 노드와 다른 경우
         """
-        current_id = self.get_current_node_id()
+        with self._lock.write():
+            self._check_version(expected_version)
+            current_id = self.active_path_ids[-1]
+            if expected_node_id is not None and expected_node_id != current_id:
+                raise PathConflictError(
+                    expected_node_id, current_id, user_question, ai_answer
+                )
 
-        # 새 노드 생성
-        new_node = create_node(
-            parent_id=current_id,
-            user_question=user_question,
-            ai_answer=ai_answer,
-            metadata=metadata,
-        )
+            # 새 노드 생성
+            new_node = create_node(
+                parent_id=current_id,
+                user_question=user_question,
+                ai_answer=ai_answer,
+                metadata=metadata,
+            )
 
-        # 트리에 추가
-        success = self.tree.add_node(new_node)
-        if not success:
-            raise ValueError(f"Failed to add node {new_node.id}")
+            # 트리에 추가
+            success = self.tree.add_node(new_node)
+            if not success:
+                raise ValueError(f"Failed to add node {new_node.id}")
 
-        # 활성 경로 업데이트
-        self.active_path_ids.append(new_node.id)
+            # 활성 경로 업데이트
+            self.active_path_ids.append(new_node.id)
+            if self._path_refs is not None:
+                self._path_refs.update(self._text_refs([new_node.id]))
+            self._commit()
 
-        return new_node
+            # 지연 로딩 모드에서는 트리에 저장된 LazyNode를 반환
+            stored = self.tree.nodes[new_node.id]
+            self.journal.record(
+                Operation("add", stored.id, current_id, stored.id, node=stored)
+            )
+            self.events.publish(NodeAdded(self.version, stored.id, current_id))
+            return stored
 
     def get_active_path(self) -> List[Node]:
         """
@@ -103,65 +362,237 @@ class Store:
         Returns:
             루트부터 현재 노드까지의 Node 리스트
         """
+        with self._lock.read():
+            path_ids = list(self.active_path_ids)
+
         nodes = []
-        for node_id in self.active_path_ids:
+        for node_id in path_ids:
             node = self.tree.get_node(node_id)
             if node:
                 nodes.append(node)
         return nodes
 
-    def switch_to_node(self, target_node_id: str) -> bool:
+    def get_active_path_ids(self) -> List[str]:
+        """
+        현재 활성 경로의 노드 ID 복사본을 반환합니다 (스레드 안전).
+
+        Returns:
+            루트부터 현재 노드까지의 ID 리스트
+        """
+        with self._lock.read():
+            return list(self.active_path_ids)
+
+    def switch_to_node(
+        self, target_node_id: str, expected_version: Optional[int] = None
+    ) -> Optional[PathDelta]:
         """
-        다른 노드로 경로를 전환합니다 (단순 역추적 방식).
+        다른 노드로 경로를 전환합니다 (LCA 기반 증분 방식).
+
+        대상 노드에서 부모를 따라 올라가다 현재 활성 경로와 만나는 지점(LCA)에서
+        멈추고, 활성 경로의 LCA 이하 부분만 대상 쪽 경로로 교체합니다.
+        활성 경로의 i번째 요소는 깊이 i의 조상이므로 만나는 지점은 깊이 인덱스로
+        O(1)에 판정되며, 전체 비용은 트리 깊이가 아닌 두 노드 사이 거리에
+        비례합니다.
 
         Args:
             target_node_id: 전환할 대상 노드의 ID
+            expected_version: 기대하는 현재 버전 (None이면 검사하지 않음)
 
         Returns:
-            전환 성공 시 True, 실패 시 False
+            전환 성공 시 PathDelta (참으로 평가됨), 실패 시 None
+
+        Raises:
+            VersionConflictError: 현재 버전이 기대 버전과 다른 경우
+
+        Example:
+            >>> delta = store.switch_to_node(sibling_id)
+            >>> delta.lca, delta.removed_ids, delta.added_ids
+            ('a1', ['b1'], ['b2'])
         """
-        if not self.tree.node_exists(target_node_id):
-            return False
+        with self._lock.write():
+            self._check_version(expected_version)
+            return self._switch_and_record(target_node_id)
 
-        # 대상 노드에서 루트까지의 경로를 가져옴
-        path_to_root = self.tree.get_path_to_root(target_node_id)
+    def _switch_and_record(self, target_node_id: str) -> Optional[PathDelta]:
+        """활성 경로를 전환하고 실행 취소 기록에 남깁니다 (쓰기 잠금 안)."""
+        previous_id = self.active_path_ids[-1]
+        delta = self._switch_to_node(target_node_id)
+        self._record_switch(previous_id, delta)
+        return delta
 
-        # 경로를 뒤집어서 루트->대상 순서로 변경
-        self.active_path_ids = list(reversed(path_to_root))
+    def _record_switch(self, previous_id: str, delta: Optional[PathDelta]):
+        """실제로 위치가 바뀐 전환만 실행 취소 기록에 남깁니다."""
+        if delta is not None and delta.distance:
+            self.journal.record(
+                Operation("switch", None, previous_id, self.active_path_ids[-1])
+            )
 
-        return True
+    def _switch_to_node(self, target_node_id: str) -> Optional[PathDelta]:
+        """쓰기 잠금 안에서 활성 경로를 전환합니다 (switch_to_node 참고)."""
+        delta = self._move_to(target_node_id)
+        if delta is None:
+            return None
+
+        self._record_visit(delta)
+        self._commit()
+        self.events.publish(PathSwitched(self.version, delta))
+        return delta
+
+    def _move_to(self, target_node_id: str) -> Optional[PathDelta]:
+        """활성 경로만 대상 노드 쪽으로 바꿉니다 (버전/방문 기록 없음)."""
+        tree = self.tree
+        if not tree.node_exists(target_node_id):
+            return None
 
-    def save_checkpoint(self, name: str) -> bool:
+        path = self.active_path_ids
+        suffix: List[str] = []
+        lca: Optional[str] = target_node_id
+        while lca is not None:
+            depth = tree.get_depth(lca)
+            if depth < len(path) and path[depth] == lca:
+                break
+            suffix.append(lca)
+            lca = tree.nodes[lca].parent_id
+
+        keep = tree.get_depth(lca) + 1 if lca is not None else 0
+        removed_ids = path[keep:]
+        del path[keep:]
+        suffix.reverse()
+        path.extend(suffix)
+        return PathDelta(lca=lca, removed_ids=removed_ids, added_ids=suffix)
+
+    def _record_visit(self, delta: PathDelta, detached: Optional[Node] = None):
         """
-        현재 노드에 이름표(체크포인트)를 저장합니다.
+        방문 이력을 사용하는 저장소(CompressedTextStore)에 전환을 알립니다.
+
+        활성 경로의 본문은 다음 AI 컨텍스트로 읽히므로 경로 전체를 hot으로
+        유지합니다. 경로 참조 집합에서는 바뀐 구간만 빼고 더하며, 새로 들어온
+        노드만 방문으로 기록하므로 비용은 경로 길이가 아니라 바뀐 구간의
+        길이에 비례합니다.
+
+        Args:
+            delta: 활성 경로 변경분
+            detached: 방금 트리에서 제거되어 경로에서 빠진 노드 (실행 취소)
+        """
+        if self._path_refs is None:
+            return
+        self._path_refs.difference_update(
+            self._text_refs(delta.removed_ids, detached)
+        )
+        entered = self._text_refs(delta.added_ids)
+        self._path_refs.update(entered)
+        self.content_store.record_switch(entered)
+
+    def _reset_path_refs(self):
+        """활성 경로가 통째로 바뀐 뒤 경로 참조 집합을 다시 만듭니다 (O(깊이))."""
+        if self._path_refs is not None:
+            self._path_refs.clear()
+            self._path_refs.update(self._text_refs(self.active_path_ids))
+
+    def _text_refs(
+        self, node_ids: List[str], detached: Optional[Node] = None
+    ) -> list:
+        """노드들의 질문/답변 본문 저장소 참조를 모읍니다 (본문은 읽지 않음)."""
+        refs = []
+        for node_id in node_ids:
+            node = self.tree.get_node(node_id)
+            if node is None and detached is not None and detached.id == node_id:
+                node = detached
+            if isinstance(node, LazyNode):
+                refs.append(node.text_ref("user_question"))
+                refs.append(node.text_ref("ai_answer"))
+        return refs
+
+    def save_checkpoint(
+        self,
+        name: str,
+        expected_version: Optional[int] = None,
+        node_id: Optional[str] = None,
+    ) -> bool:
+        """
+        현재 노드(또는 지정한 노드)에 이름표(체크포인트)를 저장합니다.
 
         Args:
             name: 체크포인트 이름
+            expected_version: 기대하는 현재 버전 (None이면 검사하지 않음)
+            node_id: 체크포인트를 붙일 노드 ID (None이면 현재 노드)
 
         Returns:
             저장 성공 시 True, 이미 존재하면 False
+
+        Raises:
+            ValueError: node_id가 트리에 없는 경우
+            VersionConflictError: 현재 버전이 기대 버전과 다른 경우
         """
-        if name in self.checkpoints:
-            return False
+        with self._lock.write():
+            self._check_version(expected_version)
+            if name in self.checkpoints:
+                return False
 
-        self.checkpoints[name] = self.get_current_node_id()
-        return True
+            if node_id is None:
+                node_id = self.active_path_ids[-1]
+            elif not self.tree.node_exists(node_id):
+                raise ValueError(f"Node '{node_id}' does not exist")
+            self.checkpoints[name] = node_id
+            self._commit(name)
+            self.journal.record(Operation("checkpoint", name, None, node_id))
+            self.events.publish(CheckpointSaved(self.version, name, node_id))
+            return True
 
-    def load_checkpoint(self, name: str) -> bool:
+    def load_checkpoint(
+        self, name: str, expected_version: Optional[int] = None
+    ) -> bool:
         """
         저장된 체크포인트로 이동합니다.
 
         Args:
             name: 체크포인트 이름
+            expected_version: 기대하는 현재 버전 (None이면 검사하지 않음)
 
         Returns:
             이동 성공 시 True, 체크포인트가 없으면 False
+
+        Raises:
+            VersionConflictError: 현재 버전이 기대 버전과 다른 경우
         """
-        if name not in self.checkpoints:
-            return False
+        with self._lock.write():
+            self._check_version(expected_version)
+            if name not in self.checkpoints:
+                return False
+
+            target_node_id = self.checkpoints[name]
+            return self._switch_and_record(target_node_id) is not None
+
+    def get_checkpoint_names(self, node_id: str) -> List[str]:
+        """
+        노드를 가리키는 체크포인트 이름들을 역색인으로 조회합니다.
+
+        체크포인트 수와 무관하게 O(해당 이름 수)입니다.
 
-        target_node_id = self.checkpoints[name]
-        return self.switch_to_node(target_node_id)
+        Args:
+            node_id: 노드 ID
+
+        Returns:
+            체크포인트 이름 리스트 (저장 순서, 없으면 빈 리스트)
+        """
+        with self._lock.read():
+            return self.checkpoint_index.names_of(node_id)
+
+    def get_checkpoint_snapshot(self, name: str) -> Optional[PathSnapshot]:
+        """
+        체크포인트가 저장한 활성 경로 스냅샷을 반환합니다.
+
+        스냅샷은 경로 해시로 식별되며, 같은 대화 이력을 가리키는 체크포인트는
+        하나의 스냅샷을 공유합니다.
+
+        Args:
+            name: 체크포인트 이름
+
+        Returns:
+            PathSnapshot 객체, 없으면 None
+        """
+        with self._lock.read():
+            return self.checkpoint_index.snapshot_of(name)
 
     def list_checkpoints(self) -> Dict[str, str]:
         """
@@ -170,22 +601,497 @@ class Store:
         Returns:
             {이름: 노드ID} 딕셔너리
         """
-        return self.checkpoints.copy()
+        with self._lock.read():
+            return dict(self.checkpoints)
+
+    def list_checkpoints_page(
+        self,
+        after: Optional[str] = None,
+        limit: Optional[int] = DEFAULT_PAGE_SIZE,
+        prefix: str = "",
+        exclude_prefix: str = "",
+    ) -> Page:
+        """
+        체크포인트를 이름순으로 한 페이지씩 반환합니다.
+
+        이름순 정렬 색인에서 커서 위치를 찾아 limit개만 읽으므로, 체크포인트
+        수와 무관하게 O(log C + limit)입니다.
+
+        Args:
+            after: 이전 페이지의 next_cursor (None이면 처음부터)
+            limit: 페이지 크기 (None이면 끝까지)
+            prefix: 이 접두사로 시작하는 이름만
+            exclude_prefix: 이 접두사로 시작하는 이름은 제외
+
+        Returns:
+            (이름, 노드 ID) 튜플을 담은 Page
+
+        Raises:
+            ValueError: limit이 1보다 작은 경우
+
+        Example:
+            >>> page = store.list_checkpoints_page(limit=20)
+            >>> for name, node_id in page.items:
+            ...     print(name, node_id)
+        """
+        with self._lock.read():
+            names = self.checkpoint_index.iter_names(
+                after or "", prefix, exclude_prefix
+            )
+            checkpoints = self.checkpoints
+            items = ((name, checkpoints[name]) for name in names)
+            return paginate(items, limit, lambda item: item[0])
+
+    def count_checkpoints(self, prefix: str = "") -> int:
+        """
+        접두사로 시작하는 체크포인트 수를 O(log C)로 반환합니다.
+
+        Args:
+            prefix: 이름 접두사 (빈 문자열이면 전체)
+
+        Returns:
+            체크포인트 수
+        """
+        with self._lock.read():
+            return self.checkpoint_index.count_names(prefix)
 
-    def delete_checkpoint(self, name: str) -> bool:
+    def delete_checkpoint(
+        self, name: str, expected_version: Optional[int] = None
+    ) -> bool:
         """
         체크포인트를 삭제합니다.
 
         Args:
             name: 삭제할 체크포인트 이름
+            expected_version: 기대하는 현재 버전 (None이면 검사하지 않음)
 
         Returns:
             삭제 성공 시 True, 없으면 False
+
+        Raises:
+            VersionConflictError: 현재 버전이 기대 버전과 다른 경우
         """
-        if name not in self.checkpoints:
-            return False
+        with self._lock.write():
+            self._check_version(expected_version)
+            if name not in self.checkpoints:
+                return False
+
+            node_id = self.checkpoints.pop(name)
+            self._commit(name)
+            self.journal.record(Operation("checkpoint", name, node_id, None))
+            self.events.publish(CheckpointDeleted(self.version, name, node_id))
+            return True
+
+    def prune_checkpoints(
+        self, names: List[str], expected_version: Optional[int] = None
+    ) -> int:
+        """
+        여러 체크포인트를 한 번에 삭제합니다 (보존 정책 등 유지 관리용).
+
+        하나의 변경(버전 1 증가)으로 처리되며, 사용자 작업이 아니므로 실행 취소
+        기록에는 남기지 않습니다. 없는 이름은 건너뜁니다.
+
+        Args:
+            names: 삭제할 체크포인트 이름들
+            expected_version: 기대하는 현재 버전 (None이면 검사하지 않음)
+
+        Returns:
+            실제로 삭제된 개수
+
+        Raises:
+            VersionConflictError: 현재 버전이 기대 버전과 다른 경우
+        """
+        with self._lock.write():
+            self._check_version(expected_version)
+            removed = [
+                (name, self.checkpoints.pop(name))
+                for name in names
+                if name in self.checkpoints
+            ]
+            if not removed:
+                return 0
+
+            self._commit(*(name for name, _ in removed))
+            for name, node_id in removed:
+                self.events.publish(CheckpointDeleted(self.version, name, node_id))
+            return len(removed)
+
+    def rename_checkpoint(
+        self, old_name: str, new_name: str, expected_version: Optional[int] = None
+    ) -> bool:
+        """
+        체크포인트 이름을 바꿉니다.
+
+        Args:
+            old_name: 현재 이름
+            new_name: 새 이름
+            expected_version: 기대하는 현재 버전 (None이면 검사하지 않음)
+
+        Returns:
+            변경 성공 시 True, 현재 이름이 없거나 새 이름이 이미 있으면 False
+
+        Raises:
+            VersionConflictError: 현재 버전이 기대 버전과 다른 경우
+        """
+        with self._lock.write():
+            self._check_version(expected_version)
+            if old_name not in self.checkpoints or new_name in self.checkpoints:
+                return False
+
+            node_id = self.checkpoints.pop(old_name)
+            self.checkpoints[new_name] = node_id
+            self._commit(old_name, new_name)
+            self.journal.record(Operation("rename", None, old_name, new_name))
+            self.events.publish(
+                CheckpointRenamed(self.version, old_name, new_name, node_id)
+            )
+            return True
+
+    def fork(self) -> "Store":
+        """
+        copy-on-write로 분기된 Store를 만듭니다 ("만약에" 탐색용).
+
+        트리와 체크포인트는 분기 시점의 내용을 구조적으로 공유하며, 양쪽은
+        이후 각자의 변경분(새 노드, 바뀐 체크포인트)만 기록합니다. 노드 수와
+        무관하게 O(1)이고, 활성 경로만 복사됩니다 (O(깊이)). 분기를 거듭해 변경
+        계층이 cow.MAX_LAYERS에 이르면 그 분기에서 한 번 평탄화합니다 (O(N)).
+
+        분기 이전 노드는 양쪽이 공유하는 바닥에 고정되어 그 추가를 되돌릴 수
+        없으므로, 이 Store의 실행 취소 기록은 비워집니다.
+
+        Returns:
+            분기된 Store (forked_from이 이 Store를 가리킴)
+
+        Example:
+            >>> what_if = store.fork()
+            >>> what_if.add_node("다르게 물어보면?", "...")
+            >>> store.merge(what_if)  # 필요하면 결과를 되가져오기
+        """
+        with self._lock.write():
+            child = Store(
+                tree=self.tree.fork(),
+                max_versions=self.max_versions,
+                journal_size=self.journal.max_size,
+            )
+            # 분기 이전 노드는 공유 바닥에 고정되므로 그 추가는 되돌릴 수 없음
+            self.journal.clear()
+            nodes_base = child.tree.nodes.base
+            checkpoints_base, self.checkpoints, child.checkpoints = layered(
+                self.checkpoints
+            )
+            child.active_path_ids = list(self.active_path_ids)
+            child._reset_path_refs()
+            child.checkpoint_index.rebuild()
+            child.checkpoint_stats.rebuild()
+            child.forked_from = self
+            child._fork_point = (nodes_base, checkpoints_base)
+            return child
+
+    def merge(
+        self,
+        fork: "Store",
+        switch: bool = False,
+        expected_version: Optional[int] = None,
+    ) -> int:
+        """
+        fork()로 분기한 Store의 변경분을 이 Store로 되가져옵니다.
+
+        분기 쪽에서 추가된 노드는 모두 이 트리에 추가되고, 체크포인트 변경(추가,
+        이동, 삭제)이 반영됩니다. 같은 이름의 체크포인트가 양쪽에서 다르게
+        바뀌었으면 아무것도 반영하지 않고 거부합니다.
+
+        Args:
+            fork: 이 Store에서 분기한 Store (한 번만 병합 가능)
+            switch: True면 분기 쪽의 현재 노드로 전환
+            expected_version: 기대하는 현재 버전 (None이면 검사하지 않음)
+
+        Returns:
+            병합된 노드 개수
+
+        Raises:
+            ValueError: 이 Store의 분기가 아니거나, 이미 병합한 분기이거나, 분기
+                이후 어느 쪽이든 reset, replace_state로 상태가 바뀌었거나,
+                체크포인트가 충돌하는 경우
+            VersionConflictError: 현재 버전이 기대 버전과 다른 경우
+        """
+        if fork.forked_from is not self:
+            raise ValueError("Store was not forked from this store")
+
+        with fork._lock.read():
+            if not isinstance(fork.tree.nodes, CowDict) or not isinstance(
+                fork.checkpoints, CowDict
+            ):
+                raise ValueError("fork state was replaced")
+            nodes_base, checkpoints_base = fork._fork_point
+            new_nodes, _ = changes_between(fork.tree.nodes, nodes_base)
+            theirs, theirs_deleted = changes_between(
+                fork.checkpoints, checkpoints_base
+            )
+            fork_current_id = fork.active_path_ids[-1]
+
+        with self._lock.write():
+            self._check_version(expected_version)
+            if fork in self._merged_forks:
+                raise ValueError("Fork was already merged")
+            if not isinstance(self.tree.nodes, CowDict) or not isinstance(
+                self.checkpoints, CowDict
+            ):
+                raise ValueError("Store state was replaced after fork")
+
+            # 양쪽에서 다르게 바뀐 이름만 충돌 (이쪽 계층은 그사이 평탄화됐을 수
+            # 있으므로 분기 시점 값과 직접 비교)
+            conflicts = []
+            for name in set(theirs) | theirs_deleted:
+                mine = self.checkpoints.get(name)
+                if mine != checkpoints_base.get(name) and mine != theirs.get(name):
+                    conflicts.append(name)
+            if conflicts:
+                raise ValueError(f"Checkpoint conflict: {sorted(conflicts)}")
+
+            self.tree.add_nodes(new_nodes.values())
+            for name in theirs_deleted:
+                self.checkpoints.pop(name, None)
+            self.checkpoints.update(theirs)
+            if switch:
+                self._switch_to_node(fork_current_id)
+            self._merged_forks.add(fork)
+            self.journal.clear()
+            self._commit(replaced=True)
+            self.events.publish(Reset(self.version))
+            return len(new_nodes)
+
+    def list_versions(self) -> List[int]:
+        """
+        보관 중인 버전 번호 목록을 오래된 순으로 반환합니다.
+
+        Returns:
+            버전 번호 리스트 (버전 기록이 꺼져 있으면 빈 리스트)
+        """
+        with self._lock.read():
+            if self._versions is None:
+                return []
+            return [snapshot.version for snapshot in self._versions]
+
+    def get_snapshot(
+        self, version: Optional[int] = None, ago: int = 0
+    ) -> StoreVersion:
+        """
+        보관 중인 버전 스냅샷을 반환합니다.
+
+        Args:
+            version: 버전 번호 (None이면 ago로 지정)
+            ago: 최신 버전으로부터 몇 번의 변경 이전인지 (0이면 현재)
+
+        Returns:
+            StoreVersion 객체
+
+        Raises:
+            ValueError: 버전 기록이 꺼져 있거나, 해당 버전이 고리에 없는 경우
+
+        Example:
+            >>> store = Store(max_versions=100)
+            >>> old = store.get_snapshot(ago=20)  # 20번의 변경 이전 트리
+            >>> old.tree.get_node_count()
+        """
+        with self._lock.read():
+            if version is None:
+                version = self.version - ago
+            return self._find_snapshot(version)
 
-        del self.checkpoints[name]
+    def _find_snapshot(self, version: int) -> StoreVersion:
+        """
+        고리에서 버전 스냅샷을 찾습니다 (잠금 안에서 호출).
+
+        Args:
+            version: 버전 번호
+
+        Returns:
+            StoreVersion 객체
+
+        Raises:
+            ValueError: 버전 기록이 꺼져 있거나, 해당 버전이 고리에 없는 경우
+        """
+        if self._versions is None:
+            raise ValueError("Version history is disabled (max_versions=0)")
+        oldest = self._versions[0].version
+        if not oldest <= version <= self.version:
+            raise ValueError(f"Version {version} is not in history")
+        # 고리의 버전 번호는 연속이므로 위치를 바로 계산
+        return self._versions[version - oldest]
+
+    def restore_version(
+        self, version: int, expected_version: Optional[int] = None
+    ) -> Optional[PathDelta]:
+        """
+        과거 버전의 현재 위치와 체크포인트를 복원합니다 (새 버전으로 기록).
+
+        트리는 추가만 가능하므로 그 이후 추가된 노드는 남아 있으며,
+        활성 경로는 O(거리), 체크포인트는 O(체크포인트 수)로 복원됩니다.
+
+        Args:
+            version: 복원할 버전 번호
+            expected_version: 기대하는 현재 버전 (None이면 검사하지 않음)
+
+        Returns:
+            활성 경로 변경분 (PathDelta)
+
+        Raises:
+            ValueError: 버전이 고리에 없거나 그 노드가 현재 트리에 없는 경우
+            VersionConflictError: 현재 버전이 기대 버전과 다른 경우
+        """
+        with self._lock.write():
+            self._check_version(expected_version)
+            # 조회와 복원 사이에 reset 등이 끼어들지 않도록 같은 잠금 안에서 조회
+            snapshot = self._find_snapshot(version)
+            if not self.tree.node_exists(snapshot.current_node_id):
+                raise ValueError(
+                    f"Node '{snapshot.current_node_id}' no longer exists"
+                )
+
+            for name in [n for n in self.checkpoints if n not in snapshot.checkpoints]:
+                del self.checkpoints[name]
+            for name, node_id in snapshot.checkpoints.items():
+                if self.checkpoints.get(name) != node_id:
+                    self.checkpoints[name] = node_id
+            self._checkpoint_map = snapshot.checkpoints
+            self.journal.clear()
+
+            delta = self._switch_to_node(snapshot.current_node_id)
+            self.events.publish(Reset(self.version))
+            return delta
+
+    def undo(self, expected_version: Optional[int] = None) -> Optional[Operation]:
+        """
+        가장 최근 작업을 되돌립니다.
+
+        노드 추가를 되돌리면 노드가 트리에서 제거되고 부모로 이동하며,
+        전환/체크포인트 작업은 작업 전 상태로 돌아갑니다. 기록은 작업당 O(1)
+        크기이고, 되돌리는 비용은 트리 크기가 아니라 이동 거리에 비례합니다.
+
+        Args:
+            expected_version: 기대하는 현재 버전 (None이면 검사하지 않음)
+
+        Returns:
+            되돌린 작업, 되돌릴 작업이 없으면 None
+
+        Raises:
+            ValueError: 기록 이후 prune_checkpoints, 체크포인트 정리 등으로 더 이상
+                되돌릴 수 없게 된 경우 (그 기록은 버려지므로 다음 호출은 그
+                이전 작업을 되돌림)
+            VersionConflictError: 현재 버전이 기대 버전과 다른 경우
+
+        Example:
+            >>> store.delete_checkpoint("중요")
+            >>> store.undo().kind
+            'checkpoint'
+        """
+        with self._lock.write():
+            self._check_version(expected_version)
+            journal = self.journal
+            if not journal.undo_ops:
+                return None
+
+            op = journal.undo_ops.pop()
+            # 적용할 수 없게 된 기록은 버려서 이후 실행 취소를 막지 않게 함
+            self._apply(op, undo=True)
+            journal.redo_ops.append(op)
+            return op
+
+    def redo(self, expected_version: Optional[int] = None) -> Optional[Operation]:
+        """
+        마지막으로 되돌린 작업을 다시 실행합니다.
+
+        Args:
+            expected_version: 기대하는 현재 버전 (None이면 검사하지 않음)
+
+        Returns:
+            다시 실행한 작업, 없으면 None
+
+        Raises:
+            ValueError: 더 이상 다시 실행할 수 없게 된 경우 (그 기록은 버려짐)
+            VersionConflictError: 현재 버전이 기대 버전과 다른 경우
+        """
+        with self._lock.write():
+            self._check_version(expected_version)
+            journal = self.journal
+            if not journal.redo_ops:
+                return None
+
+            op = journal.redo_ops.pop()
+            self._apply(op, undo=False)
+            journal.undo_ops.append(op)
+            return op
+
+    def _apply(self, op: Operation, undo: bool):
+        """작업의 이전(undo) 또는 이후 상태를 적용합니다 (쓰기 잠금 안)."""
+        value = op.before if undo else op.after
+
+        if op.kind == "add":
+            changed = False
+            if undo:
+                changed = self._unlink_node(op.key)
+            elif not self.tree.node_exists(op.key):
+                changed = self.tree.add_node(op.node)
+            delta = self._move_to(value)
+            self._record_visit(delta, detached=op.node)
+            self._commit()
+
+            # NodeAdded는 경로 연장을 포함하므로 그 외에는 경로 전환을 알림
+            if changed and undo:
+                self.events.publish(NodeRemoved(self.version, op.key, op.before))
+            if changed and not undo:
+                self.events.publish(NodeAdded(self.version, op.key, op.before))
+            else:
+                self.events.publish(PathSwitched(self.version, delta))
+
+        elif op.kind == "switch":
+            if not self.tree.node_exists(value):
+                raise ValueError(f"Node '{value}' no longer exists")
+            self._switch_to_node(value)
+
+        elif op.kind == "checkpoint":
+            # 기록 이후 prune_checkpoints 등으로 바뀌었으면 적용하지 않음
+            current = op.after if undo else op.before
+            if self.checkpoints.get(op.key) != current:
+                raise ValueError(f"Checkpoint '{op.key}' was changed since")
+            if value is None:
+                node_id = self.checkpoints.pop(op.key)
+                self._commit(op.key)
+                self.events.publish(CheckpointDeleted(self.version, op.key, node_id))
+            else:
+                self.checkpoints[op.key] = value
+                self._commit(op.key)
+                self.events.publish(CheckpointSaved(self.version, op.key, value))
+
+        elif op.kind == "rename":
+            old_name, new_name = op.before, op.after
+            if undo:
+                old_name, new_name = new_name, old_name
+            if old_name not in self.checkpoints or new_name in self.checkpoints:
+                raise ValueError(f"Cannot rename checkpoint '{old_name}'")
+            node_id = self.checkpoints.pop(old_name)
+            self.checkpoints[new_name] = node_id
+            self._commit(old_name, new_name)
+            self.events.publish(
+                CheckpointRenamed(self.version, old_name, new_name, node_id)
+            )
+
+        else:
+            raise ValueError(f"Unknown operation kind '{op.kind}'")
+
+    def _unlink_node(self, node_id: str) -> bool:
+        """
+        노드 추가를 되돌릴 때 트리에서 노드를 제거합니다.
+
+        Returns:
+            트리에서 실제로 제거했으면 True, 이미 없으면 False
+
+        Raises:
+            ValueError: 노드에 자식이 생겼거나 분기 이전 노드라 제거할 수 없는 경우
+        """
+        if not self.tree.node_exists(node_id):
+            return False
+        self.tree.remove_leaf(node_id)
         return True
 
     def get_children_of_current(self) -> List[Node]:
@@ -198,15 +1104,29 @@ class Store:
         current_id = self.get_current_node_id()
         return self.tree.get_children(current_id)
 
-    def get_tree_stats(self) -> Dict[str, int]:
+    def get_checkpoint_stats(self) -> Dict:
+        """
+        체크포인트 통계를 반환합니다 (점진적으로 유지되는 값이므로 O(1)).
+
+        Returns:
+            total_count, avg_depth, max_depth, min_depth, branch_points
+        """
+        with self._lock.read():
+            return self.checkpoint_stats.as_dict()
+
+    def get_tree_stats(self) -> Dict:
         """
-        트리 통계를 반환합니다.
+        트리 통계를 반환합니다 (점진적으로 유지되는 값이므로 O(1)).
 
         Returns:
-            통계 정보 딕셔너리
+            통계 정보 딕셔너리 (total_nodes, path_depth, checkpoints와
+            TreeStats.as_dict()의 항목들)
         """
-        return {
-            "total_nodes": self.tree.get_node_count(),
-            "path_depth": len(self.active_path_ids),
-            "checkpoints": len(self.checkpoints),
-        }
+        with self._lock.read():
+            stats = self.tree.stats.as_dict()
+            stats.update(
+                total_nodes=self.tree.get_node_count(),
+                path_depth=len(self.active_path_ids),
+                checkpoints=len(self.checkpoints),
+            )
+            return stats
@@ -0,0 +1,157 @@
+"""
+내용 주소 기반(content-addressed) 텍스트 저장소.
+
+이 모듈은 노드 본문을 해시로 식별하여 동일한 문자열을 한 번만 보관하는
+TextStore를 제공합니다. ContentStore와 같은 put/get 인터페이스를 가지므로
+Tree/Store의 content_store로 그대로 사용할 수 있으며, ContentStore를
+백엔드로 지정하면 디스크에도 고유 본문만 기록합니다.
+"""
+
+import hashlib
+from typing import Dict, Optional
+
+from core.content_store import ContentStore
+
+Digest = bytes
+
+
+def text_digest(text: str) -> Digest:
+    """
+    텍스트의 내용 해시를 계산합니다.
+
+    Args:
+        text: 해시할 텍스트
+
+    Returns:
+        16바이트 BLAKE2b 다이제스트
+    """
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+class TextStore:
+    """
+    참조 카운트를 가진 내용 주소 기반 텍스트 저장소.
+
+    put()은 텍스트의 다이제스트를 참조로 반환하므로, 같은 텍스트를 가진
+    노드들은 같은 참조를 공유하고 본문 비교는 참조 비교로 대체됩니다.
+    """
+
+    # 같은 텍스트는 항상 같은 참조(다이제스트)를 가짐
+    content_addressed = True
+
+    def __init__(self, backing: Optional[ContentStore] = None):
+        """
+        텍스트 저장소를 초기화합니다.
+
+        Args:
+            backing: 지정하면 고유 본문을 이 ContentStore(디스크)에 기록하고
+                메모리에는 다이제스트 → 디스크 참조만 유지합니다
+        """
+        self.backing = backing
+        self._texts: Dict[Digest, object] = {}
+        self._refcounts: Dict[Digest, int] = {}
+        self._sizes: Dict[Digest, int] = {}
+        self._logical_bytes = 0
+
+    def put(self, text: str) -> Digest:
+        """
+        텍스트를 저장하고 참조 카운트를 증가시킵니다.
+
+        이미 같은 내용이 있으면 새로 기록하지 않습니다.
+
+        Args:
+            text: 저장할 텍스트
+
+        Returns:
+            텍스트의 다이제스트 (참조)
+        """
+        digest = text_digest(text)
+        if digest in self._refcounts:
+            self._refcounts[digest] += 1
+        else:
+            self._texts[digest] = (
+                self.backing.put(text) if self.backing is not None else text
+            )
+            self._refcounts[digest] = 1
+            self._sizes[digest] = len(text.encode("utf-8"))
+
+        self._logical_bytes += self._sizes[digest]
+        return digest
+
+    def get(self, digest: Digest) -> str:
+        """
+        다이제스트로 텍스트를 조회합니다.
+
+        Args:
+            digest: put()이 반환한 참조
+
+        Returns:
+            저장된 텍스트
+
+        Raises:
+            KeyError: 참조가 없거나 이미 해제된 경우
+        """
+        stored = self._texts[digest]
+        if self.backing is not None:
+            return self.backing.get(stored)
+        return stored
+
+    def release(self, digest: Digest) -> bool:
+        """
+        참조 카운트를 감소시키고, 0이 되면 메모리에서 제거합니다.
+
+        디스크 백엔드의 바이트는 추가 전용이므로 그대로 남습니다.
+
+        Args:
+            digest: 해제할 참조
+
+        Returns:
+            항목이 완전히 제거되었으면 True
+        """
+        count = self._refcounts.get(digest)
+        if count is None:
+            return False
+
+        self._logical_bytes -= self._sizes[digest]
+        if count > 1:
+            self._refcounts[digest] = count - 1
+            return False
+
+        del self._refcounts[digest]
+        del self._texts[digest]
+        del self._sizes[digest]
+        return True
+
+    def refcount(self, digest: Digest) -> int:
+        """
+        참조 카운트를 반환합니다.
+
+        Args:
+            digest: 조회할 참조
+
+        Returns:
+            참조 카운트 (없으면 0)
+        """
+        return self._refcounts.get(digest, 0)
+
+    def report(self) -> dict:
+        """
+        중복 제거 현황을 반환합니다.
+
+        Returns:
+            고유 본문 수, 전체 참조 수, 논리/실제 바이트, 중복 제거 비율 딕셔너리
+
+        Example:
+            >>> report = text_store.report()
+            >>> report['dedup_ratio']  # 3.5 (논리 크기 / 실제 보관 크기)
+        """
+        unique_bytes = sum(self._sizes.values())
+        return {
+            "unique_texts": len(self._refcounts),
+            "references": sum(self._refcounts.values()),
+            "logical_bytes": self._logical_bytes,
+            "stored_bytes": unique_bytes,
+            "dedup_ratio": (
+                self._logical_bytes / unique_bytes if unique_bytes > 0 else 1.0
+            ),
+        }
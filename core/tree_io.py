@@ -0,0 +1,255 @@
+"""
+트리 전체의 스트리밍 JSONL 내보내기/가져오기.
+
+이 모듈은 Store의 트리, 체크포인트, 현재 위치를 한 줄에 레코드 하나씩
+JSONL 형식으로 기록하고 다시 읽어옵니다. 노드는 부모가 자식보다 먼저
+나오는 순서로 기록되며, 가져오기는 한 번의 순차 읽기 동안 고정 크기
+묶음으로 삽입하므로 파일 전체의 노드를 한꺼번에 들고 있지 않습니다.
+
+레코드 형식:
+    {"type": "header", "format": "conversation-tree", "version": 1, ...}
+    {"type": "node", "id": ..., "parent_id": ..., "user_question": ..., ...}
+    {"type": "checkpoint", "name": ..., "node_id": ..., "path_hash": ...}
+    {"type": "state", "current_node_id": ...}
+
+체크포인트의 path_hash(루트부터의 대화 이력 머클 해시)는 가져올 때 다시
+만든 트리의 해시와 비교되어, 내용이 바뀐 파일은 거부됩니다.
+"""
+
+import gc
+import json
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from core.models import Node, Tree
+from core.store import Store
+
+FORMAT_NAME = "conversation-tree"
+FORMAT_VERSION = 1
+
+# 가져오기에서 Tree.add_nodes()에 한 번에 넘기는 노드 수
+IMPORT_CHUNK_SIZE = 1000
+
+
+def _dump(record: dict) -> str:
+    """레코드 하나를 JSONL 한 줄로 직렬화합니다."""
+    return json.dumps(record, ensure_ascii=False, default=str) + "\n"
+
+
+def export_tree_jsonl(store: Store, fp: TextIO) -> int:
+    """
+    트리 전체를 JSONL로 내보냅니다.
+
+    노드를 한 줄씩 기록하므로 트리 크기와 무관하게 추가 메모리는 일정합니다.
+    기록하는 동안 Store의 읽기 잠금을 잡아 일관된 스냅샷을 내보냅니다.
+
+    Args:
+        store: 내보낼 Store 객체
+        fp: 텍스트 모드로 열린 출력 스트림
+
+    Returns:
+        기록된 노드 개수 (루트 포함)
+
+    Example:
+        >>> with open("tree.jsonl", "w", encoding="utf-8") as f:
+        ...     export_tree_jsonl(store, f)
+        42
+    """
+    with store._lock.read():
+        tree = store.tree
+        fp.write(
+            _dump(
+                {
+                    "type": "header",
+                    "format": FORMAT_NAME,
+                    "version": FORMAT_VERSION,
+                    "root_id": tree.root_id,
+                    "node_count": tree.get_node_count(),
+                }
+            )
+        )
+
+        # Tree.add_node는 부모가 있어야 추가되므로 삽입 순서가 곧 부모 우선 순서
+        count = 0
+        for node in tree.nodes.values():
+            fp.write(
+                _dump(
+                    {
+                        "type": "node",
+                        "id": node.id,
+                        "parent_id": node.parent_id,
+                        "user_question": node.user_question,
+                        "ai_answer": node.ai_answer,
+                        "metadata": node.metadata,
+                        "timestamp": node.timestamp.isoformat(),
+                    }
+                )
+            )
+            count += 1
+
+        for name, node_id in store.checkpoints.items():
+            fp.write(
+                _dump(
+                    {
+                        "type": "checkpoint",
+                        "name": name,
+                        "node_id": node_id,
+                        "path_hash": tree.get_path_hash(node_id),
+                    }
+                )
+            )
+
+        current_node_id = store.active_path_ids[-1]
+        fp.write(_dump({"type": "state", "current_node_id": current_node_id}))
+
+        return count
+
+
+def _read_tree(
+    lines: Iterator[str],
+    header: dict,
+    store: Store,
+    chunk_size: int,
+) -> Tuple[Tree, Dict[str, str], str]:
+    """
+    헤더 다음 레코드들을 읽어 새 트리를 만들고 검증합니다 (import_tree_jsonl 참고).
+
+    Returns:
+        (새 트리, 체크포인트 {이름: 노드ID}, 현재 노드 ID)
+    """
+    tree = Tree(root_id=header["root_id"], content_store=store.content_store)
+    batch: List[Node] = []
+    node_count = 1  # 루트
+    root_record: Optional[dict] = None
+    checkpoints: Dict[str, str] = {}
+    checkpoint_hashes: Dict[str, str] = {}
+    current_node_id = tree.root_id
+
+    # 노드 수만큼 반복되는 루프이므로 전역/속성 조회를 지역 변수로 고정
+    decode = json.JSONDecoder().decode
+    parse_timestamp = datetime.fromisoformat
+
+    for line in lines:
+        if not line.strip():
+            continue
+        record = decode(line)
+        kind = record.get("type")
+
+        if kind == "node":
+            if record["id"] == tree.root_id and root_record is None:
+                root_record = record
+                continue
+            node_count += 1
+            batch.append(
+                Node(
+                    id=record["id"],
+                    parent_id=record["parent_id"],
+                    user_question=record["user_question"],
+                    ai_answer=record["ai_answer"],
+                    metadata=record.get("metadata") or {},
+                    timestamp=parse_timestamp(record["timestamp"]),
+                )
+            )
+            if len(batch) >= chunk_size:
+                tree.add_nodes(batch)
+                batch = []
+        elif kind == "checkpoint":
+            checkpoints[record["name"]] = record["node_id"]
+            if record.get("path_hash"):
+                checkpoint_hashes[record["name"]] = record["path_hash"]
+        elif kind == "state":
+            current_node_id = record["current_node_id"]
+        else:
+            raise ValueError(f"Unknown record type: {kind}")
+
+    if root_record is None:
+        raise ValueError(f"Root node '{tree.root_id}' is missing")
+    expected_count = header.get("node_count")
+    if expected_count is not None and expected_count != node_count:
+        raise ValueError(
+            f"Node count mismatch: header says {expected_count}, found {node_count}"
+        )
+    root = tree.nodes[tree.root_id]
+    root.user_question = root_record["user_question"]
+    root.ai_answer = root_record["ai_answer"]
+    root.metadata = root_record.get("metadata") or {}
+    root.timestamp = parse_timestamp(root_record["timestamp"])
+    tree.add_nodes(batch)
+    nodes = tree.nodes
+
+    for name, node_id in checkpoints.items():
+        if node_id not in nodes:
+            raise ValueError(
+                f"Checkpoint '{name}' points to missing node '{node_id}'"
+            )
+        # 해시는 삽입 시 이미 계산되어 있으므로 체크포인트당 O(1) 비교
+        expected_hash = checkpoint_hashes.get(name)
+        if expected_hash and expected_hash != tree.get_path_hash(node_id):
+            raise ValueError(f"Checkpoint '{name}' failed integrity check")
+    if current_node_id not in nodes:
+        raise ValueError(f"Current node '{current_node_id}' is missing")
+
+    return tree, checkpoints, current_node_id
+
+
+def import_tree_jsonl(
+    fp: Iterable[str],
+    store: Optional[Store] = None,
+    chunk_size: int = IMPORT_CHUNK_SIZE,
+) -> Store:
+    """
+    JSONL로 내보낸 트리를 가져옵니다.
+
+    노드는 읽는 동안 chunk_size개씩 Tree.add_nodes()로 새 트리에 삽입되므로
+    추가 메모리는 파일 크기가 아니라 묶음 크기에 비례합니다. 노드는 내보낸
+    순서처럼 부모가 앞 묶음이나 같은 묶음에 있어야 합니다. 새 트리는 모든
+    검증이 끝난 뒤에만 대상 Store에 반영되므로, 실패하면 대상 Store는
+    변경되지 않습니다 (all-or-nothing).
+
+    Args:
+        fp: JSONL 줄을 내는 입력 스트림 (텍스트 모드 파일 등)
+        store: 가져온 내용으로 교체할 Store (None이면 새로 생성)
+        chunk_size: 한 번에 삽입할 노드 수 (1 이상)
+
+    Returns:
+        가져온 내용이 반영된 Store 객체
+
+    Raises:
+        ValueError: 형식이 잘못되었거나, 노드 수가 헤더와 다르거나, 트리 검증
+            또는 체크포인트 무결성 검증(path_hash)에 실패한 경우
+
+    Example:
+        >>> with open("tree.jsonl", encoding="utf-8") as f:
+        ...     store = import_tree_jsonl(f)
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    if store is None:
+        store = Store()
+
+    lines = iter(fp)
+    try:
+        header = json.loads(next(lines))
+    except StopIteration:
+        raise ValueError("Empty tree export")
+
+    if header.get("type") != "header" or header.get("format") != FORMAT_NAME:
+        raise ValueError("Not a conversation tree export")
+    if header.get("version") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported export version: {header.get('version')}")
+
+    # 가져온 객체는 모두 끝까지 살아남으므로, 순환 GC가 늘어나는 객체를 반복해서
+    # 훑지 않도록 읽는 동안 잠시 끔 (노드 수에 대해 초선형으로 느려지는 것 방지)
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        tree, checkpoints, current_node_id = _read_tree(
+            lines, header, store, chunk_size
+        )
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    store.replace_state(tree, checkpoints, current_node_id)
+
+    return store
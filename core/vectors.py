@@ -0,0 +1,573 @@
+"""
+노드 의미 검색용 로컬 벡터 색인.
+
+이 모듈은 노드의 질문/답변을 임베딩 벡터로 바꿔 행렬에 쌓고, 질의 벡터와의
+내적(정규화된 벡터이므로 코사인 유사도)으로 가까운 노드를 찾습니다.
+
+- 임베딩 함수는 교체할 수 있습니다 (Embedder: 문자열 리스트 → 벡터 리스트).
+  기본값 HashingEmbedder는 외부 모델 없이 토큰을 해싱해 고정 차원 벡터를
+  만드는 결정적 임베더입니다 (같은 입력은 어느 프로세스에서나 같은 벡터).
+- NumPy가 설치되어 있으면 벡터를 NumPy 행렬(float32 또는 float16)에 두고
+  행렬 곱으로 검색합니다. 없으면 같은 기능을 순수 파이썬 리스트로 수행합니다
+  (float16은 NumPy가 있을 때만 적용되고, 없으면 float32 배열로 저장).
+- NumPy가 있을 때 벡터가 ivf_threshold개를 넘으면 k-평균으로 만든 거친
+  양자화기(IVF)를 학습해, 질의와 가까운 n_probe개 클러스터의 벡터만 비교합니다
+  (근사 검색). 학습은 색인 잠금 밖에서 하고 끝나면 결과만 바꿔 끼우므로 그동안
+  검색이 멈추지 않습니다. 순수 파이썬으로는 학습이 너무 느려 IVF를 쓰지 않습니다.
+- 임베딩은 NodeAdded 이벤트로 대기열에 넣어 두고 flush() 또는 백그라운드
+  스레드(start())가 batch_size개씩 묶어 계산합니다. Store 쓰기 잠금 안에서는
+  대기열에 넣기만 하므로 턴 추가가 임베딩 때문에 느려지지 않습니다.
+"""
+
+import hashlib
+import heapq
+import math
+import random
+import threading
+from array import array
+from functools import lru_cache
+from itertools import islice
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from core.events import NodeAdded, NodeRemoved, Reset, StoreEvent
+from core.search import tokenize
+
+try:
+    import numpy as np
+except ImportError:  # NumPy 없이도 리스트 기반으로 동작
+    np = None
+
+if TYPE_CHECKING:
+    from core.models import Node, Tree
+    from core.store import Store
+
+# 문자열 리스트를 받아 같은 길이의 벡터 리스트를 반환하는 임베딩 함수
+Embedder = Callable[[List[str]], Sequence[Sequence[float]]]
+
+# 전체 검색 시 한 번에 float32로 바꿔 곱하는 행 수 (float16 행렬의 임시 메모리 제한)
+_CHUNK_ROWS = 65536
+# IVF 학습에 쓰는 클러스터당 표본 수와 k-평균 반복 횟수
+_SAMPLES_PER_LIST = 32
+_KMEANS_ITERATIONS = 5
+
+
+@lru_cache(maxsize=65536)
+def _token_bucket(token: str, dim: int) -> Tuple[int, float]:
+    digest = hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest()
+    value = int.from_bytes(digest, "little")
+    # 부호도 해시로 정해 서로 다른 토큰의 충돌이 평균적으로 상쇄되게 함
+    return value % dim, 1.0 if value >> 63 else -1.0
+
+
+class HashingEmbedder:
+    """
+    토큰 해싱 기반 결정적 임베더 (feature hashing).
+
+    core.search.tokenize로 나눈 토큰을 blake2b로 해싱해 dim차원 중 한 칸에
+    ±1을 더하고 L2 정규화합니다. 의미를 학습하지는 않지만 단어(한글은 2음절)
+    겹침을 코사인 유사도로 반영하며, 외부 모델이나 네트워크가 필요 없습니다.
+
+    Example:
+        >>> embed = HashingEmbedder(dim=256)
+        >>> vectors = embed(["파이썬 리스트", "python list"])
+        >>> len(vectors[0])
+        256
+    """
+
+    def __init__(self, dim: int = 256):
+        """
+        Args:
+            dim: 벡터 차원
+        """
+        if dim < 1:
+            raise ValueError(f"dim은 1 이상이어야 합니다: {dim}")
+        self.dim = dim
+
+    def __call__(self, texts: List[str]) -> List[List[float]]:
+        """여러 본문을 한 번에 임베딩합니다."""
+        return [self.embed(text) for text in texts]
+
+    def embed(self, text: str) -> List[float]:
+        """
+        본문 하나를 임베딩합니다.
+
+        Args:
+            text: 본문
+
+        Returns:
+            L2 정규화된 dim차원 벡터 (토큰이 없으면 영벡터)
+        """
+        dim = self.dim
+        vector = [0.0] * dim
+        for token in tokenize(text):
+            bucket, sign = _token_bucket(token, dim)
+            vector[bucket] += sign
+        norm = math.sqrt(sum(x * x for x in vector))
+        if norm:
+            vector = [x / norm for x in vector]
+        return vector
+
+
+class VectorHit(NamedTuple):
+    """
+    벡터 검색 결과 한 건.
+
+    Attributes:
+        node_id: 노드 ID
+        score: 코사인 유사도 (-1 ~ 1, 클수록 가까움)
+    """
+
+    node_id: str
+    score: float
+
+
+class _Matrix:
+    """행 단위로 늘어나는 벡터 행렬 (NumPy 행렬 또는 float 배열 리스트)."""
+
+    def __init__(self, dim: int, dtype: str = "float32"):
+        self.dim = dim
+        self._size = 0
+        if np is not None:
+            self._data = np.zeros((16, dim), dtype=dtype)
+        else:
+            self._rows: List[array] = []
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, vector: Sequence[float]) -> int:
+        row = self._size
+        if np is not None:
+            if row == len(self._data):
+                grown = np.zeros((row * 2, self.dim), dtype=self._data.dtype)
+                grown[:row] = self._data
+                self._data = grown
+            self._data[row] = vector
+        else:
+            self._rows.append(array("f", vector))
+        self._size += 1
+        return row
+
+    def row(self, index: int):
+        if np is not None:
+            return self._data[index].astype(np.float32)
+        return self._rows[index]
+
+    def set_row(self, index: int, vector: Sequence[float]):
+        if np is not None:
+            self._data[index] = vector
+        else:
+            self._rows[index] = array("f", vector)
+
+    def top(
+        self, query: Sequence[float], k: int, rows: Optional[Sequence[int]] = None
+    ) -> List[Tuple[int, float]]:
+        """query와 내적이 큰 행 k개를 (행 번호, 점수)로 반환합니다."""
+        if np is None:
+            candidates = range(self._size) if rows is None else rows
+            scored = ((row, _dot(self._rows[row], query)) for row in candidates)
+            return heapq.nlargest(k, scored, key=lambda item: item[1])
+
+        q = np.asarray(query, dtype=np.float32)
+        if rows is None:
+            index = None
+            scores = np.empty(self._size, dtype=np.float32)
+            for start in range(0, self._size, _CHUNK_ROWS):
+                block = self._data[start : start + _CHUNK_ROWS]
+                end = min(start + _CHUNK_ROWS, self._size)
+                scores[start:end] = block[: end - start].astype(np.float32) @ q
+        else:
+            index = np.asarray(rows, dtype=np.int64)
+            scores = self._data[index].astype(np.float32) @ q
+        k = min(k, len(scores))
+        if k <= 0:
+            return []
+        best = np.argpartition(-scores, k - 1)[:k]
+        best = best[np.argsort(-scores[best])]
+        ids = best if index is None else index[best]
+        return [(int(row), float(scores[i])) for row, i in zip(ids, best)]
+
+    def nearest(self, centroids: "_Matrix", stop: Optional[int] = None) -> List[int]:
+        """앞쪽 stop개(None이면 전체) 각 행과 내적이 가장 큰 centroids 행 번호."""
+        stop = self._size if stop is None else stop
+        if np is None:
+            return [centroids.top(row, 1)[0][0] for row in self._rows[:stop]]
+        labels: List[int] = []
+        centers = centroids._data[: len(centroids)].astype(np.float32)
+        for start in range(0, stop, _CHUNK_ROWS):
+            end = min(start + _CHUNK_ROWS, stop)
+            block = self._data[start:end].astype(np.float32)
+            labels.extend((block @ centers.T).argmax(axis=1).tolist())
+        return labels
+
+
+def _dot(a: Sequence[float], b: Sequence[float]) -> float:
+    return sum(x * y for x, y in zip(a, b))
+
+
+def _normalized_mean(vectors: List[Sequence[float]]) -> List[float]:
+    dim = len(vectors[0])
+    total = [0.0] * dim
+    for vector in vectors:
+        for i, x in enumerate(vector):
+            total[i] += x
+    norm = math.sqrt(sum(x * x for x in total))
+    return [x / norm for x in total] if norm else total
+
+
+def _node_text(node: "Node") -> str:
+    return f"{node.user_question}\n{node.ai_answer}"
+
+
+class VectorIndex:
+    """
+    노드 임베딩 행렬과 top-k 유사도 검색.
+
+    행 번호 → 노드 ID 표로 관리하며, 실행 취소로 제거된 노드의 행은 비워 두고
+    검색에서 건너뜁니다. 검색과 행 추가는 색인 자체 잠금으로 보호됩니다.
+
+    Example:
+        >>> index = VectorIndex(store)
+        >>> index.start()  # 백그라운드 임베딩
+        >>> index.flush()  # 또는 직접 대기열 처리
+        >>> index.similar_to(node_id, k=5)
+        [VectorHit(node_id='...', score=0.71...), ...]
+    """
+
+    def __init__(
+        self,
+        store: "Store",
+        embedder: Optional[Embedder] = None,
+        dtype: str = "float32",
+        batch_size: int = 64,
+        ivf_threshold: int = 100_000,
+        n_lists: Optional[int] = None,
+        n_probe: int = 8,
+    ):
+        """
+        색인을 만들고 store의 노드 이벤트를 구독합니다.
+
+        현재 트리의 노드는 모두 임베딩 대기열에 들어가며, flush()나
+        백그라운드 스레드가 처리하기 전까지는 검색되지 않습니다.
+
+        Args:
+            store: 대상 Store
+            embedder: 임베딩 함수 (None이면 HashingEmbedder())
+            dtype: 행렬 자료형 "float32" 또는 "float16" (NumPy가 있을 때 적용)
+            batch_size: 한 번에 임베딩할 노드 수
+            ivf_threshold: 벡터 수가 이 값을 넘으면 IVF 양자화기를 학습
+                (NumPy가 없으면 무시하고 항상 전체 비교)
+            n_lists: IVF 클러스터 수 (None이면 √벡터 수)
+            n_probe: IVF 검색 시 비교할 클러스터 수
+
+        Raises:
+            ValueError: dtype이 지원하지 않는 값인 경우
+        """
+        if dtype not in ("float32", "float16"):
+            raise ValueError(f"Unsupported dtype: {dtype}")
+        self.store = store
+        if embedder is None:
+            embedder = HashingEmbedder()
+        self.embedder: Embedder = embedder
+        self.dtype = dtype
+        self.batch_size = batch_size
+        self.ivf_threshold = ivf_threshold
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        self._lock = threading.Lock()
+        self._pending: Dict[str, None] = {}  # 임베딩 대기 노드 (추가된 순)
+        self._wakeup = threading.Event()
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+        self._training = False  # IVF 학습 중 (잠금 밖에서 진행)
+        self._reset(store.tree)
+        store.events.subscribe(self._on_event, NodeAdded, NodeRemoved, Reset)
+
+    @property
+    def pending_count(self) -> int:
+        """임베딩을 기다리는 노드 수."""
+        return len(self._pending)
+
+    @property
+    def uses_ivf(self) -> bool:
+        """IVF 양자화기로 근사 검색 중인지 여부."""
+        return self._centroids is not None
+
+    def __len__(self) -> int:
+        """임베딩된(검색 가능한) 노드 수."""
+        return len(self._rows)
+
+    # ==================== 임베딩 ====================
+
+    def flush(self, limit: Optional[int] = None) -> int:
+        """
+        대기 중인 노드를 batch_size개씩 임베딩해 행렬에 추가합니다.
+
+        임베딩 함수는 잠금 밖에서 호출되므로 그동안에도 검색할 수 있습니다.
+
+        Args:
+            limit: 최대 처리 노드 수 (None이면 전부)
+
+        Returns:
+            처리한 노드 수
+        """
+        done = 0
+        while limit is None or done < limit:
+            size = self.batch_size
+            if limit is not None:
+                size = min(size, limit - done)
+            with self._lock:
+                batch = list(islice(self._pending, size))
+                for node_id in batch:
+                    del self._pending[node_id]
+                tree = self._tree
+            if not batch:
+                break
+
+            nodes = [node for node in map(tree.get_node, batch) if node is not None]
+            texts = [_node_text(node) for node in nodes]
+            vectors = self.embedder(texts) if texts else ()
+            with self._lock:
+                # 그 사이 트리가 교체됐거나 실행 취소된 노드는 버림
+                if tree is self._tree:
+                    for node, vector in zip(nodes, vectors):
+                        if tree.node_exists(node.id):
+                            self._append(node.id, vector)
+            self._maybe_train()
+            done += len(batch)
+        return done
+
+    def start(self, interval: float = 0.5):
+        """
+        백그라운드 임베딩 스레드를 시작합니다 (이미 실행 중이면 무시).
+
+        Args:
+            interval: 대기열이 비었을 때 다시 확인하는 간격 (초)
+        """
+        if self._thread is not None:
+            return
+        self._stopping = False
+        self._thread = threading.Thread(
+            target=self._run, args=(interval,), name="vector-indexer", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        """
+        백그라운드 임베딩 스레드를 멈춥니다.
+
+        Args:
+            timeout: 스레드 종료를 기다릴 최대 시간 (초, None이면 무한)
+        """
+        if self._thread is None:
+            return
+        self._stopping = True
+        self._wakeup.set()
+        self._thread.join(timeout)
+        self._thread = None
+
+    def _run(self, interval: float):
+        while not self._stopping:
+            self._wakeup.wait(interval)
+            self._wakeup.clear()
+            while self._pending and not self._stopping:
+                self.flush(self.batch_size)
+
+    # ==================== 검색 ====================
+
+    def search(
+        self, text: str, k: int = 10, exclude: Optional[Set[str]] = None
+    ) -> List[VectorHit]:
+        """
+        본문과 의미가 가까운 노드를 찾습니다.
+
+        Args:
+            text: 질의 본문
+            k: 최대 결과 수
+            exclude: 결과에서 뺄 노드 ID 집합
+
+        Returns:
+            VectorHit 리스트 (유사도 내림차순)
+        """
+        vector = self.embedder([text])[0]
+        return self.search_vector(vector, k, exclude)
+
+    def similar_to(self, node_id: str, k: int = 10) -> List[VectorHit]:
+        """
+        노드와 의미가 가까운 다른 노드를 찾습니다.
+
+        Args:
+            node_id: 기준 노드 ID
+            k: 최대 결과 수
+
+        Returns:
+            VectorHit 리스트 (자기 자신 제외, 유사도 내림차순)
+
+        Raises:
+            ValueError: 노드가 트리에 없는 경우
+        """
+        node = self.store.tree.get_node(node_id)
+        if node is None:
+            raise ValueError(f"Node '{node_id}' not found")
+        with self._lock:
+            row = self._rows.get(node_id)
+            vector = self._matrix.row(row) if row is not None else None
+        if vector is None:
+            vector = self.embedder([_node_text(node)])[0]
+        return self.search_vector(vector, k, {node_id})
+
+    def search_vector(
+        self,
+        vector: Sequence[float],
+        k: int = 10,
+        exclude: Optional[Set[str]] = None,
+    ) -> List[VectorHit]:
+        """
+        벡터와 내적이 큰 노드를 찾습니다 (IVF 학습 후에는 근사 검색).
+
+        Args:
+            vector: 질의 벡터 (임베딩 함수와 같은 차원)
+            k: 최대 결과 수
+            exclude: 결과에서 뺄 노드 ID 집합
+
+        Returns:
+            VectorHit 리스트 (유사도 내림차순)
+
+        Raises:
+            ValueError: k가 1보다 작은 경우
+        """
+        if k < 1:
+            raise ValueError(f"k는 1 이상이어야 합니다: {k}")
+        exclude = exclude or set()
+        with self._lock:
+            if self._matrix is None:
+                return []
+            rows = None
+            if self._centroids is not None:
+                probes = self._centroids.top(vector, self.n_probe)
+                rows = [row for cluster, _ in probes for row in self._lists[cluster]]
+            # 비운 행과 제외 대상이 결과를 밀어내지 않도록 그만큼 더 가져옴
+            fetch = k + self._removed + len(exclude)
+            hits = []
+            for row, score in self._matrix.top(vector, fetch, rows):
+                node_id = self._row_ids[row]
+                if node_id is None or node_id in exclude:
+                    continue
+                hits.append(VectorHit(node_id, score))
+                if len(hits) == k:
+                    break
+            return hits
+
+    # ==================== 내부 ====================
+
+    def _reset(self, tree: "Tree"):
+        with self._lock:
+            self._tree = tree
+            self._matrix: Optional[_Matrix] = None  # 첫 벡터의 차원으로 생성
+            self._row_ids: List[Optional[str]] = []  # 행 번호 → 노드 ID
+            self._rows: Dict[str, int] = {}  # 노드 ID → 행 번호
+            self._removed = 0  # 비운 행 수
+            self._centroids: Optional[_Matrix] = None
+            self._lists: List[List[int]] = []  # 클러스터 → 행 번호
+            self._pending.clear()
+            self._enqueue_missing()
+
+    def _enqueue_missing(self):
+        root_id = self._tree.root_id
+        for node_id in self._tree.nodes:
+            if node_id != root_id and node_id not in self._rows:
+                self._pending[node_id] = None
+        if self._pending:
+            self._wakeup.set()
+
+    def _append(self, node_id: str, vector: Sequence[float]):
+        if node_id in self._rows:
+            return
+        if self._matrix is None:
+            self._matrix = _Matrix(len(vector), self.dtype)
+        row = self._matrix.append(vector)
+        self._row_ids.append(node_id)
+        self._rows[node_id] = row
+        if self._centroids is not None:
+            cluster = self._centroids.top(vector, 1)[0][0]
+            self._lists[cluster].append(row)
+
+    def _maybe_train(self):
+        # 잠금 안에서는 표본만 복사하고, k-평균과 전체 행 배정은 잠금 밖에서 함
+        with self._lock:
+            if (
+                np is None
+                or self._training
+                or self._centroids is not None
+                or len(self._rows) <= self.ivf_threshold
+            ):
+                return
+            self._training = True
+            matrix = self._matrix
+            size = len(matrix)
+            live = [row for row in range(size) if self._row_ids[row] is not None]
+            n_lists = self.n_lists or max(1, int(math.sqrt(len(live))))
+            rng = random.Random(0)
+            sample_rows = rng.sample(live, min(len(live), n_lists * _SAMPLES_PER_LIST))
+            sample = _Matrix(matrix.dim)
+            for row in sample_rows:
+                sample.append(matrix.row(row))
+
+        try:
+            # 구면 k-평균: 표본 앞쪽 n_lists개로 시작해 몇 번만 반복
+            centroids = _Matrix(matrix.dim)
+            for row in range(min(n_lists, len(sample))):
+                centroids.append(sample.row(row))
+            for _ in range(_KMEANS_ITERATIONS):
+                members: Dict[int, List[Sequence[float]]] = {}
+                for row, cluster in enumerate(sample.nearest(centroids)):
+                    members.setdefault(cluster, []).append(sample.row(row))
+                for cluster, vectors in members.items():
+                    centroids.set_row(cluster, _normalized_mean(vectors))
+            # 앞쪽 size개 행은 이후 바뀌지 않으므로 잠금 없이 배정
+            labels = matrix.nearest(centroids, size)
+        finally:
+            with self._lock:
+                self._training = False
+
+        with self._lock:
+            if self._matrix is not matrix:
+                return  # 학습 중 트리가 교체됨
+            lists: List[List[int]] = [[] for _ in range(len(centroids))]
+            for row, cluster in enumerate(labels):
+                if self._row_ids[row] is not None:
+                    lists[cluster].append(row)
+            # 학습 중 추가된 행은 하나씩 배정
+            for row in range(size, len(matrix)):
+                if self._row_ids[row] is not None:
+                    lists[centroids.top(matrix.row(row), 1)[0][0]].append(row)
+            self._lists = lists
+            self._centroids = centroids
+
+    def _on_event(self, event: StoreEvent):
+        tree = self.store.tree
+        if tree is not self._tree:
+            self._reset(tree)  # 가져오기, reset 등으로 트리가 교체됨
+            return
+        with self._lock:
+            if isinstance(event, NodeAdded):
+                self._pending[event.node_id] = None
+                self._wakeup.set()
+            elif isinstance(event, NodeRemoved):
+                self._pending.pop(event.node_id, None)
+                row = self._rows.pop(event.node_id, None)
+                if row is not None:
+                    self._row_ids[row] = None
+                    self._removed += 1
+            elif isinstance(event, Reset):
+                self._enqueue_missing()  # 병합 등으로 같은 트리에 노드가 늘어남
@@ -0,0 +1,137 @@
+"""
+async_api 모듈(asyncio 인터페이스) 테스트.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from core.async_api import AsyncConversationManager, AsyncStore
+from core.concurrency import VersionConflictError
+from core.conversation import ConversationManager
+from core.session import SessionManager
+
+
+class FakeAIClient:
+    """고정 지연 후 답변하는 블로킹 가짜 AI 클라이언트."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.contexts = []
+        self._lock = threading.Lock()
+
+    def ask(self, question, system_prompt=None):
+        time.sleep(self.latency)
+        return f"답변: {question}"
+
+    def ask_with_context(self, question, context, system_prompt=None):
+        with self._lock:
+            self.contexts.append(context)
+        return self.ask(question, system_prompt)
+
+
+class TestAsyncStore:
+    """AsyncStore 테스트."""
+
+    def test_add_and_switch(self):
+        """비동기 추가/전환/체크포인트 확인."""
+
+        async def scenario():
+            store = AsyncStore()
+            node = await store.add_node("Q?", "A.")
+            assert await store.save_checkpoint("cp")
+            delta = await store.switch("root")
+            assert delta.removed_ids == [node.id]
+            assert await store.load_checkpoint("cp")
+            path = await store.get_active_path()
+            return node, path, store.get_version()
+
+        node, path, version = asyncio.run(scenario())
+
+        assert [n.id for n in path] == ["root", node.id]
+        assert version == 4
+
+    def test_stale_version_rejected(self):
+        """비동기 경로에서도 버전 충돌이 전달되는지 확인."""
+
+        async def scenario():
+            store = AsyncStore()
+            version = store.get_version()
+            await store.add_node("Q?", "A.", expected_version=version)
+            await store.switch("root", expected_version=version)
+
+        with pytest.raises(VersionConflictError):
+            asyncio.run(scenario())
+
+
+class TestAsyncConversation:
+    """AsyncConversationManager 테스트."""
+
+    def test_ask_uses_context(self):
+        """ask가 이전 맥락과 함께 질문하고 노드를 만드는지 확인."""
+        ai = FakeAIClient()
+
+        async def scenario():
+            conv = AsyncConversationManager(ai_client=ai)
+            first = await conv.ask("Python이 뭐야?")
+            second = await conv.ask("특징은?")
+            return first, second
+
+        first, second = asyncio.run(scenario())
+
+        assert first.ai_answer == "답변: Python이 뭐야?"
+        assert second.parent_id == first.id
+        assert "Python이 뭐야?" in ai.contexts[0]
+
+    def test_same_conversation_serialised(self):
+        """같은 대화의 동시 질문이 순서대로 한 줄로 이어지는지 확인."""
+        ai = FakeAIClient(latency=0.01)
+
+        async def scenario():
+            conv = AsyncConversationManager(ai_client=ai)
+            await asyncio.gather(*(conv.ask(f"Q{i}?") for i in range(5)))
+            return conv.manager.store
+
+        store = asyncio.run(scenario())
+
+        # 분기 없이 깊이 5의 한 줄 경로
+        assert len(store.active_path_ids) == 6
+        assert store.tree.get_node_count() == 6
+
+    def test_throughput_scales_with_concurrency(self):
+        """세션 수를 늘리면 처리량이 함께 늘어나는지 확인."""
+        latency = 0.02
+        asks_per_session = 3
+
+        async def run_sessions(count: int, executor) -> float:
+            manager = SessionManager()
+            convs = [
+                AsyncConversationManager(
+                    ConversationManager(manager.open_session(f"user-{i}")),
+                    ai_client=FakeAIClient(latency),
+                    executor=executor,
+                )
+                for i in range(count)
+            ]
+
+            async def session_loop(conv):
+                for j in range(asks_per_session):
+                    await conv.ask(f"질문 {j}?")
+
+            start = time.perf_counter()
+            await asyncio.gather(*(session_loop(conv) for conv in convs))
+            elapsed = time.perf_counter() - start
+            return count * asks_per_session / elapsed
+
+        async def scenario(executor):
+            single = await run_sessions(1, executor)
+            many = await run_sessions(64, executor)
+            return single, many
+
+        with ThreadPoolExecutor(max_workers=64) as executor:
+            single, many = asyncio.run(scenario(executor))
+
+        assert many > single * 8
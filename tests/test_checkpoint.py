@@ -2,18 +2,27 @@
 checkpoint 모듈 테스트.
 """
 
+import time
+from datetime import datetime, timedelta
+
 import pytest
 
 from core.checkpoint import (
+    CheckpointCompactor,
+    RetentionPolicy,
+    export_checkpoints,
     find_checkpoint_by_node,
     get_checkpoint_info,
     get_checkpoint_stats,
+    has_same_history,
+    import_checkpoints,
     list_checkpoints_detailed,
+    plan_retention,
     rename_checkpoint,
     suggest_checkpoint_name,
     validate_checkpoint_name,
 )
-from core.models import create_node
+from core.models import Node, create_node
 from core.store import Store
 
 
@@ -203,3 +212,190 @@ class TestRenameCheckpoint:
 
         assert success is False
         assert "이미 존재합니다" in error
+
+
+class TestPathHashCheckpoints:
+    """경로 해시 기반 이력 비교와 가져오기 검증 테스트."""
+
+    def test_has_same_history(self):
+        """내용이 같은 이력이면 다른 노드라도 같다고 판단하는지 확인."""
+        store = Store()
+        store.add_node("Q1?", "A1.")
+        store.save_checkpoint("first")
+        store.switch_to_node("root")
+        store.add_node("Q1?", "A1.")
+        store.save_checkpoint("retry")
+        store.add_node("Q2?", "A2.")
+        store.save_checkpoint("deeper")
+
+        assert has_same_history(store, "first", "retry")
+        assert not has_same_history(store, "first", "deeper")
+        assert not has_same_history(store, "first", "missing")
+
+    def test_import_rejects_different_history(self):
+        """같은 노드 ID라도 이력이 다르면 가져오지 않는지 확인."""
+        store = Store()
+        node = store.add_node("Q?", "A.")
+        store.save_checkpoint("cp")
+        data = export_checkpoints(store)
+
+        target = Store()
+        target.tree.add_node(create_node("root", "다른 질문?", "A.", node_id=node.id))
+        same = Store()
+        same.tree.add_node(create_node("root", "Q?", "A.", node_id=node.id))
+
+        assert import_checkpoints(target, data) == (0, ["cp"])
+        assert import_checkpoints(same, data) == (1, [])
+
+
+def _branching_store(count: int) -> Store:
+    """두 최상위 서브트리(a, b)에 번갈아 자동 체크포인트를 만든 Store."""
+    store = Store()
+    a = store.add_node("A?", "A.")
+    store.switch_to_node("root")
+    b = store.add_node("B?", "B.")
+    for i in range(count):
+        store.switch_to_node(a.id if i % 2 == 0 else b.id)
+        store.add_node(f"Q{i}?", f"A{i}.")
+        store.save_checkpoint(f"@branch_{i:04d}")
+    return store
+
+
+class TestRetentionPolicy:
+    """자동 체크포인트 보존 정책 테스트."""
+
+    def test_invalid_policy(self):
+        """잘못된 정책 값은 ValueError."""
+        with pytest.raises(ValueError):
+            RetentionPolicy(keep_recent=-1)
+        with pytest.raises(ValueError):
+            RetentionPolicy(group_by="week")
+
+    def test_keep_recent_and_one_per_subtree(self):
+        """최근 N개와 서브트리별 대표 하나만 남기고 수동 체크포인트는 고정되는지 확인."""
+        store = _branching_store(10)
+        store.save_checkpoint("manual", node_id="root")
+        policy = RetentionPolicy(keep_recent=3, group_by="subtree")
+
+        doomed = plan_retention(store, policy)
+
+        # 최근 3개(7, 8, 9) + 그 이전의 서브트리별 최신(a: 6, b: 5)만 남음
+        kept = sorted(set(store.list_checkpoints()) - set(doomed))
+        assert kept == [
+            "@branch_0005",
+            "@branch_0006",
+            "@branch_0007",
+            "@branch_0008",
+            "@branch_0009",
+            "manual",
+        ]
+
+    def test_one_per_day(self):
+        """오래된 자동 체크포인트는 날짜별로 가장 최근 것만 남는지 확인."""
+        store = Store()
+        start = datetime(2024, 1, 1, 9)
+        for i in range(6):
+            node = Node(
+                id=f"n{i}",
+                parent_id="root",
+                user_question="Q?",
+                ai_answer="A.",
+                timestamp=start + timedelta(days=i // 2, hours=i),
+            )
+            store.tree.add_node(node)
+            store.save_checkpoint(f"@branch_{i}", node_id=node.id)
+
+        doomed = plan_retention(store, RetentionPolicy(keep_recent=1))
+
+        assert doomed == ["@branch_0", "@branch_2"]
+
+    def test_subtree_key_uses_depth_index(self):
+        """서브트리 키를 경로 전체를 만들지 않고 깊이 색인으로 찾는지 확인."""
+        store = Store()
+        nodes = [store.add_node(f"Q{i}", f"A{i}") for i in range(200)]
+        store.switch_to_node(nodes[99].id)
+        side = store.add_node("옆 질문", "옆 답변")
+        store.tree.get_path_to_root = None  # 호출되면 실패
+        policy = RetentionPolicy(group_by="subtree", subtree_depth=2)
+
+        path_ids = store.active_path_ids
+        assert policy.group_key(store.tree, side.id, path_ids) == nodes[1].id
+        assert policy.group_key(store.tree, nodes[150].id, path_ids) == nodes[1].id
+        assert policy.group_key(store.tree, nodes[150].id) == nodes[1].id
+        assert policy.group_key(store.tree, nodes[0].id, path_ids) == nodes[0].id
+        assert policy.group_key(store.tree, "root") == "root"
+        assert policy.group_key(store.tree, "missing") is None
+
+
+class TestCheckpointCompactor:
+    """점진적 체크포인트 정리기 테스트."""
+
+    def test_incremental_matches_plan(self):
+        """이벤트로 고른 삭제 대상이 일괄 계산 결과와 같은지 확인."""
+        store = Store()
+        policy = RetentionPolicy(keep_recent=3, group_by="subtree")
+        compactor = CheckpointCompactor(store, policy)
+        reference = _branching_store(10)
+
+        # 같은 작업을 compactor가 붙은 store에서 재현
+        a = store.add_node("A?", "A.")
+        store.switch_to_node("root")
+        b = store.add_node("B?", "B.")
+        for i in range(10):
+            store.switch_to_node(a.id if i % 2 == 0 else b.id)
+            store.add_node(f"Q{i}?", f"A{i}.")
+            store.save_checkpoint(f"@branch_{i:04d}")
+
+        assert compactor.pending_count == len(plan_retention(reference, policy))
+        undo_depth = len(store.journal)
+
+        removed = compactor.compact()
+
+        assert removed == 5
+        assert compactor.pending_count == 0
+        assert sorted(store.list_checkpoints()) == sorted(
+            set(reference.list_checkpoints()) - set(plan_retention(reference, policy))
+        )
+        assert len(store.journal) == undo_depth  # 정리는 기록되지 않음
+
+    def test_deleted_and_renamed_are_untracked(self):
+        """사용자가 지우거나 수동 이름으로 바꾼 체크포인트는 정리 대상에서 빠지는지 확인."""
+        store = Store()
+        compactor = CheckpointCompactor(store, RetentionPolicy(keep_recent=0))
+        store.add_node("Q?", "A.")
+        store.save_checkpoint("@branch_1")
+        store.save_checkpoint("@branch_2")
+        store.save_checkpoint("@branch_3")
+        assert compactor.pending_count == 2
+
+        store.delete_checkpoint("@branch_1")
+        store.rename_checkpoint("@branch_2", "keep-me")
+
+        assert compactor.pending_count == 0
+        assert compactor.compact() == 0
+        assert sorted(store.list_checkpoints()) == ["@branch_3", "keep-me"]
+
+    def test_background_compaction(self):
+        """백그라운드 스레드가 삭제 대상을 정리하는지 확인."""
+        store = Store()
+        compactor = CheckpointCompactor(
+            store, RetentionPolicy(keep_recent=2), batch_size=3
+        )
+        compactor.start(interval=0.01)
+        try:
+            store.add_node("Q?", "A.")
+            for i in range(20):
+                store.save_checkpoint(f"@branch_{i:02d}")
+
+            deadline = time.monotonic() + 5
+            while len(store.list_checkpoints()) > 3 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            compactor.stop()
+
+        # 같은 날짜이므로 최근 2개 + 그 이전 대표 1개
+        assert sorted(store.list_checkpoints()) == [
+            "@branch_17",
+            "@branch_18",
+            "@branch_19",
+        ]
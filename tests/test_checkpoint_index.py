@@ -0,0 +1,140 @@
+"""
+checkpoint_index 모듈(노드 → 체크포인트 이름 역색인) 테스트.
+"""
+
+from cli.visualizer import visualize_tree
+from core.checkpoint import (
+    AUTO_CHECKPOINT_PREFIX,
+    find_checkpoint_by_node,
+    list_checkpoints_detailed,
+)
+from core.store import Store
+
+
+class TestCheckpointIndex:
+    """CheckpointIndex 테스트."""
+
+    def test_multiple_names_per_node(self):
+        """한 노드의 여러 이름이 저장 순서대로 조회되는지 확인."""
+        store = Store()
+        node = store.add_node("Q", "A")
+        store.save_checkpoint("first")
+        store.save_checkpoint("second")
+        store.save_checkpoint("root-cp", node_id="root")
+
+        assert store.get_checkpoint_names(node.id) == ["first", "second"]
+        assert store.get_checkpoint_names("root") == ["root-cp"]
+        assert store.get_checkpoint_names("missing") == []
+        assert find_checkpoint_by_node(store, node.id) == "first"
+
+    def test_delete_and_rename(self):
+        """삭제와 이름 변경이 색인에 반영되는지 확인."""
+        store = Store()
+        node = store.add_node("Q", "A")
+        store.save_checkpoint("a")
+        store.save_checkpoint("b")
+
+        store.rename_checkpoint("a", "c")
+        assert store.get_checkpoint_names(node.id) == ["b", "c"]
+
+        store.delete_checkpoint("b")
+        store.delete_checkpoint("c")
+        assert store.get_checkpoint_names(node.id) == []
+        assert len(store.checkpoint_index) == 0
+
+    def test_undo_redo_and_reset(self):
+        """실행 취소/다시 실행과 reset 후에도 색인이 일치하는지 확인."""
+        store = Store()
+        node = store.add_node("Q", "A")
+        store.save_checkpoint("cp")
+        store.rename_checkpoint("cp", "renamed")
+
+        store.undo()
+        assert store.get_checkpoint_names(node.id) == ["cp"]
+        store.undo()
+        assert store.get_checkpoint_names(node.id) == []
+        store.redo()
+        assert store.get_checkpoint_names(node.id) == ["cp"]
+
+        store.reset()
+        assert len(store.checkpoint_index) == 0
+
+    def test_fork_and_merge(self):
+        """분기 Store가 독립된 색인을 갖고 병합 후 다시 맞춰지는지 확인."""
+        store = Store()
+        node = store.add_node("Q", "A")
+        store.save_checkpoint("base")
+
+        child = store.fork()
+        assert child.get_checkpoint_names(node.id) == ["base"]
+        child.save_checkpoint("what-if")
+        assert store.get_checkpoint_names(node.id) == ["base"]
+
+        store.merge(child)
+        assert store.get_checkpoint_names(node.id) == ["base", "what-if"]
+
+    def test_snapshots_are_deduplicated(self):
+        """같은 이력의 체크포인트가 스냅샷 하나를 공유하고 참조가 없으면 버리는지 확인."""
+        store = Store()
+        a = store.add_node("Q1", "A1")
+        b = store.add_node("Q2", "A2")
+        store.save_checkpoint("deep")
+        store.save_checkpoint("deep-again")
+        store.save_checkpoint("shallow", node_id=a.id)
+        index = store.checkpoint_index
+
+        snapshot = store.get_checkpoint_snapshot("deep")
+        assert snapshot.path_ids == ("root", a.id, b.id)
+        assert snapshot.hash == store.tree.get_path_hash(b.id)
+        assert snapshot.depth == 2
+        assert store.get_checkpoint_snapshot("deep-again") is snapshot
+        assert index.snapshot_count == 2
+
+        store.rename_checkpoint("deep", "renamed")
+        store.delete_checkpoint("deep-again")
+        assert store.get_checkpoint_snapshot("renamed") is snapshot
+        store.delete_checkpoint("renamed")
+        assert index.snapshot_count == 1
+        assert store.get_checkpoint_snapshot("renamed") is None
+
+    def test_visualize_tree_shows_all_names(self):
+        """트리 시각화가 한 노드의 모든 체크포인트 이름을 표시하는지 확인."""
+        store = Store()
+        store.add_node("Q", "A")
+        store.save_checkpoint("one")
+        store.save_checkpoint("two")
+
+        assert "📌one, two" in visualize_tree(store)
+        assert "📌" not in visualize_tree(store, show_checkpoints=False)
+
+    def test_checkpoint_pages(self):
+        """체크포인트 목록이 이름순 페이지로 나뉘고 변경이 반영되는지 확인."""
+        store = Store()
+        node = store.add_node("Q", "A")
+        for name in ["delta", "alpha", "charlie"]:
+            store.save_checkpoint(name)
+        store.save_checkpoint(f"{AUTO_CHECKPOINT_PREFIX}x", node_id="root")
+        store.rename_checkpoint("delta", "bravo")
+
+        first = store.list_checkpoints_page(limit=2)
+        auto_name = f"{AUTO_CHECKPOINT_PREFIX}x"
+        assert first.items == [(auto_name, "root"), ("alpha", node.id)]
+        rest = store.list_checkpoints_page(after=first.next_cursor, limit=2)
+        assert [name for name, _ in rest.items] == ["bravo", "charlie"]
+        assert rest.next_cursor is None
+
+        # 자동 체크포인트 구간만 / 구간 제외
+        auto = store.list_checkpoints_page(prefix=AUTO_CHECKPOINT_PREFIX)
+        assert [name for name, _ in auto.items] == [f"{AUTO_CHECKPOINT_PREFIX}x"]
+        manual = store.list_checkpoints_page(
+            limit=1, exclude_prefix=AUTO_CHECKPOINT_PREFIX
+        )
+        assert manual.items == [("alpha", node.id)]
+        assert store.count_checkpoints() == 4
+        assert store.count_checkpoints(AUTO_CHECKPOINT_PREFIX) == 1
+
+        store.delete_checkpoint("bravo")
+        names = [cp["name"] for cp in list_checkpoints_detailed(store, after="alpha")]
+        assert names == ["charlie"]
+        store.reset()
+        assert store.list_checkpoints_page().items == []
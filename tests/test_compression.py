@@ -0,0 +1,171 @@
+"""
+compression 모듈(cold 답변 압축) 테스트.
+"""
+
+import threading
+import time
+
+import pytest
+
+from core.compression import CompressedTextStore, build_zdict
+from core.store import Store
+
+LONG_ANSWER = "충분한 수면과 규칙적인 운동은 스트레스 관리에 도움이 됩니다. " * 20
+
+
+class TestCompressedTextStore:
+    """CompressedTextStore 기본 동작 테스트."""
+
+    @pytest.mark.parametrize("method", ["zlib", "lzma"])
+    def test_roundtrip_after_compression(self, method):
+        """압축된 본문을 투명하게 읽을 수 있는지 확인."""
+        cts = CompressedTextStore(method=method, cold_after=0)
+        ref = cts.put(LONG_ANSWER)
+
+        assert cts.compress_cold() == 1
+        assert cts.stats()["compressed"] == 1
+        assert cts.get(ref) == LONG_ANSWER
+
+    def test_zdict_roundtrip(self):
+        """공유 사전을 사용한 압축/해제 확인."""
+        zdict = build_zdict([LONG_ANSWER, LONG_ANSWER])
+        cts = CompressedTextStore(zdict=zdict, cold_after=0)
+        ref = cts.put(LONG_ANSWER)
+        cts.compress_cold()
+
+        assert zdict
+        assert cts.get(ref) == LONG_ANSWER
+
+    def test_invalid_options(self):
+        """지원하지 않는 설정은 ValueError."""
+        with pytest.raises(ValueError):
+            CompressedTextStore(method="zstd")
+        with pytest.raises(ValueError):
+            CompressedTextStore(method="lzma", zdict=b"abc")
+
+    def test_short_text_not_compressed(self):
+        """min_size보다 짧은 본문은 압축하지 않음."""
+        cts = CompressedTextStore(cold_after=0)
+        cts.put("짧은 답변")
+
+        assert cts.compress_cold() == 0
+
+    def test_hot_cache(self):
+        """압축된 본문은 hot 캐시를 통해 한 번만 해제되는지 확인."""
+        cts = CompressedTextStore(cold_after=0, hot_cache_size=1)
+        ref = cts.put(LONG_ANSWER)
+        cts.compress_cold()
+
+        cts.get(ref)
+        cts.get(ref)
+
+        stats = cts.stats()
+        assert stats["cache_misses"] == 1
+        assert stats["cache_hits"] == 1
+
+    def test_concurrent_reads_and_switches(self):
+        """여러 스레드가 읽고 전환해도 본문과 캐시가 깨지지 않는지 확인."""
+        cts = CompressedTextStore(cold_after=0, hot_cache_size=2)
+        texts = [LONG_ANSWER + str(i) for i in range(8)]
+        handles = [cts.put(text) for text in texts]
+        cts.compress_cold()
+        errors = []
+
+        # 압축/해제 도중 다른 스레드로 전환되게 해 경쟁 상태를 드러냄
+        compress, decompress = cts._compress, cts._decompress
+        cts._compress = lambda text: time.sleep(0) or compress(text)
+        cts._decompress = lambda blob: time.sleep(0) or decompress(blob)
+
+        def reader(offset):
+            try:
+                for i in range(offset, offset + 1000):
+                    k = i % len(handles)
+                    if cts.get(handles[k]) != texts[k]:
+                        errors.append(k)
+            except Exception as exc:  # 경쟁 상태로 인한 KeyError 등
+                errors.append(exc)
+
+        def switcher(offset):
+            try:
+                for i in range(offset, offset + 300):
+                    k = i % len(handles)
+                    cts.record_switch(handles[k : k + 2])
+            except Exception as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=reader, args=(n,)) for n in range(4)]
+        threads += [threading.Thread(target=switcher, args=(n,)) for n in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert [cts.get(handle) for handle in handles] == texts
+
+
+class TestCompressionPolicy:
+    """전환 횟수 기반 압축 정책 테스트."""
+
+    def test_unvisited_answers_compressed(self):
+        """N번의 전환 동안 방문하지 않은 답변만 압축되는지 확인."""
+        cts = CompressedTextStore(cold_after=2)
+        store = Store(content_store=cts)
+        cold = store.add_node("오래된 질문?", LONG_ANSWER)
+        store.switch_to_node("root")
+        hot = store.add_node("최근 질문?", LONG_ANSWER + "!")
+
+        for _ in range(3):
+            store.switch_to_node(hot.id)
+
+        assert not isinstance(cts._data[cold.text_ref("ai_answer")], str)
+        assert isinstance(cts._data[hot.text_ref("ai_answer")], str)
+        assert cold.ai_answer == LONG_ANSWER
+        assert cts.stats()["saved_bytes"] > 0
+
+    def test_visit_restores_raw_text(self):
+        """압축된 노드로 전환하면 원문으로 복원되는지 확인."""
+        cts = CompressedTextStore(cold_after=0)
+        store = Store(content_store=cts)
+        node = store.add_node("질문?", LONG_ANSWER)
+        store.switch_to_node("root")
+
+        assert not isinstance(cts._data[node.text_ref("ai_answer")], str)
+
+        cts.cold_after = 5
+        store.switch_to_node(node.id)
+
+        assert isinstance(cts._data[node.text_ref("ai_answer")], str)
+        assert node.ai_answer == LONG_ANSWER
+
+    def test_shared_ancestors_stay_hot(self):
+        """분기 사이를 오가도 공통 조상 본문은 압축되지 않는지 확인."""
+        cts = CompressedTextStore(cold_after=3)
+        store = Store(content_store=cts)
+        ancestors = [store.add_node(f"질문 {i}?", LONG_ANSWER) for i in range(4)]
+        left = store.add_node("왼쪽?", LONG_ANSWER)
+        store.switch_to_node(ancestors[-1].id)
+        right = store.add_node("오른쪽?", LONG_ANSWER)
+
+        recorded = []
+        record_switch = cts.record_switch
+
+        def counting_record_switch(handles):
+            recorded.append(list(handles))
+            return record_switch(handles)
+
+        cts.record_switch = counting_record_switch
+        for _ in range(6):
+            store.switch_to_node(left.id)
+            store.switch_to_node(right.id)
+
+        for node in ancestors:
+            assert isinstance(cts._data[node.text_ref("ai_answer")], str)
+        # 전환마다 새로 경로에 들어온 노드 하나의 본문만 기록
+        assert all(len(handles) == 2 for handles in recorded)
+
+        # 경로에서 빠진 뒤에는 다시 cold_after번의 전환이 지나면 압축
+        store.switch_to_node("root")
+        for _ in range(4):
+            store.switch_to_node("root")
+        assert not isinstance(cts._data[ancestors[0].text_ref("ai_answer")], str)
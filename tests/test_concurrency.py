@@ -0,0 +1,159 @@
+"""
+Store 동시성(읽기-쓰기 잠금, 버전 키) 테스트.
+"""
+
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from core.concurrency import RWLock, VersionConflictError
+from core.store import Store
+
+
+def assert_path_consistent(store: Store, path_ids):
+    """활성 경로가 루트에서 시작해 부모-자식으로 이어지는지 확인."""
+    assert path_ids[0] == "root"
+    for parent_id, child_id in zip(path_ids, path_ids[1:]):
+        assert store.tree.get_node(child_id).parent_id == parent_id
+
+
+class TestRWLock:
+    """RWLock 테스트."""
+
+    def test_readers_do_not_block_each_other(self):
+        """읽기 잠금 두 개가 동시에 잡히는지 확인."""
+        lock = RWLock()
+        barrier = threading.Barrier(2, timeout=2)
+
+        def reader():
+            with lock.read():
+                barrier.wait()  # 둘 다 읽기 잠금 안에 있어야 통과
+
+        threads = [threading.Thread(target=reader) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert not barrier.broken
+
+    def test_writer_is_exclusive(self):
+        """쓰기 잠금 중에는 읽기가 진행되지 않는지 확인."""
+        lock = RWLock()
+        events = []
+
+        def reader():
+            with lock.read():
+                events.append("read")
+
+        with lock.write():
+            thread = threading.Thread(target=reader)
+            thread.start()
+            thread.join(timeout=0.1)
+            events.append("write-done")
+        thread.join()
+
+        assert events == ["write-done", "read"]
+
+
+class TestVersionedStore:
+    """버전 키와 compare-and-swap 테스트."""
+
+    def test_version_increments_on_change(self):
+        """상태 변경 시에만 버전이 증가하는지 확인."""
+        store = Store()
+        assert store.get_version() == 0
+
+        node = store.add_node("Q?", "A.")
+        store.save_checkpoint("cp")
+        assert store.get_version() == 2
+
+        assert not store.save_checkpoint("cp")  # 실패는 버전 유지
+        assert store.switch_to_node("missing") is None
+        assert store.get_version() == 2
+
+        store.switch_to_node("root")
+        store.load_checkpoint("cp")
+        assert store.get_current_node_id() == node.id
+        assert store.get_version() == 4
+
+    def test_stale_writer_rejected(self):
+        """오래된 버전으로 쓰면 409로 거부되고 상태가 유지되는지 확인."""
+        store = Store()
+        version = store.get_version()
+        store.add_node("Q1?", "A1.", expected_version=version)
+
+        with pytest.raises(VersionConflictError) as exc_info:
+            store.add_node("Q2?", "A2.", expected_version=version)
+
+        assert exc_info.value.status == 409
+        assert exc_info.value.actual == version + 1
+        assert store.tree.get_node_count() == 2
+        with pytest.raises(VersionConflictError):
+            store.switch_to_node("root", expected_version=version)
+        assert store.get_current_node_id() != "root"
+
+
+class TestConcurrentStress:
+    """스레드 풀에서 Store를 동시에 사용하는 스트레스 테스트."""
+
+    def test_mixed_operations_keep_invariants(self):
+        """추가/전환/체크포인트/읽기를 섞어도 불변식이 유지되는지 확인."""
+        store = Store()
+        mutations = []
+        lock = threading.Lock()
+
+        def worker(seed: int):
+            rng = random.Random(seed)
+            done = 0
+            for i in range(300):
+                op = rng.random()
+                if op < 0.4:
+                    store.add_node(f"Q{seed}-{i}?", "A.")
+                    done += 1
+                elif op < 0.7:
+                    target = rng.choice(list(store.tree.nodes))
+                    if store.switch_to_node(target):
+                        done += 1
+                elif op < 0.8:
+                    if store.save_checkpoint(f"cp-{seed}-{i}"):
+                        done += 1
+                else:
+                    assert_path_consistent(store, store.get_active_path_ids())
+            with lock:
+                mutations.append(done)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(worker, range(8)))
+
+        assert store.get_version() == sum(mutations)
+        assert_path_consistent(store, store.get_active_path_ids())
+        for node_id in store.list_checkpoints().values():
+            assert store.tree.node_exists(node_id)
+
+    def test_compare_and_swap_serialises_writers(self):
+        """CAS 쓰기에서 성공 횟수와 버전, 노드 수가 일치하는지 확인."""
+        store = Store()
+        counts = {"ok": 0, "conflict": 0}
+        lock = threading.Lock()
+
+        def worker(_):
+            for _ in range(200):
+                version = store.get_version()
+                try:
+                    store.add_node("Q?", "A.", expected_version=version)
+                    key = "ok"
+                except VersionConflictError:
+                    key = "conflict"
+                with lock:
+                    counts[key] += 1
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(worker, range(8)))
+
+        assert counts["ok"] + counts["conflict"] == 1600
+        assert store.get_version() == counts["ok"]
+        assert store.tree.get_node_count() == counts["ok"] + 1
+        assert len(store.get_active_path_ids()) == counts["ok"] + 1
@@ -0,0 +1,156 @@
+"""
+content_store 모듈 및 지연 로딩 모드 테스트.
+"""
+
+import sys
+import threading
+import tracemalloc
+
+from core.content_store import ContentStore, split_ref
+from core.models import LazyNode, Node
+from core.store import Store
+
+
+class TestContentStore:
+    """ContentStore 기본 동작 테스트."""
+
+    def test_put_and_get(self, tmp_path):
+        """기록한 텍스트를 참조로 다시 읽을 수 있는지 확인."""
+        with ContentStore(str(tmp_path / "content.bin")) as cs:
+            ref1 = cs.put("안녕하세요")
+            ref2 = cs.put("hello")
+
+            assert cs.get(ref1) == "안녕하세요"
+            assert cs.get(ref2) == "hello"
+            assert split_ref(ref2)[0] == sum(split_ref(ref1))
+
+    def test_lru_cache(self, tmp_path):
+        """LRU 캐시 적중과 축출 확인."""
+        with ContentStore(str(tmp_path / "content.bin"), cache_size=2) as cs:
+            refs = [cs.put(f"text-{i}") for i in range(3)]
+
+            for ref in refs:
+                cs.get(ref)
+            cs.get(refs[2])
+
+            info = cs.cache_info()
+            assert info["misses"] == 3
+            assert info["hits"] == 1
+            assert info["size"] == 2
+
+    def test_reopen_keeps_refs(self, tmp_path):
+        """파일을 다시 열어도 기존 참조가 유효한지 확인 (추가 전용)."""
+        path = str(tmp_path / "content.bin")
+        with ContentStore(path) as cs:
+            ref = cs.put("persistent")
+
+        with ContentStore(path) as cs:
+            new_ref = cs.put("more")
+            assert cs.get(ref) == "persistent"
+            assert split_ref(new_ref)[0] == split_ref(ref)[1]
+
+    def test_concurrent_reads(self, tmp_path):
+        """여러 스레드가 캐시를 거치지 않고 동시에 읽어도 본문이 섞이지 않는지 확인."""
+        with ContentStore(str(tmp_path / "content.bin"), cache_size=0) as cs:
+            texts = [f"본문-{i}-" * (i % 7 + 1) for i in range(200)]
+            refs = [cs.put(text) for text in texts]
+            errors = []
+
+            def reader(offset):
+                for i in range(offset, offset + 2000):
+                    k = i % len(refs)
+                    if cs.get(refs[k]) != texts[k]:
+                        errors.append(k)
+
+            threads = [threading.Thread(target=reader, args=(n,)) for n in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            assert errors == []
+
+
+class TestLazyStore:
+    """지연 로딩 모드 Store 테스트."""
+
+    def test_nodes_are_lazy(self, tmp_path):
+        """트리에 저장된 노드가 본문 없이 골격만 유지하는지 확인."""
+        with ContentStore(str(tmp_path / "content.bin")) as cs:
+            store = Store(content_store=cs)
+            node = store.add_node("Python이 뭐야?", "Python은 프로그래밍 언어입니다.")
+
+            assert isinstance(node, LazyNode)
+            assert "user_question" not in node.__dict__
+            assert "ai_answer" not in node.__dict__
+            assert node.question_preview == "Python이 뭐야?"
+            assert node.user_question == "Python이 뭐야?"
+            assert node.ai_answer == "Python은 프로그래밍 언어입니다."
+
+    def test_navigation_works(self, tmp_path):
+        """전환, 경로 조회가 일반 모드와 동일하게 동작하는지 확인."""
+        with ContentStore(str(tmp_path / "content.bin")) as cs:
+            store = Store(content_store=cs)
+            node1 = store.add_node("Q1?", "A1.")
+            node2 = store.add_node("Q2?", "A2.")
+
+            store.switch_to_node(node1.id)
+
+            assert store.active_path_ids == ["root", node1.id]
+            assert [n.id for n in store.tree.get_children(node1.id)] == [node2.id]
+
+    def test_reset_keeps_lazy_mode(self, tmp_path):
+        """reset() 후에도 지연 로딩 모드가 유지되는지 확인."""
+        with ContentStore(str(tmp_path / "content.bin")) as cs:
+            store = Store(content_store=cs)
+            store.reset()
+
+            node = store.add_node("Q?", "A.")
+
+            assert isinstance(node, LazyNode)
+
+    def test_assignment_writes_to_store(self, tmp_path):
+        """본문을 다시 대입하면 저장소에 새로 기록되는지 확인."""
+        with ContentStore(str(tmp_path / "content.bin")) as cs:
+            store = Store(content_store=cs)
+            node = store.add_node("Q?", "A.")
+
+            node.ai_answer = "수정된 답변"
+
+            assert node.ai_answer == "수정된 답변"
+            assert isinstance(node.to_node(), Node)
+            assert node.to_node().ai_answer == "수정된 답변"
+
+    def test_resident_memory_reduced(self, tmp_path):
+        """긴 답변을 가진 트리의 상주 메모리가 크게 줄어드는지 확인."""
+        answer_body = "가나다라마바사 " * 256
+
+        def measure(store: Store) -> int:
+            tracemalloc.start()
+            before = tracemalloc.get_traced_memory()[0]
+            for i in range(300):
+                store.add_node(f"질문 {i}?", f"{answer_body}{i}")
+            after = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            return after - before
+
+        eager = measure(Store())
+        with ContentStore(str(tmp_path / "content.bin")) as cs:
+            lazy = measure(Store(content_store=cs))
+
+        assert lazy * 5 < eager
+
+    def test_lazy_node_keeps_only_refs(self, tmp_path):
+        """LazyNode가 슬롯에 참조만 들고 저장소는 클래스로 공유하는지 확인."""
+        with ContentStore(str(tmp_path / "content.bin")) as cs:
+            node = Node(
+                id="n1", parent_id=None, user_question="질문", ai_answer="답변"
+            )
+            first = LazyNode.from_node(node, cs)
+            second = LazyNode.from_node(node, cs)
+
+            assert vars(first) == {}
+            assert type(first) is type(second)
+            assert isinstance(first, LazyNode)
+            assert isinstance(first.text_ref("ai_answer"), int)
+            assert first.question_preview == node.question_preview
+            assert first.to_node().ai_answer == "답변"
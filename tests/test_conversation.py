@@ -4,8 +4,11 @@ ConversationManager 테스트.
 
 import pytest
 
+from core.concurrency import PathConflictError
 from core.conversation import ConversationManager
+from core.session import SessionManager
 from core.store import Store
+from core.vectors import VectorIndex
 
 
 class TestConversationManagerInit:
@@ -168,6 +171,193 @@ class TestBranching:
         assert success is False
 
 
+class TestAutoCheckpoint:
+    """분기 자동 체크포인트 테스트."""
+
+    def test_checkpoint_created_once_per_branch(self):
+        """두 번째 자식이 생길 때 한 번만 체크포인트가 저장되는지 확인."""
+        cm = ConversationManager(auto_checkpoint=True)
+        node1 = cm.turn("Q1?", "A1.")
+        cm.turn("Q2?", "A2.")
+        assert cm.store.list_checkpoints() == {}
+
+        cm.branch_from_node(node1.id)
+        cm.turn("Q3?", "A3.")
+        cm.branch_from_node(node1.id)
+        cm.turn("Q4?", "A4.")
+
+        assert cm.store.list_checkpoints() == {f"@branch_{node1.id[:8]}": node1.id}
+
+    def test_disabled_by_default(self):
+        """기본값에서는 자동 체크포인트를 만들지 않는지 확인."""
+        cm = ConversationManager()
+        cm.turn("Q1?", "A1.")
+        cm.branch_from_node("root")
+        cm.turn("Q2?", "A2.")
+
+        assert cm.store.list_checkpoints() == {}
+        assert cm.save_branch_checkpoints() == []
+
+    def test_direct_store_adds_and_undo(self):
+        """Store에 직접 추가한 분기도 반영되고, 되돌린 분기는 건너뛰는지 확인."""
+        cm = ConversationManager(auto_checkpoint=True)
+        store = cm.store
+        store.add_node("Q1?", "A1.")
+        store.switch_to_node("root")
+        store.add_node("Q2?", "A2.")
+
+        assert cm.save_branch_checkpoints() == ["@branch_root"]
+
+        store.switch_to_node("root")
+        store.add_node("Q3?", "A3.")  # root의 세 번째 자식 - 새 분기 아님
+        node = store.add_node("Q4?", "A4.")
+        store.switch_to_node(node.parent_id)
+        store.add_node("Q5?", "A5.")
+        store.undo()  # 분기를 만든 노드 추가 취소
+
+        assert cm.save_branch_checkpoints() == []
+
+    def test_branch_points_from_merge(self):
+        """merge로 들어온 분기점만 저장하고 정리된 기존 분기점은 두는지 확인."""
+        cm = ConversationManager(auto_checkpoint=True)
+        store = cm.store
+        node1 = cm.turn("Q1?", "A1.")
+        cm.branch_from_node("root")
+        cm.turn("Q2?", "A2.")
+        assert store.delete_checkpoint("@branch_root")
+
+        what_if = store.fork()
+        what_if.add_node("Q3?", "A3.")
+        what_if.switch_to_node(node1.id)
+        what_if.add_node("Q4?", "A4.")
+        what_if.switch_to_node(node1.id)
+        what_if.add_node("Q5?", "A5.")
+        store.merge(what_if)
+
+        assert cm.save_branch_checkpoints() == [f"@branch_{node1.id[:8]}"]
+        assert store.list_checkpoints() == {f"@branch_{node1.id[:8]}": node1.id}
+
+    def test_branch_points_from_other_session(self):
+        """트리를 공유하는 다른 세션이 만든 분기점도 저장하는지 확인."""
+        manager = SessionManager()
+        alice = ConversationManager(
+            manager.open_session("alice"), auto_checkpoint=True
+        )
+        bob = ConversationManager(manager.open_session("bob"), auto_checkpoint=True)
+
+        node1 = alice.turn("Q1?", "A1.")
+        bob.turn("Q2?", "A2.")  # root의 두 번째 자식 - bob이 만든 분기점
+        bob.branch_from_node(node1.id)
+        bob.turn("Q3?", "A3.")
+        alice.turn("Q4?", "A4.")  # node1의 두 번째 자식 - alice가 만든 분기점
+
+        expected = {"@branch_root": "root", f"@branch_{node1.id[:8]}": node1.id}
+        assert alice.store.list_checkpoints() == expected
+        assert bob.save_branch_checkpoints() == [f"@branch_{node1.id[:8]}"]
+        assert bob.store.list_checkpoints() == expected
+        assert alice.save_branch_checkpoints() == []
+
+
+class TestRelatedTurns:
+    """다른 분기의 관련 턴 검색 테스트."""
+
+    class _RecordingAI:
+        """받은 맥락을 기록하는 가짜 AI 클라이언트."""
+
+        def __init__(self):
+            self.contexts = []
+
+        def ask(self, question):
+            return "답변"
+
+        def ask_with_context(self, question, context, system_prompt=None):
+            self.contexts.append(context)
+            return "답변"
+
+    def test_related_turns_from_other_branches(self):
+        """현재 경로 밖의 관련 턴만 찾아 ask 맥락에 넣는지 확인."""
+        store = Store()
+        cm = ConversationManager(store, vector_index=VectorIndex(store))
+        sort_node = cm.turn("파이썬 리스트 정렬", "sorted 함수를 씁니다")
+        cm.branch_from_node("root")
+        cm.turn("자바 스레드", "synchronized 를 씁니다")
+
+        related = cm.get_related_turns("리스트 정렬 방법", limit=1)
+        assert [node.id for node in related] == [sort_node.id]
+
+        ai = self._RecordingAI()
+        cm.ask("리스트 정렬 방법은?", ai)
+        assert "다른 분기의 관련 대화" in ai.contexts[0]
+        assert "sorted 함수를 씁니다" in ai.contexts[0]
+
+    def test_unrelated_turns_are_dropped(self):
+        """유사도가 낮은 턴은 맥락에 넣지 않고 빈 경로 맥락도 쓰지 않는지 확인."""
+        store = Store()
+        cm = ConversationManager(store, vector_index=VectorIndex(store))
+        cm.turn("자바 스레드 동기화", "synchronized 를 씁니다")
+        cm.branch_from_node("root")
+
+        assert cm.get_related_turns("오늘 날씨 어때") == []
+        assert len(cm.get_related_turns("오늘 날씨 어때", min_score=-1.0)) == 1
+
+        ai = self._RecordingAI()
+        cm.ask("자바 스레드 동기화 방법", ai)
+        assert ai.contexts[0].startswith("다른 분기의 관련 대화:")
+        assert "[대화 없음]" not in ai.contexts[0]
+
+    def test_without_vector_index(self):
+        """벡터 색인이 없으면 관련 턴이 없는지 확인."""
+        cm = ConversationManager()
+        cm.turn("Q?", "A.")
+        assert cm.get_related_turns("Q") == []
+
+
+class TestAskConflicts:
+    """AI 호출 중 다른 작업자가 Store를 바꾼 경우의 ask 테스트."""
+
+    class _SideEffectAI:
+        """답변하기 전에 주어진 작업을 실행하는 가짜 AI 클라이언트."""
+
+        def __init__(self, side_effect):
+            self.side_effect = side_effect
+
+        def ask(self, question):
+            self.side_effect()
+            return "늦은 답변"
+
+        def ask_with_context(self, question, context, system_prompt=None):
+            return self.ask(question)
+
+    def test_unrelated_write_is_not_conflict(self):
+        """체크포인트 정리처럼 경로와 무관한 변경 중에는 답변이 붙는지 확인."""
+        store = Store()
+        cm = ConversationManager(store)
+        store.save_checkpoint("old", node_id="root")
+        ai = self._SideEffectAI(lambda: store.prune_checkpoints(["old"]))
+
+        node = cm.ask("Q?", ai)
+
+        assert node.parent_id == "root"
+        assert store.get_current_node_id() == node.id
+
+    def test_path_change_keeps_answer(self):
+        """현재 노드가 바뀌면 거부하되 받은 답변을 예외에 담는지 확인."""
+        store = Store()
+        cm = ConversationManager(store)
+        moved = cm.turn("Q1?", "A1.")
+        cm.branch_from_node("root")
+        ai = self._SideEffectAI(lambda: store.switch_to_node(moved.id))
+
+        with pytest.raises(PathConflictError) as exc_info:
+            cm.ask("Q2?", ai)
+
+        assert exc_info.value.expected == "root"
+        assert exc_info.value.actual == moved.id
+        assert exc_info.value.ai_answer == "늦은 답변"
+        assert store.get_current_node_id() == moved.id
+        assert store.tree.get_child_count(moved.id) == 0
+
+
 class TestGetCurrentNode:
     """현재 노드 조회 테스트."""
 
@@ -0,0 +1,226 @@
+"""
+cow 모듈(copy-on-write 자료구조)과 Store.fork() 테스트.
+"""
+
+import pytest
+
+from core.cow import MAX_LAYERS, CowDict, SortedIds, layered
+from core.store import Store
+
+
+class TestCowDict:
+    """CowDict 테스트."""
+
+    def test_overlay_and_tombstone(self):
+        """변경이 바닥에 반영되지 않고 삭제가 바닥 키를 가리는지 확인."""
+        base = {"a": 1, "b": 2}
+        view = CowDict(base)
+
+        view["c"] = 3
+        view["a"] = 10
+        del view["b"]
+
+        assert dict(view) == {"a": 10, "c": 3}
+        assert len(view) == 2
+        assert "b" not in view
+        assert base == {"a": 1, "b": 2}
+
+        view["b"] = 20
+        assert view["b"] == 20 and len(view) == 3
+
+    def test_setdefault_copies_base_value(self):
+        """setdefault가 바닥 리스트를 복사해 반환하는지 확인."""
+        base = {"k": [1]}
+        view = CowDict(base)
+
+        view.setdefault("k", []).append(2)
+        view.setdefault("new", []).append(3)
+
+        assert view["k"] == [1, 2]
+        assert base["k"] == [1]
+        assert view["new"] == [3]
+        assert len(view) == 2
+
+    def test_changes_since_across_layers(self):
+        """여러 계층에 걸친 변경분을 모으는지 확인."""
+        base = {"a": 1, "b": 2}
+        first = CowDict(base)
+        first["c"] = 3
+        del first["a"]
+        _, _, second = layered(first)
+        second["a"] = 5
+        del second["c"]
+
+        updated, deleted = second.changes_since(base)
+
+        assert updated == {"a": 5}
+        assert deleted == {"c"}
+        with pytest.raises(ValueError):
+            second.changes_since({})
+
+    def test_reversed_matches_iteration(self):
+        """역순 순회가 정순 순회를 뒤집은 것과 같은지 확인."""
+        view = CowDict({"a": 1, "b": 2, "c": 3})
+        del view["b"]
+        view["d"] = 4
+        view["a"] = 10
+
+        assert list(reversed(view)) == list(view)[::-1]
+
+
+class TestSortedIds:
+    """SortedIds 계층 테스트."""
+
+    def test_rank_select_across_layers(self):
+        """계층화된 목록이 합친 목록처럼 동작하는지 확인."""
+        ids = SortedIds(["b", "d", "f"])
+        mine, theirs = ids.fork()
+        theirs.add("a")
+        theirs.add("e")
+        mine.add("c")
+
+        assert list(theirs.iter_from()) == ["a", "b", "d", "e", "f"]
+        assert [theirs.select(i) for i in range(5)] == ["a", "b", "d", "e", "f"]
+        assert theirs.select(5) is None
+        assert theirs.rank("e") == 3
+        assert list(mine.iter_from("c")) == ["c", "d", "f"]
+
+    def test_extend_defers_sorting(self):
+        """일괄 추가는 모아 두었다가 다음 조회 때 한 번에 합치는지 확인."""
+        ids = SortedIds(["b", "f"])
+        ids.extend(["e", "a"])
+        ids.extend(["d", "c"])
+        assert ids._ids == ["b", "f"]
+        assert len(ids) == 6
+
+        assert ids.rank("d") == 3
+        assert list(ids.iter_from()) == ["a", "b", "c", "d", "e", "f"]
+        mine, theirs = ids.fork()
+        theirs.extend(["g"])
+        assert theirs.select(6) == "g" and len(mine) == 6
+
+
+class TestStoreFork:
+    """Store.fork()/merge() 테스트."""
+
+    def test_fork_isolated(self):
+        """분기 양쪽의 변경이 서로 보이지 않는지 확인."""
+        store = Store()
+        node1 = store.add_node("Q1?", "A1.")
+        store.save_checkpoint("cp")
+
+        what_if = store.fork()
+        alt = what_if.add_node("Alt?", "Alt.")
+        what_if.delete_checkpoint("cp")
+        main = store.add_node("Main?", "Main.")
+
+        assert not store.tree.node_exists(alt.id)
+        assert not what_if.tree.node_exists(main.id)
+        assert store.list_checkpoints() == {"cp": node1.id}
+        assert what_if.list_checkpoints() == {}
+        assert what_if.tree.get_node_count() == 3
+        assert [n.id for n in what_if.tree.get_children(node1.id)] == [alt.id]
+        assert [n.id for n in store.tree.get_children(node1.id)] == [main.id]
+        assert what_if.tree.get_node_number(alt.id) is not None
+        assert store.tree.get_node_number(alt.id) is None
+
+    def test_fork_is_constant_size(self):
+        """분기 시 노드를 복사하지 않는지 확인."""
+        store = Store()
+        for i in range(200):
+            store.add_node(f"Q{i}?", "A.")
+
+        what_if = store.fork()
+
+        assert what_if.tree.nodes.own == {}
+        assert what_if.tree.nodes.base is store.tree.nodes.base
+        assert what_if.tree.get_node_count() == 201
+
+    def test_merge_back(self):
+        """분기의 새 노드와 체크포인트가 병합되는지 확인."""
+        store = Store()
+        store.add_node("Q1?", "A1.")
+        store.save_checkpoint("old")
+
+        what_if = store.fork()
+        alt = what_if.add_node("Alt?", "Alt.")
+        what_if.save_checkpoint("alt")
+        what_if.delete_checkpoint("old")
+
+        merged = store.merge(what_if, switch=True)
+
+        assert merged == 1
+        assert store.tree.node_exists(alt.id)
+        assert store.list_checkpoints() == {"alt": alt.id}
+        assert store.get_current_node_id() == alt.id
+
+    def test_merge_conflict_is_atomic(self):
+        """체크포인트 충돌 시 아무것도 병합되지 않는지 확인."""
+        store = Store()
+        what_if = store.fork()
+        what_if.add_node("Alt?", "Alt.")
+        what_if.save_checkpoint("cp")
+        store.add_node("Main?", "Main.")
+        store.save_checkpoint("cp")
+
+        with pytest.raises(ValueError, match="conflict"):
+            store.merge(what_if)
+
+        assert store.tree.get_node_count() == 2
+
+    def test_merge_twice_rejected(self):
+        """같은 분기를 두 번 병합하면 ValueError이고 상태가 그대로인지 확인."""
+        store = Store()
+        what_if = store.fork()
+        what_if.add_node("Alt?", "Alt.")
+        what_if.save_checkpoint("alt")
+        store.merge(what_if)
+        store.delete_checkpoint("alt")
+        version = store.get_version()
+
+        with pytest.raises(ValueError, match="already merged"):
+            store.merge(what_if)
+
+        assert store.get_version() == version
+        assert store.tree.get_node_count() == 2
+        assert store.list_checkpoints() == {}
+
+    def test_merge_requires_own_fork(self):
+        """다른 Store의 분기는 병합할 수 없는지 확인."""
+        with pytest.raises(ValueError):
+            Store().merge(Store().fork())
+
+    def test_repeated_forks_keep_layers_shallow(self):
+        """분기를 거듭해도 계층이 MAX_LAYERS를 넘지 않고 이전 분기도 병합되는지 확인."""
+        store = Store()
+        store.add_node("Q?", "A.")
+        forks = []
+        for i in range(3 * MAX_LAYERS):
+            forks.append(store.fork())
+            forks[-1].add_node(f"Alt{i}?", "Alt.")
+            forks[-1].save_checkpoint(f"alt{i}")
+            store.add_node(f"Main{i}?", "Main.")
+
+        layer, depth = store.tree.nodes, 0
+        while isinstance(layer, CowDict):
+            layer, depth = layer.base, depth + 1
+        assert depth <= MAX_LAYERS
+        assert store.tree.get_node_count() == 2 + 3 * MAX_LAYERS
+
+        assert store.merge(forks[0]) == 1
+        assert store.merge(forks[-1]) == 1
+        assert set(store.list_checkpoints()) == {"alt0", f"alt{3 * MAX_LAYERS - 1}"}
+
+    @pytest.mark.parametrize("replace", ["reset", "replace_state"])
+    def test_merge_replaced_fork(self, replace):
+        """분기 쪽 상태가 교체됐으면 ValueError인지 확인."""
+        store = Store()
+        what_if = store.fork()
+        if replace == "reset":
+            what_if.reset()
+        else:
+            other = Store()
+            what_if.replace_state(other.tree, {}, "root")
+
+        with pytest.raises(ValueError, match="fork state was replaced"):
+            store.merge(what_if)
@@ -0,0 +1,103 @@
+"""
+duplicates 모듈(MinHash-LSH 중복 질문 색인) 테스트.
+"""
+
+import pytest
+
+from core.duplicates import DuplicateIndex, question_shingles
+from core.store import Store
+
+
+def _branches(store, questions):
+    """root 아래에 질문마다 분기를 만들고 노드 목록을 반환."""
+    nodes = []
+    for question in questions:
+        store.switch_to_node("root")
+        nodes.append(store.add_node(question, "답변"))
+    return nodes
+
+
+class TestQuestionShingles:
+    """question_shingles 함수 테스트."""
+
+    def test_normalization(self):
+        """대소문자·구두점·공백 차이를 무시하는지 확인."""
+        assert question_shingles("Python이 뭐야?") == question_shingles(
+            "python이   뭐야"
+        )
+        assert question_shingles("뭐야?") == {"뭐야"}
+        assert question_shingles("?!") == set()
+        assert question_shingles("abcd", size=3) == {"abc", "bcd"}
+
+
+class TestDuplicateIndex:
+    """DuplicateIndex 테스트."""
+
+    def test_find_exact_and_near_duplicates(self):
+        """같은 질문과 조금 다른 질문은 찾고 다른 주제는 제외하는지 확인."""
+        store = Store()
+        index = DuplicateIndex(store)
+        a, b, c, d = _branches(
+            store,
+            [
+                "파이썬에서 리스트를 정렬하는 방법은?",
+                "파이썬에서 리스트를 정렬하는 방법은?",
+                "파이썬에서 리스트를 정렬하는 방법은 뭐야?",
+                "자바 스레드 동기화는 어떻게 하나요",
+            ],
+        )
+
+        hits = index.find_duplicates(a.id)
+        ids = [hit.node_id for hit in hits]
+        assert ids[0] == b.id and hits[0].similarity == 1.0
+        assert c.id in ids
+        assert d.id not in ids and a.id not in ids
+        assert index.find_duplicates(d.id) == []
+        assert len(index) == 4
+
+        with pytest.raises(ValueError):
+            index.find_duplicates(store.tree.root_id)
+
+    def test_find_similar_questions(self):
+        """트리에 없는 질문으로도 중복을 찾는지 확인."""
+        store = Store()
+        index = DuplicateIndex(store)
+        (node,) = _branches(store, ["SQL 조인 종류를 알려줘"])
+
+        hits = index.find_similar_questions("sql 조인 종류를 알려줘!")
+        assert [hit.node_id for hit in hits] == [node.id]
+        assert index.find_similar_questions("전혀 관계없는 문장입니다") == []
+
+    def test_undo_and_reset(self):
+        """실행 취소와 reset이 색인에 반영되는지 확인."""
+        store = Store()
+        index = DuplicateIndex(store)
+        a, b = _branches(store, ["도커 이미지 빌드 방법", "도커 이미지 빌드 방법"])
+        assert [hit.node_id for hit in index.find_duplicates(a.id)] == [b.id]
+
+        store.undo()  # b 추가 취소
+        assert index.find_duplicates(a.id) == []
+        with pytest.raises(ValueError):
+            index.find_duplicates(b.id)
+
+        store.reset()
+        assert len(index) == 0
+        (c,) = _branches(store, ["도커 이미지 빌드 방법"])
+        assert index.find_duplicates(c.id) == []
+
+    def test_clusters(self):
+        """반복된 질문이 큰 묶음부터 모이는지 확인."""
+        store = Store()
+        index = DuplicateIndex(store)
+        questions = ["깃 브랜치 병합 방법"] * 3 + ["쿠버네티스 파드 재시작"] * 2
+        nodes = _branches(store, questions + ["혼자인 질문입니다"])
+
+        clusters = index.clusters()
+        assert [len(group) for group in clusters] == [3, 2]
+        assert set(clusters[0]) == {node.id for node in nodes[:3]}
+        assert len(index.clusters(min_size=1)) == 3
+
+    def test_invalid_bands(self):
+        """bands가 num_perm의 약수가 아니면 ValueError인지 확인."""
+        with pytest.raises(ValueError):
+            DuplicateIndex(Store(), num_perm=64, bands=10)
@@ -0,0 +1,152 @@
+"""
+events 모듈(Store 변경 이벤트 버스) 테스트.
+"""
+
+from core.events import (
+    CheckpointDeleted,
+    CheckpointRenamed,
+    CheckpointSaved,
+    EventBus,
+    NodeAdded,
+    NodeRemoved,
+    PathSwitched,
+    Reset,
+)
+from core.session import SessionManager
+from core.store import Store
+
+
+class TestEventBus:
+    """EventBus 테스트."""
+
+    def test_type_filter_and_unsubscribe(self):
+        """타입 필터와 구독 해제가 동작하는지 확인."""
+        bus = EventBus()
+        everything, added_only = [], []
+        unsubscribe = bus.subscribe(everything.append)
+        bus.subscribe(added_only.append, NodeAdded)
+
+        bus.publish(NodeAdded(1, "a", "root"))
+        bus.publish(Reset(2))
+        unsubscribe()
+        bus.publish(Reset(3))
+
+        assert [e.version for e in everything] == [1, 2]
+        assert [e.version for e in added_only] == [1]
+        assert len(bus) == 1
+
+    def test_queue_subscriber(self):
+        """큐 구독자에 이벤트가 쌓이는지 확인."""
+        bus = EventBus()
+        events = bus.subscribe_queue(Reset)
+
+        bus.publish(NodeAdded(1, "a", "root"))
+        bus.publish(Reset(2))
+
+        assert events.get_nowait() == Reset(2)
+        assert events.empty()
+
+    def test_bounded_queue_drops_and_unsubscribes(self):
+        """가득 찬 큐는 발행을 막지 않고 버린 수를 세며, 구독 해제가 되는지 확인."""
+        bus = EventBus()
+        events = bus.subscribe_queue(maxsize=1)
+
+        bus.publish(Reset(1))
+        bus.publish(Reset(2))  # 기다리지 않고 버림
+        assert events.get_nowait() == Reset(1)
+        assert events.dropped == 1
+
+        events.unsubscribe()
+        bus.publish(Reset(3))
+        assert events.empty() and len(bus) == 0
+
+    def test_failing_subscriber_does_not_stop_delivery(self):
+        """한 구독자의 예외 뒤에도 나머지가 받고, 예외는 모아 두는지 확인."""
+        bus = EventBus()
+        received = []
+
+        def broken(event):
+            raise RuntimeError("boom")
+
+        bus.subscribe(broken)
+        bus.subscribe(received.append)
+
+        bus.publish(Reset(1))
+        assert received == [Reset(1)]
+        assert bus.error_count == 1
+        event, error = bus.errors[0]
+        assert event == Reset(1)
+        assert str(error) == "boom"
+
+    def test_failing_subscriber_does_not_fail_mutation(self):
+        """구독자 예외가 이미 반영된 변경을 실패로 보이게 하지 않는지 확인."""
+        store = Store()
+
+        def broken(event):
+            raise RuntimeError("boom")
+
+        store.events.subscribe(broken, NodeAdded)
+        node = store.add_node("Q?", "A.")
+
+        assert store.get_current_node_id() == node.id
+        assert store.tree.get_child_count("root") == 1
+        assert store.events.error_count == 1
+
+
+class TestStoreEvents:
+    """Store가 발행하는 이벤트 테스트."""
+
+    def test_mutations_publish_events(self):
+        """각 변경이 버전 순서대로 해당 이벤트를 발행하는지 확인."""
+        store = Store()
+        events = []
+        store.events.subscribe(events.append)
+
+        node = store.add_node("Q?", "A.")
+        store.save_checkpoint("cp")
+        store.rename_checkpoint("cp", "cp2")
+        store.switch_to_node("root")
+        store.delete_checkpoint("cp2")
+        store.reset()
+
+        assert [type(e) for e in events] == [
+            NodeAdded,
+            CheckpointSaved,
+            CheckpointRenamed,
+            PathSwitched,
+            CheckpointDeleted,
+            Reset,
+        ]
+        assert [e.version for e in events] == list(range(1, 7))
+        assert events[0] == NodeAdded(1, node.id, "root")
+        assert events[3].delta.removed_ids == [node.id]
+        assert events[4].node_id == node.id
+
+    def test_undo_redo_publish_events(self):
+        """실행 취소/다시 실행도 변경분을 이벤트로 알리는지 확인."""
+        store = Store()
+        node = store.add_node("Q?", "A.")
+        store.save_checkpoint("cp")
+        events = []
+        store.events.subscribe(events.append)
+
+        store.undo()
+        store.undo()
+        store.redo()
+
+        assert events[0] == CheckpointDeleted(3, "cp", node.id)
+        assert isinstance(events[1], NodeRemoved)
+        assert isinstance(events[2], PathSwitched)
+        assert events[2].delta.removed_ids == [node.id]
+        assert events[3] == NodeAdded(5, node.id, "root")
+
+    def test_session_undo_add_only_switches(self):
+        """세션의 턴 추가 되돌리기는 경로 전환으로만 알리는지 확인."""
+        session = SessionManager().open_session()
+        session.add_node("Q?", "A.")
+        events = []
+        session.events.subscribe(events.append)
+
+        session.undo()
+
+        assert [type(e) for e in events] == [PathSwitched]
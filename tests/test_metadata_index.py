@@ -0,0 +1,102 @@
+"""
+metadata_index 모듈(메타데이터 보조 색인과 질의 플래너) 테스트.
+"""
+
+import pytest
+
+from core.metadata_index import Condition, MetadataIndex, parse_query
+from core.store import Store
+
+
+def _tagged_store():
+    """모델/지연 시간 태그가 붙은 노드로 깊이 1~6의 체인을 만든 Store."""
+    store = Store()
+    nodes = []
+    for i in range(6):
+        metadata = {
+            "model": "gpt-4o-mini" if i % 2 else "gpt-4o",
+            "latency_ms": 1000 * (i + 1),
+        }
+        nodes.append(store.add_node(f"Q{i}", f"A{i}", metadata))
+    return store, nodes
+
+
+class TestParseQuery:
+    """parse_query 함수 테스트."""
+
+    def test_parse(self):
+        """연산자, 숫자/문자열 값, and 연결을 해석하는지 확인."""
+        conditions = parse_query(
+            "depth>10 AND model == gpt-4o-mini and cost<=0.5 and topic='42'"
+        )
+        assert conditions == [
+            Condition("depth", ">", 10),
+            Condition("model", "=", "gpt-4o-mini"),
+            Condition("cost", "<=", 0.5),
+            Condition("topic", "=", "42"),
+        ]
+
+    @pytest.mark.parametrize("text", ["", "depth>", "model", "latency_ms>fast"])
+    def test_invalid(self, text):
+        """잘못된 질의는 ValueError인지 확인."""
+        with pytest.raises(ValueError):
+            parse_query(text)
+
+
+class TestMetadataIndex:
+    """MetadataIndex 테스트."""
+
+    def test_query(self):
+        """여러 조건을 모두 만족하는 노드만 찾는지 확인."""
+        store, nodes = _tagged_store()
+        index = MetadataIndex(store, hash_keys=["model"], range_keys=["latency_ms"])
+
+        result = index.query("depth>2 and model=gpt-4o-mini and latency_ms>=4000")
+        assert result == sorted([nodes[3].id, nodes[5].id])
+        assert index.query("model!=gpt-4o and depth<3") == [nodes[1].id]
+        assert index.query("latency_ms=3000") == [nodes[2].id]
+        assert index.query("depth>=1", limit=2) == sorted(n.id for n in nodes)[:2]
+        # 색인하지 않은 키, 없는 키
+        assert index.query("topic=python") == []
+        assert len(index.query("depth>0")) == len(index) == 6
+
+    def test_plan_picks_most_selective_index(self):
+        """후보가 가장 적은 색인을 고르고, 없으면 전체 탐색인지 확인."""
+        store, _ = _tagged_store()
+        index = MetadataIndex(store, hash_keys=["model"], range_keys=["latency_ms"])
+
+        plan = index.plan("depth>1 and model=gpt-4o-mini and latency_ms>5000")
+        assert (plan.index, plan.estimate) == ("latency_ms", 1)
+        plan = index.plan("depth>=5 and model=gpt-4o")
+        assert (plan.index, plan.estimate) == ("depth", 2)
+        plan = index.plan("latency_ms>2000 and latency_ms<4000")
+        assert (plan.index, plan.estimate) == ("latency_ms", 1)
+        plan = index.plan("topic=python")
+        assert (plan.index, plan.estimate) == (None, 6)
+
+    def test_add_index_later(self):
+        """나중에 추가한 색인이 기존 노드를 포함하는지 확인."""
+        store, nodes = _tagged_store()
+        index = MetadataIndex(store)
+        assert index.plan("model=gpt-4o").index is None
+
+        index.add_hash_index("model")
+        index.add_range_index("latency_ms")
+        assert index.plan("model=gpt-4o").estimate == 3
+        assert index.query("latency_ms<2000") == [nodes[0].id]
+        with pytest.raises(ValueError):
+            index.add_range_index("depth")
+
+    def test_undo_and_reset(self):
+        """실행 취소와 reset이 색인에 반영되는지 확인."""
+        store, nodes = _tagged_store()
+        index = MetadataIndex(store, hash_keys=["model"], range_keys=["latency_ms"])
+
+        store.undo()  # 마지막 노드(깊이 6) 추가 취소
+        assert index.query("latency_ms>5000") == []
+        assert index.plan("model=gpt-4o-mini").estimate == 2
+
+        store.reset()
+        assert len(index) == 0
+        node = store.add_node("Q", "A", {"model": "o1", "latency_ms": 10})
+        assert index.query("model=o1 and latency_ms<100") == [node.id]
@@ -354,3 +354,237 @@ class TestTreeIntegration:
 
         path_d = tree.get_path_to_root(node_d.id)
         assert len(path_d) == 3  # D -> C -> root
+
+
+class TestTreeIndexes:
+    """Tree 보조 인덱스(자식, 깊이, ID 정렬) 테스트."""
+
+    def _node(self, node_id, parent_id):
+        return Node(id=node_id, parent_id=parent_id, user_question="Q?", ai_answer="A.")
+
+    def test_children_and_depth(self):
+        """자식 목록이 추가 순서를 유지하고 깊이가 기록되는지 확인."""
+        tree = Tree()
+        tree.add_node(self._node("b", "root"))
+        tree.add_node(self._node("a", "root"))
+        tree.add_node(self._node("c", "a"))
+
+        assert tree.get_child_ids("root") == ["b", "a"]
+        assert [n.id for n in tree.get_children("a")] == ["c"]
+        assert tree.get_depth("root") == 0
+        assert tree.get_depth("c") == 2
+        assert tree.get_depth("missing") == -1
+
+    def test_prefix_and_numbering(self):
+        """접두사 검색과 노드 번호가 ID 정렬 순서를 따르는지 확인."""
+        tree = Tree()
+        for node_id in ["abc2", "abc1", "zzz", "abd"]:
+            tree.add_node(self._node(node_id, "root"))
+
+        assert tree.find_ids_by_prefix("abc") == ["abc1", "abc2"]
+        assert tree.find_ids_by_prefix("ab", limit=2) == ["abc1", "abc2"]
+        assert tree.find_ids_by_prefix("x") == []
+
+        # root는 번호에서 제외 (ID 순서상 zzz 앞이지만 건너뜀)
+        assert tree.get_node_number("abc1") == 1
+        assert tree.get_node_number("zzz") == 4
+        assert tree.get_node_number("root") is None
+        assert tree.get_node_by_number(4) == "zzz"
+        assert tree.get_node_by_number(5) is None
+        assert list(tree.iter_numbered_ids()) == ["abc1", "abc2", "abd", "zzz"]
+
+    def test_remove_leaf(self):
+        """잎 노드 제거가 모든 인덱스에서 지워지는지 확인."""
+        tree = Tree()
+        tree.add_node(self._node("a", "root"))
+        tree.add_node(self._node("b", "a"))
+
+        with pytest.raises(ValueError):
+            tree.remove_leaf("a")  # 자식이 있음
+        with pytest.raises(ValueError):
+            tree.remove_leaf("root")
+
+        removed = tree.remove_leaf("b")
+
+        assert removed.id == "b"
+        assert not tree.node_exists("b")
+        assert tree.get_child_ids("a") == []
+        assert tree.get_depth("b") == -1
+        assert list(tree.iter_numbered_ids()) == ["a"]
+
+        tree.add_node(removed)
+        assert tree.get_child_ids("a") == ["b"]
+
+    def test_leaf_and_branch_point_sets(self):
+        """잎/분기점 집합이 추가와 제거에 맞춰 갱신되는지 확인."""
+        tree = Tree()
+        assert tree.get_leaf_ids() == ["root"]
+        assert tree.get_newest_leaf_id() == "root"
+
+        tree.add_node(self._node("a", "root"))
+        tree.add_node(self._node("b", "root"))
+        tree.add_node(self._node("c", "a"))
+
+        assert tree.get_leaf_ids() == ["b", "c"]
+        assert tree.get_newest_leaf_id() == "c"
+        assert tree.get_branch_point_ids() == ["root"]
+        assert tree.is_branch_point("root") and not tree.is_branch_point("a")
+        assert tree.is_leaf("b") and not tree.is_leaf("a")
+
+        tree.remove_leaf("c")
+        tree.remove_leaf("b")
+
+        assert tree.get_leaf_ids() == ["a"]
+        assert tree.get_branch_point_ids() == []
+
+    def test_sets_after_add_nodes_and_fork(self):
+        """일괄 추가와 분기(fork) 후에도 집합이 독립적으로 유지되는지 확인."""
+        tree = Tree()
+        tree.add_nodes([self._node("a", "root"), self._node("b", "a")])
+        tree.add_nodes([self._node("c", "a")])
+        child = tree.fork()
+        child.add_node(self._node("d", "b"))
+
+        assert tree.get_leaf_ids() == ["b", "c"]
+        assert tree.get_branch_point_ids() == ["a"]
+        assert child.get_leaf_ids() == ["c", "d"]
+        assert child.get_newest_leaf_id() == "d"
+        assert child.get_branch_point_ids() == ["a"]
+
+    def test_branch_points_on_path(self):
+        """경로가 짧을 때와 분기점이 적을 때 모두 같은 결과를 내는지 확인."""
+        tree = Tree()
+        chain = ["root"]
+        for i in range(6):
+            tree.add_node(self._node(f"p{i}", chain[-1]))
+            chain.append(f"p{i}")
+        # p1, p3에 곁가지를 달아 분기점으로 만듦
+        tree.add_node(self._node("x1", "p1"))
+        tree.add_node(self._node("x3", "p3"))
+
+        # 분기점(2개)이 경로(7개)보다 적은 경우
+        assert tree.get_branch_points_on_path(chain) == ["p1", "p3"]
+        # 경로가 분기점 수 이하로 짧은 경우
+        assert tree.get_branch_points_on_path(chain[:2]) == []
+        # 곁가지 쪽 경로에는 p1만 포함 (p3는 같은 깊이에 다른 노드가 있음)
+        assert tree.get_branch_points_on_path(["root", "p0", "p1", "x1"]) == ["p1"]
+
+
+    def test_path_hash(self):
+        """경로 해시가 ID가 아닌 루트부터의 내용으로 정해지는지 확인."""
+
+        def turn(node_id, parent_id, question, answer="A"):
+            return Node(
+                id=node_id,
+                parent_id=parent_id,
+                user_question=question,
+                ai_answer=answer,
+            )
+
+        tree = Tree()
+        tree.add_node(turn("a", "root", "Q"))
+        tree.add_node(turn("b", "root", "Q"))
+        tree.add_node(turn("c", "a", "Q2"))
+        tree.add_node(turn("d", "b", "Q2"))
+        tree.add_node(turn("e", "b", "Q", "2A"))
+
+        assert tree.get_path_hash("a") == tree.get_path_hash("b")
+        assert tree.get_path_hash("c") == tree.get_path_hash("d")
+        assert tree.get_path_hash("c") != tree.get_path_hash("e")
+        assert tree.get_path_hash("a") != tree.get_path_hash("root")
+        assert tree.get_path_hash("missing") is None
+
+        # 일괄 추가(자식이 먼저 와도)와 분기 트리에서도 같은 해시
+        other = Tree()
+        other.add_nodes([turn("y", "x", "Q2"), turn("x", "root", "Q")])
+        assert other.get_path_hash("y") == tree.get_path_hash("c")
+
+        tree.remove_leaf("e")
+        assert tree.get_path_hash("e") is None
+        assert tree.fork().get_path_hash("d") == tree.get_path_hash("d")
+
+
+    def test_list_nodes_pages(self):
+        """노드 목록이 번호 순 페이지로 나뉘고 분기 트리에서도 이어지는지 확인."""
+        tree = Tree()
+        for node_id in ["d", "b", "a", "zz", "c"]:
+            tree.add_node(self._node(node_id, "root"))
+
+        first = tree.list_nodes(limit=2)
+        assert [n.id for n in first.items] == ["a", "b"]
+        assert first.next_cursor == "b"
+        second = tree.list_nodes(after=first.next_cursor, limit=2)
+        assert [n.id for n in second.items] == ["c", "d"]
+        # root는 건너뛰고, 마지막 페이지는 커서가 없음
+        last = tree.list_nodes(after=second.next_cursor, limit=2)
+        assert [n.id for n in last.items] == ["zz"]
+        assert last.next_cursor is None
+        assert [n.id for n in tree.list_nodes(limit=None).items] == [
+            "a", "b", "c", "d", "zz"
+        ]
+
+        child = tree.fork()
+        child.add_node(self._node("ca", "root"))
+        page = child.list_nodes(after="c", limit=2)
+        assert [n.id for n in page.items] == ["ca", "d"]
+        with pytest.raises(ValueError):
+            tree.list_nodes(limit=0)
+
+    def test_list_children_pages(self):
+        """자식 목록이 추가 순서대로 페이지로 나뉘는지 확인."""
+        tree = Tree()
+        for node_id in ["c", "a", "b"]:
+            tree.add_node(self._node(node_id, "root"))
+
+        first = tree.list_children("root", limit=2)
+        assert [n.id for n in first.items] == ["c", "a"]
+        rest = tree.list_children("root", after=first.next_cursor, limit=2)
+        assert [n.id for n in rest.items] == ["b"]
+        assert rest.next_cursor is None
+        assert tree.list_children("a").items == []
+        with pytest.raises(ValueError):
+            tree.list_children("root", after="missing")
+
+
+class TestAddNodes:
+    """Tree.add_nodes() 일괄 추가 테스트."""
+
+    def _node(self, node_id, parent_id):
+        return Node(id=node_id, parent_id=parent_id, user_question="Q?", ai_answer="A.")
+
+    def test_any_order(self):
+        """자식이 부모보다 먼저 와도 추가되는지 확인."""
+        tree = Tree()
+        added = tree.add_nodes(
+            [self._node("c", "b"), self._node("b", "a"), self._node("a", "root")]
+        )
+
+        assert added == 3
+        assert tree.get_depth("c") == 3
+        assert tree.get_path_to_root("c") == ["c", "b", "a", "root"]
+        assert tree.get_node_number("c") == 3
+
+    def test_missing_parent_is_atomic(self):
+        """검증 실패 시 트리가 변경되지 않는지 확인."""
+        tree = Tree()
+
+        with pytest.raises(ValueError, match="does not exist"):
+            tree.add_nodes([self._node("a", "root"), self._node("b", "missing")])
+
+        assert tree.get_node_count() == 1
+        assert tree.get_child_ids("root") == []
+        assert tree.find_ids_by_prefix("a") == []
+
+    def test_duplicate_and_cycle(self):
+        """중복 ID와 순환 참조를 거부하는지 확인."""
+        tree = Tree()
+        tree.add_node(self._node("a", "root"))
+
+        with pytest.raises(ValueError, match="Duplicate"):
+            tree.add_nodes([self._node("a", "root")])
+        with pytest.raises(ValueError, match="Cycle"):
+            tree.add_nodes([self._node("x", "y"), self._node("y", "x")])
+        with pytest.raises(ValueError, match="no parent"):
+            tree.add_nodes([self._node("z", None)])
+
+        assert tree.get_node_count() == 2
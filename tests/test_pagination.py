@@ -0,0 +1,34 @@
+"""
+pagination 모듈(커서 기반 페이지) 테스트.
+"""
+
+import pytest
+
+from core.pagination import Page, paginate
+
+
+class TestPaginate:
+    """paginate 함수 테스트."""
+
+    def test_cursor_only_when_more_items(self):
+        """다음 항목이 있을 때만 커서가 생기는지 확인."""
+        assert paginate(iter("abc"), 2, str.upper) == Page(["a", "b"], "B")
+        assert paginate(iter("ab"), 2, str.upper) == Page(["a", "b"], None)
+        assert paginate(iter("abc"), None, str.upper) == Page(["a", "b", "c"], None)
+
+    def test_reads_at_most_one_extra_item(self):
+        """무한 이터러블에서도 limit + 1개만 읽는지 확인."""
+        def numbers():
+            n = 0
+            while True:
+                n += 1
+                yield n
+
+        source = numbers()
+        assert paginate(source, 3, str).items == [1, 2, 3]
+        assert next(source) == 5
+
+    def test_invalid_limit(self):
+        """limit이 1보다 작으면 ValueError."""
+        with pytest.raises(ValueError):
+            paginate([], 0, str)
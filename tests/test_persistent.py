@@ -0,0 +1,161 @@
+"""
+persistent 모듈(PMap, TreeVersion)과 Store 버전 기록 테스트.
+"""
+
+import random
+
+import pytest
+
+from core.models import Tree, create_node
+from core.persistent import PMap
+from core.store import Store
+
+
+class _CollidingKey:
+    """해시가 항상 같은 키 (충돌 노드 검증용)."""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __hash__(self):
+        return 42
+
+    def __eq__(self, other):
+        return isinstance(other, _CollidingKey) and other.name == self.name
+
+
+class TestPMap:
+    """PMap 테스트."""
+
+    def test_set_and_delete_keep_old_versions(self):
+        """set/delete가 이전 버전을 바꾸지 않는지 확인."""
+        v1 = PMap({"a": 1})
+        v2 = v1.set("b", 2)
+        v3 = v2.delete("a")
+
+        assert dict(v1) == {"a": 1}
+        assert dict(v2) == {"a": 1, "b": 2}
+        assert dict(v3) == {"b": 2}
+        assert v3.delete("missing") is v3
+        assert v2.set("a", 1) is v2
+
+    def test_matches_dict_under_random_operations(self):
+        """무작위 변경 후 내용이 dict와 같은지 확인 (충돌 키 포함)."""
+        rng = random.Random(7)
+        keys = [f"k{i}" for i in range(300)] + [_CollidingKey(i) for i in range(5)]
+        pmap, expected = PMap(), {}
+
+        for _ in range(3000):
+            key = rng.choice(keys)
+            if rng.random() < 0.3:
+                pmap = pmap.delete(key)
+                expected.pop(key, None)
+            else:
+                value = rng.randint(0, 9)
+                pmap = pmap.set(key, value)
+                expected[key] = value
+
+        assert len(pmap) == len(expected)
+        assert dict(pmap.items()) == expected
+        for key in keys:
+            assert pmap.get(key) == expected.get(key)
+
+
+class TestTreeVersion:
+    """Tree.snapshot() 테스트."""
+
+    def test_snapshot_requires_enable(self):
+        """버전 유지를 켜지 않으면 snapshot이 실패하는지 확인."""
+        with pytest.raises(ValueError):
+            Tree(root_id="root").snapshot()
+
+    def test_snapshot_is_unchanged_by_later_adds(self):
+        """스냅샷이 이후 추가된 노드를 보지 않는지 확인."""
+        tree = Tree(root_id="root")
+        a = create_node("root", "Q1", "A1")
+        tree.add_node(a)
+        tree.enable_versions()
+        before = tree.snapshot()
+
+        b = create_node(a.id, "Q2", "A2")
+        tree.add_node(b)
+        after = tree.snapshot()
+
+        assert before.get_node_count() == 2
+        assert not before.node_exists(b.id)
+        assert after.get_child_ids(a.id) == [b.id]
+        assert after.get_path_to_root(b.id) == [b.id, a.id, "root"]
+        # 바뀌지 않은 노드는 공유
+        assert after.get_node(a.id) is before.get_node(a.id)
+
+
+class TestStoreVersions:
+    """Store 버전 기록(max_versions) 테스트."""
+
+    def test_disabled_by_default(self):
+        """기본값에서는 버전을 보관하지 않는지 확인."""
+        store = Store()
+        store.add_node("Q", "A")
+
+        assert store.list_versions() == []
+        with pytest.raises(ValueError):
+            store.get_snapshot()
+
+    def test_ring_is_bounded(self):
+        """최근 max_versions개만 보관하는지 확인."""
+        store = Store(max_versions=5)
+        for i in range(10):
+            store.add_node(f"Q{i}", f"A{i}")
+
+        assert store.list_versions() == [6, 7, 8, 9, 10]
+        with pytest.raises(ValueError):
+            store.get_snapshot(version=2)
+
+    def test_snapshot_ago(self):
+        """몇 번의 변경 이전 상태를 조회할 수 있는지 확인."""
+        store = Store(max_versions=50)
+        nodes = [store.add_node(f"Q{i}", f"A{i}") for i in range(5)]
+        store.save_checkpoint("cp")
+        store.switch_to_node(nodes[1].id)
+
+        now = store.get_snapshot()
+        assert now.current_node_id == nodes[1].id
+        assert now.checkpoints["cp"] == nodes[4].id
+
+        old = store.get_snapshot(ago=4)
+        assert old.version == store.get_version() - 4
+        assert old.current_node_id == nodes[2].id
+        assert old.tree.get_node_count() == 4
+        assert "cp" not in old.checkpoints
+        assert old.active_path_ids == ["root", nodes[0].id, nodes[1].id, nodes[2].id]
+
+    def test_restore_version(self):
+        """과거 위치와 체크포인트가 새 버전으로 복원되는지 확인."""
+        store = Store(max_versions=50)
+        a = store.add_node("Q1", "A1")
+        store.save_checkpoint("first")
+        target = store.get_version()
+        b = store.add_node("Q2", "A2")
+        store.save_checkpoint("second")
+        store.delete_checkpoint("first")
+
+        delta = store.restore_version(target)
+
+        assert delta.added_ids == [] and delta.removed_ids == [b.id]
+        assert store.get_current_node_id() == a.id
+        assert store.list_checkpoints() == {"first": a.id}
+        # 트리는 추가만 가능하므로 이후 노드도 남아 있음
+        assert store.tree.node_exists(b.id)
+        assert store.get_snapshot().checkpoints == {"first": a.id}
+
+    def test_reset_keeps_recording(self):
+        """reset 이후 새 트리에서도 버전 기록이 이어지는지 확인."""
+        store = Store(max_versions=10)
+        store.add_node("Q", "A")
+        store.reset()
+        node = store.add_node("Q2", "A2")
+
+        snapshot = store.get_snapshot()
+        assert snapshot.tree.get_node_count() == 2
+        assert snapshot.current_node_id == node.id
+        assert store.get_snapshot(ago=1).tree.get_node_count() == 1
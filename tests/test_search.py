@@ -0,0 +1,116 @@
+"""
+search 모듈(전문 검색 역색인) 테스트.
+"""
+
+import io
+
+import pytest
+
+from core.search import SearchIndex, tokenize
+from core.store import Store
+
+
+def _store_with_turns():
+    """검색용 대화 트리: root → a → b, root → c."""
+    store = Store()
+    a = store.add_node("파이썬 리스트는?", "list comprehension 으로 만드는 컬렉션")
+    b = store.add_node("딕셔너리는?", "key value 구조이며 comprehension 도 가능")
+    store.switch_to_node("root")
+    c = store.add_node("자바 배열은?", "고정 크기이며 list 와 다름")
+    return store, a, b, c
+
+
+class TestTokenize:
+    """tokenize 함수 테스트."""
+
+    def test_english_and_korean(self):
+        """영문은 소문자 단어, 한글은 2음절 바이그램으로 나뉘는지 확인."""
+        assert tokenize("Python List!") == ["python", "list"]
+        assert tokenize("파이썬은 좋아") == ["파이", "이썬", "썬은", "좋아"]
+        assert tokenize("a 가") == ["a", "가"]
+        assert tokenize("") == []
+
+
+class TestSearchIndex:
+    """SearchIndex 테스트."""
+
+    def test_ranking_and_korean_stem(self):
+        """조사가 붙은 어절을 어간으로 찾고 점수 순으로 정렬되는지 확인."""
+        store, a, b, c = _store_with_turns()
+        index = SearchIndex(store)
+
+        assert [hit.node_id for hit in index.search("리스트")] == [a.id]
+        hits = index.search("list comprehension")
+        assert [hit.node_id for hit in hits][0] == a.id
+        assert {hit.node_id for hit in hits} == {a.id, b.id, c.id}
+        assert hits[0].score >= hits[-1].score
+        assert index.search("없는단어") == []
+        with pytest.raises(ValueError):
+            index.search("list", limit=0)
+
+    def test_phrase_and_filters(self):
+        """구절 일치와 하위 트리/깊이/체크포인트 필터를 확인."""
+        store, a, b, c = _store_with_turns()
+        index = SearchIndex(store)
+        store.save_checkpoint("arrays", node_id=c.id)
+
+        assert [h.node_id for h in index.search('"list comprehension"')] == [a.id]
+        # 질문과 답변 경계를 넘는 구절은 일치하지 않음
+        assert index.search('"리스트는 list"') == []
+
+        assert [h.node_id for h in index.search("list", subtree=a.id)] == [a.id]
+        assert [h.node_id for h in index.search("comprehension", min_depth=2)] == [
+            b.id
+        ]
+        assert [h.node_id for h in index.search("list", has_checkpoint=True)] == [
+            c.id
+        ]
+        with pytest.raises(ValueError):
+            index.search("list", subtree="missing")
+
+    def test_incremental_updates(self):
+        """노드 추가, 실행 취소, reset이 색인에 반영되는지 확인."""
+        store = Store()
+        index = SearchIndex(store)
+        node = store.add_node("async 란?", "비동기 실행")
+
+        assert [hit.node_id for hit in index.search("async")] == [node.id]
+        store.undo()
+        assert index.search("async") == []
+        store.redo()
+        assert [hit.node_id for hit in index.search("비동기")] == [node.id]
+
+        store.reset()
+        assert index.search("async") == []
+        assert len(index) == 1  # 새 트리의 루트
+
+    def test_merge_indexes_new_nodes(self):
+        """분기 Store에서 추가된 노드가 병합 후 검색되는지 확인."""
+        store = Store()
+        index = SearchIndex(store)
+        child = store.fork()
+        node = child.add_node("thread 안전?", "잠금으로 보호")
+
+        store.merge(child)
+        assert [hit.node_id for hit in index.search("thread")] == [node.id]
+
+    def test_dump_and_load(self):
+        """저장한 색인을 불러오고 이후 변경분만 반영하는지 확인."""
+        store, a, b, c = _store_with_turns()
+        index = SearchIndex(store)
+        buffer = io.StringIO()
+        assert index.dump(buffer) == 4
+
+        store.switch_to_node(c.id)
+        d = store.add_node("배열 정렬?", "sort 사용")
+        buffer.seek(0)
+        loaded = SearchIndex(store, fp=buffer)
+
+        assert len(loaded) == 5
+        assert loaded.term_count == SearchIndex(store).term_count
+        for query in ["리스트", "list", "sort", '"key value"']:
+            assert loaded.search(query) == index.search(query)
+        assert [hit.node_id for hit in loaded.search("sort")] == [d.id]
+
+        with pytest.raises(ValueError):
+            SearchIndex(store, fp=io.StringIO('{"type": "header"}\n'))
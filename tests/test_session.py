@@ -0,0 +1,106 @@
+"""
+session 모듈(공유 트리 위의 다중 세션) 테스트.
+"""
+
+from core.session import Session, SessionManager
+
+
+class TestSession:
+    """Session 동작 테스트."""
+
+    def test_nodes_shared_paths_independent(self):
+        """노드는 공유되고 활성 경로는 세션별로 독립적인지 확인."""
+        manager = SessionManager()
+        alice = manager.open_session("alice")
+        bob = manager.open_session("bob")
+
+        node = alice.add_node("Q?", "A.")
+
+        assert bob.tree is alice.tree
+        assert bob.get_current_node_id() == "root"
+        assert bob.switch_to_node(node.id)
+        assert bob.active_path_ids == ["root", node.id]
+        assert alice.active_path_ids == ["root", node.id]
+
+        bob.add_node("Bob Q?", "Bob A.")
+        assert alice.get_current_node_id() == node.id
+        assert len(alice.get_children_of_current()) == 1
+
+    def test_checkpoint_namespace(self):
+        """체크포인트 이름공간이 세션별로 분리되는지 확인."""
+        manager = SessionManager()
+        alice = manager.open_session("alice")
+        bob = manager.open_session("bob")
+        alice.add_node("Q?", "A.")
+
+        assert alice.save_checkpoint("cp")
+        assert bob.save_checkpoint("cp")
+        assert alice.list_checkpoints()["cp"] != bob.list_checkpoints()["cp"]
+
+    def test_history_and_go_back(self):
+        """이동 이력 기록과 되돌아가기 확인."""
+        session = SessionManager().open_session()
+        node1 = session.add_node("Q1?", "A1.")
+        node2 = session.add_node("Q2?", "A2.")
+
+        session.switch_to_node("root")
+        session.switch_to_node(node1.id)
+
+        assert session.history == [node2.id, "root"]
+        assert session.go_back()
+        assert session.get_current_node_id() == "root"
+        assert session.go_back()
+        assert session.get_current_node_id() == node2.id
+        assert session.go_back() is None
+
+    def test_history_bounded(self):
+        """이동 이력이 최대 길이를 넘지 않는지 확인."""
+        manager = SessionManager()
+        session = Session(manager.tree, history_size=3)
+        node = session.add_node("Q?", "A.")
+
+        for _ in range(5):
+            session.switch_to_node("root")
+            session.switch_to_node(node.id)
+
+        assert len(session.history) == 3
+
+    def test_reset_keeps_shared_tree(self):
+        """세션 reset이 공유 트리를 건드리지 않는지 확인."""
+        manager = SessionManager()
+        session = manager.open_session()
+        session.add_node("Q?", "A.")
+
+        session.reset()
+
+        assert session.active_path_ids == ["root"]
+        assert manager.tree.get_node_count() == 2
+
+    def test_undo_add_keeps_shared_node(self):
+        """세션의 턴 추가 되돌리기가 공유 트리에서 노드를 지우지 않는지 확인."""
+        manager = SessionManager()
+        session = manager.open_session()
+        node = session.add_node("Q?", "A.")
+
+        session.undo()
+
+        assert session.get_current_node_id() == "root"
+        assert manager.tree.node_exists(node.id)
+        session.redo()
+        assert session.get_current_node_id() == node.id
+
+
+class TestSessionManager:
+    """SessionManager 테스트."""
+
+    def test_open_get_close(self):
+        """세션 열기/조회/닫기 확인."""
+        manager = SessionManager()
+        session = manager.open_session("s1")
+
+        assert manager.open_session("s1") is session
+        assert manager.get_session("s1") is session
+        assert len(manager) == 1
+        assert manager.close_session("s1")
+        assert not manager.close_session("s1")
+        assert manager.get_session("s1") is None
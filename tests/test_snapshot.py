@@ -0,0 +1,98 @@
+"""
+snapshot 모듈 테스트.
+"""
+
+import pytest
+
+from core.path_utils import get_leaf_nodes
+from core.snapshot import SnapshotTree, open_snapshot, write_snapshot
+from core.store import Store
+
+
+def _build_store() -> tuple[Store, dict]:
+    """root -> A -> B, root -> C 구조의 Store를 만듭니다."""
+    store = Store()
+    node_a = store.add_node("질문 A?", "답변 A.", {"topic": "python"})
+    node_b = store.add_node("질문 B?", "답변 B.")
+    store.switch_to_node("root")
+    node_c = store.add_node("질문 C?", "답변 C.")
+    return store, {"a": node_a, "b": node_b, "c": node_c}
+
+
+class TestWriteAndOpen:
+    """스냅샷 저장/열기 테스트."""
+
+    def test_roundtrip_nodes(self, tmp_path):
+        """저장한 노드가 동일하게 디코딩되는지 확인."""
+        store, nodes = _build_store()
+        path = tmp_path / "tree.snap"
+
+        count = write_snapshot(store.tree, str(path))
+
+        assert count == 4
+        with open_snapshot(str(path)) as snap:
+            assert snap.root_id == "root"
+            assert snap.get_node_count() == 4
+            for original in nodes.values():
+                assert snap.get_node(original.id) == original
+
+    def test_structure_queries(self, tmp_path):
+        """자식, 경로, 깊이 조회가 원본 트리와 일치하는지 확인."""
+        store, nodes = _build_store()
+        path = tmp_path / "tree.snap"
+        write_snapshot(store.tree, str(path))
+
+        with open_snapshot(str(path)) as snap:
+            children = [n.id for n in snap.get_children("root")]
+            assert children == [nodes["a"].id, nodes["c"].id]
+            assert snap.get_path_to_root(nodes["b"].id) == store.tree.get_path_to_root(
+                nodes["b"].id
+            )
+            assert snap.get_depth(nodes["b"].id) == 2
+            assert snap.get_children(nodes["b"].id) == []
+
+    def test_missing_node(self, tmp_path):
+        """존재하지 않는 노드 조회."""
+        store, _ = _build_store()
+        path = tmp_path / "tree.snap"
+        write_snapshot(store.tree, str(path))
+
+        with open_snapshot(str(path)) as snap:
+            assert snap.get_node("missing") is None
+            assert snap.node_exists("missing") is False
+            assert snap.get_path_to_root("missing") == []
+            assert snap.get_depth("missing") == -1
+
+    def test_nodes_mapping_compatible(self, tmp_path):
+        """nodes 매핑을 사용하는 기존 유틸리티가 동작하는지 확인."""
+        store, nodes = _build_store()
+        path = tmp_path / "tree.snap"
+        write_snapshot(store.tree, str(path))
+
+        with open_snapshot(str(path)) as snap:
+            assert len(snap.nodes) == 4
+            assert nodes["a"].id in snap.nodes
+            leaves = {leaf.id for leaf in get_leaf_nodes(snap)}
+            assert leaves == {nodes["b"].id, nodes["c"].id}
+
+
+class TestReadOnly:
+    """읽기 전용 동작 테스트."""
+
+    def test_add_node_rejected(self, tmp_path):
+        """스냅샷에 노드 추가 시도 시 TypeError."""
+        store, nodes = _build_store()
+        path = tmp_path / "tree.snap"
+        write_snapshot(store.tree, str(path))
+
+        with open_snapshot(str(path)) as snap:
+            with pytest.raises(TypeError):
+                snap.add_node(nodes["a"])
+
+    def test_invalid_file(self, tmp_path):
+        """스냅샷 형식이 아닌 파일은 ValueError."""
+        path = tmp_path / "not_a_snapshot.bin"
+        path.write_bytes(b"hello world" * 10)
+
+        with pytest.raises(ValueError):
+            SnapshotTree(str(path))
@@ -0,0 +1,211 @@
+"""
+stats 모듈(점진적 트리/체크포인트 통계) 테스트.
+"""
+
+import random
+
+import pytest
+
+from core.models import Node, Tree
+from core.session import SessionManager
+from core.stats import Histogram
+from core.store import Store
+
+
+def _brute_tree_stats(tree):
+    """트리를 전부 훑어 통계를 계산합니다 (비교 기준)."""
+    fanouts = [len(tree.get_child_ids(node_id)) for node_id in tree.nodes]
+    depths = [len(tree.get_path_to_root(node_id)) - 1 for node_id in tree.nodes]
+    return {
+        "node_count": len(fanouts),
+        "leaf_count": fanouts.count(0),
+        "branch_points": sum(1 for f in fanouts if f >= 2),
+        "max_depth": max(depths),
+        "mean_depth": sum(depths) / len(depths),
+    }
+
+
+class TestHistogram:
+    """Histogram 테스트."""
+
+    def test_min_max_follow_removals(self):
+        """경계값이 제거되면 최소/최대가 다음 값으로 이동하는지 확인."""
+        hist = Histogram()
+        for value in [1, 4, 4, 9]:
+            hist.add(value)
+
+        hist.remove(9)
+        hist.remove(1)
+        assert (hist.min, hist.max, hist.count) == (4, 4, 2)
+
+        hist.remove(4)
+        hist.remove(4)
+        assert (hist.min, hist.max, hist.mean) == (0, 0, 0)
+        with pytest.raises(ValueError):
+            hist.remove(4)
+
+    def test_move_sole_max_is_constant_time(self):
+        """유일한 최댓값을 1씩 옮길 때 빈 값을 훑지 않는지 확인."""
+
+        class CountingDict(dict):
+            lookups = 0
+
+            def __contains__(self, key):
+                CountingDict.lookups += 1
+                return super().__contains__(key)
+
+        hist = Histogram()
+        hist.counts = CountingDict()
+        hist.add(0)
+        hist.add(100_000)
+        hist.move(100_000, 100_001)
+        hist.move(100_001, 100_000)
+        assert (hist.min, hist.max) == (0, 100_000)
+        assert CountingDict.lookups <= 2
+
+
+class TestTreeStats:
+    """Tree가 유지하는 구조 통계 테스트."""
+
+    def test_matches_full_scan(self):
+        """무작위 추가/제거 후 통계가 전체 순회 결과와 같은지 확인."""
+        rng = random.Random(3)
+        tree = Tree()
+        ids = ["root"]
+        for i in range(300):
+            node = Node(
+                id=f"n{i}",
+                parent_id=rng.choice(ids),
+                user_question="Q?",
+                ai_answer="A.",
+            )
+            tree.add_node(node)
+            ids.append(node.id)
+            if i % 7 == 0:
+                leaves = [n for n in ids[1:] if not tree.get_child_ids(n)]
+                removed = tree.remove_leaf(rng.choice(leaves))
+                ids.remove(removed.id)
+
+        stats = tree.stats.as_dict()
+        for key, value in _brute_tree_stats(tree).items():
+            assert stats[key] == pytest.approx(value)
+
+    def test_wide_fanout(self):
+        """자식이 아주 많은 부모 아래에서도 분기 계수 통계가 맞는지 확인."""
+        store = Store()
+        for i in range(5000):
+            store.switch_to_node("root")
+            store.add_node(f"Q{i}?", "A.")
+        stats = store.get_tree_stats()
+        assert stats["branch_points"] == 1
+        assert stats["branching_histogram"] == {0: 5000, 5000: 1}
+
+        store.undo()
+        assert store.get_tree_stats()["branching_histogram"] == {0: 4999, 4999: 1}
+
+    def test_add_nodes_and_fork(self):
+        """일괄 추가와 분기 후에도 통계가 독립적으로 맞는지 확인."""
+        tree = Tree()
+        tree.add_nodes(
+            Node(id=node_id, parent_id=parent_id, user_question="Q?", ai_answer="A.")
+            for node_id, parent_id in [("b", "a"), ("a", "root"), ("c", "a")]
+        )
+        other = tree.fork()
+        other.add_node(Node(id="d", parent_id="b", user_question="Q?", ai_answer="A."))
+
+        assert tree.stats.as_dict()["branching_histogram"] == {0: 2, 1: 1, 2: 1}
+        assert tree.stats.branch_point_count == 1
+        assert other.stats.as_dict()["max_depth"] == 3
+        assert tree.stats.as_dict()["max_depth"] == 2
+
+    def test_bulk_batches_match_full_scan(self):
+        """여러 번의 일괄 추가를 한 번에 반영한 통계가 전체 순회와 같은지 확인."""
+        rng = random.Random(5)
+        tree = Tree()
+        ids = ["root"]
+        for batch_no in range(20):
+            batch = []
+            for i in range(rng.randint(1, 40)):
+                node_id = f"b{batch_no}-{i}"
+                batch.append(
+                    Node(
+                        id=node_id,
+                        parent_id=rng.choice(ids),
+                        user_question="Q?",
+                        ai_answer="A.",
+                    )
+                )
+                ids.append(node_id)
+            tree.add_nodes(batch)
+
+        stats = tree.stats.as_dict()
+        for key, value in _brute_tree_stats(tree).items():
+            assert stats[key] == pytest.approx(value)
+
+
+class TestCheckpointStats:
+    """Store가 유지하는 체크포인트 통계 테스트."""
+
+    def test_tracks_checkpoint_changes(self):
+        """저장/이름 변경/삭제/분기 발생이 통계에 반영되는지 확인."""
+        store = Store()
+        node1 = store.add_node("Q1?", "A1.")
+        store.add_node("Q2?", "A2.")
+        store.save_checkpoint("deep")
+        store.save_checkpoint("mid", node_id=node1.id)
+
+        stats = store.get_checkpoint_stats()
+        assert (stats["total_count"], stats["max_depth"], stats["min_depth"]) == (
+            2,
+            2,
+            1,
+        )
+        assert stats["branch_points"] == 0
+
+        # node1에 두 번째 자식이 생기면 'mid'가 분기 체크포인트가 됨
+        store.switch_to_node(node1.id)
+        store.add_node("Q3?", "A3.")
+        assert store.get_checkpoint_stats()["branch_points"] == 1
+
+        store.rename_checkpoint("mid", "branch")
+        assert store.checkpoint_stats.depth_of("branch") == 1
+        store.undo()  # 이름 변경 취소
+        store.undo()  # 노드 추가 취소 → 분기 해제
+        assert store.get_checkpoint_stats()["branch_points"] == 0
+
+        store.delete_checkpoint("deep")
+        assert store.get_checkpoint_stats()["avg_depth"] == 1
+
+    def test_shared_tree_branch_count(self):
+        """다른 세션이 만든 분기점의 체크포인트를 지워도 음수가 되지 않는지 확인."""
+        manager = SessionManager()
+        a = manager.open_session("a")
+        b = manager.open_session("b")
+        a.add_node("Q1?", "A1.")
+        a.save_checkpoint("cp", node_id="root")
+
+        b.switch_to_node("root")
+        b.add_node("Q2?", "A2.")  # root가 분기점이 되지만 a는 이벤트를 받지 않음
+        a.delete_checkpoint("cp")
+        assert a.get_checkpoint_stats()["branch_points"] == 0
+
+        # 자기 세션의 추가로 분기가 생기면 기존 체크포인트가 반영됨
+        a.save_checkpoint("cp", node_id="root")
+        a.switch_to_node("root")
+        a.add_node("Q3?", "A3.")
+        assert a.get_checkpoint_stats()["branch_points"] == 1
+        a.delete_checkpoint("cp")
+        assert a.get_checkpoint_stats()["branch_points"] == 0
+
+    def test_reset_and_fork_rebuild(self):
+        """reset과 fork 후 통계가 다시 만들어지는지 확인."""
+        store = Store()
+        store.add_node("Q?", "A.")
+        store.save_checkpoint("cp")
+
+        child = store.fork()
+        assert child.get_checkpoint_stats()["total_count"] == 1
+
+        store.reset()
+        assert store.get_checkpoint_stats()["total_count"] == 0
+        assert store.get_tree_stats()["leaf_count"] == 1
@@ -165,7 +165,7 @@ class TestSwitchToNode:
         # B로 전환
         success = store.switch_to_node(node_b.id)
 
-        assert success is True
+        assert success
         assert store.active_path_ids == ["root", node_a.id, node_b.id]
 
     def test_switch_to_ancestor(self):
@@ -180,7 +180,7 @@ class TestSwitchToNode:
         # root로 전환
         success = store.switch_to_node("root")
 
-        assert success is True
+        assert success
         assert store.active_path_ids == ["root"]
 
     def test_switch_to_invalid_node(self):
@@ -189,10 +189,51 @@ class TestSwitchToNode:
 
         success = store.switch_to_node("non-existent")
 
-        assert success is False
+        assert success is None
         assert store.active_path_ids == ["root"]  # 변경되지 않음
 
 
+    def test_switch_returns_delta(self):
+        """전환 결과로 LCA와 제거/추가된 경로가 반환되는지 확인."""
+        store = Store()
+
+        # root -> A -> B -> C, A -> D -> E
+        node_a = store.add_node("A?", "A.")
+        node_b = store.add_node("B?", "B.")
+        node_c = store.add_node("C?", "C.")
+        store.switch_to_node(node_a.id)
+        node_d = store.add_node("D?", "D.")
+        node_e = store.add_node("E?", "E.")
+
+        delta = store.switch_to_node(node_c.id)
+
+        assert delta.lca == node_a.id
+        assert delta.removed_ids == [node_d.id, node_e.id]
+        assert delta.added_ids == [node_b.id, node_c.id]
+        assert delta.distance == 4
+        assert store.active_path_ids == ["root", node_a.id, node_b.id, node_c.id]
+
+    def test_switch_delta_to_ancestor_and_self(self):
+        """조상/자기 자신으로 전환할 때의 delta 확인."""
+        store = Store()
+        node1 = store.add_node("Q1?", "A1.")
+        node2 = store.add_node("Q2?", "A2.")
+
+        same = store.switch_to_node(node2.id)
+        assert same
+        assert (same.lca, same.removed_ids, same.added_ids) == (node2.id, [], [])
+
+        up = store.switch_to_node(node1.id)
+        assert (up.lca, up.removed_ids, up.added_ids) == (node1.id, [node2.id], [])
+
+        down = store.switch_to_node(node2.id)
+        assert (down.lca, down.removed_ids, down.added_ids) == (
+            node1.id,
+            [],
+            [node2.id],
+        )
+
+
 class TestCheckpoints:
     """체크포인트 기능 테스트."""
 
@@ -393,3 +434,124 @@ class TestStoreIntegration:
         store.switch_to_node(node1.id)
         children = store.get_children_of_current()
         assert len(children) == 2
+
+
+class TestUndoRedo:
+    """실행 취소/다시 실행 테스트."""
+
+    def test_undo_add_node_removes_leaf(self):
+        """턴 추가를 되돌리면 노드가 제거되고 부모로 이동하는지 확인."""
+        store = Store()
+        node1 = store.add_node("Q1?", "A1.")
+        node2 = store.add_node("Q2?", "A2.")
+
+        op = store.undo()
+
+        assert op.kind == "add" and op.key == node2.id
+        assert store.get_current_node_id() == node1.id
+        assert not store.tree.node_exists(node2.id)
+        assert store.tree.get_child_ids(node1.id) == []
+
+        store.redo()
+        assert store.get_current_node_id() == node2.id
+        assert store.tree.get_child_ids(node1.id) == [node2.id]
+
+    def test_undo_switch_and_checkpoints(self):
+        """전환, 체크포인트 저장/삭제/이름 변경을 순서대로 되돌리는지 확인."""
+        store = Store()
+        node1 = store.add_node("Q1?", "A1.")
+        store.save_checkpoint("cp")
+        store.switch_to_node("root")
+        store.rename_checkpoint("cp", "renamed")
+        store.delete_checkpoint("renamed")
+
+        store.undo()
+        assert store.list_checkpoints() == {"renamed": node1.id}
+        store.undo()
+        assert store.list_checkpoints() == {"cp": node1.id}
+        store.undo()
+        assert store.get_current_node_id() == node1.id
+        store.undo()
+        assert store.list_checkpoints() == {}
+
+        store.redo()
+        store.redo()
+        assert store.list_checkpoints() == {"cp": node1.id}
+        assert store.get_current_node_id() == "root"
+
+    def test_new_operation_clears_redo(self):
+        """새 작업이 다시 실행 기록을 비우는지 확인."""
+        store = Store()
+        store.add_node("Q1?", "A1.")
+        store.undo()
+        store.add_node("Q2?", "A2.")
+
+        assert store.redo() is None
+        assert store.tree.get_node_count() == 2
+
+    def test_journal_size_is_bounded(self):
+        """journal_size만큼만 되돌릴 수 있는지 확인."""
+        store = Store(journal_size=2)
+        for i in range(5):
+            store.add_node(f"Q{i}?", f"A{i}.")
+
+        assert store.undo() is not None
+        assert store.undo() is not None
+        assert store.undo() is None
+        assert store.tree.get_node_count() == 4
+
+    def test_undo_bumps_version(self):
+        """되돌리기도 버전을 올리고 기대 버전을 검사하는지 확인."""
+        store = Store()
+        store.add_node("Q1?", "A1.")
+        version = store.get_version()
+
+        store.undo(expected_version=version)
+        assert store.get_version() == version + 1
+
+        with pytest.raises(ValueError):
+            store.redo(expected_version=version)
+
+    def test_prune_is_not_recorded(self):
+        """prune_checkpoints는 기록되지 않고 지워진 체크포인트는 되돌리지 못하는지 확인."""
+        store = Store()
+        store.save_checkpoint("a")
+        store.save_checkpoint("b")
+        version = store.get_version()
+
+        assert store.prune_checkpoints(["a", "b", "missing"]) == 2
+        assert store.get_version() == version + 1
+        assert store.list_checkpoints() == {}
+        assert store.prune_checkpoints(["a"]) == 0
+
+        with pytest.raises(ValueError):
+            store.undo()  # "b" 저장 취소 - 이미 없음
+        # 적용할 수 없는 기록은 버려져 실행 취소가 막히지 않음
+        assert len(store.journal) == 1
+        with pytest.raises(ValueError):
+            store.undo()  # "a"도 이미 없음
+        assert store.undo() is None
+
+    def test_stale_op_does_not_block_history(self):
+        """정리된 체크포인트 기록을 건너뛰고 그 이전 작업을 되돌리는지 확인."""
+        store = Store()
+        node = store.add_node("Q?", "A.")
+        store.save_checkpoint("cp")
+        store.prune_checkpoints(["cp"])
+
+        with pytest.raises(ValueError):
+            store.undo()
+        assert store.undo().kind == "add"
+        assert not store.tree.node_exists(node.id)
+        assert store.redo().kind == "add"
+        assert store.tree.node_exists(node.id)
+
+    def test_rename_checkpoint_rejects_existing_name(self):
+        """이미 있는 이름으로는 바꿀 수 없는지 확인."""
+        store = Store()
+        store.save_checkpoint("a")
+        store.save_checkpoint("b")
+
+        assert not store.rename_checkpoint("a", "b")
+        assert not store.rename_checkpoint("missing", "c")
+        assert store.list_checkpoints() == {"a": "root", "b": "root"}
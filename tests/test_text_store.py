@@ -0,0 +1,104 @@
+"""
+text_store 모듈(내용 주소 기반 중복 제거) 테스트.
+"""
+
+from cli.visualizer import visualize_stats
+from core.content_store import ContentStore
+from core.store import Store
+from core.text_store import TextStore, text_digest
+
+
+class TestTextStore:
+    """TextStore 기본 동작 테스트."""
+
+    def test_identical_text_stored_once(self):
+        """같은 텍스트는 같은 참조를 공유하는지 확인."""
+        ts = TextStore()
+
+        ref1 = ts.put("같은 답변")
+        ref2 = ts.put("같은 답변")
+        ref3 = ts.put("다른 답변")
+
+        assert ref1 == ref2 == text_digest("같은 답변")
+        assert ref1 != ref3
+        assert ts.refcount(ref1) == 2
+        assert ts.get(ref1) == "같은 답변"
+
+    def test_release(self):
+        """참조 카운트가 0이 되면 제거되는지 확인."""
+        ts = TextStore()
+        ref = ts.put("text")
+        ts.put("text")
+
+        assert ts.release(ref) is False
+        assert ts.refcount(ref) == 1
+        assert ts.release(ref) is True
+        assert ts.refcount(ref) == 0
+        assert ts.release(ref) is False
+
+    def test_report(self):
+        """중복 제거 비율 계산 확인."""
+        ts = TextStore()
+        for _ in range(4):
+            ts.put("abcd")
+
+        report = ts.report()
+
+        assert report["unique_texts"] == 1
+        assert report["references"] == 4
+        assert report["logical_bytes"] == 16
+        assert report["stored_bytes"] == 4
+        assert report["dedup_ratio"] == 4.0
+
+    def test_disk_backing_writes_once(self, tmp_path):
+        """디스크 백엔드에 고유 본문만 기록되는지 확인."""
+        with ContentStore(str(tmp_path / "content.bin")) as cs:
+            ts = TextStore(backing=cs)
+            ref = ts.put("hello")
+            ts.put("hello")
+
+            assert cs.cache_info()["bytes"] == 5
+            assert ts.get(ref) == "hello"
+
+
+class TestDedupStore:
+    """TextStore를 사용하는 Store 테스트."""
+
+    def test_sibling_answers_compared_by_hash(self):
+        """형제 노드의 답변 비교가 참조 비교로 이루어지는지 확인."""
+        ts = TextStore()
+        store = Store(content_store=ts)
+        node1 = store.add_node("질문", "같은 답변")
+        store.switch_to_node("root")
+        node2 = store.add_node("질문", "같은 답변")
+        store.switch_to_node("root")
+        node3 = store.add_node("질문", "다른 답변")
+
+        assert node1._ai_answer_ref == node2._ai_answer_ref
+        assert node1.has_same_answer(node2)
+        assert not node1.has_same_answer(node3)
+        assert ts.report()["unique_texts"] == 3  # 질문 1개 + 답변 2개
+
+    def test_reassign_releases_old_text(self):
+        """본문 재대입 시 이전 참조가 해제되는지 확인."""
+        ts = TextStore()
+        store = Store(content_store=ts)
+        node = store.add_node("Q?", "old")
+        old_ref = node._ai_answer_ref
+
+        node.ai_answer = "new"
+
+        assert ts.refcount(old_ref) == 0
+        assert node.ai_answer == "new"
+
+    def test_stats_shows_dedup(self):
+        """stats 출력에 중복 제거 현황이 포함되는지 확인."""
+        store = Store(content_store=TextStore())
+        store.add_node("Q?", "A.")
+        store.switch_to_node("root")
+        store.add_node("Q?", "A.")
+
+        output = visualize_stats(store)
+
+        assert "본문 중복 제거" in output
+        assert "2.00x" in output
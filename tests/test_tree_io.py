@@ -0,0 +1,159 @@
+"""
+tree_io 모듈(JSONL 내보내기/가져오기) 테스트.
+"""
+
+import io
+import json
+
+import pytest
+
+from core.models import LazyNode, Tree
+from core.store import Store
+from core.text_store import TextStore
+from core.tree_io import export_tree_jsonl, import_tree_jsonl
+
+
+def _build_store() -> Store:
+    """분기와 체크포인트가 있는 Store를 만듭니다."""
+    store = Store()
+    node1 = store.add_node("Q1?", "A1.", {"topic": "python"})
+    store.add_node("Q2?", "A2.")
+    store.save_checkpoint("cp1")
+    store.switch_to_node(node1.id)
+    store.add_node("Q3?", "A3.")
+    return store
+
+
+def _export(store: Store) -> str:
+    buf = io.StringIO()
+    export_tree_jsonl(store, buf)
+    return buf.getvalue()
+
+
+class TestExport:
+    """내보내기 테스트."""
+
+    def test_parent_before_child(self):
+        """모든 노드가 부모 다음에 기록되는지 확인."""
+        store = _build_store()
+        records = [json.loads(line) for line in _export(store).splitlines()]
+
+        seen = set()
+        for record in records:
+            if record["type"] == "node":
+                assert record["parent_id"] is None or record["parent_id"] in seen
+                seen.add(record["id"])
+
+        assert records[0]["type"] == "header"
+        assert records[0]["node_count"] == 4
+        assert len(seen) == 4
+
+    def test_includes_checkpoints_and_state(self):
+        """체크포인트와 현재 위치가 기록되는지 확인."""
+        store = _build_store()
+        records = [json.loads(line) for line in _export(store).splitlines()]
+
+        checkpoints = [r for r in records if r["type"] == "checkpoint"]
+        state = [r for r in records if r["type"] == "state"]
+
+        node_id = store.checkpoints["cp1"]
+        assert checkpoints == [
+            {
+                "type": "checkpoint",
+                "name": "cp1",
+                "node_id": node_id,
+                "path_hash": store.tree.get_path_hash(node_id),
+            }
+        ]
+        assert state[0]["current_node_id"] == store.get_current_node_id()
+
+
+class TestImport:
+    """가져오기 테스트."""
+
+    def test_roundtrip(self):
+        """내보낸 트리를 그대로 복원하는지 확인."""
+        store = _build_store()
+
+        restored = import_tree_jsonl(io.StringIO(_export(store)))
+
+        assert list(restored.tree.nodes) == list(store.tree.nodes)
+        for node_id, node in store.tree.nodes.items():
+            assert restored.tree.get_node(node_id) == node
+        assert restored.checkpoints == store.checkpoints
+        assert restored.active_path_ids == store.active_path_ids
+
+    def test_import_into_lazy_store(self):
+        """지연 로딩 Store로 가져오면 LazyNode로 저장되는지 확인."""
+        store = _build_store()
+        target = Store(content_store=TextStore())
+
+        import_tree_jsonl(io.StringIO(_export(store)), target)
+
+        node_id = store.get_current_node_id()
+        assert isinstance(target.tree.get_node(node_id), LazyNode)
+        assert target.tree.get_node(node_id).ai_answer == "A3."
+
+    def test_missing_parent_is_atomic(self):
+        """부모가 없는 노드가 있으면 실패하고 대상 Store는 그대로인지 확인."""
+        lines = _export(_build_store()).splitlines(keepends=True)
+        # 루트 다음 첫 노드(다른 노드들의 조상)를 제거
+        broken = [lines[0], lines[1]] + lines[3:]
+        target = Store()
+        target.add_node("기존?", "유지.")
+        before = list(target.tree.nodes)
+
+        with pytest.raises(ValueError):
+            import_tree_jsonl(io.StringIO("".join(broken)), target)
+
+        assert list(target.tree.nodes) == before
+
+    def test_tampered_content_fails_integrity_check(self):
+        """체크포인트 이전 이력의 내용이 바뀌면 가져오기가 거부되는지 확인."""
+        exported = _export(_build_store())
+        assert import_tree_jsonl(io.StringIO(exported)).list_checkpoints()
+
+        tampered = exported.replace('"A1."', '"바뀐 답변."')
+        with pytest.raises(ValueError, match="integrity"):
+            import_tree_jsonl(io.StringIO(tampered))
+
+    def test_invalid_header(self):
+        """헤더가 없으면 ValueError."""
+        with pytest.raises(ValueError):
+            import_tree_jsonl(io.StringIO('{"type": "node"}\n'))
+        with pytest.raises(ValueError):
+            import_tree_jsonl(io.StringIO(""))
+
+    def test_inserts_in_chunks(self, monkeypatch):
+        """노드를 chunk_size개씩 나누어 삽입하는지 확인."""
+        store = Store()
+        for i in range(7):
+            store.add_node(f"Q{i}?", f"A{i}.")
+        sizes = []
+        add_nodes = Tree.add_nodes
+
+        def counting_add_nodes(tree, nodes):
+            sizes.append(len(nodes))
+            return add_nodes(tree, nodes)
+
+        monkeypatch.setattr(Tree, "add_nodes", counting_add_nodes)
+        restored = import_tree_jsonl(io.StringIO(_export(store)), chunk_size=3)
+
+        assert sizes == [3, 3, 1]
+        assert list(restored.tree.nodes) == list(store.tree.nodes)
+        assert restored.active_path_ids == store.active_path_ids
+        with pytest.raises(ValueError):
+            import_tree_jsonl(io.StringIO(_export(store)), chunk_size=0)
+
+    def test_node_count_mismatch(self):
+        """헤더의 노드 수와 실제 노드 수가 다르면 ValueError인지 확인."""
+        lines = _export(_build_store()).splitlines(keepends=True)
+        leaf = next(
+            i
+            for i, line in enumerate(lines)
+            if json.loads(line).get("user_question") == "Q3?"
+        )
+        truncated = lines[:leaf] + lines[leaf + 1 :]
+
+        with pytest.raises(ValueError, match="Node count"):
+            import_tree_jsonl(io.StringIO("".join(truncated)))
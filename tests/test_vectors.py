@@ -0,0 +1,148 @@
+"""
+vectors 모듈(임베딩 벡터 색인) 테스트.
+"""
+
+import math
+import time
+
+import pytest
+
+from core import vectors
+from core.store import Store
+from core.vectors import HashingEmbedder, VectorIndex
+
+TOPICS = [
+    ("파이썬 리스트 정렬", "sorted 함수로 리스트를 정렬합니다"),
+    ("자바 스레드 동기화", "synchronized 키워드로 스레드를 보호합니다"),
+    ("SQL 조인 종류", "inner join 과 outer join 이 있습니다"),
+]
+
+
+def _store_with_topics(repeat=1):
+    """주제별로 root 아래 분기를 만든 Store와 노드 목록."""
+    store = Store()
+    nodes = []
+    for i in range(repeat):
+        for question, answer in TOPICS:
+            store.switch_to_node("root")
+            nodes.append(store.add_node(f"{question} {i}", answer))
+    return store, nodes
+
+
+class TestHashingEmbedder:
+    """HashingEmbedder 테스트."""
+
+    def test_deterministic_and_normalized(self):
+        """같은 본문은 같은 정규화 벡터가 되고 겹치는 단어가 많을수록 가까운지 확인."""
+        embed = HashingEmbedder(dim=64)
+        a, b, c, empty = embed(["python list sort", "python list", "java thread", ""])
+
+        assert embed(["python list sort"])[0] == a
+        assert math.isclose(sum(x * x for x in a), 1.0)
+        dot = lambda u, v: sum(x * y for x, y in zip(u, v))  # noqa: E731
+        assert dot(a, b) > dot(a, c)
+        assert not any(empty)
+        with pytest.raises(ValueError):
+            HashingEmbedder(dim=0)
+
+
+class TestVectorIndex:
+    """VectorIndex 테스트."""
+
+    def test_flush_and_similar(self):
+        """대기열을 처리한 뒤 의미가 가까운 노드를 찾는지 확인."""
+        store, nodes = _store_with_topics()
+        index = VectorIndex(store)
+        assert index.pending_count == 3 and len(index) == 0
+
+        assert index.flush() == 3
+        assert len(index) == 3
+        hit = index.search("리스트를 정렬하는 방법", k=1)[0]
+        assert hit.node_id == nodes[0].id
+
+        extra = store.add_node("리스트 정렬 순서 뒤집기", "reverse=True 를 넘깁니다")
+        assert index.pending_count == 1
+        similar = index.similar_to(extra.id, k=2)  # 아직 임베딩 전이어도 비교 가능
+        assert similar[0].node_id == nodes[0].id
+        assert extra.id not in [hit.node_id for hit in similar]
+        with pytest.raises(ValueError):
+            index.similar_to("missing")
+
+    def test_exclude_undo_and_reset(self):
+        """제외 집합, 실행 취소, reset이 결과에 반영되는지 확인."""
+        store, nodes = _store_with_topics()
+        index = VectorIndex(store)
+        index.flush()
+
+        hits = index.search("리스트 정렬", k=3, exclude={nodes[0].id})
+        assert nodes[0].id not in [hit.node_id for hit in hits]
+        assert len(hits) == 2
+
+        store.undo()  # 마지막 노드(SQL) 추가 취소
+        assert nodes[2].id not in [h.node_id for h in index.search("join", k=3)]
+        assert len(index) == 2
+
+        store.reset()
+        assert len(index) == 0 and index.search("리스트") == []
+
+    def test_ivf_matches_brute_force_top1(self):
+        """IVF로 전환된 뒤에도 가장 가까운 노드를 찾고 새 벡터가 배정되는지 확인."""
+        pytest.importorskip("numpy")
+        store, nodes = _store_with_topics(repeat=10)
+        index = VectorIndex(store, ivf_threshold=20, n_lists=3, n_probe=2)
+        index.flush()
+        assert index.uses_ivf
+
+        for node in nodes[:3]:
+            assert index.similar_to(node.id, k=1)[0].score > 0.5
+        store.switch_to_node("root")
+        new = store.add_node("SQL 조인 종류 new", "inner join 과 outer join 이 있습니다")
+        index.flush()
+        sql_ids = {node.id for node in nodes[2::3]} | {new.id}
+        assert index.search("inner join outer join", k=1)[0].node_id in sql_ids
+
+    def test_numpy_backend_float16(self):
+        """NumPy float16 행렬로도 float32와 같은 순위를 내는지 확인."""
+        pytest.importorskip("numpy")
+        store, nodes = _store_with_topics(repeat=3)
+        full = VectorIndex(store)
+        half = VectorIndex(store, dtype="float16")
+        full.flush()
+        half.flush()
+
+        assert half._matrix._data.dtype.name == "float16"
+        for question, _ in TOPICS:
+            expected = [hit.node_id for hit in full.search(question, k=3)]
+            actual = half.search(question, k=3)
+            assert {hit.node_id for hit in actual} == set(expected)
+            assert all(isinstance(hit.score, float) for hit in actual)
+
+    def test_no_ivf_without_numpy(self, monkeypatch):
+        """NumPy가 없으면 IVF를 학습하지 않고 전체 비교로 찾는지 확인."""
+        monkeypatch.setattr(vectors, "np", None)
+        store, nodes = _store_with_topics(repeat=10)
+        index = VectorIndex(store, ivf_threshold=20, n_lists=3)
+        index.flush()
+
+        assert not index.uses_ivf and len(index) == 30
+        assert index.search("inner join outer join", k=1)[0].node_id in {
+            node.id for node in nodes[2::3]
+        }
+
+    def test_background_worker_and_options(self):
+        """백그라운드 스레드가 대기열을 비우고 잘못된 옵션을 거부하는지 확인."""
+        store, _ = _store_with_topics()
+        index = VectorIndex(store, dtype="float16", batch_size=2)
+        index.start(interval=0.01)
+        try:
+            for _ in range(200):
+                if len(index) == 3:
+                    break
+                time.sleep(0.01)
+        finally:
+            index.stop(timeout=1)
+        assert len(index) == 3 and index.pending_count == 0
+
+        with pytest.raises(ValueError):
+            VectorIndex(store, dtype="int8")
+